@@ -13,6 +13,7 @@ from app.application.use_cases.moto_club.get_club import GetMotoClubUseCase
 from app.application.use_cases.moto_club.list_clubs import ListMotoClubsUseCase
 from app.application.use_cases.moto_club.update_club import UpdateMotoClubUseCase
 from app.domain.value_objects.club_role import ClubRole
+from app.domain.value_objects.entity_version import EntityVersion
 from app.infrastructure.specs.moto_club.club_by_id import MotoClubById
 from app.infrastructure.specs.moto_club.club_filter import MotoClubFilter
 
@@ -73,6 +74,13 @@ class MotoClubController:
 
         return club.to_dto()
 
+    async def get_club_version(self, club_id: UUID) -> EntityVersion:
+        """Версия мотоклуба без загрузки клуба"""
+        version = await self.get_uc.get_version(club_id)
+        if version is None:
+            raise NotFoundError("MotoClub not found")
+        return version
+
     async def list_clubs(
             self,
             public_only: bool = False,
@@ -9,6 +9,7 @@ from app.application.use_cases.motokonig.get_top_riders import GetTopRidersUseCa
 from app.application.use_cases.motokonig.update_ride_stats import UpdateRideStatsUseCase
 from app.domain.entities.motokonig import MotoKonig
 from app.domain.ports.repositories.motokonig import IMotoKonigRepository
+from app.domain.value_objects.entity_version import EntityVersion
 from app.infrastructure.specs.motokonig.motokonig_by_id import MotoKonigById
 from app.infrastructure.specs.motokonig.motokonig_by_user_id import MotoKonigByUserId
 
@@ -55,6 +56,10 @@ class MotoKonigController:
         """Получить профиль по ID пользователя"""
         return await self._motokonig_repo.get(MotoKonigByUserId(user_id))
 
+    async def get_profile_version_by_user_id(self, user_id: UUID) -> EntityVersion | None:
+        """Версия профиля пользователя без загрузки профиля"""
+        return await self._motokonig_repo.get_version_by_user_id(user_id)
+
     async def update_profile(
             self,
             motokonig_id: UUID,
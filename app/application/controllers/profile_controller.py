@@ -4,6 +4,9 @@ from datetime import date
 from uuid import UUID
 
 from app.application.exceptions import NotFoundError
+from app.application.use_cases.club_membership.resolve_viewer_relationships import (
+    ResolveViewerRelationshipsUseCase,
+)
 from app.application.use_cases.profile.create_profile import CreateProfileUseCase
 from app.application.use_cases.profile.delete_profile import DeleteProfileUseCase
 from app.application.use_cases.profile.get_profile import GetProfileUseCase
@@ -17,6 +20,7 @@ from app.application.use_cases.social_link.remove_social_link import (
 )
 from app.domain.entities.profile import PrivacyLevel, Profile
 from app.domain.entities.social_link import SocialPlatform
+from app.domain.value_objects.entity_version import EntityVersion
 from app.infrastructure.specs.profile.profile_by_id import ProfileById
 from app.infrastructure.specs.profile.profile_by_user_id import ProfileByUserId
 
@@ -33,6 +37,7 @@ class ProfileController:
             add_social_link_uc: AddSocialLinkUseCase,
             remove_social_link_uc: RemoveSocialLinkUseCase,
             get_social_links_uc: GetProfileSocialLinksUseCase,
+            resolve_relationships_uc: ResolveViewerRelationshipsUseCase,
     ):
         self.create_profile_uc = create_profile_uc
         self.get_profile_uc = get_profile_uc
@@ -41,6 +46,7 @@ class ProfileController:
         self.add_social_link_uc = add_social_link_uc
         self.remove_social_link_uc = remove_social_link_uc
         self.get_social_links_uc = get_social_links_uc
+        self.resolve_relationships_uc = resolve_relationships_uc
 
     async def create_profile(
             self,
@@ -70,34 +76,41 @@ class ProfileController:
     async def get_profile_by_id(
             self,
             profile_id: UUID,
+            viewer_id: UUID,
             viewer_role: str = "USER",
-            is_friend: bool = False,
-            is_club_member: bool = False
     ) -> dict:
-        """Получить профиль по ID"""
+        """Получить профиль по ID с учётом приватности для зрителя"""
         spec = ProfileById(profile_id)
         profile = await self.get_profile_uc.execute(spec)
 
         if not profile:
             raise NotFoundError("Profile not found")
 
-        return profile.to_dto(viewer_role, is_friend, is_club_member)
+        relationship = await self.resolve_relationships_uc.execute_one(viewer_id, profile.user_id)
+        return profile.to_dto(viewer_role, relationship.is_friend, relationship.is_club_member)
 
     async def get_profile_by_user_id(
             self,
             user_id: UUID,
+            viewer_id: UUID,
             viewer_role: str = "USER",
-            is_friend: bool = False,
-            is_club_member: bool = False
     ) -> dict:
-        """Получить профиль по ID пользователя"""
+        """Получить профиль по ID пользователя с учётом приватности для зрителя"""
         spec = ProfileByUserId(user_id)
         profile = await self.get_profile_uc.execute(spec)
 
         if not profile:
             raise NotFoundError("Profile not found")
 
-        return profile.to_dto(viewer_role, is_friend, is_club_member)
+        relationship = await self.resolve_relationships_uc.execute_one(viewer_id, profile.user_id)
+        return profile.to_dto(viewer_role, relationship.is_friend, relationship.is_club_member)
+
+    async def get_profile_version_by_user_id(self, user_id: UUID) -> EntityVersion:
+        """Версия профиля пользователя без загрузки профиля"""
+        version = await self.get_profile_uc.get_version_by_user_id(user_id)
+        if version is None:
+            raise NotFoundError("Profile not found")
+        return version
 
     async def update_profile(
             self,
@@ -172,10 +185,17 @@ class ProfileController:
     async def get_profile_social_links(
             self,
             profile_id: UUID,
+            viewer_id: UUID,
             viewer_role: str = "USER",
-            is_friend: bool = False,
-            is_club_member: bool = False
     ) -> list[dict]:
-        """Получить социальные ссылки профиля"""
+        """Получить социальные ссылки профиля с учётом приватности для зрителя"""
+        profile = await self.get_profile_uc.execute(ProfileById(profile_id))
+        if not profile:
+            raise NotFoundError("Profile not found")
+
+        relationship = await self.resolve_relationships_uc.execute_one(viewer_id, profile.user_id)
         social_links = await self.get_social_links_uc.execute(profile_id)
-        return [link.to_dto(viewer_role, is_friend, is_club_member) for link in social_links]
+        return [
+            link.to_dto(viewer_role, relationship.is_friend, relationship.is_club_member)
+            for link in social_links
+        ]
@@ -8,6 +8,7 @@ from app.application.use_cases.ride.create_ride import CreateRideUseCase
 from app.application.use_cases.ride.join_ride import JoinRideUseCase
 from app.domain.entities.ride import Ride
 from app.domain.ports.repositories.ride import IRideRepository
+from app.domain.ports.services.checkpoint_index import CheckpointIndexPort
 from app.domain.value_objects.ride_difficulty import RideDifficulty
 from app.infrastructure.specs.ride.ride_by_id import RideByIdSpec
 from app.infrastructure.specs.ride.ride_by_organizer import RideByOrganizerSpec
@@ -25,11 +26,13 @@ class RideController:
             create_ride_uc: CreateRideUseCase,
             join_ride_uc: JoinRideUseCase,
             complete_ride_uc: CompleteRideUseCase,
+            checkpoint_index: CheckpointIndexPort,
     ):
         self._ride_repo = ride_repo
         self._create_ride_uc = create_ride_uc
         self._join_ride_uc = join_ride_uc
         self._complete_ride_uc = complete_ride_uc
+        self._checkpoint_index = checkpoint_index
 
     async def create_ride(
             self,
@@ -113,7 +116,13 @@ class RideController:
             raise ValueError("Only organizer can start the ride")
 
         ride.start_ride()
-        return await self._ride_repo.update(ride)
+        ride = await self._ride_repo.update(ride)
+
+        # Индекс контрольных точек строится один раз, а не на каждую отметку;
+        # старый индекс сбрасываем, чтобы взять точки на момент старта
+        self._checkpoint_index.invalidate(ride_id)
+        await self._checkpoint_index.get(ride_id)
+        return ride
 
     async def complete_ride(
             self,
@@ -123,12 +132,14 @@ class RideController:
             weather_conditions: str | None = None,
     ) -> Ride:
         """Завершить поездку"""
-        return await self._complete_ride_uc.execute(
+        ride = await self._complete_ride_uc.execute(
             ride_id=ride_id,
             organizer_id=organizer_id,
             actual_distance=actual_distance,
             weather_conditions=weather_conditions,
         )
+        self._checkpoint_index.invalidate(ride_id)
+        return ride
 
     async def rate_ride(
             self,
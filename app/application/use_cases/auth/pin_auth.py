@@ -1,7 +1,7 @@
 # app/application/use_cases/auth/pin_auth.py
 
+import asyncio
 import hashlib
-import hmac
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID, uuid4
@@ -9,6 +9,7 @@ from uuid import UUID, uuid4
 from app.domain.ports.repositories.pin_storage import PinStoragePort
 from app.domain.ports.repositories.user import IUserRepository
 from app.domain.ports.services.token import TokenServicePort
+from app.domain.value_objects.pin_check import PinCheckStatus
 from app.infrastructure.specs.user.user_by_id import UserById
 
 
@@ -43,7 +44,7 @@ class PinAuthUseCase:
             raise ValueError("User not found or inactive")
 
         # Хешируем PIN с device_id как соль
-        pin_hash = self._hash_pin(pin_code, device_id)
+        pin_hash = await asyncio.to_thread(self._hash_pin, pin_code, device_id)
 
         # Генерируем уникальный токен устройства
         device_token = self._generate_device_token(user_id, device_id)
@@ -86,28 +87,29 @@ class PinAuthUseCase:
         except ValueError:
             return None
 
-        # Проверяем количество попыток
-        attempts = await self.pin_storage.get_failed_attempts(user_id, device_id)
-        if attempts >= self.MAX_ATTEMPTS:
+        # Заблокированное устройство отсекаем до PBKDF2: перебор не должен грузить CPU
+        if await self.pin_storage.get_failed_attempts(user_id, device_id) >= self.MAX_ATTEMPTS:
             raise ValueError("Too many failed attempts. Try again later.")
 
-        # Получаем данные PIN
-        pin_data = await self.pin_storage.get_pin_data(user_id, device_id)
-        if not pin_data:
-            return None
-
-        # УБИРАЕМ проверку device_token из payload
-        # Вместо этого проверяем только существование PIN для этого устройства
+        # PBKDF2 занимает десятки миллисекунд — считаем вне event loop
+        pin_hash = await asyncio.to_thread(self._hash_pin, pin_code, device_id)
 
-        # Проверяем PIN
-        if not self._verify_pin(pin_code, device_id, pin_data["pin_hash"]):
-            await self.pin_storage.increment_failed_attempts(user_id, device_id)
-            remaining = self.MAX_ATTEMPTS - attempts - 1
+        # Попытки, PIN и счётчик проверяются в хранилище одной атомарной операцией
+        check = await self.pin_storage.check_pin(
+            user_id,
+            device_id,
+            pin_hash,
+            self.MAX_ATTEMPTS,
+            datetime.now(UTC).isoformat(),
+        )
+        if check.status is PinCheckStatus.LOCKED:
+            raise ValueError("Too many failed attempts. Try again later.")
+        if check.status is PinCheckStatus.NOT_FOUND:
+            return None
+        if check.status is PinCheckStatus.INVALID:
+            remaining = max(self.MAX_ATTEMPTS - check.attempts, 0)
             raise ValueError(f"Invalid PIN. {remaining} attempts remaining.")
 
-        # PIN верный - сбрасываем счётчик
-        await self.pin_storage.reset_failed_attempts(user_id, device_id)
-
         # Получаем пользователя
         user = await self.user_repo.get(UserById(user_id))
         if not user or not user.is_active:
@@ -120,7 +122,7 @@ class PinAuthUseCase:
             "username": user.username,
             "role": user.role.name,
             "device_id": device_id,
-            "device_token": pin_data["device_token"],  # Теперь добавляем!
+            "device_token": check.device_token,
             "jti": jti
         }
 
@@ -134,26 +136,12 @@ class PinAuthUseCase:
             payload.get("exp", 0)
         )
 
-        # Логируем успешный вход
-        await self._log_successful_login(user_id, device_id, pin_data.get("device_name"))
-
         return {
             "access_token": access_token,
             "refresh_token": new_refresh_token,
             "token_type": "bearer"
         }
 
-    async def _log_successful_login(
-            self,
-            user_id: UUID,
-            device_id: str,
-            device_name: str | None
-    ) -> None:
-        """Логирование успешного входа для безопасности"""
-        # Используем метод порта вместо прямого доступа к redis
-        timestamp = datetime.now(UTC).isoformat()
-        await self.pin_storage.update_last_login(user_id, device_id, timestamp)
-
     def _hash_pin(self, pin: str, salt: str) -> str:
         """Хешируем PIN с солью используя PBKDF2"""
         return hashlib.pbkdf2_hmac(
@@ -163,13 +151,6 @@ class PinAuthUseCase:
             100000  # iterations
         ).hex()
 
-    def _verify_pin(self, pin: str, salt: str, stored_hash: str) -> bool:
-        """Безопасное сравнение хешей"""
-        return hmac.compare_digest(
-            self._hash_pin(pin, salt),
-            stored_hash
-        )
-
     def _generate_device_token(self, user_id: UUID, device_id: str) -> str:
         """Генерируем уникальный токен устройства"""
         data = f"{user_id}:{device_id}:{datetime.now().timestamp()}"
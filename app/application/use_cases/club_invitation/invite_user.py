@@ -84,10 +84,8 @@ class InviteUserToClubUseCase:
             raise ValueError("User already has a pending invitation to this club")
 
         # Проверяем лимит участников
-        if club.max_members:
-            current_count = await self.membership_repo.count_club_members(club_id)
-            if current_count >= club.max_members:
-                raise ValueError("Club has reached maximum member limit")
+        if club.max_members and club.member_count >= club.max_members:
+            raise ValueError("Club has reached maximum member limit")
 
         # Создаем приглашение
         invitation = ClubInvitation(
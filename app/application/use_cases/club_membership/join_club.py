@@ -7,6 +7,9 @@ from app.domain.ports.repositories.club_membership import (
     IClubMembershipRepository,
 )
 from app.domain.ports.repositories.moto_club import IMotoClubRepository
+from app.domain.ports.services.viewer_relationship_cache import (
+    ViewerRelationshipCachePort,
+)
 from app.domain.value_objects.club_role import ClubRole
 from app.infrastructure.specs.moto_club.club_by_id import MotoClubById
 
@@ -17,10 +20,12 @@ class JoinClubUseCase:
     def __init__(
             self,
             club_repo: IMotoClubRepository,
-            membership_repo: IClubMembershipRepository
+            membership_repo: IClubMembershipRepository,
+            relationship_cache: ViewerRelationshipCachePort,
     ):
         self.club_repo = club_repo
         self.membership_repo = membership_repo
+        self.relationship_cache = relationship_cache
 
     async def execute(
             self,
@@ -58,10 +63,8 @@ class JoinClubUseCase:
             raise ValueError("User is already a member of this club")
 
         # Проверяем лимит участников
-        if club.max_members:
-            current_count = await self.membership_repo.count_club_members(club_id)
-            if current_count >= club.max_members:
-                raise ValueError("Club has reached maximum member limit")
+        if club.max_members and club.member_count >= club.max_members:
+            raise ValueError("Club has reached maximum member limit")
 
         # Создаем членство
         membership = ClubMembership(
@@ -71,4 +74,10 @@ class JoinClubUseCase:
             status="active",
         )
 
-        return await self.membership_repo.add(membership)
+        saved = await self.membership_repo.add(membership)
+
+        # Новый участник стал «своим» для всего клуба — кэш отношений сбросится после коммита
+        peer_ids = await self.membership_repo.get_club_member_ids(club_id)
+        await self.relationship_cache.invalidate(user_id, peer_ids)
+
+        return saved
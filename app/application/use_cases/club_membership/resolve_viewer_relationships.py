@@ -0,0 +1,65 @@
+# app/application/use_cases/club_membership/resolve_viewer_relationships.py
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from app.domain.ports.repositories.club_membership import (
+    IClubMembershipRepository,
+)
+from app.domain.ports.services.viewer_relationship_cache import (
+    ViewerRelationshipCachePort,
+)
+from app.domain.value_objects.viewer_relationship import ViewerRelationship
+
+__all__ = ["ResolveViewerRelationshipsUseCase"]
+
+
+class ResolveViewerRelationshipsUseCase:
+    """Use case для определения отношений зрителя к владельцам профилей"""
+
+    def __init__(
+            self,
+            membership_repo: IClubMembershipRepository,
+            cache: ViewerRelationshipCachePort,
+    ):
+        self.membership_repo = membership_repo
+        self.cache = cache
+
+    async def execute(
+            self,
+            viewer_id: UUID,
+            user_ids: Iterable[UUID],
+    ) -> dict[UUID, ViewerRelationship]:
+        """
+        Отношения зрителя к пачке пользователей
+
+        Сначала читается кэш зрителя, по промахам выполняется один запрос
+        к членствам в клубах, найденное дописывается в кэш.
+        """
+        targets = set(user_ids)
+        relationships = {}
+        if viewer_id in targets:
+            targets.discard(viewer_id)
+            relationships[viewer_id] = ViewerRelationship.owner()
+        if not targets:
+            return relationships
+
+        shared = await self.cache.get_many(viewer_id, targets)
+        missing = targets - shared.keys()
+        if missing:
+            peers = await self.membership_repo.get_club_peer_ids(viewer_id, missing)
+            resolved = {user_id: user_id in peers for user_id in missing}
+            await self.cache.set_many(viewer_id, resolved)
+            shared.update(resolved)
+
+        # Дружбы в системе пока нет, видимость FRIENDS_ONLY открыта только владельцу
+        relationships.update(
+            (user_id, ViewerRelationship(is_club_member=is_member))
+            for user_id, is_member in shared.items()
+        )
+        return relationships
+
+    async def execute_one(self, viewer_id: UUID, user_id: UUID) -> ViewerRelationship:
+        """Отношение зрителя к одному пользователю"""
+        relationships = await self.execute(viewer_id, (user_id,))
+        return relationships[user_id]
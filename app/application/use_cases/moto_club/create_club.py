@@ -73,5 +73,6 @@ class CreateMotoClubUseCase:
         )
 
         await self.membership_repo.add(president_membership)
+        saved_club.member_count = 1
 
         return saved_club
@@ -2,15 +2,35 @@
 
 from uuid import UUID
 
+from app.domain.ports.repositories.club_membership import (
+    IClubMembershipRepository,
+)
 from app.domain.ports.repositories.moto_club import IMotoClubRepository
+from app.domain.ports.services.viewer_relationship_cache import (
+    ViewerRelationshipCachePort,
+)
 
 
 class DeleteMotoClubUseCase:
     """Use case для удаления мотоклуба"""
 
-    def __init__(self, repo: IMotoClubRepository):
+    def __init__(
+            self,
+            repo: IMotoClubRepository,
+            membership_repo: IClubMembershipRepository,
+            relationship_cache: ViewerRelationshipCachePort,
+    ):
         self.repo = repo
+        self.membership_repo = membership_repo
+        self.relationship_cache = relationship_cache
 
     async def execute(self, club_id: UUID) -> bool:
         """Удалить мотоклуб"""
-        return await self.repo.delete(club_id)
+        # Членства удаляются каскадом, поэтому участников запоминаем заранее
+        member_ids = await self.membership_repo.get_club_member_ids(club_id)
+        deleted = await self.repo.delete(club_id)
+
+        # Бывшие участники больше не «свои» друг другу — кэш сбросится после коммита
+        if deleted:
+            await self.relationship_cache.invalidate_viewers(member_ids)
+        return deleted
@@ -1,8 +1,11 @@
 # app/application/use_cases/moto_club/get_club.py
 
+from uuid import UUID
+
 from app.domain.entities.moto_club import MotoClub
 from app.domain.ports.repositories.moto_club import IMotoClubRepository
 from app.domain.ports.specs.moto_club import MotoClubSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
 
 
 class GetMotoClubUseCase:
@@ -14,3 +17,7 @@ class GetMotoClubUseCase:
     async def execute(self, spec: MotoClubSpecificationPort) -> MotoClub | None:
         """Получить мотоклуб по спецификации"""
         return await self.repo.get(spec)
+
+    async def get_version(self, club_id: UUID) -> EntityVersion | None:
+        """Версия мотоклуба для условных запросов"""
+        return await self.repo.get_version(club_id)
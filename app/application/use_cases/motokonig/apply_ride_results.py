@@ -0,0 +1,44 @@
+# app/application/use_cases/motokonig/apply_ride_results.py
+
+from app.application.use_cases.motokonig.update_ride_stats import apply_ride_stats
+from app.domain.entities.motokonig import MotoKonig
+from app.domain.events.ride import RideCompleted
+from app.domain.ports.repositories.motokonig import IMotoKonigRepository
+from app.domain.ports.repositories.ride import IRideRepository
+
+__all__ = ["ApplyRideResultsUseCase"]
+
+
+class ApplyRideResultsUseCase:
+    """Use case для учёта итогов завершённой поездки в профилях участников"""
+
+    def __init__(
+            self,
+            motokonig_repo: IMotoKonigRepository,
+            ride_repo: IRideRepository,
+    ):
+        self._motokonig_repo = motokonig_repo
+        self._ride_repo = ride_repo
+
+    async def execute(self, event: RideCompleted) -> list[MotoKonig]:
+        """
+        Обновить статистику и достижения всех участников
+
+        Возвращает обновлённые профили: рейтинговую таблицу вызывающий код
+        обновляет по ним уже после коммита.
+        """
+
+        # Повторная доставка сообщения не должна учитывать поездку дважды
+        if not await self._ride_repo.mark_results_applied(event.ride_id):
+            return []
+
+        results = {p.motokonig_id: p for p in event.participants}
+        motokonigs = await self._motokonig_repo.get_many(list(results))
+        duration = max(event.duration, 1)
+
+        for motokonig in motokonigs:
+            result = results[motokonig.motokonig_id]
+            apply_ride_stats(motokonig, result.distance, duration, result.max_speed)
+
+        await self._motokonig_repo.update_many(motokonigs)
+        return motokonigs
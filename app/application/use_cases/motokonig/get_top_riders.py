@@ -2,24 +2,51 @@
 
 from app.domain.entities.motokonig import MotoKonig
 from app.domain.ports.repositories.motokonig import IMotoKonigRepository
+from app.domain.ports.services.leaderboard import LeaderboardPort
 from app.infrastructure.specs.motokonig.motokonig_public import MotoKonigPublic
 
 __all__ = ["GetTopRidersUseCase"]
 
+MAX_TOP_LIMIT = 100
+
 
 class GetTopRidersUseCase:
     """Use case для получения топ-райдеров"""
 
-    def __init__(self, motokonig_repo: IMotoKonigRepository):
+    def __init__(
+            self,
+            motokonig_repo: IMotoKonigRepository,
+            leaderboard: LeaderboardPort,
+    ):
         self._motokonig_repo = motokonig_repo
+        self._leaderboard = leaderboard
 
     async def execute(self, limit: int = 10) -> list[MotoKonig]:
         """Получить топ публичных профилей по рейтингу"""
+        limit = max(1, min(limit, MAX_TOP_LIMIT))
+
+        # Рейтинговую таблицу обновляет обработчик завершения поездок
+        top_ids = await self._leaderboard.top(limit)
+        profiles = {p.motokonig_id: p for p in await self._motokonig_repo.get_many(top_ids)}
+        ranked = [
+            profiles[motokonig_id]
+            for motokonig_id in top_ids
+            if motokonig_id in profiles and profiles[motokonig_id].is_public
+        ]
+        # Короткий список без удалённых и скрытых профилей — это вся таблица
+        if top_ids and len(ranked) == len(top_ids):
+            return ranked
+
+        # Таблица пуста или устарела: пересобираем её по всем публичным профилям,
+        # чтобы удалённые и скрытые профили из неё ушли. Полный проход по базе
+        # делает один запрос за интервал, остальные отдают то, что есть
+        if not await self._leaderboard.claim_rebuild():
+            return ranked
 
-        # Получаем публичные профили
         public_profiles = await self._motokonig_repo.get_list(
             MotoKonigPublic()
         )
+        await self._leaderboard.replace(public_profiles)
 
         # Сортируем по рейтингу и опыту
         sorted_profiles = sorted(
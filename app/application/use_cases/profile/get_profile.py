@@ -1,8 +1,11 @@
 # app/application/use_cases/profile/get_profile.py
 
+from uuid import UUID
+
 from app.domain.entities.profile import Profile
 from app.domain.ports.repositories.profile import IProfileRepository
 from app.domain.ports.specs.profile import ProfileSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
 
 
 class GetProfileUseCase:
@@ -14,3 +17,7 @@ class GetProfileUseCase:
     async def execute(self, spec: ProfileSpecificationPort) -> Profile | None:
         """Получить профиль по спецификации"""
         return await self.repo.get(spec)
+
+    async def get_version_by_user_id(self, user_id: UUID) -> EntityVersion | None:
+        """Версия профиля пользователя для условных запросов"""
+        return await self.repo.get_version_by_user_id(user_id)
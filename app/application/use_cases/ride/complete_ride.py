@@ -2,9 +2,10 @@
 
 from uuid import UUID
 
-from app.application.use_cases.motokonig.update_ride_stats import UpdateRideStatsUseCase
 from app.domain.entities.ride import Ride
+from app.domain.events.ride import CompletedRideParticipant, RideCompleted
 from app.domain.ports.repositories.ride import IRideRepository
+from app.domain.ports.services.event_publisher import EventPublisherPort
 
 __all__ = ["CompleteRideUseCase"]
 
@@ -15,10 +16,10 @@ class CompleteRideUseCase:
     def __init__(
             self,
             ride_repo: IRideRepository,
-            update_stats_uc: UpdateRideStatsUseCase,
+            event_publisher: EventPublisherPort,
     ):
         self._ride_repo = ride_repo
-        self._update_stats_uc = update_stats_uc
+        self._event_publisher = event_publisher
 
     async def execute(
             self,
@@ -27,7 +28,7 @@ class CompleteRideUseCase:
             actual_distance: int,
             weather_conditions: str | None = None,
     ) -> Ride:
-        """Завершить поездку и обновить статистику участников"""
+        """Завершить поездку, статистику участников обновит обработчик события"""
 
         # Получаем поездку
         ride = await self._ride_repo.get_by_id(ride_id)
@@ -40,23 +41,26 @@ class CompleteRideUseCase:
 
         # Завершаем поездку
         ride.complete_ride(actual_distance, weather_conditions)
+        duration = int((ride.actual_end - ride.actual_start).total_seconds() / 60)
 
-        # Обновляем статистику для всех участников
-        if ride.actual_start and ride.actual_end:
-            duration = int((ride.actual_end - ride.actual_start).total_seconds() / 60)
-
-            for participant in ride.participants:
-                if participant.left_at is None:  # Только для тех, кто доехал
-                    # Рассчитываем индивидуальные показатели
-                    participant_distance = participant.distance_covered or actual_distance
-                    participant_max_speed = participant.max_speed or 100.0
+        # Сохраняем поездку
+        ride = await self._ride_repo.update(ride)
 
-                    await self._update_stats_uc.execute(
+        await self._event_publisher.publish(
+            RideCompleted(
+                ride_id=ride.ride_id,
+                completed_at=ride.actual_end,
+                duration=duration,
+                participants=tuple(
+                    CompletedRideParticipant(
                         motokonig_id=participant.motokonig_id,
-                        distance=participant_distance,
-                        duration=duration,
-                        max_speed=participant_max_speed,
+                        distance=participant.distance_covered or actual_distance,
+                        max_speed=participant.max_speed or 100.0,
                     )
+                    for participant in ride.participants
+                    if participant.left_at is None  # Только для тех, кто доехал
+                ),
+            )
+        )
 
-        # Сохраняем поездку
-        return await self._ride_repo.update(ride)
+        return ride
@@ -0,0 +1,66 @@
+# app/application/use_cases/ride/ingest_telemetry.py
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from app.domain.entities.participant_track import ParticipantTrack
+from app.domain.ports.services.checkpoint_index import CheckpointIndexPort
+from app.domain.ports.services.ride_position_hub import RidePositionHubPort
+from app.domain.ports.services.telemetry_buffer import TelemetryBufferPort
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.gps_fix import GpsFix
+
+__all__ = ["IngestTelemetryUseCase"]
+
+
+class IngestTelemetryUseCase:
+    """Use case для приёма GPS-телеметрии участника поездки"""
+
+    def __init__(
+            self,
+            telemetry_buffer: TelemetryBufferPort,
+            position_hub: RidePositionHubPort,
+            checkpoint_index: CheckpointIndexPort,
+    ):
+        self._telemetry_buffer = telemetry_buffer
+        self._position_hub = position_hub
+        self._checkpoint_index = checkpoint_index
+
+    async def start_session(self, ride_id: UUID, user_id: UUID) -> ParticipantTrack:
+        """Открыть сессию телеметрии для участника активной поездки"""
+        track = await self._telemetry_buffer.load_track(ride_id, user_id)
+        if not track:
+            raise ValueError("Ride is not in progress or user is not a participant")
+        return track
+
+    async def execute(self, track: ParticipantTrack, fixes: Sequence[GpsFix]) -> int:
+        """Учесть пакет отметок, вернуть количество принятых"""
+        grid = await self._checkpoint_index.get(track.ride_id)
+
+        accepted: list[GpsFix] = []
+        arrivals: list[CheckpointArrival] = []
+        for fix in sorted(fixes, key=lambda f: f.recorded_at):
+            if not track.apply(fix):
+                continue
+            accepted.append(fix)
+
+            arrivals.extend(
+                CheckpointArrival(
+                    ride_id=track.ride_id,
+                    checkpoint_id=checkpoint_id,
+                    motokonig_id=track.motokonig_id,
+                    reached_at=fix.recorded_at,
+                )
+                for checkpoint_id in grid.nearby(fix)
+                if track.mark_reached(checkpoint_id)
+            )
+
+        if accepted:
+            await self._telemetry_buffer.push(track, accepted, arrivals)
+            # Остальным участникам достаточно последней позиции из пакета
+            await self._position_hub.publish(track.ride_id, track.motokonig_id, accepted[-1])
+
+        for arrival in arrivals:
+            await self._position_hub.publish_arrival(arrival)
+
+        return len(accepted)
@@ -0,0 +1,36 @@
+# app/application/use_cases/ride/watch_positions.py
+
+from uuid import UUID
+
+from app.domain.ports.services.ride_position_hub import (
+    RidePositionHubPort,
+    RidePositionSubscription,
+)
+from app.domain.ports.services.telemetry_buffer import TelemetryBufferPort
+
+__all__ = ["WatchRidePositionsUseCase"]
+
+
+class WatchRidePositionsUseCase:
+    """Use case для получения позиций участников активной поездки"""
+
+    def __init__(
+            self,
+            telemetry_buffer: TelemetryBufferPort,
+            position_hub: RidePositionHubPort,
+    ):
+        self._telemetry_buffer = telemetry_buffer
+        self._position_hub = position_hub
+
+    async def subscribe(self, ride_id: UUID, user_id: UUID) -> RidePositionSubscription:
+        """Подписать участника активной поездки на позиции остальных"""
+        track = await self._telemetry_buffer.load_track(ride_id, user_id)
+        if not track:
+            raise ValueError("Ride is not in progress or user is not a participant")
+
+        arrivals = await self._telemetry_buffer.load_arrivals(ride_id)
+        return await self._position_hub.subscribe(ride_id, arrivals)
+
+    async def unsubscribe(self, subscription: RidePositionSubscription) -> None:
+        """Отписать участника"""
+        await self._position_hub.unsubscribe(subscription)
@@ -1,8 +1,10 @@
 import logging
+from collections.abc import Sequence
 from logging import Logger
 
 import structlog
 from loguru import logger
+from structlog.typing import Processor
 
 
 class InterceptHandler(logging.Handler):
@@ -22,17 +24,24 @@ class InterceptHandler(logging.Handler):
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
 
-def setup_logging() -> None:
-    """Initialize structlog and forward logs to Loguru."""
+def setup_logging(processors: Sequence[Processor] = ()) -> None:
+    """Initialize structlog and forward logs to Loguru.
+
+    ``processors`` run right after the context variables are merged.
+    """
 
     handler = InterceptHandler()
     logging.basicConfig(handlers=[handler], level=logging.INFO, force=True)
     for name in ("uvicorn", "uvicorn.access", "fastapi"):
-        logging.getLogger(name).handlers = [handler]
+        named = logging.getLogger(name)
+        named.handlers = [handler]
+        # Иначе запись дойдёт и до корневого обработчика и задвоится
+        named.propagate = False
 
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
+            *processors,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.format_exc_info,
@@ -9,11 +9,15 @@ from pydantic import BaseModel, Field
 class ProjectConfig(BaseModel):
     project_name: str = "MotoKonig API Gateway"
     version: str = Field(alias='API_VERSION', default='dev')
+    # Проверять исходящие DTO по схемам ответа; в production выключено
+    validate_responses: bool = Field(alias='API_VALIDATE_RESPONSES', default=False)
 
 
 class SecuritySettings(BaseModel):
     secret_key: str = Field(alias='SECRET_KEY', default="my_projects_most_secret_key_ever")
     algorithm: str = Field(alias='ALGORITHM', default="HS256")
+    # Потоки для bcrypt: каждый хэш занимает ядро на сотни миллисекунд
+    bcrypt_workers: int = Field(alias='BCRYPT_WORKERS', default=4)
 
 
 class PostgresConfig(BaseModel):
@@ -22,12 +26,67 @@ class PostgresConfig(BaseModel):
     postgres_password: str = Field(alias='POSTGRES_PASSWORD', default="motokonig")
     postgres_host: str = Field(alias='POSTGRES_HOST', default="localhost")
     postgres_port: int = Field(alias='POSTGRES_PORT', default=5432)
+    # Полный DSN вместо параметров выше, например SQLite для бенчмарков
+    database_url: str = Field(alias='DATABASE_URL', default="")
+    # Реплики потоковой репликации через запятую: "replica1:5432,replica2"
+    replica_hosts: str = Field(alias='POSTGRES_REPLICA_HOSTS', default="")
+
+    # Соединений к одному серверу на все процессы сервиса. При max_connections=100
+    # остаётся запас воркерам событий, обслуживанию, миграциям и администрированию
+    connection_budget: int = Field(alias='POSTGRES_CONNECTION_BUDGET', default=60)
+    # Процессов, делящих бюджет; python -m app.server выставляет по числу воркеров
+    pool_processes: int = Field(alias='POSTGRES_POOL_PROCESSES', default=1)
+    # Пул на процесс, 0 — connection_budget // pool_processes.
+    # Всего соединений: pool_processes * (pool_size + max_overflow)
+    pool_size: int = Field(alias='POSTGRES_POOL_SIZE', default=0)
+    max_overflow: int = Field(alias='POSTGRES_MAX_OVERFLOW', default=0)
+    pool_timeout: float = Field(alias='POSTGRES_POOL_TIMEOUT', default=30.0)  # секунды
+    pool_recycle: int = Field(alias='POSTGRES_POOL_RECYCLE', default=1800)  # секунды
+    pool_pre_ping: bool = Field(alias='POSTGRES_POOL_PRE_PING', default=True)
+    # Кэши подготовленных выражений asyncpg и диалекта SQLAlchemy, 0 — выключены (нужно за PgBouncer)
+    statement_cache_size: int = Field(alias='POSTGRES_STATEMENT_CACHE_SIZE', default=100)
+    prepared_statement_cache_size: int = Field(alias='POSTGRES_PREPARED_STATEMENT_CACHE_SIZE', default=100)
+    statement_timeout: int = Field(alias='POSTGRES_STATEMENT_TIMEOUT', default=30000)  # мс, 0 — без ограничения
 
     def get_dsn(self) -> str:
         """Return the PostgreSQL DSN."""
+        return self.database_url or self._dsn(self.postgres_host, self.postgres_port)
+
+    def get_replica_dsns(self) -> list[str]:
+        """DSN реплик для чтения, пустой список — реплик нет"""
+        dsns = []
+        for item in filter(None, (part.strip() for part in self.replica_hosts.split(","))):
+            host, _, port = item.partition(":")
+            dsns.append(self._dsn(host, int(port) if port else self.postgres_port))
+        return dsns
+
+    def get_pool_size(self) -> int:
+        """Размер пула одного процесса"""
+        if self.pool_size > 0:
+            return self.pool_size
+        return max(self.connection_budget // max(self.pool_processes, 1), 1)
+
+    def get_engine_options(self) -> dict:
+        """Параметры пула и драйвера для create_async_engine"""
+        options = {
+            "pool_size": self.get_pool_size(),
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+        if self.get_dsn().startswith("postgresql+asyncpg"):
+            options["connect_args"] = {
+                "statement_cache_size": self.statement_cache_size,
+                "prepared_statement_cache_size": self.prepared_statement_cache_size,
+                "server_settings": {"statement_timeout": str(self.statement_timeout)},
+            }
+        return options
+
+    def _dsn(self, host: str, port: int) -> str:
         return (
             f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@"
-            f"{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+            f"{host}:{port}/{self.postgres_db}"
         )
 
 
@@ -71,6 +130,114 @@ class MinIOConfig(BaseModel):
     temp_bucket: str = Field(alias='MINIO_TEMP_BUCKET', default='temp')
 
 
+class TelemetryConfig(BaseModel):
+    """Конфигурация приёма GPS-телеметрии поездок"""
+    flush_interval: float = Field(alias='TELEMETRY_FLUSH_INTERVAL', default=2.0)  # секунды
+    max_batch_size: int = Field(alias='TELEMETRY_MAX_BATCH_SIZE', default=5000)
+    max_buffered_points: int = Field(alias='TELEMETRY_MAX_BUFFERED_POINTS', default=50000)
+    broadcast_tick: float = Field(alias='TELEMETRY_BROADCAST_TICK', default=1.0)  # секунды
+    client_queue_size: int = Field(alias='TELEMETRY_CLIENT_QUEUE_SIZE', default=8)
+    checkpoint_radius: float = Field(alias='TELEMETRY_CHECKPOINT_RADIUS', default=50.0)  # метры
+
+
+class OutboxConfig(BaseModel):
+    """Конфигурация ретранслятора outbox"""
+    poll_interval: float = Field(alias='OUTBOX_POLL_INTERVAL', default=1.0)  # секунды
+    batch_size: int = Field(alias='OUTBOX_BATCH_SIZE', default=100)
+
+
+class EntityCacheConfig(BaseModel):
+    """Конфигурация кэша сущностей в Redis"""
+    enabled: bool = Field(alias='ENTITY_CACHE_ENABLED', default=True)
+    # Время жизни записей по типам сущностей, секунды
+    profile_ttl: int = Field(alias='ENTITY_CACHE_PROFILE_TTL', default=600)
+    motokonig_ttl: int = Field(alias='ENTITY_CACHE_MOTOKONIG_TTL', default=300)
+    motorcycle_ttl: int = Field(alias='ENTITY_CACHE_MOTORCYCLE_TTL', default=1800)
+    moto_club_ttl: int = Field(alias='ENTITY_CACHE_MOTO_CLUB_TTL', default=120)
+
+
+class ReplicaConfig(BaseModel):
+    """Конфигурация маршрутизации чтения на реплики"""
+    max_lag: float = Field(alias='REPLICA_MAX_LAG', default=5.0)  # секунды
+    check_interval: float = Field(alias='REPLICA_CHECK_INTERVAL', default=5.0)  # секунды
+    # Сколько чтений клиента после его записи идут в primary, секунды
+    read_your_writes_window: int = Field(alias='REPLICA_READ_YOUR_WRITES_WINDOW', default=5)
+
+
+class QueryStatsConfig(BaseModel):
+    """Конфигурация учёта запросов к БД на HTTP-запрос"""
+    enabled: bool = Field(alias='DB_QUERY_STATS_ENABLED', default=True)
+    # Сколько раз одна форма запроса может выполниться за HTTP-запрос
+    repeat_threshold: int = Field(alias='DB_QUERY_REPEAT_THRESHOLD', default=10)
+    # Падать при превышении вместо предупреждения, включается в тестах
+    strict: bool = Field(alias='DB_QUERY_REPEAT_STRICT', default=False)
+
+
+class MaintenanceConfig(BaseModel):
+    """Конфигурация обслуживающего воркера"""
+    leader_key: str = Field(alias='MAINTENANCE_LEADER_KEY', default='maintenance:leader')
+    leader_ttl: float = Field(alias='MAINTENANCE_LEADER_TTL', default=30.0)  # секунды
+    batch_size: int = Field(alias='MAINTENANCE_BATCH_SIZE', default=1000)
+    # Расписания в формате cron, время UTC
+    expire_listings_cron: str = Field(alias='MAINTENANCE_EXPIRE_LISTINGS_CRON', default='*/5 * * * *')
+    expire_invitations_cron: str = Field(alias='MAINTENANCE_EXPIRE_INVITATIONS_CRON', default='*/15 * * * *')
+    metrics_port: int = Field(alias='MAINTENANCE_METRICS_PORT', default=9102)
+
+
+class CompressionConfig(BaseModel):
+    """Конфигурация сжатия ответов"""
+    enabled: bool = Field(alias='COMPRESSION_ENABLED', default=True)
+    # Тела меньше порога отдаются как есть: заголовки и кадры съедят выигрыш
+    minimum_size: int = Field(alias='COMPRESSION_MINIMUM_SIZE', default=1024)  # байты
+    gzip_level: int = Field(alias='COMPRESSION_GZIP_LEVEL', default=6)
+    brotli_quality: int = Field(alias='COMPRESSION_BROTLI_QUALITY', default=5)
+    zstd_level: int = Field(alias='COMPRESSION_ZSTD_LEVEL', default=3)
+    # Сжатые публичные списки без авторизации живут в памяти воркера
+    hot_response_ttl: int = Field(alias='COMPRESSION_HOT_RESPONSE_TTL', default=30)  # секунды
+    hot_response_max_entries: int = Field(alias='COMPRESSION_HOT_RESPONSE_MAX_ENTRIES', default=256)
+
+
+class RateLimitConfig(BaseModel):
+    """Конфигурация ограничения частоты запросов"""
+    enabled: bool = Field(alias='RATE_LIMIT_ENABLED', default=True)
+    key_prefix: str = Field(alias='RATE_LIMIT_KEY_PREFIX', default='ratelimit')
+    # Лимиты в формате "N/second|minute|hour|day" или "N/30s"
+    login_per_ip: str = Field(alias='RATE_LIMIT_LOGIN_PER_IP', default='30/minute')
+    login_per_user: str = Field(alias='RATE_LIMIT_LOGIN_PER_USER', default='10/minute')
+    register_per_ip: str = Field(alias='RATE_LIMIT_REGISTER_PER_IP', default='5/hour')
+    pin_login_per_ip: str = Field(alias='RATE_LIMIT_PIN_LOGIN_PER_IP', default='30/minute')
+    pin_login_per_device: str = Field(alias='RATE_LIMIT_PIN_LOGIN_PER_DEVICE', default='10/minute')
+    media_upload_per_user: str = Field(alias='RATE_LIMIT_MEDIA_UPLOAD_PER_USER', default='60/hour')
+    listing_create_per_user: str = Field(alias='RATE_LIMIT_LISTING_CREATE_PER_USER', default='20/hour')
+
+    def policies(self) -> dict[str, dict[str, str]]:
+        """Лимиты по политикам и субъектам (ip, user, device)"""
+        return {
+            "login": {"ip": self.login_per_ip, "user": self.login_per_user},
+            "register": {"ip": self.register_per_ip},
+            "pin_login": {"ip": self.pin_login_per_ip, "device": self.pin_login_per_device},
+            "media_upload": {"user": self.media_upload_per_user},
+            "listing_create": {"user": self.listing_create_per_user},
+        }
+
+
+class ServerConfig(BaseModel):
+    """Конфигурация production-сервера API"""
+    host: str = Field(alias='SERVER_HOST', default='0.0.0.0')
+    port: int = Field(alias='SERVER_PORT', default=8000)
+    # 0 — по числу доступных процессу ядер
+    workers: int = Field(alias='SERVER_WORKERS', default=0)
+    # Воркер перезапускается после стольких запросов, разброс не даёт всем уйти разом
+    max_requests: int = Field(alias='SERVER_MAX_REQUESTS', default=20000)
+    max_requests_jitter: int = Field(alias='SERVER_MAX_REQUESTS_JITTER', default=2000)
+    graceful_timeout: int = Field(alias='SERVER_GRACEFUL_TIMEOUT', default=30)  # секунды
+    keep_alive_timeout: int = Field(alias='SERVER_KEEP_ALIVE_TIMEOUT', default=5)  # секунды
+    backlog: int = Field(alias='SERVER_BACKLOG', default=2048)
+    # Адреса прокси, которым доверяется X-Forwarded-For
+    forwarded_allow_ips: str = Field(alias='FORWARDED_ALLOW_IPS', default='*')
+    prometheus_multiproc_dir: str = Field(alias='PROMETHEUS_MULTIPROC_DIR', default='/tmp/prometheus-multiproc')
+
+
 class Config(BaseModel):
     project: ProjectConfig = Field(default_factory=lambda: ProjectConfig(**env))
     security: SecuritySettings = Field(default_factory=lambda: SecuritySettings(**env))
@@ -80,3 +247,12 @@ class Config(BaseModel):
     logging: LoggingConfig = Field(default_factory=lambda: LoggingConfig(**env))
     rabbitmq: RabbitMQConfig = Field(default_factory=lambda: RabbitMQConfig(**env))
     minio: MinIOConfig = Field(default_factory=lambda: MinIOConfig(**env))
+    telemetry: TelemetryConfig = Field(default_factory=lambda: TelemetryConfig(**env))
+    outbox: OutboxConfig = Field(default_factory=lambda: OutboxConfig(**env))
+    entity_cache: EntityCacheConfig = Field(default_factory=lambda: EntityCacheConfig(**env))
+    replica: ReplicaConfig = Field(default_factory=lambda: ReplicaConfig(**env))
+    query_stats: QueryStatsConfig = Field(default_factory=lambda: QueryStatsConfig(**env))
+    maintenance: MaintenanceConfig = Field(default_factory=lambda: MaintenanceConfig(**env))
+    compression: CompressionConfig = Field(default_factory=lambda: CompressionConfig(**env))
+    rate_limit: RateLimitConfig = Field(default_factory=lambda: RateLimitConfig(**env))
+    server: ServerConfig = Field(default_factory=lambda: ServerConfig(**env))
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from app.domain.entities.hydration import Hydratable
 from app.domain.value_objects.event_type import EventType
 from app.domain.value_objects.location import Location
 
@@ -13,9 +14,15 @@ if TYPE_CHECKING:
     pass
 
 
-class Event:
+class Event(Hydratable):
     """Доменная сущность мероприятия"""
 
+    __slots__ = (
+        "id", "organizer_id", "title", "description", "location", "start_time",
+        "end_time", "event_type", "max_participants", "photo_urls", "created_at",
+        "updated_at",
+    )
+
     def __init__(
             self,
             *,
@@ -0,0 +1,44 @@
+# app/domain/entities/hydration.py
+
+from typing import Any, Self
+
+__all__ = ["Hydratable"]
+
+
+class Hydratable:
+    """
+    Восстановление сущности из доверенного источника
+
+    Конструктор сущности проверяет инварианты и нормализует значения.
+    Данные из собственной БД уже прошли это при записи, поэтому
+    репозитории собирают сущность через ``hydrate`` — без проверок,
+    напрямую в слоты. Передавать нужно все атрибуты сущности.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        slots = cls.__dict__.get("__slots__", ())
+        if slots:
+            cls.hydrate = classmethod(_build_hydrate(cls.__name__, slots))
+
+    @classmethod
+    def hydrate(cls, **attributes: Any) -> Self:
+        entity = cls.__new__(cls)
+        for name, value in attributes.items():
+            setattr(entity, name, value)
+        return entity
+
+
+def _build_hydrate(name: str, slots: tuple[str, ...]) -> Any:
+    # Сгенерированная функция с именованными аргументами по слотам: вдвое
+    # быстрее цикла с setattr и падает на пропущенном или лишнем атрибуте
+    body = "".join(f"    entity.{slot} = {slot}\n" for slot in slots)
+    source = (
+        f"def hydrate(cls, *, {', '.join(slots)}):\n"
+        f"    entity = new(cls)\n{body}    return entity\n"
+    )
+    namespace: dict[str, Any] = {"new": object.__new__}
+    exec(compile(source, f"<hydrate {name}>", "exec"), namespace)
+    return namespace["hydrate"]
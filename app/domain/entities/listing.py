@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from app.domain.entities.hydration import Hydratable
 from app.domain.value_objects.listing_category import ListingCategory
 from app.domain.value_objects.listing_status import ListingStatus
 
@@ -13,7 +14,7 @@ if TYPE_CHECKING:
     pass
 
 
-class Listing:
+class Listing(Hydratable):
     """
     Доменная сущность объявления в маркетплейсе
 
@@ -25,6 +26,13 @@ class Listing:
     - Описание не должно быть слишком длинным
     """
 
+    __slots__ = (
+        "id", "seller_id", "title", "description", "category", "price", "currency",
+        "location", "status", "is_negotiable", "contact_phone", "contact_email",
+        "photo_urls", "views_count", "expires_at", "moderation_notes", "is_featured",
+        "created_at", "updated_at",
+    )
+
     def __init__(
             self,
             *,
@@ -72,7 +80,7 @@ class Listing:
         self.contact_email: str | None = contact_email.strip() if contact_email else None
         self.photo_urls: list[str] = photo_urls or []
         self.views_count: int = views_count
-        self.expires_at: datetime | None = expires_at or (datetime.utcnow() + timedelta(days=30))
+        self.expires_at: datetime | None = expires_at or (datetime.now(UTC) + timedelta(days=30))
         self.moderation_notes: str | None = moderation_notes
         self.is_featured: bool = is_featured
         self.created_at: datetime | None = created_at
@@ -201,7 +209,7 @@ class Listing:
         """Продлить срок действия"""
         if days <= 0 or days > 90:
             raise ValueError("Extension must be between 1 and 90 days")
-        self.expires_at = datetime.utcnow() + timedelta(days=days)
+        self.expires_at = datetime.now(UTC) + timedelta(days=days)
         if self.status == ListingStatus.EXPIRED:
             self.status = ListingStatus.ACTIVE
 
@@ -221,7 +229,7 @@ class Listing:
         """Проверить, истёк ли срок"""
         if not self.expires_at:
             return False
-        return datetime.utcnow() > self.expires_at
+        return datetime.now(UTC) > self.expires_at
 
     def get_price_rub(self) -> float:
         """Получить цену в рублях"""
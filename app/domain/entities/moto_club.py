@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from app.domain.entities.hydration import Hydratable
+
 if TYPE_CHECKING:
     pass
 
 
-class MotoClub:
+class MotoClub(Hydratable):
     """
     Доменная сущность мотоклуба
 
@@ -21,6 +23,12 @@ class MotoClub:
     - Клуб может быть публичным или приватным
     """
 
+    __slots__ = (
+        "id", "name", "description", "president_id", "is_public", "max_members",
+        "location", "website", "founded_date", "avatar_url", "is_active",
+        "member_count", "created_at", "updated_at",
+    )
+
     def __init__(
             self,
             *,
@@ -35,6 +43,7 @@ class MotoClub:
             founded_date: datetime | None = None,
             avatar_url: str | None = None,
             is_active: bool = True,
+            member_count: int = 0,
             created_at: datetime | None = None,
             updated_at: datetime | None = None,
     ):
@@ -55,9 +64,10 @@ class MotoClub:
         self.max_members: int | None = max_members
         self.location: str | None = location.strip() if location else None
         self.website: str | None = website.strip() if website else None
-        self.founded_date: datetime | None = founded_date or datetime.utcnow()
+        self.founded_date: datetime | None = founded_date or datetime.now(UTC)
         self.avatar_url: str | None = avatar_url
         self.is_active: bool = is_active
+        self.member_count: int = member_count
         self.created_at: datetime | None = created_at
         self.updated_at: datetime | None = updated_at
 
@@ -148,6 +158,7 @@ class MotoClub:
             "founded_date": self.founded_date,
             "avatar_url": self.avatar_url,
             "is_active": self.is_active,
+            "member_count": self.member_count,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from app.domain.entities.achievement import Achievement
+from app.domain.entities.hydration import Hydratable
 from app.domain.value_objects.achievement_type import AchievementType
 from app.domain.value_objects.motokonig_status import MotoKonigStatus
 
@@ -34,7 +35,7 @@ if TYPE_CHECKING:
 
 
 
-class MotoKonig:
+class MotoKonig(Hydratable):
     """
     Доменная сущность MotoKonig - профиль мотоциклиста
 
@@ -46,6 +47,13 @@ class MotoKonig:
     - Статус должен соответствовать уровню опыта
     """
 
+    __slots__ = (
+        "motokonig_id", "user_id", "nickname", "status", "experience_points",
+        "total_distance", "total_rides", "average_speed", "max_speed",
+        "favorite_routes", "achievements", "rating", "bio", "avatar_url", "is_public",
+        "created_at", "updated_at",
+    )
+
     def __init__(
             self,
             *,
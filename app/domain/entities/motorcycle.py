@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from app.domain.entities.hydration import Hydratable
 from app.domain.value_objects.engine_type import EngineType
 from app.domain.value_objects.motorcycle_type import MotorcycleType
 
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
     pass
 
 
-class Motorcycle:
+class Motorcycle(Hydratable):
     """
     Доменная сущность мотоцикла
 
@@ -26,6 +27,12 @@ class Motorcycle:
     - Пробег не может быть отрицательным
     """
 
+    __slots__ = (
+        "id", "owner_id", "brand", "model", "year", "engine_volume", "engine_type",
+        "motorcycle_type", "power", "mileage", "color", "description", "is_active",
+        "created_at", "updated_at",
+    )
+
     def __init__(
             self,
             *,
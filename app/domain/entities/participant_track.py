@@ -0,0 +1,118 @@
+# app/domain/entities/participant_track.py
+
+from uuid import UUID
+
+from app.domain.value_objects.gps_fix import GpsFix
+
+__all__ = ["ParticipantTrack"]
+
+
+class ParticipantTrack:
+    """
+    Накопленная телеметрия участника активной поездки
+
+    Дистанция и скорости считаются инкрементально по каждой новой отметке,
+    поэтому пересчитывать весь трек не нужно.
+
+    Инварианты:
+    - Отметки применяются строго по возрастанию времени
+    - Скачки GPS с неправдоподобной скоростью отбрасываются
+    - Дистанция накапливается только в движении
+    - Каждая контрольная точка засчитывается участнику один раз
+    """
+
+    MAX_PLAUSIBLE_SPEED = 400.0  # км/ч
+    MIN_MOVING_SPEED = 3.0  # км/ч
+
+    def __init__(
+            self,
+            *,
+            ride_id: UUID,
+            motokonig_id: UUID,
+            distance_m: float = 0.0,
+            moving_seconds: float = 0.0,
+            max_speed: float | None = None,
+            last_fix: GpsFix | None = None,
+            reached_checkpoints: set[UUID] | None = None,
+    ):
+        if distance_m < 0:
+            raise ValueError("Distance cannot be negative")
+        if moving_seconds < 0:
+            raise ValueError("Moving time cannot be negative")
+
+        self.ride_id = ride_id
+        self.motokonig_id = motokonig_id
+        self.distance_m = distance_m
+        self.moving_seconds = moving_seconds
+        self.max_speed = max_speed
+        self.last_fix = last_fix
+        self.reached_checkpoints = reached_checkpoints or set()
+
+    @classmethod
+    def from_stats(
+            cls,
+            *,
+            ride_id: UUID,
+            motokonig_id: UUID,
+            distance_m: float,
+            average_speed: float | None,
+            max_speed: float | None,
+            reached_checkpoints: set[UUID] | None = None,
+    ) -> "ParticipantTrack":
+        """Восстановить трек из сохранённой статистики участника"""
+        moving_seconds = distance_m / average_speed * 3.6 if average_speed else 0.0
+        return cls(
+            ride_id=ride_id,
+            motokonig_id=motokonig_id,
+            distance_m=distance_m,
+            moving_seconds=moving_seconds,
+            max_speed=max_speed,
+            reached_checkpoints=reached_checkpoints,
+        )
+
+    def apply(self, fix: GpsFix) -> bool:
+        """Учесть новую отметку. Возвращает False, если отметка отброшена"""
+        last = self.last_fix
+        if last is None:
+            speed = fix.speed or 0.0
+        else:
+            elapsed = (fix.recorded_at - last.recorded_at).total_seconds()
+            if elapsed <= 0:
+                return False
+
+            meters = last.distance_to(fix)
+            computed_speed = meters / elapsed * 3.6
+            if computed_speed > self.MAX_PLAUSIBLE_SPEED:
+                return False
+
+            speed = fix.speed if fix.speed is not None else computed_speed
+            if speed >= self.MIN_MOVING_SPEED:
+                self.distance_m += meters
+                self.moving_seconds += elapsed
+
+        if 0 < speed <= self.MAX_PLAUSIBLE_SPEED and (
+                self.max_speed is None or speed > self.max_speed
+        ):
+            self.max_speed = speed
+
+        self.last_fix = fix
+        return True
+
+    def mark_reached(self, checkpoint_id: UUID) -> bool:
+        """Отметить контрольную точку пройденной. False, если уже была пройдена"""
+        if checkpoint_id in self.reached_checkpoints:
+            return False
+        self.reached_checkpoints.add(checkpoint_id)
+        return True
+
+    @property
+    def distance_covered(self) -> int:
+        """Пройденная дистанция в километрах"""
+        return int(self.distance_m // 1000)
+
+    @property
+    def average_speed(self) -> float | None:
+        """Средняя скорость в движении, км/ч"""
+        if self.moving_seconds <= 0 or self.distance_m <= 0:
+            return None
+        return self.distance_m / self.moving_seconds * 3.6
@@ -7,13 +7,14 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from app.domain.entities.hydration import Hydratable
 from app.domain.value_objects.privacy_level import PrivacyLevel
 
 if TYPE_CHECKING:
     pass
 
 
-class Profile:
+class Profile(Hydratable):
     """
     Доменная сущность профиля пользователя
 
@@ -24,6 +25,12 @@ class Profile:
     - Bio не может быть слишком длинным
     """
 
+    __slots__ = (
+        "id", "user_id", "bio", "location", "phone", "date_of_birth",
+        "riding_experience", "avatar_url", "privacy_level", "phone_privacy",
+        "location_privacy", "created_at", "updated_at",
+    )
+
     def __init__(
             self,
             *,
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from app.domain.entities.hydration import Hydratable
 from app.domain.value_objects.ride_checkpoint import RideCheckpoint
 from app.domain.value_objects.ride_difficulty import RideDifficulty
 from app.domain.value_objects.ride_participant import RideParticipant
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
     pass
 
 
-class Ride:
+class Ride(Hydratable):
     """
     Доменная сущность поездки
 
@@ -27,6 +28,15 @@ class Ride:
     - Продолжительность должна быть положительной
     """
 
+    __slots__ = (
+        "ride_id", "organizer_id", "title", "description", "difficulty",
+        "planned_distance", "max_participants", "start_location", "end_location",
+        "planned_start", "planned_duration", "actual_start", "actual_end",
+        "actual_distance", "route_gpx", "weather_conditions", "participants",
+        "checkpoints", "is_public", "is_completed", "rating", "created_at",
+        "updated_at",
+    )
+
     def __init__(
             self,
             *,
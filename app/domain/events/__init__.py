@@ -0,0 +1,10 @@
+# app/domain/events/__init__.py
+
+from .base import DomainEvent
+from .ride import CompletedRideParticipant, RideCompleted
+
+__all__ = [
+    "DomainEvent",
+    "CompletedRideParticipant",
+    "RideCompleted",
+]
@@ -0,0 +1,30 @@
+# app/domain/events/base.py
+
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Self
+
+__all__ = ["DomainEvent"]
+
+
+class DomainEvent(ABC):
+    """
+    Базовый класс доменного события
+
+    Событие публикуется в брокер под именем ``topic`` и передаётся
+    JSON-совместимым словарём.
+    """
+
+    __slots__ = ()
+
+    topic: ClassVar[str]
+
+    @abstractmethod
+    def to_payload(self) -> dict[str, Any]:
+        """Преобразовать событие в JSON-совместимый словарь"""
+        ...
+
+    @classmethod
+    @abstractmethod
+    def from_payload(cls, payload: dict[str, Any]) -> Self:
+        """Восстановить событие из словаря"""
+        ...
@@ -0,0 +1,62 @@
+# app/domain/events/ride.py
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, ClassVar, Self
+from uuid import UUID
+
+from app.domain.events.base import DomainEvent
+
+__all__ = ["CompletedRideParticipant", "RideCompleted"]
+
+
+@dataclass(frozen=True, slots=True)
+class CompletedRideParticipant:
+    """Итоги поездки одного участника"""
+
+    motokonig_id: UUID
+    distance: int  # в километрах
+    max_speed: float
+
+
+@dataclass(frozen=True, slots=True)
+class RideCompleted(DomainEvent):
+    """Поездка завершена организатором"""
+
+    topic: ClassVar[str] = "ride.completed"
+
+    ride_id: UUID
+    completed_at: datetime
+    duration: int  # в минутах
+    participants: tuple[CompletedRideParticipant, ...]
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "ride_id": str(self.ride_id),
+            "completed_at": self.completed_at.isoformat(),
+            "duration": self.duration,
+            "participants": [
+                {
+                    "motokonig_id": str(p.motokonig_id),
+                    "distance": p.distance,
+                    "max_speed": p.max_speed,
+                }
+                for p in self.participants
+            ],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> Self:
+        return cls(
+            ride_id=UUID(payload["ride_id"]),
+            completed_at=datetime.fromisoformat(payload["completed_at"]),
+            duration=payload["duration"],
+            participants=tuple(
+                CompletedRideParticipant(
+                    motokonig_id=UUID(p["motokonig_id"]),
+                    distance=p["distance"],
+                    max_speed=p["max_speed"],
+                )
+                for p in payload["participants"]
+            ),
+        )
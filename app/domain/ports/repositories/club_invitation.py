@@ -36,6 +36,6 @@ class IClubInvitationRepository(Protocol):
         """Получить активное приглашение для пользователя в клуб"""
         ...
 
-    async def expire_old_invitations(self) -> int:
-        """Сделать просроченными старые приглашения"""
+    async def expire_old_invitations(self, limit: int = 1000) -> int:
+        """Сделать просроченными не больше ``limit`` старых приглашений"""
         ...
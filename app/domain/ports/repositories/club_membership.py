@@ -1,5 +1,6 @@
 # app/domain/ports/club_membership.py
 
+from collections.abc import Collection
 from typing import Protocol
 from uuid import UUID
 
@@ -39,3 +40,11 @@ class IClubMembershipRepository(Protocol):
     async def count_club_members(self, club_id: UUID, active_only: bool = True) -> int:
         """Подсчитать количество участников клуба"""
         ...
+
+    async def get_club_member_ids(self, club_id: UUID) -> list[UUID]:
+        """ID активных участников клуба"""
+        ...
+
+    async def get_club_peer_ids(self, user_id: UUID, candidate_ids: Collection[UUID]) -> set[UUID]:
+        """ID кандидатов, состоящих хотя бы в одном общем клубе с пользователем"""
+        ...
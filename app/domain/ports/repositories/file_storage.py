@@ -10,6 +10,14 @@ from app.domain.value_objects.file_type import FileType
 class FileStoragePort(Protocol):
     """Порт для работы с файловым хранилищем"""
 
+    async def start(self) -> None:
+        """Подготовить клиент хранилища до приёма запросов"""
+        ...
+
+    async def stop(self) -> None:
+        """Освободить клиент хранилища"""
+        ...
+
     async def upload_file(
             self,
             file_content: bytes,
@@ -34,6 +34,6 @@ class IListingRepository(Protocol):
         """Подсчитать активные объявления продавца"""
         ...
 
-    async def expire_old_listings(self) -> int:
-        """Пометить старые объявления как истёкшие"""
+    async def expire_old_listings(self, limit: int = 1000) -> int:
+        """Пометить истёкшими не больше ``limit`` старых объявлений"""
         ...
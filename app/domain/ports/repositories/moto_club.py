@@ -5,6 +5,7 @@ from uuid import UUID
 
 from app.domain.entities.moto_club import MotoClub
 from app.domain.ports.specs.moto_club import MotoClubSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
 
 
 class IMotoClubRepository(Protocol):
@@ -18,6 +19,10 @@ class IMotoClubRepository(Protocol):
         """Получить мотоклуб по спецификации"""
         ...
 
+    async def get_version(self, club_id: UUID) -> EntityVersion | None:
+        """Версия мотоклуба с числом активных участников без загрузки клуба"""
+        ...
+
     async def get_list(self, spec: MotoClubSpecificationPort | None = None) -> list[MotoClub]:
         """Получить список мотоклубов по спецификации"""
         ...
@@ -1,10 +1,12 @@
 # app/domain/ports/repositories/motokonig.py
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from app.domain.entities.motokonig import MotoKonig
 from app.domain.ports.specs.motokonig import MotoKonigSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
 
 __all__ = ["IMotoKonigRepository"]
 
@@ -27,11 +29,21 @@ class IMotoKonigRepository(ABC):
         """Получить профиль по ID"""
         ...
 
+    @abstractmethod
+    async def get_many(self, motokonig_ids: Sequence[UUID]) -> list[MotoKonig]:
+        """Получить профили по списку ID одним запросом"""
+        ...
+
     @abstractmethod
     async def get_by_user_id(self, user_id: UUID) -> MotoKonig | None:
         """Получить профиль по ID пользователя"""
         ...
 
+    @abstractmethod
+    async def get_version_by_user_id(self, user_id: UUID) -> EntityVersion | None:
+        """Версия профиля пользователя без загрузки самого профиля"""
+        ...
+
     @abstractmethod
     async def get_list(self, spec: MotoKonigSpecificationPort | None = None) -> list[MotoKonig]:
         """Получить список профилей по спецификации"""
@@ -42,6 +54,11 @@ class IMotoKonigRepository(ABC):
         """Обновить профиль"""
         ...
 
+    @abstractmethod
+    async def update_many(self, motokonigs: Sequence[MotoKonig]) -> None:
+        """Сохранить статистику и новые достижения профилей пакетно"""
+        ...
+
     @abstractmethod
     async def delete(self, motokonig_id: UUID) -> None:
         """Удалить профиль"""
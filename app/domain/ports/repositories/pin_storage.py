@@ -4,6 +4,8 @@ from datetime import timedelta
 from typing import Any, Protocol
 from uuid import UUID
 
+from app.domain.value_objects.pin_check import PinCheck
+
 
 class PinStoragePort(Protocol):
     """Порт для работы с PIN-кодами"""
@@ -20,14 +22,6 @@ class PinStoragePort(Protocol):
         """Сохранить PIN для устройства"""
         ...
 
-    async def get_pin_data(
-            self,
-            user_id: UUID,
-            device_id: str
-    ) -> dict[str, Any] | None:
-        """Получить данные PIN"""
-        ...
-
     async def delete_pin(
             self,
             user_id: UUID,
@@ -36,12 +30,20 @@ class PinStoragePort(Protocol):
         """Удалить PIN"""
         ...
 
-    async def increment_failed_attempts(
+    async def check_pin(
             self,
             user_id: UUID,
-            device_id: str
-    ) -> int:
-        """Увеличить счётчик неудачных попыток"""
+            device_id: str,
+            pin_hash: str,
+            max_attempts: int,
+            timestamp: str
+    ) -> PinCheck:
+        """
+        Атомарно проверить хэш PIN с учётом лимита попыток
+
+        При совпадении счётчик попыток сбрасывается и отмечается вход
+        ``timestamp``, при несовпадении счётчик увеличивается.
+        """
         ...
 
     async def get_failed_attempts(
@@ -49,24 +51,7 @@ class PinStoragePort(Protocol):
             user_id: UUID,
             device_id: str
     ) -> int:
-        """Получить количество неудачных попыток"""
-        ...
-
-    async def reset_failed_attempts(
-            self,
-            user_id: UUID,
-            device_id: str
-    ) -> None:
-        """Сбросить счётчик попыток"""
-        ...
-
-    async def update_last_login(
-            self,
-            user_id: UUID,
-            device_id: str,
-            timestamp: str
-    ) -> None:
-        """Обновить время последнего входа"""
+        """Получить количество неудачных попыток, не меняя его"""
         ...
 
     async def get_user_devices(
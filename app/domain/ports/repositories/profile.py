@@ -5,6 +5,7 @@ from uuid import UUID
 
 from app.domain.entities.profile import Profile
 from app.domain.ports.specs.profile import ProfileSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
 
 
 class IProfileRepository(Protocol):
@@ -18,6 +19,10 @@ class IProfileRepository(Protocol):
         """Получить профиль по спецификации"""
         ...
 
+    async def get_version_by_user_id(self, user_id: UUID) -> EntityVersion | None:
+        """Версия профиля пользователя без загрузки самого профиля"""
+        ...
+
     async def get_list(self, spec: ProfileSpecificationPort | None = None) -> list[Profile]:
         """Получить список профилей по спецификации"""
         ...
@@ -37,6 +37,11 @@ class IRideRepository(ABC):
         """Обновить поездку"""
         ...
 
+    @abstractmethod
+    async def mark_results_applied(self, ride_id: UUID) -> bool:
+        """Отметить, что итоги поездки учтены. False, если уже были учтены"""
+        ...
+
     @abstractmethod
     async def delete(self, ride_id: UUID) -> None:
         """Удалить поездку"""
@@ -0,0 +1,45 @@
+# app/domain/ports/repositories/ride_telemetry.py
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
+
+from app.domain.entities.participant_track import ParticipantTrack
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.telemetry_point import TelemetryPoint
+
+__all__ = ["IRideTelemetryRepository"]
+
+
+class IRideTelemetryRepository(ABC):
+    """Порт репозитория телеметрии поездок"""
+
+    @abstractmethod
+    async def get_active_track(self, ride_id: UUID, user_id: UUID) -> ParticipantTrack | None:
+        """Получить трек участника начатой и незавершённой поездки"""
+        ...
+
+    @abstractmethod
+    async def add_points(self, points: Sequence[TelemetryPoint]) -> int:
+        """Сохранить пакет GPS-отметок одним запросом"""
+        ...
+
+    @abstractmethod
+    async def save_tracks(self, tracks: Sequence[ParticipantTrack]) -> None:
+        """Сохранить накопленную статистику участников одним запросом"""
+        ...
+
+    @abstractmethod
+    async def get_checkpoints(self, ride_id: UUID) -> list[tuple[UUID, float, float]]:
+        """Получить контрольные точки поездки: (id, широта, долгота)"""
+        ...
+
+    @abstractmethod
+    async def get_arrivals(self, ride_id: UUID) -> list[CheckpointArrival]:
+        """Получить прохождения контрольных точек поездки"""
+        ...
+
+    @abstractmethod
+    async def add_arrivals(self, arrivals: Sequence[CheckpointArrival]) -> None:
+        """Сохранить прохождения контрольных точек, повторы игнорируются"""
+        ...
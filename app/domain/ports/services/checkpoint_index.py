@@ -0,0 +1,18 @@
+# app/domain/ports/services/checkpoint_index.py
+
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.value_objects.checkpoint_grid import CheckpointGrid
+
+
+class CheckpointIndexPort(Protocol):
+    """Порт кэша пространственных индексов контрольных точек поездок"""
+
+    async def get(self, ride_id: UUID) -> CheckpointGrid:
+        """Получить индекс поездки, построив его при первом обращении"""
+        ...
+
+    def invalidate(self, ride_id: UUID) -> None:
+        """Сбросить индекс поездки: она завершена или её контрольные точки изменились"""
+        ...
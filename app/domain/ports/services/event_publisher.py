@@ -0,0 +1,13 @@
+# app/domain/ports/services/event_publisher.py
+
+from typing import Protocol
+
+from app.domain.events.base import DomainEvent
+
+
+class EventPublisherPort(Protocol):
+    """Порт публикации доменных событий"""
+
+    async def publish(self, event: DomainEvent) -> None:
+        """Опубликовать событие"""
+        ...
@@ -0,0 +1,27 @@
+# app/domain/ports/services/leaderboard.py
+
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.entities.motokonig import MotoKonig
+
+
+class LeaderboardPort(Protocol):
+    """Порт рейтинговой таблицы райдеров"""
+
+    async def update(self, motokonigs: Sequence[MotoKonig]) -> None:
+        """Обновить позиции профилей, скрытые профили убрать из таблицы"""
+        ...
+
+    async def replace(self, motokonigs: Sequence[MotoKonig]) -> None:
+        """Пересобрать таблицу заново только из публичных профилей"""
+        ...
+
+    async def claim_rebuild(self) -> bool:
+        """Занять пересборку таблицы; False, если её недавно пересобирали"""
+        ...
+
+    async def top(self, limit: int) -> list[UUID]:
+        """ID лучших райдеров по убыванию рейтинга"""
+        ...
@@ -0,0 +1,19 @@
+# app/domain/ports/services/rate_limiter.py
+
+from collections.abc import Mapping
+from typing import Protocol
+
+from app.domain.value_objects.rate_limit import RateLimitDecision
+
+
+class RateLimiterPort(Protocol):
+    """Порт ограничения частоты запросов, общего для всех воркеров"""
+
+    async def hit(self, policy: str, subjects: Mapping[str, str]) -> RateLimitDecision:
+        """
+        Учесть запрос по политике для каждого субъекта (``ip``, ``user``, ``device``)
+
+        Запрос проходит, только если укладывается во все лимиты, и тогда
+        списывается со всех сразу. Субъекты без лимита в политике пропускаются.
+        """
+        ...
@@ -0,0 +1,50 @@
+# app/domain/ports/services/ride_position_hub.py
+
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.gps_fix import GpsFix
+
+
+class RidePositionSubscription(Protocol):
+    """Подписка клиента на позиции участников поездки"""
+
+    ride_id: UUID
+
+    async def receive(self) -> str:
+        """Дождаться следующего кадра с позициями"""
+        ...
+
+
+class RidePositionHubPort(Protocol):
+    """Порт рассылки позиций участников активной поездки"""
+
+    async def publish(self, ride_id: UUID, motokonig_id: UUID, fix: GpsFix) -> None:
+        """Опубликовать последнюю позицию участника"""
+        ...
+
+    async def publish_arrival(self, arrival: CheckpointArrival) -> None:
+        """Опубликовать прохождение контрольной точки"""
+        ...
+
+    async def subscribe(
+            self,
+            ride_id: UUID,
+            arrivals: Sequence[CheckpointArrival] = (),
+    ) -> RidePositionSubscription:
+        """Подписать клиента, передав уже известные прохождения точек"""
+        ...
+
+    async def unsubscribe(self, subscription: RidePositionSubscription) -> None:
+        """Отписать клиента"""
+        ...
+
+    async def start(self) -> None:
+        """Запустить приём сообщений и рассылку кадров"""
+        ...
+
+    async def stop(self) -> None:
+        """Остановить рассылку и закрыть подписки"""
+        ...
@@ -0,0 +1,42 @@
+# app/domain/ports/services/telemetry_buffer.py
+
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.entities.participant_track import ParticipantTrack
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.gps_fix import GpsFix
+
+
+class TelemetryBufferPort(Protocol):
+    """Порт буфера телеметрии с пакетной записью в хранилище"""
+
+    async def load_track(self, ride_id: UUID, user_id: UUID) -> ParticipantTrack | None:
+        """Загрузить трек участника активной поездки"""
+        ...
+
+    async def load_arrivals(self, ride_id: UUID) -> list[CheckpointArrival]:
+        """Загрузить прохождения контрольных точек, включая ещё не записанные"""
+        ...
+
+    async def push(
+            self,
+            track: ParticipantTrack,
+            fixes: Sequence[GpsFix],
+            arrivals: Sequence[CheckpointArrival] = (),
+    ) -> None:
+        """Поставить принятые отметки и статистику участника в очередь на запись"""
+        ...
+
+    async def flush(self) -> int:
+        """Записать накопленные данные, вернуть количество сохранённых отметок"""
+        ...
+
+    async def start(self) -> None:
+        """Запустить периодическую запись"""
+        ...
+
+    async def stop(self) -> None:
+        """Остановить периодическую запись и сбросить остаток"""
+        ...
@@ -0,0 +1,25 @@
+# app/domain/ports/services/viewer_relationship_cache.py
+
+from collections.abc import Collection, Mapping
+from typing import Protocol
+from uuid import UUID
+
+
+class ViewerRelationshipCachePort(Protocol):
+    """Порт кэша общих клубов зрителя с другими пользователями"""
+
+    async def get_many(self, viewer_id: UUID, user_ids: Collection[UUID]) -> dict[UUID, bool]:
+        """Закэшированные признаки общего клуба, отсутствующие в кэше ID пропускаются"""
+        ...
+
+    async def set_many(self, viewer_id: UUID, relations: Mapping[UUID, bool]) -> None:
+        """Сохранить признаки общего клуба для зрителя"""
+        ...
+
+    async def invalidate(self, user_id: UUID, peer_ids: Collection[UUID]) -> None:
+        """Сбросить кэш пользователя и его записи у участников затронутого клуба"""
+        ...
+
+    async def invalidate_viewers(self, viewer_ids: Collection[UUID]) -> None:
+        """Сбросить кэш отношений этих зрителей целиком"""
+        ...
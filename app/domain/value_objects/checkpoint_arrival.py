@@ -0,0 +1,17 @@
+# app/domain/value_objects/checkpoint_arrival.py
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+__all__ = ["CheckpointArrival"]
+
+
+@dataclass(frozen=True, slots=True)
+class CheckpointArrival:
+    """Факт прохождения участником контрольной точки поездки"""
+
+    ride_id: UUID
+    checkpoint_id: UUID
+    motokonig_id: UUID
+    reached_at: datetime
@@ -0,0 +1,63 @@
+# app/domain/value_objects/checkpoint_grid.py
+
+from collections.abc import Iterable
+from math import cos, floor, radians
+from uuid import UUID
+
+from app.domain.value_objects.gps_fix import GpsFix, haversine_m
+
+__all__ = ["CheckpointGrid"]
+
+METERS_PER_DEGREE = 111_320.0
+
+
+class CheckpointGrid:
+    """
+    Пространственный индекс контрольных точек поездки
+
+    Точки раскладываются по равномерной сетке с ячейкой не меньше радиуса
+    срабатывания, поэтому для отметки достаточно проверить её ячейку и восемь
+    соседних — стоимость не зависит от количества точек на маршруте.
+    """
+
+    def __init__(
+            self,
+            checkpoints: Iterable[tuple[UUID, float, float]],
+            radius_m: float,
+    ):
+        if radius_m <= 0:
+            raise ValueError("Radius must be positive")
+
+        points = list(checkpoints)
+        self.radius_m = radius_m
+        self._lat_step = radius_m / METERS_PER_DEGREE
+        # Градус долготы короче к полюсам: шаг считаем по самой дальней от экватора точке
+        max_lat = max((abs(latitude) for _, latitude, _ in points), default=0.0)
+        self._lon_step = self._lat_step / max(cos(radians(max_lat)), 0.01)
+
+        self._cells: dict[tuple[int, int], list[tuple[UUID, float, float]]] = {}
+        for point in points:
+            _, latitude, longitude = point
+            self._cells.setdefault(self._cell(latitude, longitude), []).append(point)
+        self._size = len(points)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return floor(latitude / self._lat_step), floor(longitude / self._lon_step)
+
+    def nearby(self, fix: GpsFix) -> list[UUID]:
+        """Контрольные точки в радиусе срабатывания от отметки"""
+        if not self._cells:
+            return []
+
+        row, col = self._cell(fix.latitude, fix.longitude)
+        found = []
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                for checkpoint_id, latitude, longitude in self._cells.get((row + d_row, col + d_col), ()):
+                    distance = haversine_m(fix.latitude, fix.longitude, latitude, longitude)
+                    if distance <= self.radius_m:
+                        found.append(checkpoint_id)
+        return found
@@ -0,0 +1,20 @@
+# app/domain/value_objects/entity_version.py
+
+from dataclasses import dataclass
+from datetime import datetime
+
+__all__ = ["EntityVersion"]
+
+
+@dataclass(frozen=True, slots=True)
+class EntityVersion:
+    """
+    Версия сущности для условных запросов
+
+    ``updated_at`` меняется при записи самой сущности, ``revision`` —
+    число вложенных записей, которые её ``updated_at`` не трогают
+    (достижения профиля, участники клуба).
+    """
+
+    updated_at: datetime | None
+    revision: int = 0
@@ -0,0 +1,40 @@
+# app/domain/value_objects/gps_fix.py
+
+from dataclasses import dataclass
+from datetime import datetime
+from math import asin, cos, radians, sin, sqrt
+
+__all__ = ["GpsFix", "haversine_m"]
+
+EARTH_RADIUS_M = 6_371_000.0
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Расстояние между двумя точками в метрах (формула гаверсинусов)"""
+    phi1, phi2 = radians(lat1), radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = radians(lon2 - lon1)
+    h = sin(d_phi / 2) ** 2 + cos(phi1) * cos(phi2) * sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * asin(sqrt(h))
+
+
+@dataclass(frozen=True, slots=True)
+class GpsFix:
+    """Value object GPS-отметки с телефона участника"""
+
+    recorded_at: datetime
+    latitude: float
+    longitude: float
+    speed: float | None = None  # км/ч, если устройство его сообщает
+
+    def __post_init__(self) -> None:
+        if not -90 <= self.latitude <= 90:
+            raise ValueError("Latitude must be between -90 and 90")
+        if not -180 <= self.longitude <= 180:
+            raise ValueError("Longitude must be between -180 and 180")
+        if self.speed is not None and self.speed < 0:
+            raise ValueError("Speed cannot be negative")
+
+    def distance_to(self, other: "GpsFix") -> float:
+        """Расстояние до другой отметки в метрах"""
+        return haversine_m(self.latitude, self.longitude, other.latitude, other.longitude)
@@ -0,0 +1,25 @@
+# app/domain/value_objects/pin_check.py
+
+from dataclasses import dataclass
+from enum import Enum
+
+__all__ = ["PinCheck", "PinCheckStatus"]
+
+
+class PinCheckStatus(Enum):
+    """Исход проверки PIN-кода"""
+
+    VERIFIED = "verified"
+    INVALID = "invalid"
+    LOCKED = "locked"
+    NOT_FOUND = "not_found"
+
+
+@dataclass(frozen=True, slots=True)
+class PinCheck:
+    """Результат проверки PIN с данными устройства при успехе"""
+
+    status: PinCheckStatus
+    attempts: int = 0  # неудачные попытки после проверки
+    device_token: str | None = None
+    device_name: str | None = None
@@ -0,0 +1,46 @@
+# app/domain/value_objects/rate_limit.py
+
+from dataclasses import dataclass
+
+__all__ = ["RateLimit", "RateLimitDecision"]
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """Не больше ``limit`` запросов за ``period`` секунд, с пачкой до ``limit`` сразу"""
+
+    limit: int
+    period: float
+
+    def __post_init__(self) -> None:
+        if self.limit <= 0 or self.period <= 0:
+            raise ValueError("Rate limit and period must be positive")
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Разобрать запись вида ``10/minute`` или ``5/30s``"""
+        count, _, period = value.strip().partition("/")
+        period = period.strip().lower()
+        if period in _PERIODS:
+            seconds = float(_PERIODS[period])
+        elif period.endswith("s") and period[:-1].replace(".", "", 1).isdigit():
+            seconds = float(period[:-1])
+        else:
+            raise ValueError(f"Invalid rate limit: {value!r}")
+        return cls(int(count), seconds)
+
+    @property
+    def emission_interval(self) -> float:
+        """Интервал, за который восстанавливается один запрос"""
+        return self.period / self.limit
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    """Результат проверки лимита"""
+
+    allowed: bool
+    remaining: int
+    retry_after: float = 0.0  # секунды до следующей разрешённой попытки
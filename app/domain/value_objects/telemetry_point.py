@@ -0,0 +1,17 @@
+# app/domain/value_objects/telemetry_point.py
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.value_objects.gps_fix import GpsFix
+
+__all__ = ["TelemetryPoint"]
+
+
+@dataclass(frozen=True, slots=True)
+class TelemetryPoint:
+    """GPS-отметка, привязанная к участнику поездки"""
+
+    ride_id: UUID
+    motokonig_id: UUID
+    fix: GpsFix
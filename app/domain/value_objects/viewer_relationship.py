@@ -0,0 +1,18 @@
+# app/domain/value_objects/viewer_relationship.py
+
+from dataclasses import dataclass
+
+__all__ = ["ViewerRelationship"]
+
+
+@dataclass(frozen=True, slots=True)
+class ViewerRelationship:
+    """Отношение зрителя к владельцу профиля для проверок приватности"""
+
+    is_friend: bool = False
+    is_club_member: bool = False
+
+    @classmethod
+    def owner(cls) -> "ViewerRelationship":
+        """Пользователь смотрит собственный профиль"""
+        return cls(is_friend=True, is_club_member=True)
@@ -0,0 +1,113 @@
+# app/infrastructure/cache/codec.py
+
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from functools import cache
+from importlib import import_module
+from typing import Any
+from uuid import UUID
+
+import msgpack
+
+__all__ = ["decode_entity", "encode_entity"]
+
+# Восстанавливать разрешено только доменные типы
+ALLOWED_MODULE_PREFIX = "app.domain."
+
+_EXT_UUID = 1
+_EXT_DATETIME = 2
+_EXT_DATE = 3
+_EXT_ENUM = 4
+_EXT_OBJECT = 5
+
+
+def _type_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+@cache
+def _resolve_type(path: str) -> type:
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith(ALLOWED_MODULE_PREFIX):
+        raise TypeError(f"Type {path} is not allowed in entity cache")
+
+    obj: Any = import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names: list[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+
+
+def _state(obj: Any) -> dict[str, Any]:
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    state = dict(getattr(obj, "__dict__", {}))
+    for name in _slot_names(type(obj)):
+        if hasattr(obj, name):
+            state[name] = getattr(obj, name)
+    return state
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return msgpack.ExtType(_EXT_ENUM, _pack([_type_path(type(obj)), obj.value]))
+    if isinstance(obj, UUID):
+        return msgpack.ExtType(_EXT_UUID, obj.bytes)
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, obj.isoformat().encode())
+    if isinstance(obj, date):
+        return msgpack.ExtType(_EXT_DATE, obj.isoformat().encode())
+    if isinstance(obj, tuple | set | frozenset):
+        return list(obj)
+    if type(obj).__module__.startswith(ALLOWED_MODULE_PREFIX):
+        return msgpack.ExtType(_EXT_OBJECT, _pack([_type_path(type(obj)), _state(obj)]))
+    raise TypeError(f"Cannot cache value of type {type(obj).__name__}")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_UUID:
+        return UUID(bytes=data)
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == _EXT_ENUM:
+        path, value = _unpack(data)
+        return _resolve_type(path)(value)
+    if code == _EXT_OBJECT:
+        path, state = _unpack(data)
+        cls = _resolve_type(path)
+        # Сущность уже прошла валидацию при записи: конструктор не вызываем
+        obj = cls.__new__(cls)
+        for name, value in state.items():
+            object.__setattr__(obj, name, value)
+        return obj
+    return msgpack.ExtType(code, data)
+
+
+def _pack(value: Any) -> bytes:
+    # strict_types: str-перечисления (StrEnum) не должны упаковываться как строки
+    return msgpack.packb(value, default=_default, use_bin_type=True, strict_types=True)
+
+
+def _unpack(data: bytes) -> Any:
+    return msgpack.unpackb(data, ext_hook=_ext_hook, raw=False, strict_map_key=False)
+
+
+def encode_entity(entity: Any) -> bytes:
+    """Сериализовать доменную сущность в msgpack"""
+    return _pack(entity)
+
+
+def decode_entity(data: bytes) -> Any:
+    """Восстановить доменную сущность из msgpack"""
+    return _unpack(data)
@@ -0,0 +1,147 @@
+# app/infrastructure/cache/entity_cache.py
+
+import asyncio
+from collections.abc import Awaitable, Callable, Collection
+from typing import Any, TypeVar
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.cache.codec import decode_entity, encode_entity
+from app.infrastructure.database.replica_router import primary_reads
+
+__all__ = ["RedisEntityCache"]
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Ключи, изменённые в текущей транзакции сессии
+_PENDING_KEYS = "entity_cache_pending_keys"
+_LISTENING = "entity_cache_listening"
+
+# Загрузка у лидера не удалась: ожидающие идут в БД сами
+_LOAD_FAILED = b""
+
+
+class RedisEntityCache:
+    """
+    Read-through кэш доменных сущностей в Redis
+
+    Сущности хранятся в msgpack под ключами ``entity:{namespace}:{id}``.
+    Одновременные промахи по одному ключу внутри процесса объединяются:
+    запрос в БД выполняет первый, остальные ждут его результат.
+
+    Изменённые ключи удаляются сразу и ещё раз после коммита сессии —
+    второе удаление убирает значение, которое параллельный читатель мог
+    успеть закэшировать до коммита. Пока транзакция не завершена, сама
+    сессия читает эти сущности мимо кэша. Промахи загружаются из primary,
+    даже если сессия читает с реплик.
+    """
+
+    def __init__(self, redis: Redis, enabled: bool = True):
+        self.redis = redis
+        self.enabled = enabled
+        self._inflight: dict[str, asyncio.Future[bytes | None]] = {}
+        self._stale: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def key(namespace: str, entity_id: UUID) -> str:
+        return f"entity:{namespace}:{entity_id}"
+
+    async def get_or_load(
+            self,
+            session: AsyncSession,
+            namespace: str,
+            entity_id: UUID,
+            ttl: int,
+            loader: Callable[[], Awaitable[T | None]],
+    ) -> T | None:
+        """Вернуть сущность из кэша или загрузить её из БД"""
+        key = self.key(namespace, entity_id)
+        if not self.enabled or key in session.info.get(_PENDING_KEYS, ()):
+            return await loader()
+
+        raw = await self._get(key)
+        if raw is not None:
+            return decode_entity(raw)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            raw = await asyncio.shield(inflight)
+            if raw is _LOAD_FAILED:
+                return await loader()
+            return decode_entity(raw) if raw is not None else None
+
+        future: asyncio.Future[bytes | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            # Отстающая реплика закэшировала бы старую версию на весь TTL
+            with primary_reads(session):
+                entity = await loader()
+            raw = encode_entity(entity) if entity is not None else None
+            if raw is not None and key not in self._stale:
+                await self._set(key, raw, ttl)
+            future.set_result(raw)
+        except BaseException:
+            future.set_result(_LOAD_FAILED)
+            raise
+        finally:
+            del self._inflight[key]
+            self._stale.discard(key)
+        return entity
+
+    async def invalidate(
+            self,
+            session: AsyncSession,
+            namespace: str,
+            entity_ids: Collection[UUID],
+    ) -> None:
+        """Удалить сущности из кэша сейчас и повторно после коммита сессии"""
+        if not self.enabled or not entity_ids:
+            return
+
+        keys = {self.key(namespace, entity_id) for entity_id in entity_ids}
+        if not session.info.get(_LISTENING):
+            session.info[_LISTENING] = True
+            event.listen(session.sync_session, "after_commit", self._after_commit)
+            event.listen(session.sync_session, "after_rollback", self._after_rollback)
+        session.info.setdefault(_PENDING_KEYS, set()).update(keys)
+
+        await self._delete(keys)
+
+    def _after_commit(self, sync_session: Any) -> None:
+        keys = sync_session.info.pop(_PENDING_KEYS, None)
+        if keys:
+            task = asyncio.get_running_loop().create_task(self._delete(keys))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _after_rollback(self, sync_session: Any) -> None:
+        # Откат: в БД ничего не изменилось, ранее удалённые ключи просто прогреются заново
+        sync_session.info.pop(_PENDING_KEYS, None)
+
+    async def _get(self, key: str) -> bytes | None:
+        try:
+            return await self.redis.get(key)
+        except RedisError:
+            logger.warning("entity_cache_unavailable", key=key, exc_info=True)
+            return None
+
+    async def _set(self, key: str, raw: bytes, ttl: int) -> None:
+        try:
+            await self.redis.set(key, raw, ex=ttl)
+        except RedisError:
+            logger.warning("entity_cache_unavailable", key=key, exc_info=True)
+
+    async def _delete(self, keys: Collection[str]) -> None:
+        self._stale.update(key for key in keys if key in self._inflight)
+        try:
+            await self.redis.delete(*keys)
+        except RedisError:
+            logger.warning("entity_cache_invalidation_failed", keys=list(keys), exc_info=True)
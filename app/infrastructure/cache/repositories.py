@@ -0,0 +1,269 @@
+# app/infrastructure/cache/repositories.py
+
+from collections.abc import Awaitable, Callable, Collection, Sequence
+from typing import TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.club_membership import ClubMembership
+from app.domain.entities.moto_club import MotoClub
+from app.domain.entities.motokonig import MotoKonig
+from app.domain.entities.motorcycle import Motorcycle
+from app.domain.entities.profile import Profile
+from app.domain.ports.repositories.club_membership import IClubMembershipRepository
+from app.domain.ports.repositories.moto_club import IMotoClubRepository
+from app.domain.ports.repositories.motokonig import IMotoKonigRepository
+from app.domain.ports.repositories.motorcycle import IMotorcycleRepository
+from app.domain.ports.repositories.profile import IProfileRepository
+from app.domain.ports.specs.club_membership import ClubMembershipSpecificationPort
+from app.domain.ports.specs.moto_club import MotoClubSpecificationPort
+from app.domain.ports.specs.motokonig import MotoKonigSpecificationPort
+from app.domain.ports.specs.motorcycle import MotorcycleSpecificationPort
+from app.domain.ports.specs.profile import ProfileSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.specs.club_membership.membership_by_id import (
+    ClubMembershipById,
+)
+from app.infrastructure.specs.moto.moto_by_id import MotorcycleById
+from app.infrastructure.specs.moto_club.club_by_id import MotoClubById
+from app.infrastructure.specs.motokonig.motokonig_by_id import MotoKonigById
+from app.infrastructure.specs.profile.profile_by_id import ProfileById
+
+__all__ = [
+    "CachedClubMembershipRepository",
+    "CachedMotoClubRepository",
+    "CachedMotoKonigRepository",
+    "CachedMotorcycleRepository",
+    "CachedProfileRepository",
+]
+
+T = TypeVar("T")
+
+
+class _CachedRepository:
+    """
+    Основа декораторов репозиториев с кэшем сущностей
+
+    Чтение по ID идёт через кэш, остальные запросы — напрямую в
+    репозиторий. Любая запись сбрасывает затронутые ключи.
+    """
+
+    namespace: str
+
+    def __init__(
+            self,
+            cache: RedisEntityCache,
+            session: AsyncSession,
+            ttl: int,
+    ):
+        self._cache = cache
+        self._session = session
+        self._ttl = ttl
+
+    def _cached(self, entity_id: UUID, loader: Callable[[], Awaitable[T | None]]) -> Awaitable[T | None]:
+        return self._cache.get_or_load(self._session, self.namespace, entity_id, self._ttl, loader)
+
+    async def _invalidate(self, *entity_ids: UUID) -> None:
+        await self._cache.invalidate(self._session, self.namespace, entity_ids)
+
+
+class CachedProfileRepository(_CachedRepository, IProfileRepository):
+    """Репозиторий профилей с кэшем чтения по ID"""
+
+    namespace = "profile"
+
+    def __init__(self, repo: IProfileRepository, cache: RedisEntityCache, session: AsyncSession, ttl: int):
+        super().__init__(cache, session, ttl)
+        self._repo = repo
+
+    async def add(self, profile: Profile) -> Profile:
+        return await self._repo.add(profile)
+
+    async def get(self, spec: ProfileSpecificationPort) -> Profile | None:
+        if isinstance(spec, ProfileById):
+            return await self._cached(spec.profile_id, lambda: self._repo.get(spec))
+        return await self._repo.get(spec)
+
+    async def get_version_by_user_id(self, user_id: UUID) -> EntityVersion | None:
+        return await self._repo.get_version_by_user_id(user_id)
+
+    async def get_list(self, spec: ProfileSpecificationPort | None = None) -> list[Profile]:
+        return await self._repo.get_list(spec)
+
+    async def update(self, profile: Profile) -> Profile:
+        updated = await self._repo.update(profile)
+        await self._invalidate(profile.id)
+        return updated
+
+    async def delete(self, profile_id: UUID) -> bool:
+        deleted = await self._repo.delete(profile_id)
+        await self._invalidate(profile_id)
+        return deleted
+
+
+class CachedMotorcycleRepository(_CachedRepository, IMotorcycleRepository):
+    """Репозиторий мотоциклов с кэшем чтения по ID"""
+
+    namespace = "motorcycle"
+
+    def __init__(self, repo: IMotorcycleRepository, cache: RedisEntityCache, session: AsyncSession, ttl: int):
+        super().__init__(cache, session, ttl)
+        self._repo = repo
+
+    async def add(self, motorcycle: Motorcycle) -> Motorcycle:
+        return await self._repo.add(motorcycle)
+
+    async def get(self, spec: MotorcycleSpecificationPort) -> Motorcycle | None:
+        if isinstance(spec, MotorcycleById):
+            return await self._cached(spec.motorcycle_id, lambda: self._repo.get(spec))
+        return await self._repo.get(spec)
+
+    async def get_list(self, spec: MotorcycleSpecificationPort | None = None) -> list[Motorcycle]:
+        return await self._repo.get_list(spec)
+
+    async def update(self, motorcycle: Motorcycle) -> Motorcycle:
+        updated = await self._repo.update(motorcycle)
+        await self._invalidate(motorcycle.id)
+        return updated
+
+    async def delete(self, motorcycle_id: UUID) -> bool:
+        deleted = await self._repo.delete(motorcycle_id)
+        await self._invalidate(motorcycle_id)
+        return deleted
+
+
+class CachedMotoClubRepository(_CachedRepository, IMotoClubRepository):
+    """Репозиторий мотоклубов с кэшем чтения по ID"""
+
+    namespace = "moto_club"
+
+    def __init__(self, repo: IMotoClubRepository, cache: RedisEntityCache, session: AsyncSession, ttl: int):
+        super().__init__(cache, session, ttl)
+        self._repo = repo
+
+    async def add(self, club: MotoClub) -> MotoClub:
+        return await self._repo.add(club)
+
+    async def get(self, spec: MotoClubSpecificationPort) -> MotoClub | None:
+        if isinstance(spec, MotoClubById):
+            return await self._cached(spec.club_id, lambda: self._repo.get(spec))
+        return await self._repo.get(spec)
+
+    async def get_version(self, club_id: UUID) -> EntityVersion | None:
+        # Только из БД: число участников в закэшированном клубе может отставать
+        return await self._repo.get_version(club_id)
+
+    async def get_list(self, spec: MotoClubSpecificationPort | None = None) -> list[MotoClub]:
+        return await self._repo.get_list(spec)
+
+    async def update(self, club: MotoClub) -> MotoClub:
+        updated = await self._repo.update(club)
+        await self._invalidate(club.id)
+        return updated
+
+    async def delete(self, club_id: UUID) -> bool:
+        deleted = await self._repo.delete(club_id)
+        await self._invalidate(club_id)
+        return deleted
+
+
+class CachedClubMembershipRepository(_CachedRepository, IClubMembershipRepository):
+    """
+    Репозиторий членств, сбрасывающий кэш клуба
+
+    Сами членства не кэшируются, но в закэшированном клубе хранится
+    количество участников.
+    """
+
+    namespace = CachedMotoClubRepository.namespace
+
+    def __init__(self, repo: IClubMembershipRepository, cache: RedisEntityCache, session: AsyncSession):
+        super().__init__(cache, session, ttl=0)
+        self._repo = repo
+
+    async def add(self, membership: ClubMembership) -> ClubMembership:
+        added = await self._repo.add(membership)
+        await self._invalidate(membership.club_id)
+        return added
+
+    async def get(self, spec: ClubMembershipSpecificationPort) -> ClubMembership | None:
+        return await self._repo.get(spec)
+
+    async def get_list(self, spec: ClubMembershipSpecificationPort | None = None) -> list[ClubMembership]:
+        return await self._repo.get_list(spec)
+
+    async def update(self, membership: ClubMembership) -> ClubMembership:
+        updated = await self._repo.update(membership)
+        await self._invalidate(membership.club_id)
+        return updated
+
+    async def delete(self, membership_id: UUID) -> bool:
+        # Клуб известен только из самого членства: читаем его до удаления
+        membership = await self._repo.get(ClubMembershipById(membership_id))
+        deleted = await self._repo.delete(membership_id)
+        if membership is not None:
+            await self._invalidate(membership.club_id)
+        return deleted
+
+    async def get_user_membership_in_club(self, user_id: UUID, club_id: UUID) -> ClubMembership | None:
+        return await self._repo.get_user_membership_in_club(user_id, club_id)
+
+    async def count_club_members(self, club_id: UUID, active_only: bool = True) -> int:
+        return await self._repo.count_club_members(club_id, active_only)
+
+    async def get_club_member_ids(self, club_id: UUID) -> list[UUID]:
+        return await self._repo.get_club_member_ids(club_id)
+
+    async def get_club_peer_ids(self, user_id: UUID, candidate_ids: Collection[UUID]) -> set[UUID]:
+        return await self._repo.get_club_peer_ids(user_id, candidate_ids)
+
+
+class CachedMotoKonigRepository(_CachedRepository, IMotoKonigRepository):
+    """Репозиторий MotoKonig с кэшем чтения по ID"""
+
+    namespace = "motokonig"
+
+    def __init__(self, repo: IMotoKonigRepository, cache: RedisEntityCache, session: AsyncSession, ttl: int):
+        super().__init__(cache, session, ttl)
+        self._repo = repo
+
+    async def add(self, motokonig: MotoKonig) -> MotoKonig:
+        return await self._repo.add(motokonig)
+
+    async def get(self, spec: MotoKonigSpecificationPort) -> MotoKonig | None:
+        if isinstance(spec, MotoKonigById):
+            return await self.get_by_id(spec.motokonig_id)
+        return await self._repo.get(spec)
+
+    async def get_by_id(self, motokonig_id: UUID) -> MotoKonig | None:
+        return await self._cached(motokonig_id, lambda: self._repo.get_by_id(motokonig_id))
+
+    async def get_many(self, motokonig_ids: Sequence[UUID]) -> list[MotoKonig]:
+        return await self._repo.get_many(motokonig_ids)
+
+    async def get_by_user_id(self, user_id: UUID) -> MotoKonig | None:
+        return await self._repo.get_by_user_id(user_id)
+
+    async def get_version_by_user_id(self, user_id: UUID) -> EntityVersion | None:
+        return await self._repo.get_version_by_user_id(user_id)
+
+    async def get_list(self, spec: MotoKonigSpecificationPort | None = None) -> list[MotoKonig]:
+        return await self._repo.get_list(spec)
+
+    async def update(self, motokonig: MotoKonig) -> MotoKonig:
+        updated = await self._repo.update(motokonig)
+        await self._invalidate(motokonig.motokonig_id)
+        return updated
+
+    async def update_many(self, motokonigs: Sequence[MotoKonig]) -> None:
+        await self._repo.update_many(motokonigs)
+        await self._invalidate(*(m.motokonig_id for m in motokonigs))
+
+    async def delete(self, motokonig_id: UUID) -> None:
+        await self._repo.delete(motokonig_id)
+        await self._invalidate(motokonig_id)
+
+    async def exists(self, spec: MotoKonigSpecificationPort) -> bool:
+        return await self._repo.exists(spec)
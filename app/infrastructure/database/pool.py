@@ -0,0 +1,58 @@
+# app/infrastructure/database/pool.py
+
+from time import perf_counter
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+__all__ = ["InstrumentedAsyncQueuePool"]
+
+# liveall: при нескольких процессах у каждого воркера своя серия с меткой pid
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Постоянный размер пула соединений", ["pool"], multiprocess_mode="liveall"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Соединения, выданные из пула", ["pool"], multiprocess_mode="liveall"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Соединения сверх pool_size, отрицательное значение — ещё не открытые постоянные",
+    ["pool"],
+    multiprocess_mode="liveall",
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Ожидание соединения из пула",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул asyncpg с метриками занятости и ожидания соединений
+
+    Метка ``pool`` берётся из ``pool_logging_name`` движка.
+    """
+
+    @property
+    def metrics_label(self) -> str:
+        return getattr(self, "logging_name", None) or "default"
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(self.metrics_label).observe(perf_counter() - started)
+            self._publish()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._publish()
+
+    def _publish(self) -> None:
+        label = self.metrics_label
+        DB_POOL_SIZE.labels(label).set(self.size())
+        DB_POOL_CHECKED_OUT.labels(label).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(label).set(self.overflow())
@@ -0,0 +1,133 @@
+# app/infrastructure/database/query_stats.py
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+__all__ = [
+    "QueryStats",
+    "RepeatedQueryError",
+    "add_query_stats",
+    "current_query_stats",
+    "install_query_stats",
+    "statement_shape",
+    "track_queries",
+]
+
+logger = structlog.get_logger(__name__)
+
+_current: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+_STARTED = "query_stats_started"
+
+# Списки параметров разной длины — одна форма запроса: IN ($1, $2, $3) -> IN (?)
+_PARAM_LIST = re.compile(r"\(\s*(?:\$\d+|\?|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\$\d+|\?|%\(\w+\)s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Нормализованный текст запроса без зависимости от числа параметров"""
+    return _PARAM_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RepeatedQueryError(RuntimeError):
+    """Один и тот же запрос повторился в рамках запроса больше порога"""
+
+
+@dataclass
+class QueryStats:
+    """Запросы к БД в рамках одного HTTP-запроса или блока кода"""
+    repeat_threshold: int = 10
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+    def repeated(self) -> list[tuple[str, int]]:
+        """Формы запросов, выполненные больше ``repeat_threshold`` раз"""
+        return [
+            (shape, times) for shape, times in self.shapes.most_common()
+            if times > self.repeat_threshold
+        ]
+
+    def check(self, strict: bool = False) -> None:
+        """Предупредить о повторах, а в строгом режиме — упасть"""
+        repeated = self.repeated()
+        for shape, times in repeated:
+            logger.warning("db_query_repeated", statement=shape[:300], times=times)
+        if strict and repeated:
+            shape, times = repeated[0]
+            raise RepeatedQueryError(
+                f"Statement executed {times} times (threshold {self.repeat_threshold}): {shape[:300]}"
+            )
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration_ms:.1f};desc="{self.count} queries"'
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(repeat_threshold: int = 10, strict: bool = False) -> Iterator[QueryStats]:
+    """Считать запросы внутри блока и проверить повторы на выходе"""
+    stats = QueryStats(repeat_threshold=repeat_threshold)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+    stats.check(strict)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault(_STARTED, []).append(perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    started = conn.info.get(_STARTED)
+    if stats is None or not started:
+        return
+    stats.count += 1
+    stats.duration += perf_counter() - started.pop()
+    stats.shapes[statement_shape(statement)] += 1
+
+
+def _handle_error(context: Any) -> None:
+    # Упавший запрос не доходит до after_cursor_execute: снимаем его отметку,
+    # иначе следующий запрос на этом соединении получит чужое время начала
+    started = context.connection.info.get(_STARTED) if context.connection else None
+    if started and _current.get() is not None:
+        started.pop()
+
+
+def install_query_stats() -> None:
+    """Подключить учёт запросов ко всем движкам, включая реплики"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+def add_query_stats(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Процессор structlog: текущие счётчики запросов в каждой записи"""
+    stats = _current.get()
+    if stats is not None:
+        event_dict.setdefault("db_queries", stats.count)
+        event_dict.setdefault("db_time_ms", round(stats.duration_ms, 2))
+    return event_dict
@@ -0,0 +1,219 @@
+# app/infrastructure/database/replica_router.py
+
+import asyncio
+import hashlib
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
+from itertools import count
+from typing import Any
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import ORMExecuteState
+
+from app.config.settings import ReplicaConfig
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool
+
+__all__ = ["ReplicaRouter", "primary_reads"]
+
+logger = structlog.get_logger(__name__)
+
+# Флаги в session.info
+_READ_ONLY = "replica_read_only"
+_PINNED = "replica_pinned"
+_CLIENT_KEY = "replica_client_key"
+_LISTENING = "replica_listening"
+_FORCE_PRIMARY = "replica_force_primary"
+
+# Реплика, догнавшая primary, отставания не имеет, даже если записей давно не было
+LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+@contextmanager
+def primary_reads(session: AsyncSession) -> Iterator[None]:
+    """Выполнять чтения блока на primary, не закрепляя за ним всю сессию"""
+    info = session.info
+    info[_FORCE_PRIMARY] = info.get(_FORCE_PRIMARY, 0) + 1
+    try:
+        yield
+    finally:
+        info[_FORCE_PRIMARY] -= 1
+
+
+class ReplicaRouter:
+    """
+    Маршрутизация чтения сессии запроса на реплики PostgreSQL
+
+    Сессии, помеченные только для чтения, отправляют SELECT на одну из
+    здоровых реплик по кругу. После первой записи (flush, DML или
+    SELECT ... FOR UPDATE) сессия до конца запроса работает с primary.
+    Клиент, закоммитивший запись, ещё ``read_your_writes_window`` секунд
+    читает из primary, чтобы видеть свои изменения.
+
+    Фоновая проверка раз в ``check_interval`` секунд измеряет отставание
+    реплик и исключает те, что отстали больше ``max_lag`` или недоступны.
+    """
+
+    def __init__(self, engines: Sequence[AsyncEngine], redis: Redis, config: ReplicaConfig):
+        self.engines = list(engines)
+        self.redis = redis
+        self.config = config
+        self._healthy: list[AsyncEngine] = list(self.engines)
+        self._counter = count()
+        self._task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_dsns(
+            cls,
+            dsns: Sequence[str],
+            redis: Redis,
+            config: ReplicaConfig,
+            **engine_options: Any,
+    ) -> "ReplicaRouter":
+        engines = [
+            create_async_engine(
+                dsn,
+                poolclass=InstrumentedAsyncQueuePool,
+                pool_logging_name=f"replica{index}",
+                **engine_options,
+            )
+            for index, dsn in enumerate(dsns, start=1)
+        ]
+        return cls(engines, redis, config)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.engines)
+
+    @property
+    def healthy(self) -> list[AsyncEngine]:
+        return list(self._healthy)
+
+    @staticmethod
+    def client_key(credentials: str) -> str:
+        # Токен в Redis не храним, только его хэш
+        return "db:primary_pin:" + hashlib.sha256(credentials.encode()).hexdigest()[:32]
+
+    async def attach(self, session: AsyncSession, read_only: bool, client: str | None = None) -> None:
+        """Включить маршрутизацию для сессии запроса"""
+        if not self.enabled:
+            return
+
+        info = session.info
+        if client:
+            info[_CLIENT_KEY] = self.client_key(client)
+        if read_only and not (client and await self._recently_wrote(info[_CLIENT_KEY])):
+            info[_READ_ONLY] = True
+
+        if not info.get(_LISTENING):
+            info[_LISTENING] = True
+            event.listen(session.sync_session, "do_orm_execute", self._route)
+            event.listen(session.sync_session, "after_flush", self._after_flush)
+            event.listen(session.sync_session, "after_commit", self._after_commit)
+
+    async def start(self) -> None:
+        """Запустить фоновую проверку отставания реплик"""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._monitor())
+
+    async def stop(self) -> None:
+        """Остановить проверку и закрыть пулы реплик"""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for engine in self.engines:
+            await engine.dispose()
+
+    async def check_lag(self) -> None:
+        """Измерить отставание реплик и обновить список здоровых"""
+        lags = await asyncio.gather(*(self._lag(engine) for engine in self.engines))
+        healthy = []
+        for engine, lag in zip(self.engines, lags, strict=True):
+            is_healthy = lag is not None and lag <= self.config.max_lag
+            if is_healthy:
+                healthy.append(engine)
+                if engine not in self._healthy:
+                    logger.info("replica_restored", replica=engine.url.host, lag=lag)
+            elif engine in self._healthy:
+                logger.warning("replica_ejected", replica=engine.url.host, lag=lag)
+        self._healthy = healthy
+
+    def _route(self, state: ORMExecuteState) -> None:
+        session = state.session
+        info = session.info
+        if not state.is_select or getattr(state.statement, "_for_update_arg", None) is not None:
+            info[_PINNED] = True
+            return
+        if (
+                not info.get(_READ_ONLY)
+                or info.get(_PINNED)
+                or info.get(_FORCE_PRIMARY)
+                or "bind" in state.bind_arguments
+        ):
+            return
+        # Несброшенные изменения уйдут в primary автофлашем прямо перед этим запросом
+        if session.new or session.dirty or session.deleted:
+            info[_PINNED] = True
+            return
+
+        engine = self._pick()
+        if engine is not None:
+            state.bind_arguments["bind"] = engine.sync_engine
+
+    def _pick(self) -> AsyncEngine | None:
+        healthy = self._healthy
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def _after_flush(self, session: Any, flush_context: Any) -> None:
+        session.info[_PINNED] = True
+
+    def _after_commit(self, session: Any) -> None:
+        client_key = session.info.get(_CLIENT_KEY)
+        if client_key and session.info.get(_PINNED):
+            task = asyncio.get_running_loop().create_task(self._remember_write(client_key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _remember_write(self, client_key: str) -> None:
+        try:
+            await self.redis.set(client_key, "1", ex=self.config.read_your_writes_window)
+        except RedisError:
+            logger.warning("replica_pin_unavailable", exc_info=True)
+
+    async def _recently_wrote(self, client_key: str) -> bool:
+        try:
+            return bool(await self.redis.exists(client_key))
+        except RedisError:
+            # Без Redis не знаем, писал ли клиент: безопаснее читать из primary
+            logger.warning("replica_pin_unavailable", exc_info=True)
+            return True
+
+    async def _monitor(self) -> None:
+        while True:
+            await self.check_lag()
+            await asyncio.sleep(self.config.check_interval)
+
+    async def _lag(self, engine: AsyncEngine) -> float | None:
+        try:
+            async with asyncio.timeout(self.config.check_interval):
+                async with engine.connect() as conn:
+                    return float(await conn.scalar(LAG_QUERY))
+        except (SQLAlchemyError, OSError, TimeoutError):
+            logger.warning("replica_unreachable", replica=engine.url.host, exc_info=True)
+            return None
@@ -4,10 +4,12 @@ from app.infrastructure.di.providers import (
     InfrastructureProvider,
     PresentationProvider,
     UseCaseProvider,
+    WorkerProvider,
 )
 
 __all__ = [
     "InfrastructureProvider",
     "UseCaseProvider",
     "PresentationProvider",
+    "WorkerProvider",
 ]
@@ -5,9 +5,11 @@ from app.infrastructure.di.providers.infrastructure.provider import (
 )
 from app.infrastructure.di.providers.presentation.provider import PresentationProvider
 from app.infrastructure.di.providers.use_cases.provider import UseCaseProvider
+from app.infrastructure.di.providers.worker import WorkerProvider
 
 __all__ = [
     "InfrastructureProvider",
     "UseCaseProvider",
     "PresentationProvider",
+    "WorkerProvider",
 ]
@@ -1,12 +1,18 @@
+from collections.abc import AsyncIterable
+
 from advanced_alchemy.extensions.fastapi import AdvancedAlchemy
 from dishka import Provider, Scope, provide
 from fastapi import Request
 from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config.settings import Config
+from app.infrastructure.database.replica_router import ReplicaRouter
 from app.infrastructure.messaging.redis_client import RedisClient
 
+# Запросы этих методов читают с реплик
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
 
 class InfrastructureBaseProvider(Provider):
     def __init__(self, alchemy: AdvancedAlchemy, config: Config) -> None:
@@ -15,9 +21,32 @@ class InfrastructureBaseProvider(Provider):
         self.config = config
 
     @provide(scope=Scope.REQUEST)
-    def provide_db_session(self, request: Request) -> AsyncSession:
-        """Get DB session from Advanced-Alchemy."""
-        return self.alchemy.get_session(request)
+    async def provide_db_session(self, request: Request, router: ReplicaRouter) -> AsyncSession:
+        """Get DB session from Advanced-Alchemy with replica routing for reads."""
+        session = self.alchemy.get_session(request)
+        await router.attach(
+            session,
+            read_only=request.method in READ_ONLY_METHODS,
+            client=request.headers.get("authorization"),
+        )
+        return session
+
+    @provide(scope=Scope.APP)
+    async def provide_replica_router(self, redis: Redis) -> AsyncIterable[ReplicaRouter]:
+        """Маршрутизатор чтения на реплики, без реплик ничего не меняет."""
+        router = ReplicaRouter.from_dsns(
+            self.config.postgres.get_replica_dsns(),
+            redis,
+            self.config.replica,
+            **self.config.postgres.get_engine_options(),
+        )
+        yield router
+        await router.stop()
+
+    @provide(scope=Scope.APP)
+    def provide_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Фабрика сессий для фоновых задач вне HTTP-запроса."""
+        return self.alchemy.get_async_config().create_session_maker()
 
     @provide(scope=Scope.APP)
     async def provide_redis(self) -> Redis:
@@ -5,6 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.ports.repositories.club_invitation import IClubInvitationRepository
 from app.domain.ports.repositories.club_membership import IClubMembershipRepository
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.cache.repositories import CachedClubMembershipRepository
 from app.infrastructure.repositories.sql_club_invitation_repo import (
     SqlClubInvitationRepository,
 )
@@ -15,8 +17,12 @@ from app.infrastructure.repositories.sql_club_membership_repo import (
 
 class ClubRepoProvider(Provider):
     @provide(scope=Scope.REQUEST)
-    def provide_club_membership_repo(self, session: AsyncSession) -> IClubMembershipRepository:
-        return SqlClubMembershipRepository(session)
+    def provide_club_membership_repo(
+            self,
+            session: AsyncSession,
+            cache: RedisEntityCache,
+    ) -> IClubMembershipRepository:
+        return CachedClubMembershipRepository(SqlClubMembershipRepository(session), cache, session)
 
     @provide(scope=Scope.REQUEST)
     def provide_club_invitation_repo(self, session: AsyncSession) -> IClubInvitationRepository:
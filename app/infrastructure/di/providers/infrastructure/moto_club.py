@@ -3,11 +3,18 @@
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.settings import Config
 from app.domain.ports.repositories.moto_club import IMotoClubRepository
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.cache.repositories import CachedMotoClubRepository
 from app.infrastructure.repositories.sql_moto_club_repo import SqlMotoClubRepository
 
 
 class MotoClubRepoProvider(Provider):
+    config: Config
+
     @provide(scope=Scope.REQUEST)
-    def provide_moto_club_repo(self, session: AsyncSession) -> IMotoClubRepository:
-        return SqlMotoClubRepository(session)
+    def provide_moto_club_repo(self, session: AsyncSession, cache: RedisEntityCache) -> IMotoClubRepository:
+        return CachedMotoClubRepository(
+            SqlMotoClubRepository(session), cache, session, self.config.entity_cache.moto_club_ttl
+        )
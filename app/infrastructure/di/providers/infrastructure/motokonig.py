@@ -3,9 +3,12 @@
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.settings import Config
 from app.domain.ports.repositories.achievement import IAchievementRepository
 from app.domain.ports.repositories.motokonig import IMotoKonigRepository
 from app.domain.ports.repositories.ride import IRideRepository
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.cache.repositories import CachedMotoKonigRepository
 from app.infrastructure.repositories.sql_achievement_repo import (
     SqlAchievementRepository,
 )
@@ -18,9 +21,13 @@ __all__ = ["MotoKonigRepoProvider"]
 class MotoKonigRepoProvider(Provider):
     """DI провайдер для MotoKonig репозиториев"""
 
+    config: Config
+
     @provide(scope=Scope.REQUEST)
-    def provide_motokonig_repo(self, session: AsyncSession) -> IMotoKonigRepository:
-        return SqlMotoKonigRepository(session)
+    def provide_motokonig_repo(self, session: AsyncSession, cache: RedisEntityCache) -> IMotoKonigRepository:
+        return CachedMotoKonigRepository(
+            SqlMotoKonigRepository(session), cache, session, self.config.entity_cache.motokonig_ttl
+        )
 
     @provide(scope=Scope.REQUEST)
     def provide_ride_repo(self, session: AsyncSession) -> IRideRepository:
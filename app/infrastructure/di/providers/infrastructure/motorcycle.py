@@ -3,11 +3,18 @@
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.settings import Config
 from app.domain.ports.repositories.motorcycle import IMotorcycleRepository
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.cache.repositories import CachedMotorcycleRepository
 from app.infrastructure.repositories.sql_motorcycle_repo import SqlMotorcycleRepository
 
 
 class MotorcycleRepoProvider(Provider):
+    config: Config
+
     @provide(scope=Scope.REQUEST)
-    def provide_motorcycle_repo(self, session: AsyncSession) -> IMotorcycleRepository:
-        return SqlMotorcycleRepository(session)
+    def provide_motorcycle_repo(self, session: AsyncSession, cache: RedisEntityCache) -> IMotorcycleRepository:
+        return CachedMotorcycleRepository(
+            SqlMotorcycleRepository(session), cache, session, self.config.entity_cache.motorcycle_ttl
+        )
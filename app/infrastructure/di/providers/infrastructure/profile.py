@@ -3,11 +3,18 @@
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.settings import Config
 from app.domain.ports.repositories.profile import IProfileRepository
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.cache.repositories import CachedProfileRepository
 from app.infrastructure.repositories.sql_profile_repo import SqlProfileRepository
 
 
 class ProfileRepoProvider(Provider):
+    config: Config
+
     @provide(scope=Scope.REQUEST)
-    def provide_profile_repo(self, session: AsyncSession) -> IProfileRepository:
-        return SqlProfileRepository(session)
+    def provide_profile_repo(self, session: AsyncSession, cache: RedisEntityCache) -> IProfileRepository:
+        return CachedProfileRepository(
+            SqlProfileRepository(session), cache, session, self.config.entity_cache.profile_ttl
+        )
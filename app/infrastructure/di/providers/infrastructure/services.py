@@ -1,16 +1,40 @@
 # app/infrastructure/di/providers/infrastructure/services.py
 
+from collections.abc import AsyncIterable, Iterable
+
 from dishka import Provider, Scope, provide
 from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config.settings import Config
 from app.domain.ports.repositories.file_storage import FileStoragePort
 from app.domain.ports.repositories.pin_storage import PinStoragePort
+from app.domain.ports.services.checkpoint_index import CheckpointIndexPort
+from app.domain.ports.services.event_publisher import EventPublisherPort
+from app.domain.ports.services.leaderboard import LeaderboardPort
 from app.domain.ports.services.password import PasswordService
+from app.domain.ports.services.rate_limiter import RateLimiterPort
+from app.domain.ports.services.ride_position_hub import RidePositionHubPort
+from app.domain.ports.services.telemetry_buffer import TelemetryBufferPort
 from app.domain.ports.services.token import TokenServicePort
+from app.domain.ports.services.viewer_relationship_cache import (
+    ViewerRelationshipCachePort,
+)
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.messaging.outbox import OutboxEventPublisher
+from app.infrastructure.messaging.redis_client import InstrumentedRedis
+from app.infrastructure.services.checkpoint_index import CachedCheckpointIndex
+from app.infrastructure.services.leaderboard import RedisLeaderboard
 from app.infrastructure.services.password_service import PasswordServiceImpl
 from app.infrastructure.services.pin_storage import RedisPinStorage
+from app.infrastructure.services.rate_limiter import RedisRateLimiter
+from app.infrastructure.services.ride_position_hub import RedisRidePositionHub
+from app.infrastructure.services.telemetry_buffer import BatchedTelemetryBuffer
 from app.infrastructure.services.token_service import JWTTokenService
+from app.infrastructure.services.viewer_relationship_cache import (
+    RedisViewerRelationshipCache,
+    SessionViewerRelationshipCache,
+)
 from app.infrastructure.storage.minio_client import MinIOFileStorage
 
 
@@ -20,8 +44,10 @@ class ServicesProvider(Provider):
         self.config = config
 
     @provide(scope=Scope.APP)
-    def provide_password_service(self) -> PasswordService:
-        return PasswordServiceImpl()
+    def provide_password_service(self) -> Iterable[PasswordService]:
+        service = PasswordServiceImpl(self.config.security.bcrypt_workers)
+        yield service
+        service.close()
 
     @provide(scope=Scope.APP)
     def provide_token_service(self, redis: Redis) -> TokenServicePort:
@@ -32,5 +58,60 @@ class ServicesProvider(Provider):
         return RedisPinStorage(redis)
 
     @provide(scope=Scope.APP)
-    def provide_file_storage(self) -> FileStoragePort:
-        return MinIOFileStorage(self.config.minio)
+    def provide_rate_limiter(self, redis: Redis) -> RateLimiterPort:
+        return RedisRateLimiter(redis, self.config.rate_limit)
+
+    @provide(scope=Scope.APP)
+    async def provide_file_storage(self) -> AsyncIterable[FileStoragePort]:
+        storage = MinIOFileStorage(self.config.minio)
+        yield storage
+        await storage.stop()
+
+    @provide(scope=Scope.APP)
+    def provide_telemetry_buffer(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+    ) -> TelemetryBufferPort:
+        return BatchedTelemetryBuffer(session_factory, self.config.telemetry)
+
+    @provide(scope=Scope.APP)
+    def provide_ride_position_hub(self, redis: Redis) -> RidePositionHubPort:
+        return RedisRidePositionHub(redis, self.config.telemetry)
+
+    @provide(scope=Scope.APP)
+    def provide_checkpoint_index(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+    ) -> CheckpointIndexPort:
+        return CachedCheckpointIndex(session_factory, self.config.telemetry)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_event_publisher(self, session: AsyncSession) -> EventPublisherPort:
+        return OutboxEventPublisher(session)
+
+    @provide(scope=Scope.APP)
+    def provide_leaderboard(self, redis: Redis) -> LeaderboardPort:
+        return RedisLeaderboard(redis)
+
+    @provide(scope=Scope.APP)
+    def provide_redis_viewer_relationship_cache(self, redis: Redis) -> RedisViewerRelationshipCache:
+        return RedisViewerRelationshipCache(redis)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_viewer_relationship_cache(
+            self,
+            cache: RedisViewerRelationshipCache,
+            session: AsyncSession,
+    ) -> ViewerRelationshipCachePort:
+        return SessionViewerRelationshipCache(cache, session)
+
+    @provide(scope=Scope.APP)
+    async def provide_entity_cache(self) -> AsyncIterable[RedisEntityCache]:
+        # Отдельный клиент без decode_responses: сущности хранятся в msgpack
+        redis = InstrumentedRedis(
+            host=self.config.redis.redis_host,
+            port=self.config.redis.redis_port,
+            max_connections=50,
+        )
+        yield RedisEntityCache(redis, self.config.entity_cache.enabled)
+        await redis.aclose()
@@ -10,4 +10,5 @@ from app.infrastructure.repositories.sql_user_repo import SqlUserRepository
 class UserRepoProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def provide_user_repo(self, session: AsyncSession) -> IUserRepository:
+        # Без кэша сущностей: хэш пароля не должен попадать в Redis
         return SqlUserRepository(session)
@@ -14,6 +14,7 @@ from app.application.use_cases.ride.create_ride import CreateRideUseCase
 from app.application.use_cases.ride.join_ride import JoinRideUseCase
 from app.domain.ports.repositories.motokonig import IMotoKonigRepository
 from app.domain.ports.repositories.ride import IRideRepository
+from app.domain.ports.services.checkpoint_index import CheckpointIndexPort
 
 __all__ = ["MotoKonigControllerProvider"]
 
@@ -43,10 +44,12 @@ class MotoKonigControllerProvider(Provider):
             create_ride_uc: CreateRideUseCase,
             join_ride_uc: JoinRideUseCase,
             complete_ride_uc: CompleteRideUseCase,
+            checkpoint_index: CheckpointIndexPort,
     ) -> RideController:
         return RideController(
             ride_repo=ride_repo,
             create_ride_uc=create_ride_uc,
             join_ride_uc=join_ride_uc,
             complete_ride_uc=complete_ride_uc,
+            checkpoint_index=checkpoint_index,
         )
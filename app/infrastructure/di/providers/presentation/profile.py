@@ -3,6 +3,9 @@
 from dishka import Provider, Scope, provide
 
 from app.application.controllers.profile_controller import ProfileController
+from app.application.use_cases.club_membership.resolve_viewer_relationships import (
+    ResolveViewerRelationshipsUseCase,
+)
 from app.application.use_cases.profile.create_profile import CreateProfileUseCase
 from app.application.use_cases.profile.delete_profile import DeleteProfileUseCase
 from app.application.use_cases.profile.get_profile import GetProfileUseCase
@@ -27,6 +30,7 @@ class ProfileControllerProvider(Provider):
         add_social_link_uc: AddSocialLinkUseCase,
         remove_social_link_uc: RemoveSocialLinkUseCase,
         get_social_links_uc: GetProfileSocialLinksUseCase,
+        resolve_relationships_uc: ResolveViewerRelationshipsUseCase,
     ) -> ProfileController:
         return ProfileController(
             create_profile_uc,
@@ -36,4 +40,5 @@ class ProfileControllerProvider(Provider):
             add_social_link_uc,
             remove_social_link_uc,
             get_social_links_uc,
+            resolve_relationships_uc,
         )
@@ -4,9 +4,15 @@ from app.application.use_cases.club_invitation.invite_user import (
     InviteUserToClubUseCase,
 )
 from app.application.use_cases.club_membership.join_club import JoinClubUseCase
+from app.application.use_cases.club_membership.resolve_viewer_relationships import (
+    ResolveViewerRelationshipsUseCase,
+)
 from app.domain.ports.repositories.club_invitation import IClubInvitationRepository
 from app.domain.ports.repositories.club_membership import IClubMembershipRepository
 from app.domain.ports.repositories.moto_club import IMotoClubRepository
+from app.domain.ports.services.viewer_relationship_cache import (
+    ViewerRelationshipCachePort,
+)
 
 
 class ClubUseCaseProvider(Provider):
@@ -15,8 +21,9 @@ class ClubUseCaseProvider(Provider):
         self,
         club_repo: IMotoClubRepository,
         membership_repo: IClubMembershipRepository,
+        relationship_cache: ViewerRelationshipCachePort,
     ) -> JoinClubUseCase:
-        return JoinClubUseCase(club_repo, membership_repo)
+        return JoinClubUseCase(club_repo, membership_repo, relationship_cache)
 
     @provide(scope=Scope.REQUEST)
     def provide_invite_user_uc(
@@ -26,3 +33,11 @@ class ClubUseCaseProvider(Provider):
         invitation_repo: IClubInvitationRepository,
     ) -> InviteUserToClubUseCase:
         return InviteUserToClubUseCase(club_repo, membership_repo, invitation_repo)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_resolve_viewer_relationships_uc(
+        self,
+        membership_repo: IClubMembershipRepository,
+        relationship_cache: ViewerRelationshipCachePort,
+    ) -> ResolveViewerRelationshipsUseCase:
+        return ResolveViewerRelationshipsUseCase(membership_repo, relationship_cache)
@@ -7,6 +7,9 @@ from app.application.use_cases.moto_club.list_clubs import ListMotoClubsUseCase
 from app.application.use_cases.moto_club.update_club import UpdateMotoClubUseCase
 from app.domain.ports.repositories.club_membership import IClubMembershipRepository
 from app.domain.ports.repositories.moto_club import IMotoClubRepository
+from app.domain.ports.services.viewer_relationship_cache import (
+    ViewerRelationshipCachePort,
+)
 
 
 class MotoClubUseCaseProvider(Provider):
@@ -31,5 +34,10 @@ class MotoClubUseCaseProvider(Provider):
         return UpdateMotoClubUseCase(repo)
 
     @provide(scope=Scope.REQUEST)
-    def provide_delete_moto_club_uc(self, repo: IMotoClubRepository) -> DeleteMotoClubUseCase:
-        return DeleteMotoClubUseCase(repo)
+    def provide_delete_moto_club_uc(
+        self,
+        repo: IMotoClubRepository,
+        membership_repo: IClubMembershipRepository,
+        relationship_cache: ViewerRelationshipCachePort,
+    ) -> DeleteMotoClubUseCase:
+        return DeleteMotoClubUseCase(repo, membership_repo, relationship_cache)
@@ -2,13 +2,18 @@
 
 from dishka import Provider, Scope, provide
 
+from app.application.use_cases.motokonig.apply_ride_results import (
+    ApplyRideResultsUseCase,
+)
 from app.application.use_cases.motokonig.create_profile import (
     CreateMotoKonigProfileUseCase,
 )
 from app.application.use_cases.motokonig.get_top_riders import GetTopRidersUseCase
 from app.application.use_cases.motokonig.update_ride_stats import UpdateRideStatsUseCase
 from app.domain.ports.repositories.motokonig import IMotoKonigRepository
+from app.domain.ports.repositories.ride import IRideRepository
 from app.domain.ports.repositories.user import IUserRepository
+from app.domain.ports.services.leaderboard import LeaderboardPort
 
 __all__ = ["MotoKonigUseCaseProvider"]
 
@@ -28,13 +33,23 @@ class MotoKonigUseCaseProvider(Provider):
     def provide_update_stats_uc(
             self,
             motokonig_repo: IMotoKonigRepository,
+            leaderboard: LeaderboardPort,
     ) -> UpdateRideStatsUseCase:
-        return UpdateRideStatsUseCase(motokonig_repo)
+        return UpdateRideStatsUseCase(motokonig_repo, leaderboard)
 
     @provide(scope=Scope.REQUEST)
     def provide_get_top_riders_uc(
             self,
             motokonig_repo: IMotoKonigRepository,
+            leaderboard: LeaderboardPort,
     ) -> GetTopRidersUseCase:
-        return GetTopRidersUseCase(motokonig_repo)
+        return GetTopRidersUseCase(motokonig_repo, leaderboard)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_apply_ride_results_uc(
+            self,
+            motokonig_repo: IMotoKonigRepository,
+            ride_repo: IRideRepository,
+    ) -> ApplyRideResultsUseCase:
+        return ApplyRideResultsUseCase(motokonig_repo, ride_repo)
 
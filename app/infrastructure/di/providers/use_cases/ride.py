@@ -2,12 +2,17 @@
 
 from dishka import Provider, Scope, provide
 
-from app.application.use_cases.motokonig.update_ride_stats import UpdateRideStatsUseCase
 from app.application.use_cases.ride.complete_ride import CompleteRideUseCase
 from app.application.use_cases.ride.create_ride import CreateRideUseCase
+from app.application.use_cases.ride.ingest_telemetry import IngestTelemetryUseCase
 from app.application.use_cases.ride.join_ride import JoinRideUseCase
+from app.application.use_cases.ride.watch_positions import WatchRidePositionsUseCase
 from app.domain.ports.repositories.motokonig import IMotoKonigRepository
 from app.domain.ports.repositories.ride import IRideRepository
+from app.domain.ports.services.checkpoint_index import CheckpointIndexPort
+from app.domain.ports.services.event_publisher import EventPublisherPort
+from app.domain.ports.services.ride_position_hub import RidePositionHubPort
+from app.domain.ports.services.telemetry_buffer import TelemetryBufferPort
 
 __all__ = ["RideUseCaseProvider"]
 
@@ -35,6 +40,23 @@ class RideUseCaseProvider(Provider):
     def provide_complete_ride_uc(
             self,
             ride_repo: IRideRepository,
-            update_stats_uc: UpdateRideStatsUseCase,
+            event_publisher: EventPublisherPort,
     ) -> CompleteRideUseCase:
-        return CompleteRideUseCase(ride_repo, update_stats_uc)
+        return CompleteRideUseCase(ride_repo, event_publisher)
+
+    @provide(scope=Scope.APP)
+    def provide_ingest_telemetry_uc(
+            self,
+            telemetry_buffer: TelemetryBufferPort,
+            position_hub: RidePositionHubPort,
+            checkpoint_index: CheckpointIndexPort,
+    ) -> IngestTelemetryUseCase:
+        return IngestTelemetryUseCase(telemetry_buffer, position_hub, checkpoint_index)
+
+    @provide(scope=Scope.APP)
+    def provide_watch_positions_uc(
+            self,
+            telemetry_buffer: TelemetryBufferPort,
+            position_hub: RidePositionHubPort,
+    ) -> WatchRidePositionsUseCase:
+        return WatchRidePositionsUseCase(telemetry_buffer, position_hub)
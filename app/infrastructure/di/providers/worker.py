@@ -0,0 +1,19 @@
+# app/infrastructure/di/providers/worker.py
+"""Providers specific to the background worker process."""
+
+from collections.abc import AsyncIterable
+
+from dishka import Provider, Scope, provide
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class WorkerProvider(Provider):
+    """Сессия БД на обработку одного сообщения вместо сессии HTTP-запроса"""
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_db_session(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterable[AsyncSession]:
+        async with session_factory() as session:
+            yield session
@@ -0,0 +1,116 @@
+# app/infrastructure/messaging/outbox.py
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config.settings import OutboxConfig
+from app.domain.events.base import DomainEvent
+from app.domain.ports.services.event_publisher import EventPublisherPort
+from app.infrastructure.models.outbox_message import OutboxMessage
+
+if TYPE_CHECKING:
+    # Брокер нужен только ретранслятору в воркере, API его не загружает
+    from faststream.rabbit import RabbitBroker
+
+logger = structlog.get_logger(__name__)
+
+
+class OutboxEventPublisher(EventPublisherPort):
+    """
+    Публикация событий через таблицу outbox
+
+    Событие пишется в ту же сессию, что и изменения репозиториев, поэтому
+    попадает в БД только вместе с ними. В брокер его отправит OutboxRelay.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def publish(self, event: DomainEvent) -> None:
+        self.session.add(OutboxMessage(topic=event.topic, payload=event.to_payload()))
+
+
+class OutboxRelay:
+    """
+    Ретранслятор outbox в RabbitMQ
+
+    Забирает пачку сообщений через ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    публикует её целиком, дожидаясь подтверждений брокера, и одним DELETE
+    удаляет доставленные. Несколько ретрансляторов не мешают друг другу:
+    заблокированные строки достаются только одному из них. Доставка
+    at-least-once, обработчики должны быть идемпотентны.
+    """
+
+    def __init__(
+            self,
+            broker: "RabbitBroker",
+            session_factory: async_sessionmaker[AsyncSession],
+            config: OutboxConfig,
+    ):
+        self._broker = broker
+        self._session_factory = session_factory
+        self._poll_interval = config.poll_interval
+        self._batch_size = config.batch_size
+        self._task: asyncio.Task | None = None
+
+    async def relay_batch(self) -> int:
+        """Опубликовать одну пачку сообщений, вернуть количество доставленных"""
+        async with self._session_factory() as session, session.begin():
+            result = await session.execute(
+                select(OutboxMessage.id, OutboxMessage.topic, OutboxMessage.payload)
+                .order_by(OutboxMessage.id)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            messages = result.all()
+            if not messages:
+                return 0
+
+            outcomes = await asyncio.gather(
+                *(self._broker.publish(m.payload, queue=m.topic) for m in messages),
+                return_exceptions=True,
+            )
+            delivered = [
+                m.id for m, outcome in zip(messages, outcomes, strict=True)
+                if not isinstance(outcome, BaseException)
+            ]
+            if len(delivered) < len(messages):
+                logger.warning(
+                    "outbox_publish_failed",
+                    failed=len(messages) - len(delivered),
+                )
+
+            if delivered:
+                await session.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(delivered)))
+            return len(delivered)
+
+    async def start(self) -> None:
+        """Запустить фоновую ретрансляцию"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить фоновую ретрансляцию"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                relayed = await self.relay_batch()
+            except Exception:
+                logger.exception("outbox_relay_failed")
+                relayed = 0
+
+            # Полная пачка — вероятно, есть ещё: забираем без паузы
+            if relayed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
@@ -1,9 +1,50 @@
 # app/infrastructure/messaging/redis_client.py
 
+from time import perf_counter
+from typing import Any
+
+from prometheus_client import Histogram
 from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio.client import Pipeline
 
 from app.config.settings import RedisConfig
 
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Время выполнения команды Redis, включая ожидание соединения",
+    ["command"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+
+class InstrumentedPipeline(Pipeline):
+    """Конвейер, который учитывает отправку пачки как одну команду"""
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        command = "MULTI" if self.is_transaction else "PIPELINE"
+        started = perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            REDIS_COMMAND_DURATION.labels(command).observe(perf_counter() - started)
+
+
+class InstrumentedRedis(Redis):
+    """Клиент Redis с гистограммой задержек по командам"""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        started = perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            command = args[0] if isinstance(args[0], str) else args[0].decode()
+            REDIS_COMMAND_DURATION.labels(command.upper()).observe(perf_counter() - started)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> Pipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
 
 class RedisClient:
     """Фабрика для создания Redis клиентов"""
@@ -26,7 +67,7 @@ class RedisClient:
         """Получить Redis клиент из пула"""
         if cls._pool is None:
             raise RuntimeError("Redis pool not initialized")
-        return Redis(connection_pool=cls._pool)
+        return InstrumentedRedis(connection_pool=cls._pool)
 
     @classmethod
     async def close_pool(cls) -> None:
@@ -0,0 +1,40 @@
+# app/infrastructure/metrics/registry.py
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+__all__ = ["CONTENT_TYPE_LATEST", "collect_metrics", "is_multiprocess", "mark_process_dead"]
+
+# Каталог должен быть задан до импорта prometheus_client во всех воркерах
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def is_multiprocess() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def collect_metrics() -> bytes:
+    """Метрики в текстовом формате Prometheus
+
+    В многопроцессном режиме значения каждый раз собираются из файлов
+    всех воркеров, поэтому ответ одинаков, какой бы воркер его ни отдал.
+    """
+    if not is_multiprocess():
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_process_dead(pid: int | None = None) -> None:
+    """Убрать live-gauge завершившегося воркера из агрегатов"""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid or os.getpid())
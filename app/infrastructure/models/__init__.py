@@ -13,10 +13,13 @@ from .motoclub import MotoClub
 from .motokonig import MotoKonig
 from .motokonig_achievement import MotoKonigAchievement
 from .motorcycle import Motorcycle
+from .outbox_message import OutboxMessage
 from .profile import Profile
 from .ride import Ride
 from .ride_checkpoint import RideCheckpoint
+from .ride_checkpoint_arrival import RideCheckpointArrival
 from .ride_participant import RideParticipant
+from .ride_telemetry_point import RideTelemetryPoint
 from .social_link import SocialLink
 from .user import User
 
@@ -43,4 +46,7 @@ __all__ = [
     "Ride",
     "RideParticipant",
     "RideCheckpoint",
+    "RideCheckpointArrival",
+    "RideTelemetryPoint",
+    "OutboxMessage",
 ]
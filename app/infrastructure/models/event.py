@@ -2,8 +2,9 @@
 from typing import TYPE_CHECKING
 
 from advanced_alchemy.base import UUIDAuditBase
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.domain.value_objects.event_type import EventType
@@ -42,7 +43,9 @@ class Event(UUIDAuditBase):
         index=True,
     )
     max_participants: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    photo_urls: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
+    photo_urls: Mapped[list[str]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=list
+    )
 
     participants: Mapped[list["EventParticipation"]] = relationship(
         "EventParticipation",
@@ -1,10 +1,13 @@
 # app/infrastructure/models/listing.py
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from advanced_alchemy.base import UUIDAuditBase
+from advanced_alchemy.types import DateTimeUTC
+from sqlalchemy import JSON, ForeignKey, Index, Integer, String, Text
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.domain.value_objects.listing_category import ListingCategory
@@ -21,6 +24,8 @@ class Listing(UUIDAuditBase):
     """SQLAlchemy модель объявления"""
 
     __tablename__ = "listings"
+    # Истечение срока ищет активные объявления с прошедшей датой
+    __table_args__ = (Index("ix_listings_status_expires_at", "status", "expires_at"),)
 
     # Связь с продавцом
     seller_id: Mapped[str] = mapped_column(
@@ -52,7 +57,6 @@ class Listing(UUIDAuditBase):
         SQLEnum(ListingStatus, name="listing_status", native_enum=False),
         nullable=False,
         default=ListingStatus.DRAFT,
-        index=True
     )
     moderation_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -60,15 +64,17 @@ class Listing(UUIDAuditBase):
     contact_phone: Mapped[str | None] = mapped_column(String(20), nullable=True)
     contact_email: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
-    # Медиа (JSON массив URL'ов)
-    photo_urls: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
+    # Медиа
+    photo_urls: Mapped[list[str]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=list
+    )
 
     # Статистика
     views_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     is_featured: Mapped[bool] = mapped_column(default=False, nullable=False, index=True)
 
     # Сроки
-    expires_at: Mapped[str | None] = mapped_column(String(50), nullable=True)  # ISO формат
+    expires_at: Mapped[datetime | None] = mapped_column(DateTimeUTC(timezone=True), nullable=True)
 
     # Связи
     favorites: Mapped[list["ListingFavorite"]] = relationship(
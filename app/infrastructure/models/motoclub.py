@@ -1,8 +1,10 @@
 # app/infrastructure/models/motoclub.py
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from advanced_alchemy.base import UUIDAuditBase
+from advanced_alchemy.types import DateTimeUTC
 from sqlalchemy import ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,7 +31,7 @@ class MotoClub(UUIDAuditBase):
         nullable=False,
         index=True
     )
-    president: Mapped["User"] = relationship("User", lazy="selectin")
+    president: Mapped["User"] = relationship("User", lazy="raise")
 
     # Настройки клуба
     is_public: Mapped[bool] = mapped_column(default=True, nullable=False, index=True)
@@ -44,19 +46,19 @@ class MotoClub(UUIDAuditBase):
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False, index=True)
 
     # Даты
-    founded_date: Mapped[str | None] = mapped_column(String(50), nullable=True)  # ISO формат
+    founded_date: Mapped[datetime | None] = mapped_column(DateTimeUTC(timezone=True), nullable=True)
 
-    # Связи
+    # Связи загружаются только явно через options() в запросе
     memberships: Mapped[list["ClubMembership"]] = relationship(
         "ClubMembership",
         back_populates="club",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
 
     invitations: Mapped[list["ClubInvitation"]] = relationship(
         "ClubInvitation",
         back_populates="club",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
@@ -24,6 +24,7 @@ class MotoKonigAchievement(UUIDAuditBase):
     motokonig_id: Mapped[str] = mapped_column(
         ForeignKey("motokonig_profiles.id"),
         nullable=False,
+        index=True,
     )
 
     # Attributes
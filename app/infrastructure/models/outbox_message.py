@@ -0,0 +1,28 @@
+# app/infrastructure/models/outbox_message.py
+
+from datetime import UTC, datetime
+from typing import Any
+
+from advanced_alchemy.base import BigIntBase
+from sqlalchemy import JSON, DateTime, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+__all__ = ["OutboxMessage"]
+
+
+class OutboxMessage(BigIntBase):
+    """Модель доменного события, ожидающего публикации в брокер"""
+
+    __tablename__ = "outbox"
+
+    topic: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
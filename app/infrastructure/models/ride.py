@@ -50,6 +50,11 @@ class Ride(UUIDAuditBase):
     is_public: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     rating: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Когда итоги поездки учтены в статистике участников
+    results_applied_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
 
     # Relationships
     organizer: Mapped["MotoKonig"] = relationship(
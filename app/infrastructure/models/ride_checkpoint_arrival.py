@@ -0,0 +1,36 @@
+# app/infrastructure/models/ride_checkpoint_arrival.py
+
+from datetime import datetime
+
+from advanced_alchemy.base import BigIntBase
+from sqlalchemy import DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+__all__ = ["RideCheckpointArrival"]
+
+
+class RideCheckpointArrival(BigIntBase):
+    """Модель прохождения контрольной точки участником поездки"""
+
+    __tablename__ = "ride_checkpoint_arrivals"
+    __table_args__ = (
+        UniqueConstraint("checkpoint_id", "motokonig_id", name="uq_checkpoint_arrival"),
+    )
+
+    # Foreign keys
+    ride_id: Mapped[str] = mapped_column(
+        ForeignKey("rides.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    checkpoint_id: Mapped[str] = mapped_column(
+        ForeignKey("ride_checkpoints.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    motokonig_id: Mapped[str] = mapped_column(
+        ForeignKey("motokonig_profiles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Attributes
+    reached_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
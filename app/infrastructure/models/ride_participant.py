@@ -40,6 +40,8 @@ class RideParticipant(UUIDAuditBase):
         nullable=True,
     )
     distance_covered: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Точная дистанция трека: километров в distance_covered мало, чтобы продолжить трек
+    distance_m: Mapped[float] = mapped_column(Float, default=0.0, server_default="0", nullable=False)
     average_speed: Mapped[float | None] = mapped_column(Float, nullable=True)
     max_speed: Mapped[float | None] = mapped_column(Float, nullable=True)
     is_leader: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -0,0 +1,40 @@
+# app/infrastructure/models/ride_telemetry_point.py
+
+from datetime import datetime
+
+from advanced_alchemy.base import BigIntBase
+from sqlalchemy import DateTime, Float, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+__all__ = ["RideTelemetryPoint"]
+
+
+class RideTelemetryPoint(BigIntBase):
+    """Модель GPS-отметки участника поездки"""
+
+    __tablename__ = "ride_telemetry_points"
+    __table_args__ = (
+        # Выборка трека участника по времени
+        Index(
+            "ix_ride_telemetry_points_ride_participant_time",
+            "ride_id",
+            "motokonig_id",
+            "recorded_at",
+        ),
+    )
+
+    # Foreign keys
+    ride_id: Mapped[str] = mapped_column(
+        ForeignKey("rides.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    motokonig_id: Mapped[str] = mapped_column(
+        ForeignKey("motokonig_profiles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Attributes
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    latitude: Mapped[float] = mapped_column(Float, nullable=False)
+    longitude: Mapped[float] = mapped_column(Float, nullable=False)
+    speed: Mapped[float | None] = mapped_column(Float, nullable=True)  # км/ч
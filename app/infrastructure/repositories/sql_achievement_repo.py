@@ -43,7 +43,6 @@ class SqlAchievementRepository(IAchievementRepository):
 
         self.session.add(db_model)
         await self.session.flush()
-        await self.session.refresh(db_model)
 
         return self._to_domain_entity(db_model)
 
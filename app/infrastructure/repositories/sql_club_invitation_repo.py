@@ -40,7 +40,6 @@ class SqlClubInvitationRepository(IClubInvitationRepository):
 
         self.session.add(db_invitation)
         await self.session.flush()
-        await self.session.refresh(db_invitation)
 
         # Обновляем доменную сущность
         invitation.id = db_invitation.id
@@ -73,20 +72,21 @@ class SqlClubInvitationRepository(IClubInvitationRepository):
 
     async def update(self, invitation: ClubInvitation) -> ClubInvitation:
         """Обновить приглашение"""
-        db_invitation = await self.session.get(ClubInvitationModel, invitation.id)
-
-        if db_invitation:
-            # Обновляем поля
-            db_invitation.status = invitation.status
-            db_invitation.message = invitation.message
-            db_invitation.expires_at = invitation.expires_at.isoformat()
-            db_invitation.responded_at = invitation.responded_at.isoformat() if invitation.responded_at else None
-
-            await self.session.flush()
-            await self.session.refresh(db_invitation)
+        updated_at = await self.session.scalar(
+            update(ClubInvitationModel)
+            .where(ClubInvitationModel.id == invitation.id)
+            .values(
+                status=invitation.status,
+                message=invitation.message,
+                expires_at=invitation.expires_at.isoformat(),
+                responded_at=invitation.responded_at.isoformat() if invitation.responded_at else None,
+            )
+            .returning(ClubInvitationModel.updated_at)
+        )
 
+        if updated_at:
             # Обновляем timestamp в доменной сущности
-            invitation.updated_at = db_invitation.updated_at
+            invitation.updated_at = updated_at
 
         return invitation
 
@@ -119,25 +119,30 @@ class SqlClubInvitationRepository(IClubInvitationRepository):
             return invitation
         return None
 
-    async def expire_old_invitations(self) -> int:
-        """Сделать просроченными старые приглашения"""
+    async def expire_old_invitations(self, limit: int = 1000) -> int:
+        """Сделать просроченными не больше ``limit`` старых приглашений"""
         current_time = datetime.utcnow().isoformat()
 
-        statement = (
-            update(ClubInvitationModel)
+        batch = (
+            select(ClubInvitationModel.id)
             .where(
                 ClubInvitationModel.status == "pending",
                 ClubInvitationModel.expires_at < current_time
             )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(ClubInvitationModel)
+            .where(ClubInvitationModel.id.in_(batch.scalar_subquery()))
             .values(
                 status="expired",
                 responded_at=current_time
             )
+            .execution_options(synchronize_session=False)
         )
 
         result = await self.session.execute(statement)
-        await self.session.flush()
-
         return result.rowcount or 0
 
     def _to_domain_entity(self, db_invitation: ClubInvitationModel) -> ClubInvitation:
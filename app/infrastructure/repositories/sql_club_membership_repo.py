@@ -1,9 +1,11 @@
 # app/infrastructure/repositories/sql_club_membership_repo.py
 
+from collections.abc import Collection
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.domain.entities.club_membership import ClubMembership
 from app.domain.ports.repositories.club_membership import (
@@ -38,7 +40,6 @@ class SqlClubMembershipRepository(IClubMembershipRepository):
 
         self.session.add(db_membership)
         await self.session.flush()
-        await self.session.refresh(db_membership)
 
         # Обновляем доменную сущность
         membership.id = db_membership.id
@@ -71,19 +72,20 @@ class SqlClubMembershipRepository(IClubMembershipRepository):
 
     async def update(self, membership: ClubMembership) -> ClubMembership:
         """Обновить членство"""
-        db_membership = await self.session.get(ClubMembershipModel, membership.id)
-
-        if db_membership:
-            # Обновляем поля
-            db_membership.role = membership.role
-            db_membership.status = membership.status
-            db_membership.notes = membership.notes
-
-            await self.session.flush()
-            await self.session.refresh(db_membership)
+        updated_at = await self.session.scalar(
+            update(ClubMembershipModel)
+            .where(ClubMembershipModel.id == membership.id)
+            .values(
+                role=membership.role,
+                status=membership.status,
+                notes=membership.notes,
+            )
+            .returning(ClubMembershipModel.updated_at)
+        )
 
+        if updated_at:
             # Обновляем timestamp в доменной сущности
-            membership.updated_at = db_membership.updated_at
+            membership.updated_at = updated_at
 
         return membership
 
@@ -123,6 +125,37 @@ class SqlClubMembershipRepository(IClubMembershipRepository):
         result = await self.session.execute(statement)
         return result.scalar() or 0
 
+    async def get_club_member_ids(self, club_id: UUID) -> list[UUID]:
+        """ID активных участников клуба"""
+        statement = select(ClubMembershipModel.user_id).where(
+            ClubMembershipModel.club_id == club_id,
+            ClubMembershipModel.status == "active"
+        )
+        result = await self.session.execute(statement)
+        return list(result.scalars())
+
+    async def get_club_peer_ids(self, user_id: UUID, candidate_ids: Collection[UUID]) -> set[UUID]:
+        """ID кандидатов, состоящих хотя бы в одном общем клубе с пользователем"""
+        if not candidate_ids:
+            return set()
+
+        # Самосоединение: членства зрителя x членства кандидатов по club_id
+        viewer = aliased(ClubMembershipModel)
+        peer = aliased(ClubMembershipModel)
+        statement = (
+            select(peer.user_id)
+            .join(viewer, viewer.club_id == peer.club_id)
+            .where(
+                viewer.user_id == user_id,
+                viewer.status == "active",
+                peer.user_id.in_(candidate_ids),
+                peer.status == "active",
+            )
+            .distinct()
+        )
+        result = await self.session.execute(statement)
+        return set(result.scalars())
+
     def _to_domain_entity(self, db_membership: ClubMembershipModel) -> ClubMembership:
         """Преобразовать модель БД в доменную сущность"""
         from datetime import datetime
@@ -27,7 +27,6 @@ class SqlEventParticipationRepository(IEventParticipationRepository):
         )
         self.session.add(db_part)
         await self.session.flush()
-        await self.session.refresh(db_part)
 
         participation.id = db_part.id
         participation.created_at = db_part.created_at
@@ -27,7 +27,6 @@ class SqlListingFavoriteRepository(IListingFavoriteRepository):
 
         self.session.add(db_favorite)
         await self.session.flush()
-        await self.session.refresh(db_favorite)
 
         # Обновляем доменную сущность
         favorite.id = db_favorite.id
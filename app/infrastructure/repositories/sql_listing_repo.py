@@ -1,7 +1,6 @@
 # app/infrastructure/repositories/sql_listing_repo.py
 
-import json
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from sqlalchemy import func, select, update
@@ -10,7 +9,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.domain.entities.listing import Listing
 from app.domain.ports.repositories.listing import IListingRepository
 from app.domain.ports.specs.listing import ListingSpecificationPort
-from app.domain.value_objects.listing_category import ListingCategory
 from app.domain.value_objects.listing_status import ListingStatus
 from app.infrastructure.models.listing import Listing as ListingModel
 
@@ -35,16 +33,15 @@ class SqlListingRepository(IListingRepository):
             is_negotiable=listing.is_negotiable,
             contact_phone=listing.contact_phone,
             contact_email=listing.contact_email,
-            photo_urls=json.dumps(listing.photo_urls) if listing.photo_urls else None,
+            photo_urls=listing.photo_urls,
             views_count=listing.views_count,
-            expires_at=listing.expires_at.isoformat() if listing.expires_at else None,
+            expires_at=listing.expires_at,
             moderation_notes=listing.moderation_notes,
             is_featured=listing.is_featured,
         )
 
         self.session.add(db_listing)
         await self.session.flush()
-        await self.session.refresh(db_listing)
 
         # Обновляем доменную сущность
         listing.id = db_listing.id
@@ -77,31 +74,32 @@ class SqlListingRepository(IListingRepository):
 
     async def update(self, listing: Listing) -> Listing:
         """Обновить объявление"""
-        db_listing = await self.session.get(ListingModel, listing.id)
-
-        if db_listing:
-            # Обновляем поля
-            db_listing.title = listing.title
-            db_listing.description = listing.description
-            db_listing.category = listing.category
-            db_listing.price = listing.price
-            db_listing.currency = listing.currency
-            db_listing.location = listing.location
-            db_listing.status = listing.status
-            db_listing.is_negotiable = listing.is_negotiable
-            db_listing.contact_phone = listing.contact_phone
-            db_listing.contact_email = listing.contact_email
-            db_listing.photo_urls = json.dumps(listing.photo_urls) if listing.photo_urls else None
-            db_listing.views_count = listing.views_count
-            db_listing.expires_at = listing.expires_at.isoformat() if listing.expires_at else None
-            db_listing.moderation_notes = listing.moderation_notes
-            db_listing.is_featured = listing.is_featured
-
-            await self.session.flush()
-            await self.session.refresh(db_listing)
+        updated_at = await self.session.scalar(
+            update(ListingModel)
+            .where(ListingModel.id == listing.id)
+            .values(
+                title=listing.title,
+                description=listing.description,
+                category=listing.category,
+                price=listing.price,
+                currency=listing.currency,
+                location=listing.location,
+                status=listing.status,
+                is_negotiable=listing.is_negotiable,
+                contact_phone=listing.contact_phone,
+                contact_email=listing.contact_email,
+                photo_urls=listing.photo_urls,
+                views_count=listing.views_count,
+                expires_at=listing.expires_at,
+                moderation_notes=listing.moderation_notes,
+                is_featured=listing.is_featured,
+            )
+            .returning(ListingModel.updated_at)
+        )
 
+        if updated_at:
             # Обновляем timestamp в доменной сущности
-            listing.updated_at = db_listing.updated_at
+            listing.updated_at = updated_at
 
         return listing
 
@@ -130,56 +128,50 @@ class SqlListingRepository(IListingRepository):
         result = await self.session.execute(statement)
         return result.scalar() or 0
 
-    async def expire_old_listings(self) -> int:
-        """Пометить старые объявления как истёкшие"""
-        current_time = datetime.utcnow().isoformat()
+    async def expire_old_listings(self, limit: int = 1000) -> int:
+        """Пометить истёкшими не больше ``limit`` старых объявлений"""
+        current_time = datetime.now(UTC)
 
-        statement = (
-            update(ListingModel)
+        # Пачка ограничена и пропускает строки, занятые другими транзакциями,
+        # поэтому блокировки держатся недолго и не ждут пользовательских запросов
+        batch = (
+            select(ListingModel.id)
             .where(
                 ListingModel.status == ListingStatus.ACTIVE,
                 ListingModel.expires_at < current_time
             )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(ListingModel)
+            .where(ListingModel.id.in_(batch.scalar_subquery()))
             .values(status=ListingStatus.EXPIRED)
+            .execution_options(synchronize_session=False)
         )
 
         result = await self.session.execute(statement)
-        await self.session.flush()
-
         return result.rowcount or 0
 
     def _to_domain_entity(self, db_listing: ListingModel) -> Listing:
         """Преобразовать модель БД в доменную сущность"""
-        expires_at = None
-        if db_listing.expires_at:
-            try:
-                expires_at = datetime.fromisoformat(db_listing.expires_at)
-            except ValueError:
-                expires_at = None
-
-        photo_urls = []
-        if db_listing.photo_urls:
-            try:
-                photo_urls = json.loads(db_listing.photo_urls)
-            except (json.JSONDecodeError, TypeError):
-                photo_urls = []
-
-        return Listing(
-            listing_id=db_listing.id,
+        return Listing.hydrate(
+            id=db_listing.id,
             seller_id=db_listing.seller_id,
             title=db_listing.title,
             description=db_listing.description,
-            category=ListingCategory(db_listing.category.value),
+            category=db_listing.category,
             price=db_listing.price,
             currency=db_listing.currency,
             location=db_listing.location,
-            status=ListingStatus(db_listing.status.value),
+            status=db_listing.status,
             is_negotiable=db_listing.is_negotiable,
             contact_phone=db_listing.contact_phone,
             contact_email=db_listing.contact_email,
-            photo_urls=photo_urls,
+            photo_urls=db_listing.photo_urls,
             views_count=db_listing.views_count,
-            expires_at=expires_at,
+            # Как и конструктор, считаем объявление без срока созданным сейчас
+            expires_at=db_listing.expires_at or datetime.now(UTC) + timedelta(days=30),
             moderation_notes=db_listing.moderation_notes,
             is_featured=db_listing.is_featured,
             created_at=db_listing.created_at,
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.media_file import MediaFile
@@ -33,7 +33,6 @@ class SqlMediaFileRepository(IMediaFileRepository):
 
         self.session.add(db_file)
         await self.session.flush()
-        await self.session.refresh(db_file)
 
         # Обновляем доменную сущность
         media_file.id = db_file.id
@@ -78,18 +77,19 @@ class SqlMediaFileRepository(IMediaFileRepository):
 
     async def update(self, media_file: MediaFile) -> MediaFile:
         """Обновить медиафайл"""
-        db_file = await self.session.get(MediaFileModel, media_file.id)
-
-        if db_file:
-            # Обновляем поля
-            db_file.url = media_file.url
-            db_file.is_public = media_file.is_public
-
-            await self.session.flush()
-            await self.session.refresh(db_file)
+        updated_at = await self.session.scalar(
+            update(MediaFileModel)
+            .where(MediaFileModel.id == media_file.id)
+            .values(
+                url=media_file.url,
+                is_public=media_file.is_public,
+            )
+            .returning(MediaFileModel.updated_at)
+        )
 
+        if updated_at:
             # Обновляем timestamp в доменной сущности
-            media_file.updated_at = db_file.updated_at
+            media_file.updated_at = updated_at
 
         return media_file
 
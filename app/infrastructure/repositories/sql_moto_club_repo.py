@@ -1,14 +1,18 @@
 # app/infrastructure/repositories/sql_moto_club_repo.py
 
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ScalarSelect, Select, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.domain.entities.moto_club import MotoClub
 from app.domain.ports.repositories.moto_club import IMotoClubRepository
 from app.domain.ports.specs.moto_club import MotoClubSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
+from app.infrastructure.models.club_membership import (
+    ClubMembership as ClubMembershipModel,
+)
 from app.infrastructure.models.motoclub import MotoClub as MotoClubModel
 
 
@@ -30,12 +34,11 @@ class SqlMotoClubRepository(IMotoClubRepository):
             website=club.website,
             avatar_url=club.avatar_url,
             is_active=club.is_active,
-            founded_date=club.founded_date.isoformat() if club.founded_date else None,
+            founded_date=club.founded_date,
         )
 
         self.session.add(db_club)
         await self.session.flush()
-        await self.session.refresh(db_club)
 
         # Обновляем доменную сущность
         club.id = db_club.id
@@ -44,58 +47,80 @@ class SqlMotoClubRepository(IMotoClubRepository):
 
         return club
 
-    async def get(self, spec: MotoClubSpecificationPort) -> MotoClub | None:
-        """Получить мотоклуб по спецификации"""
-        statement = spec.to_query(
-            select(MotoClubModel).options(
-                selectinload(MotoClubModel.memberships),
-                selectinload(MotoClubModel.invitations)
+    @staticmethod
+    def _member_count() -> ScalarSelect:
+        """Коррелированный подзапрос количества активных участников по индексу club_id"""
+        return (
+            select(func.count(ClubMembershipModel.id))
+            .where(
+                ClubMembershipModel.club_id == MotoClubModel.id,
+                ClubMembershipModel.status == "active",
             )
+            .correlate(MotoClubModel)
+            .scalar_subquery()
         )
+
+    @classmethod
+    def _select_with_member_count(cls) -> Select:
+        """
+        Запрос клубов с количеством активных участников
+
+        Сами членства и приглашения не загружаются.
+        """
+        return select(MotoClubModel, cls._member_count().label("member_count"))
+
+    async def get(self, spec: MotoClubSpecificationPort) -> MotoClub | None:
+        """Получить мотоклуб по спецификации"""
+        statement = spec.to_query(self._select_with_member_count())
         result = await self.session.execute(statement)
-        db_club = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if db_club:
-            return self._to_domain_entity(db_club)
+        if row:
+            return self._to_domain_entity(row.MotoClub, row.member_count)
         return None
 
+    async def get_version(self, club_id: UUID) -> EntityVersion | None:
+        """Время изменения клуба и число активных участников без загрузки строки клуба"""
+        result = await self.session.execute(
+            select(MotoClubModel.updated_at, self._member_count()).where(MotoClubModel.id == club_id)
+        )
+        row = result.one_or_none()
+        return EntityVersion(row[0], row[1]) if row else None
+
     async def get_list(self, spec: MotoClubSpecificationPort | None = None) -> list[MotoClub]:
         """Получить список мотоклубов по спецификации"""
-        statement = select(MotoClubModel).options(
-            selectinload(MotoClubModel.memberships),
-            selectinload(MotoClubModel.invitations)
-        )
+        statement = self._select_with_member_count()
 
         if spec:
             statement = spec.to_query(statement)
 
         result = await self.session.execute(statement)
-        clubs = result.scalars().all()
 
-        return [self._to_domain_entity(club) for club in clubs]
+        return [self._to_domain_entity(row.MotoClub, row.member_count) for row in result]
 
     async def update(self, club: MotoClub) -> MotoClub:
         """Обновить мотоклуб"""
-        db_club = await self.session.get(MotoClubModel, club.id)
-
-        if db_club:
-            # Обновляем поля
-            db_club.name = club.name
-            db_club.description = club.description
-            db_club.president_id = club.president_id
-            db_club.is_public = club.is_public
-            db_club.max_members = club.max_members
-            db_club.location = club.location
-            db_club.website = club.website
-            db_club.avatar_url = club.avatar_url
-            db_club.is_active = club.is_active
-            db_club.founded_date = club.founded_date.isoformat() if club.founded_date else None
-
-            await self.session.flush()
-            await self.session.refresh(db_club)
+        updated_at = await self.session.scalar(
+            update(MotoClubModel)
+            .where(MotoClubModel.id == club.id)
+            .values(
+                name=club.name,
+                description=club.description,
+                president_id=club.president_id,
+                is_public=club.is_public,
+                max_members=club.max_members,
+                location=club.location,
+                website=club.website,
+                avatar_url=club.avatar_url,
+                is_active=club.is_active,
+                founded_date=club.founded_date,
+            )
+            .returning(MotoClubModel.updated_at)
+        )
 
+        if updated_at:
             # Обновляем timestamp в доменной сущности
-            club.updated_at = db_club.updated_at
+            club.updated_at = updated_at
 
         return club
 
@@ -110,19 +135,10 @@ class SqlMotoClubRepository(IMotoClubRepository):
 
         return False
 
-    def _to_domain_entity(self, db_club: MotoClubModel) -> MotoClub:
+    def _to_domain_entity(self, db_club: MotoClubModel, member_count: int = 0) -> MotoClub:
         """Преобразовать модель БД в доменную сущность"""
-        from datetime import datetime
-
-        founded_date = None
-        if db_club.founded_date:
-            try:
-                founded_date = datetime.fromisoformat(db_club.founded_date)
-            except ValueError:
-                founded_date = None
-
-        return MotoClub(
-            club_id=db_club.id,
+        return MotoClub.hydrate(
+            id=db_club.id,
             name=db_club.name,
             description=db_club.description,
             president_id=db_club.president_id,
@@ -130,9 +146,10 @@ class SqlMotoClubRepository(IMotoClubRepository):
             max_members=db_club.max_members,
             location=db_club.location,
             website=db_club.website,
-            founded_date=founded_date,
+            founded_date=db_club.founded_date or datetime.now(UTC),
             avatar_url=db_club.avatar_url,
             is_active=db_club.is_active,
+            member_count=member_count,
             created_at=db_club.created_at,
             updated_at=db_club.updated_at
         )
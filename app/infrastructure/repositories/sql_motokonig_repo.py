@@ -1,14 +1,18 @@
 # app/infrastructure/repositories/sql_motokonig_repo.py
 
+from collections.abc import Sequence
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.domain.entities.achievement import Achievement
 from app.domain.entities.motokonig import MotoKonig
 from app.domain.ports.repositories.motokonig import IMotoKonigRepository
 from app.domain.ports.specs.motokonig import MotoKonigSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
 from app.infrastructure.models.motokonig import MotoKonig as MotoKonigModel
 from app.infrastructure.models.motokonig_achievement import (
     MotoKonigAchievement as AchievementModel,
@@ -36,9 +40,9 @@ class SqlMotoKonigRepository(IMotoKonigRepository):
             for a in db_model.achievements
         ]
 
-        return MotoKonig(
-            motokonig_id=UUID(db_model.id),
-            user_id=UUID(db_model.user_id),
+        return MotoKonig.hydrate(
+            motokonig_id=db_model.id,
+            user_id=db_model.user_id,
             nickname=db_model.nickname,
             status=db_model.status,
             experience_points=db_model.experience_points,
@@ -46,6 +50,7 @@ class SqlMotoKonigRepository(IMotoKonigRepository):
             total_rides=db_model.total_rides,
             average_speed=db_model.average_speed,
             max_speed=db_model.max_speed,
+            favorite_routes=[],
             rating=db_model.rating,
             bio=db_model.bio,
             avatar_url=db_model.avatar_url,
@@ -70,17 +75,20 @@ class SqlMotoKonigRepository(IMotoKonigRepository):
             bio=motokonig.bio,
             avatar_url=motokonig.avatar_url,
             is_public=motokonig.is_public,
+            # Пустая коллекция считается загруженной: перечитывать модель после INSERT не нужно
+            achievements=[],
         )
 
         self.session.add(db_model)
         await self.session.flush()
-        await self.session.refresh(db_model)
 
         return self._to_domain_entity(db_model)
 
     async def get(self, spec: MotoKonigSpecificationPort) -> MotoKonig | None:
         """Получить профиль по спецификации"""
-        statement = spec.to_query(select(MotoKonigModel))
+        statement = spec.to_query(
+            select(MotoKonigModel).options(selectinload(MotoKonigModel.achievements))
+        )
         result = await self.session.execute(statement)
         db_model = result.scalar_one_or_none()
 
@@ -93,6 +101,19 @@ class SqlMotoKonigRepository(IMotoKonigRepository):
         from app.infrastructure.specs.motokonig.motokonig_by_id import MotoKonigById
         return await self.get(MotoKonigById(motokonig_id))
 
+    async def get_many(self, motokonig_ids: Sequence[UUID]) -> list[MotoKonig]:
+        """Получить профили по списку ID одним запросом"""
+        if not motokonig_ids:
+            return []
+
+        statement = (
+            select(MotoKonigModel)
+            .where(MotoKonigModel.id.in_(motokonig_ids))
+            .options(selectinload(MotoKonigModel.achievements))
+        )
+        result = await self.session.execute(statement)
+        return [self._to_domain_entity(model) for model in result.scalars()]
+
     async def get_by_user_id(self, user_id: UUID) -> MotoKonig | None:
         """Получить профиль по ID пользователя"""
         from app.infrastructure.specs.motokonig.motokonig_by_user_id import (
@@ -100,9 +121,23 @@ class SqlMotoKonigRepository(IMotoKonigRepository):
         )
         return await self.get(MotoKonigByUserId(user_id))
 
+    async def get_version_by_user_id(self, user_id: UUID) -> EntityVersion | None:
+        """Время изменения профиля и число достижений одним запросом по индексам"""
+        achievements = (
+            select(func.count(AchievementModel.id))
+            .where(AchievementModel.motokonig_id == MotoKonigModel.id)
+            .correlate(MotoKonigModel)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            select(MotoKonigModel.updated_at, achievements).where(MotoKonigModel.user_id == user_id)
+        )
+        row = result.one_or_none()
+        return EntityVersion(row[0], row[1]) if row else None
+
     async def get_list(self, spec: MotoKonigSpecificationPort | None = None) -> list[MotoKonig]:
         """Получить список профилей"""
-        statement = select(MotoKonigModel)
+        statement = select(MotoKonigModel).options(selectinload(MotoKonigModel.achievements))
 
         if spec:
             statement = spec.to_query(statement)
@@ -114,7 +149,11 @@ class SqlMotoKonigRepository(IMotoKonigRepository):
 
     async def update(self, motokonig: MotoKonig) -> MotoKonig:
         """Обновить профиль"""
-        db_model = await self.session.get(MotoKonigModel, str(motokonig.motokonig_id))
+        db_model = await self.session.get(
+            MotoKonigModel,
+            str(motokonig.motokonig_id),
+            options=[selectinload(MotoKonigModel.achievements)],
+        )
 
         if db_model:
             db_model.nickname = motokonig.nickname
@@ -132,20 +171,74 @@ class SqlMotoKonigRepository(IMotoKonigRepository):
             # Обновляем достижения
             for achievement in motokonig.achievements:
                 if not any(a.achievement_type == achievement.achievement_type for a in db_model.achievements):
-                    db_achievement = AchievementModel(
-                        motokonig_id=db_model.id,
-                        achievement_type=achievement.achievement_type,
-                        earned_at=achievement.earned_at,
-                        description=achievement.description,
-                        metadata=achievement.achievement_metadata,
+                    db_model.achievements.append(
+                        AchievementModel(
+                            achievement_type=achievement.achievement_type,
+                            earned_at=achievement.earned_at,
+                            description=achievement.description,
+                            achievement_metadata=achievement.metadata,
+                        )
                     )
-                    self.session.add(db_achievement)
 
             await self.session.flush()
-            await self.session.refresh(db_model)
 
         return self._to_domain_entity(db_model)
 
+    async def update_many(self, motokonigs: Sequence[MotoKonig]) -> None:
+        """Сохранить статистику одним executemany и новые достижения одним INSERT"""
+        if not motokonigs:
+            return
+
+        table = MotoKonigModel.__table__
+        now = datetime.now(UTC)
+        await self.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                status=bindparam("b_status"),
+                experience_points=bindparam("b_experience_points"),
+                total_distance=bindparam("b_total_distance"),
+                total_rides=bindparam("b_total_rides"),
+                average_speed=bindparam("b_average_speed"),
+                max_speed=bindparam("b_max_speed"),
+                updated_at=bindparam("b_updated_at"),
+            ),
+            [
+                {
+                    "b_id": m.motokonig_id,
+                    "b_status": m.status,
+                    "b_experience_points": m.experience_points,
+                    "b_total_distance": m.total_distance,
+                    "b_total_rides": m.total_rides,
+                    "b_average_speed": m.average_speed,
+                    "b_max_speed": m.max_speed,
+                    "b_updated_at": now,
+                }
+                for m in motokonigs
+            ],
+        )
+
+        existing = await self.session.execute(
+            select(AchievementModel.motokonig_id, AchievementModel.achievement_type).where(
+                AchievementModel.motokonig_id.in_([m.motokonig_id for m in motokonigs])
+            )
+        )
+        earned = {(str(row.motokonig_id), row.achievement_type) for row in existing}
+        new_achievements = [
+            {
+                "motokonig_id": m.motokonig_id,
+                "achievement_type": a.achievement_type,
+                "earned_at": a.earned_at,
+                "description": a.description,
+                "achievement_metadata": a.metadata,
+            }
+            for m in motokonigs
+            for a in m.achievements
+            if (str(m.motokonig_id), a.achievement_type) not in earned
+        ]
+        if new_achievements:
+            await self.session.execute(insert(AchievementModel), new_achievements)
+
     async def delete(self, motokonig_id: UUID) -> None:
         """Удалить профиль"""
         db_model = await self.session.get(MotoKonigModel, str(motokonig_id))
@@ -2,10 +2,10 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.motorcycle import EngineType, Motorcycle, MotorcycleType
+from app.domain.entities.motorcycle import Motorcycle
 from app.domain.ports.repositories.motorcycle import IMotorcycleRepository
 from app.domain.ports.specs.motorcycle import MotorcycleSpecificationPort
 from app.infrastructure.models.motorcycle import Motorcycle as MotorcycleModel
@@ -36,7 +36,6 @@ class SqlMotorcycleRepository(IMotorcycleRepository):
 
         self.session.add(db_motorcycle)
         await self.session.flush()
-        await self.session.refresh(db_motorcycle)
 
         # Обновляем доменную сущность
         motorcycle.id = db_motorcycle.id
@@ -69,27 +68,28 @@ class SqlMotorcycleRepository(IMotorcycleRepository):
 
     async def update(self, motorcycle: Motorcycle) -> Motorcycle:
         """Обновить мотоцикл"""
-        db_motorcycle = await self.session.get(MotorcycleModel, motorcycle.id)
-
-        if db_motorcycle:
-            # Обновляем поля
-            db_motorcycle.brand = motorcycle.brand
-            db_motorcycle.model = motorcycle.model
-            db_motorcycle.year = motorcycle.year
-            db_motorcycle.engine_volume = motorcycle.engine_volume
-            db_motorcycle.engine_type = motorcycle.engine_type
-            db_motorcycle.motorcycle_type = motorcycle.motorcycle_type
-            db_motorcycle.power = motorcycle.power
-            db_motorcycle.mileage = motorcycle.mileage
-            db_motorcycle.color = motorcycle.color
-            db_motorcycle.description = motorcycle.description
-            db_motorcycle.is_active = motorcycle.is_active
-
-            await self.session.flush()
-            await self.session.refresh(db_motorcycle)
+        updated_at = await self.session.scalar(
+            update(MotorcycleModel)
+            .where(MotorcycleModel.id == motorcycle.id)
+            .values(
+                brand=motorcycle.brand,
+                model=motorcycle.model,
+                year=motorcycle.year,
+                engine_volume=motorcycle.engine_volume,
+                engine_type=motorcycle.engine_type,
+                motorcycle_type=motorcycle.motorcycle_type,
+                power=motorcycle.power,
+                mileage=motorcycle.mileage,
+                color=motorcycle.color,
+                description=motorcycle.description,
+                is_active=motorcycle.is_active,
+            )
+            .returning(MotorcycleModel.updated_at)
+        )
 
+        if updated_at:
             # Обновляем timestamp в доменной сущности
-            motorcycle.updated_at = db_motorcycle.updated_at
+            motorcycle.updated_at = updated_at
 
         return motorcycle
 
@@ -106,15 +106,15 @@ class SqlMotorcycleRepository(IMotorcycleRepository):
 
     def _to_domain_entity(self, db_motorcycle: MotorcycleModel) -> Motorcycle:
         """Преобразовать модель БД в доменную сущность"""
-        return Motorcycle(
-            motorcycle_id=db_motorcycle.id,
+        return Motorcycle.hydrate(
+            id=db_motorcycle.id,
             owner_id=db_motorcycle.owner_id,
             brand=db_motorcycle.brand,
             model=db_motorcycle.model,
             year=db_motorcycle.year,
             engine_volume=db_motorcycle.engine_volume,
-            engine_type=EngineType(db_motorcycle.engine_type.value),
-            motorcycle_type=MotorcycleType(db_motorcycle.motorcycle_type.value),
+            engine_type=db_motorcycle.engine_type,
+            motorcycle_type=db_motorcycle.motorcycle_type,
             power=db_motorcycle.power,
             mileage=db_motorcycle.mileage,
             color=db_motorcycle.color,
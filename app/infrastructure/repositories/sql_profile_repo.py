@@ -2,13 +2,14 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.domain.entities.profile import PrivacyLevel, Profile
+from app.domain.entities.profile import Profile
 from app.domain.ports.repositories.profile import IProfileRepository
 from app.domain.ports.specs.profile import ProfileSpecificationPort
+from app.domain.value_objects.entity_version import EntityVersion
 from app.infrastructure.models.profile import Profile as ProfileModel
 
 
@@ -35,7 +36,6 @@ class SqlProfileRepository(IProfileRepository):
 
         self.session.add(db_profile)
         await self.session.flush()
-        await self.session.refresh(db_profile)
 
         # Обновляем доменную сущность
         profile.id = db_profile.id
@@ -56,6 +56,14 @@ class SqlProfileRepository(IProfileRepository):
             return self._to_domain_entity(db_profile)
         return None
 
+    async def get_version_by_user_id(self, user_id: UUID) -> EntityVersion | None:
+        """Время изменения профиля пользователя"""
+        result = await self.session.execute(
+            select(ProfileModel.updated_at).where(ProfileModel.user_id == user_id)
+        )
+        row = result.one_or_none()
+        return EntityVersion(row[0]) if row else None
+
     async def get_list(self, spec: ProfileSpecificationPort | None = None) -> list[Profile]:
         """Получить список профилей по спецификации"""
         statement = select(ProfileModel).options(selectinload(ProfileModel.social_links))
@@ -70,25 +78,26 @@ class SqlProfileRepository(IProfileRepository):
 
     async def update(self, profile: Profile) -> Profile:
         """Обновить профиль"""
-        db_profile = await self.session.get(ProfileModel, profile.id)
-
-        if db_profile:
-            # Обновляем поля
-            db_profile.bio = profile.bio
-            db_profile.location = profile.location
-            db_profile.phone = profile.phone
-            db_profile.date_of_birth = profile.date_of_birth
-            db_profile.riding_experience = profile.riding_experience
-            db_profile.avatar_url = profile.avatar_url
-            db_profile.privacy_level = profile.privacy_level
-            db_profile.phone_privacy = profile.phone_privacy
-            db_profile.location_privacy = profile.location_privacy
-
-            await self.session.flush()
-            await self.session.refresh(db_profile)
+        updated_at = await self.session.scalar(
+            update(ProfileModel)
+            .where(ProfileModel.id == profile.id)
+            .values(
+                bio=profile.bio,
+                location=profile.location,
+                phone=profile.phone,
+                date_of_birth=profile.date_of_birth,
+                riding_experience=profile.riding_experience,
+                avatar_url=profile.avatar_url,
+                privacy_level=profile.privacy_level,
+                phone_privacy=profile.phone_privacy,
+                location_privacy=profile.location_privacy,
+            )
+            .returning(ProfileModel.updated_at)
+        )
 
+        if updated_at:
             # Обновляем timestamp в доменной сущности
-            profile.updated_at = db_profile.updated_at
+            profile.updated_at = updated_at
 
         return profile
 
@@ -105,8 +114,8 @@ class SqlProfileRepository(IProfileRepository):
 
     def _to_domain_entity(self, db_profile: ProfileModel) -> Profile:
         """Преобразовать модель БД в доменную сущность"""
-        return Profile(
-            profile_id=db_profile.id,
+        return Profile.hydrate(
+            id=db_profile.id,
             user_id=db_profile.user_id,
             bio=db_profile.bio,
             location=db_profile.location,
@@ -114,9 +123,9 @@ class SqlProfileRepository(IProfileRepository):
             date_of_birth=db_profile.date_of_birth,
             riding_experience=db_profile.riding_experience,
             avatar_url=db_profile.avatar_url,
-            privacy_level=PrivacyLevel(db_profile.privacy_level.value),
-            phone_privacy=PrivacyLevel(db_profile.phone_privacy.value),
-            location_privacy=PrivacyLevel(db_profile.location_privacy.value),
+            privacy_level=db_profile.privacy_level,
+            phone_privacy=db_profile.phone_privacy,
+            location_privacy=db_profile.location_privacy,
             created_at=db_profile.created_at,
             updated_at=db_profile.updated_at
         )
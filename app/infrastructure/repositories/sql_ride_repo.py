@@ -1,9 +1,11 @@
 # app/infrastructure/repositories/sql_ride_repo.py
 
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.domain.entities.ride import Ride, RideCheckpoint, RideParticipant
 from app.domain.ports.repositories.ride import IRideRepository
@@ -15,6 +17,9 @@ from app.infrastructure.models.ride_participant import (
 
 __all__ = ["SqlRideRepository"]
 
+# Коллекции, которые читает _to_domain_entity: ленивая загрузка в async-сессии падает
+RIDE_LOAD_OPTIONS = (selectinload(RideModel.participants), selectinload(RideModel.checkpoints))
+
 
 class SqlRideRepository(IRideRepository):
     """SQL реализация репозитория поездок"""
@@ -26,7 +31,7 @@ class SqlRideRepository(IRideRepository):
         """Преобразовать модель БД в доменную сущность"""
         participants = [
             RideParticipant(
-                motokonig_id=UUID(p.motokonig_id),
+                motokonig_id=p.motokonig_id,
                 joined_at=p.joined_at,
                 left_at=p.left_at,
                 distance_covered=p.distance_covered,
@@ -47,16 +52,16 @@ class SqlRideRepository(IRideRepository):
             for c in sorted(db_model.checkpoints, key=lambda x: x.order_index)
         ]
 
-        return Ride(
-            ride_id=UUID(db_model.id),
-            organizer_id=UUID(db_model.organizer_id),
+        return Ride.hydrate(
+            ride_id=db_model.id,
+            organizer_id=db_model.organizer_id,
             title=db_model.title,
             description=db_model.description,
             difficulty=db_model.difficulty,
             planned_distance=db_model.planned_distance,
             max_participants=db_model.max_participants,
             start_location=db_model.start_location,
-            end_location=db_model.end_location,
+            end_location=db_model.end_location or db_model.start_location,
             planned_start=db_model.planned_start,
             planned_duration=db_model.planned_duration,
             actual_start=db_model.actual_start,
@@ -88,29 +93,26 @@ class SqlRideRepository(IRideRepository):
             planned_duration=ride.planned_duration,
             route_gpx=ride.route_gpx,
             is_public=ride.is_public,
+            # Участники вставляются тем же flush, коллекции перечитывать не нужно
+            participants=[
+                ParticipantModel(
+                    motokonig_id=str(participant.motokonig_id),
+                    joined_at=participant.joined_at,
+                    is_leader=participant.is_leader,
+                )
+                for participant in ride.participants
+            ],
+            checkpoints=[],
         )
 
         self.session.add(db_model)
         await self.session.flush()
 
-        # Добавляем участников
-        for participant in ride.participants:
-            db_participant = ParticipantModel(
-                ride_id=db_model.id,
-                motokonig_id=str(participant.motokonig_id),
-                joined_at=participant.joined_at,
-                is_leader=participant.is_leader,
-            )
-            self.session.add(db_participant)
-
-        await self.session.flush()
-        await self.session.refresh(db_model)
-
         return self._to_domain_entity(db_model)
 
     async def get(self, spec: RideSpecificationPort) -> Ride | None:
         """Получить поездку по спецификации"""
-        statement = spec.to_query(select(RideModel))
+        statement = spec.to_query(select(RideModel).options(*RIDE_LOAD_OPTIONS))
         result = await self.session.execute(statement)
         db_model = result.scalar_one_or_none()
 
@@ -120,12 +122,12 @@ class SqlRideRepository(IRideRepository):
 
     async def get_by_id(self, ride_id: UUID) -> Ride | None:
         """Получить поездку по ID"""
-        from app.infrastructure.specs.ride.ride_by_id import RideById
-        return await self.get(RideById(ride_id))
+        from app.infrastructure.specs.ride.ride_by_id import RideByIdSpec
+        return await self.get(RideByIdSpec(ride_id))
 
     async def get_list(self, spec: RideSpecificationPort | None = None) -> list[Ride]:
         """Получить список поездок"""
-        statement = select(RideModel)
+        statement = select(RideModel).options(*RIDE_LOAD_OPTIONS)
 
         if spec:
             statement = spec.to_query(statement)
@@ -137,7 +139,11 @@ class SqlRideRepository(IRideRepository):
 
     async def update(self, ride: Ride) -> Ride:
         """Обновить поездку"""
-        db_model = await self.session.get(RideModel, str(ride.ride_id))
+        db_model = await self.session.get(
+            RideModel,
+            str(ride.ride_id),
+            options=RIDE_LOAD_OPTIONS,
+        )
 
         if db_model:
             # Обновляем основные поля
@@ -153,10 +159,21 @@ class SqlRideRepository(IRideRepository):
             # TODO: Обновление участников (добавление/удаление)
 
             await self.session.flush()
-            await self.session.refresh(db_model)
 
         return self._to_domain_entity(db_model)
 
+    async def mark_results_applied(self, ride_id: UUID) -> bool:
+        """Отметить, что итоги поездки учтены. False, если уже были учтены"""
+        result = await self.session.execute(
+            update(RideModel)
+            .where(
+                RideModel.id == ride_id,
+                RideModel.results_applied_at.is_(None),
+            )
+            .values(results_applied_at=datetime.now(UTC))
+        )
+        return result.rowcount == 1
+
     async def delete(self, ride_id: UUID) -> None:
         """Удалить поездку"""
         db_model = await self.session.get(RideModel, str(ride_id))
@@ -0,0 +1,199 @@
+# app/infrastructure/repositories/sql_ride_telemetry_repo.py
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.participant_track import ParticipantTrack
+from app.domain.ports.repositories.ride_telemetry import IRideTelemetryRepository
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.telemetry_point import TelemetryPoint
+from app.infrastructure.models.motokonig import MotoKonig as MotoKonigModel
+from app.infrastructure.models.ride import Ride as RideModel
+from app.infrastructure.models.ride_checkpoint import (
+    RideCheckpoint as CheckpointModel,
+)
+from app.infrastructure.models.ride_checkpoint_arrival import (
+    RideCheckpointArrival as ArrivalModel,
+)
+from app.infrastructure.models.ride_participant import (
+    RideParticipant as ParticipantModel,
+)
+from app.infrastructure.models.ride_telemetry_point import (
+    RideTelemetryPoint as TelemetryPointModel,
+)
+
+__all__ = ["SqlRideTelemetryRepository"]
+
+
+class SqlRideTelemetryRepository(IRideTelemetryRepository):
+    """SQL реализация репозитория телеметрии поездок"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_active_track(self, ride_id: UUID, user_id: UUID) -> ParticipantTrack | None:
+        """Получить трек участника начатой и незавершённой поездки"""
+        statement = (
+            select(
+                ParticipantModel.motokonig_id,
+                ParticipantModel.distance_m,
+                ParticipantModel.average_speed,
+                ParticipantModel.max_speed,
+            )
+            .join(RideModel, RideModel.id == ParticipantModel.ride_id)
+            .join(MotoKonigModel, MotoKonigModel.id == ParticipantModel.motokonig_id)
+            .where(
+                RideModel.id == ride_id,
+                MotoKonigModel.user_id == user_id,
+                RideModel.actual_start.is_not(None),
+                RideModel.is_completed.is_(False),
+                ParticipantModel.left_at.is_(None),
+            )
+        )
+        result = await self.session.execute(statement)
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        reached = await self.session.scalars(
+            select(ArrivalModel.checkpoint_id).where(
+                ArrivalModel.ride_id == ride_id,
+                ArrivalModel.motokonig_id == row.motokonig_id,
+            )
+        )
+
+        return ParticipantTrack.from_stats(
+            ride_id=ride_id,
+            motokonig_id=row.motokonig_id,
+            distance_m=row.distance_m,
+            average_speed=row.average_speed,
+            max_speed=row.max_speed,
+            reached_checkpoints=set(reached),
+        )
+
+    async def add_points(self, points: Sequence[TelemetryPoint]) -> int:
+        """Сохранить пакет GPS-отметок многострочным INSERT"""
+        if not points:
+            return 0
+
+        await self.session.execute(
+            insert(TelemetryPointModel),
+            [
+                {
+                    "ride_id": p.ride_id,
+                    "motokonig_id": p.motokonig_id,
+                    "recorded_at": p.fix.recorded_at,
+                    "latitude": p.fix.latitude,
+                    "longitude": p.fix.longitude,
+                    "speed": p.fix.speed,
+                }
+                for p in points
+            ],
+        )
+        return len(points)
+
+    async def save_tracks(self, tracks: Sequence[ParticipantTrack]) -> None:
+        """Обновить статистику участников одним executemany"""
+        if not tracks:
+            return
+
+        table = ParticipantModel.__table__
+        statement = (
+            update(table)
+            .where(
+                table.c.ride_id == bindparam("b_ride_id"),
+                table.c.motokonig_id == bindparam("b_motokonig_id"),
+            )
+            .values(
+                distance_covered=bindparam("b_distance_covered"),
+                distance_m=bindparam("b_distance_m"),
+                average_speed=bindparam("b_average_speed"),
+                max_speed=bindparam("b_max_speed"),
+                updated_at=bindparam("b_updated_at"),
+            )
+        )
+        now = datetime.now(UTC)
+        await self.session.execute(
+            statement,
+            [
+                {
+                    "b_ride_id": t.ride_id,
+                    "b_motokonig_id": t.motokonig_id,
+                    "b_distance_covered": t.distance_covered,
+                    "b_distance_m": t.distance_m,
+                    "b_average_speed": t.average_speed,
+                    "b_max_speed": t.max_speed,
+                    "b_updated_at": now,
+                }
+                for t in tracks
+            ],
+        )
+
+    async def get_checkpoints(self, ride_id: UUID) -> list[tuple[UUID, float, float]]:
+        """Получить контрольные точки поездки: (id, широта, долгота)"""
+        result = await self.session.execute(
+            select(CheckpointModel.id, CheckpointModel.latitude, CheckpointModel.longitude)
+            .where(CheckpointModel.ride_id == ride_id)
+        )
+        return [(row.id, row.latitude, row.longitude) for row in result]
+
+    async def get_arrivals(self, ride_id: UUID) -> list[CheckpointArrival]:
+        """Получить прохождения контрольных точек поездки"""
+        result = await self.session.execute(
+            select(ArrivalModel.checkpoint_id, ArrivalModel.motokonig_id, ArrivalModel.reached_at)
+            .where(ArrivalModel.ride_id == ride_id)
+            .order_by(ArrivalModel.reached_at)
+        )
+        return [
+            CheckpointArrival(
+                ride_id=ride_id,
+                checkpoint_id=row.checkpoint_id,
+                motokonig_id=row.motokonig_id,
+                reached_at=row.reached_at,
+            )
+            for row in result
+        ]
+
+    async def add_arrivals(self, arrivals: Sequence[CheckpointArrival]) -> None:
+        """Сохранить прохождения и отметить первое прохождение у самой точки"""
+        if not arrivals:
+            return
+
+        await self.session.execute(
+            pg_insert(ArrivalModel).on_conflict_do_nothing(
+                index_elements=["checkpoint_id", "motokonig_id"],
+            ),
+            [
+                {
+                    "ride_id": a.ride_id,
+                    "checkpoint_id": a.checkpoint_id,
+                    "motokonig_id": a.motokonig_id,
+                    "reached_at": a.reached_at,
+                }
+                for a in arrivals
+            ],
+        )
+
+        first_reached: dict[UUID, datetime] = {}
+        for a in arrivals:
+            if a.checkpoint_id not in first_reached or a.reached_at < first_reached[a.checkpoint_id]:
+                first_reached[a.checkpoint_id] = a.reached_at
+
+        table = CheckpointModel.__table__
+        await self.session.execute(
+            update(table)
+            .where(
+                table.c.id == bindparam("b_id"),
+                table.c.reached_at.is_(None),
+            )
+            .values(reached_at=bindparam("b_reached_at")),
+            [
+                {"b_id": checkpoint_id, "b_reached_at": reached_at}
+                for checkpoint_id, reached_at in first_reached.items()
+            ],
+        )
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.social_link import PrivacyLevel, SocialLink, SocialPlatform
@@ -29,7 +29,6 @@ class SqlSocialLinkRepository(ISocialLinkRepository):
 
         self.session.add(db_link)
         await self.session.flush()
-        await self.session.refresh(db_link)
 
         # Обновляем доменную сущность
         social_link.id = db_link.id
@@ -62,19 +61,20 @@ class SqlSocialLinkRepository(ISocialLinkRepository):
 
     async def update(self, social_link: SocialLink) -> SocialLink:
         """Обновить социальную ссылку"""
-        db_link = await self.session.get(SocialLinkModel, social_link.id)
-
-        if db_link:
-            # Обновляем поля
-            db_link.url = social_link.url
-            db_link.privacy_level = social_link.privacy_level
-            db_link.is_verified = social_link.is_verified
-
-            await self.session.flush()
-            await self.session.refresh(db_link)
+        updated_at = await self.session.scalar(
+            update(SocialLinkModel)
+            .where(SocialLinkModel.id == social_link.id)
+            .values(
+                url=social_link.url,
+                privacy_level=social_link.privacy_level,
+                is_verified=social_link.is_verified,
+            )
+            .returning(SocialLinkModel.updated_at)
+        )
 
+        if updated_at:
             # Обновляем timestamp в доменной сущности
-            social_link.updated_at = db_link.updated_at
+            social_link.updated_at = updated_at
 
         return social_link
 
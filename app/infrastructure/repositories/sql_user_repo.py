@@ -24,7 +24,6 @@ class SqlUserRepository(IUserRepository):
         )
         self.session.add(db_user)
         await self.session.flush()
-        await self.session.refresh(db_user)
         user.id = db_user.id
         user.created_at = db_user.created_at
         user.updated_at = db_user.updated_at
@@ -0,0 +1,94 @@
+# app/infrastructure/scheduling/cron.py
+
+from datetime import datetime, timedelta
+
+__all__ = ["CronSchedule"]
+
+# (минимум, максимум) для минут, часов, дня месяца, месяца и дня недели
+_BOUNDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# Дальше года вперёд подходящей минуты нет только у выражений вроде 31 февраля
+_HORIZON = timedelta(days=366 * 5)
+
+
+def _parse_field(field: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        spec, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Invalid cron step: {part}")
+
+        if spec == "*":
+            start, end = low, high
+        elif "-" in spec:
+            start_text, end_text = spec.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(spec)
+            end = high if step_text else start
+
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron value out of range {low}-{high}: {part}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    Расписание в формате cron из пяти полей: минуты, часы, день месяца,
+    месяц и день недели (0 и 7 — воскресенье)
+
+    Поддерживаются ``*``, списки, диапазоны и шаг (``*/5``, ``1-10/2``).
+    Как и в cron, если ограничены и день месяца, и день недели, подходит
+    совпадение любого из них.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression!r}")
+
+        self.expression = expression
+        minutes, hours, days, months, weekdays = (
+            _parse_field(field, low, high)
+            for field, (low, high) in zip(fields, _BOUNDS, strict=True)
+        )
+        self.minutes = minutes
+        self.hours = hours
+        self.days = days
+        self.months = months
+        # В cron воскресенье — 0, в datetime.weekday() — 6
+        self.weekdays = frozenset((day - 1) % 7 for day in weekdays)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Ближайший момент запуска строго позже ``moment``"""
+        current = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + _HORIZON
+
+        while current <= limit:
+            if current.month not in self.months:
+                year, month = divmod(current.month, 12)
+                current = current.replace(year=current.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(current):
+                current = (current + timedelta(days=1)).replace(hour=0, minute=0)
+            elif current.hour not in self.hours:
+                current = (current + timedelta(hours=1)).replace(minute=0)
+            elif current.minute not in self.minutes:
+                current += timedelta(minutes=1)
+            else:
+                return current
+
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = moment.weekday() in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
@@ -0,0 +1,109 @@
+# app/infrastructure/scheduling/leader.py
+
+import asyncio
+import os
+import socket
+from contextlib import suppress
+from uuid import uuid4
+
+import structlog
+from prometheus_client import Gauge
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, WatchError
+
+__all__ = ["RedisLeaderElection"]
+
+logger = structlog.get_logger(__name__)
+
+MAINTENANCE_LEADER = Gauge(
+    "maintenance_leader",
+    "1, если процесс — лидер обслуживающих задач",
+    multiprocess_mode="liveall",
+)
+
+
+class RedisLeaderElection:
+    """
+    Выбор лидера через ключ в Redis
+
+    Лидер — процесс, которому удалось записать свой токен в ключ
+    (``SET NX PX``). Он продлевает ключ каждую треть ``ttl``; если процесс
+    упал или потерял связь с Redis, ключ истекает и лидером становится
+    другой узел. Продление и освобождение проверяют токен в транзакции
+    WATCH/MULTI, чтобы не тронуть чужое лидерство.
+    """
+
+    def __init__(self, redis: Redis, key: str, ttl: float):
+        self.redis = redis
+        self.key = key
+        self.ttl_ms = int(ttl * 1000)
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex}"
+        self._is_leader = False
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    async def campaign(self) -> bool:
+        """Захватить или продлить лидерство, вернуть текущий статус"""
+        try:
+            if await self.redis.set(self.key, self.token, nx=True, px=self.ttl_ms):
+                leader = True
+            else:
+                leader = await self._compare_and(lambda pipe: pipe.pexpire(self.key, self.ttl_ms))
+        except RedisError:
+            # Не можем продлить ключ — не можем и гарантировать, что лидер один
+            logger.warning("leader_election_unavailable", key=self.key, exc_info=True)
+            leader = False
+
+        self._set_leader(leader)
+        return leader
+
+    async def resign(self) -> None:
+        """Отказаться от лидерства, если оно наше"""
+        try:
+            await self._compare_and(lambda pipe: pipe.delete(self.key))
+        except RedisError:
+            logger.warning("leader_election_unavailable", key=self.key, exc_info=True)
+        self._set_leader(False)
+
+    async def start(self) -> None:
+        """Запустить фоновое участие в выборах"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить выборы и освободить ключ"""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.resign()
+
+    async def _compare_and(self, command) -> bool:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self.key)
+                if await pipe.get(self.key) != self.token:
+                    return False
+                pipe.multi()
+                command(pipe)
+                await pipe.execute()
+                return True
+            except WatchError:
+                # Ключ изменился между GET и EXEC: его перехватил другой узел
+                return False
+
+    def _set_leader(self, leader: bool) -> None:
+        if leader != self._is_leader:
+            logger.info("leader_elected" if leader else "leader_lost", key=self.key, token=self.token)
+        self._is_leader = leader
+        MAINTENANCE_LEADER.set(int(leader))
+
+    async def _run(self) -> None:
+        interval = self.ttl_ms / 3000
+        while True:
+            await self.campaign()
+            await asyncio.sleep(interval)
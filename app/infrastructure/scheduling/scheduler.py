@@ -0,0 +1,99 @@
+# app/infrastructure/scheduling/scheduler.py
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from time import perf_counter
+
+import structlog
+from prometheus_client import Counter, Histogram
+
+from app.infrastructure.scheduling.cron import CronSchedule
+from app.infrastructure.scheduling.leader import RedisLeaderElection
+
+__all__ = ["MaintenanceScheduler", "ScheduledJob"]
+
+logger = structlog.get_logger(__name__)
+
+MAINTENANCE_JOB_DURATION = Histogram(
+    "maintenance_job_duration_seconds",
+    "Длительность обслуживающей задачи",
+    ["job"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+MAINTENANCE_JOB_ROWS = Counter(
+    "maintenance_job_rows", "Строки, изменённые обслуживающей задачей", ["job"]
+)
+MAINTENANCE_JOB_RUNS = Counter(
+    "maintenance_job_runs", "Запуски обслуживающих задач", ["job", "status"]
+)
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """Задача по расписанию, возвращает количество изменённых строк"""
+    name: str
+    schedule: CronSchedule
+    run: Callable[[], Awaitable[int]]
+
+
+class MaintenanceScheduler:
+    """
+    Запуск обслуживающих задач по cron-расписанию
+
+    Расписание отслеживают все узлы, но задачу выполняет только лидер,
+    поэтому каждый запуск происходит на одном узле. Запуск, пропущенный,
+    пока предыдущий ещё работал, не догоняется.
+    """
+
+    def __init__(self, jobs: Sequence[ScheduledJob], election: RedisLeaderElection):
+        self.jobs = list(jobs)
+        self.election = election
+        self._tasks: list[asyncio.Task] = []
+
+    async def run_job(self, job: ScheduledJob) -> int | None:
+        """Выполнить задачу с метриками, ``None`` — если она упала"""
+        started = perf_counter()
+        try:
+            rows = await job.run()
+        except Exception:
+            logger.exception("maintenance_job_failed", job=job.name)
+            MAINTENANCE_JOB_RUNS.labels(job.name, "failed").inc()
+            return None
+        finally:
+            MAINTENANCE_JOB_DURATION.labels(job.name).observe(perf_counter() - started)
+
+        MAINTENANCE_JOB_RUNS.labels(job.name, "ok").inc()
+        MAINTENANCE_JOB_ROWS.labels(job.name).inc(rows)
+        logger.info(
+            "maintenance_job_done",
+            job=job.name,
+            rows=rows,
+            duration=round(perf_counter() - started, 3),
+        )
+        return rows
+
+    async def start(self) -> None:
+        """Начать выборы лидера и отсчёт расписаний"""
+        await self.election.start()
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._loop(job)) for job in self.jobs]
+
+    async def stop(self) -> None:
+        """Дождаться отмены задач и отказаться от лидерства"""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        await self.election.stop()
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        while True:
+            now = datetime.now(UTC)
+            await asyncio.sleep((job.schedule.next_after(now) - now).total_seconds())
+            if self.election.is_leader:
+                await self.run_job(job)
@@ -0,0 +1,68 @@
+# app/infrastructure/services/checkpoint_index.py
+
+import asyncio
+from collections import OrderedDict
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config.settings import TelemetryConfig
+from app.domain.ports.services.checkpoint_index import CheckpointIndexPort
+from app.domain.value_objects.checkpoint_grid import CheckpointGrid
+from app.infrastructure.repositories.sql_ride_telemetry_repo import (
+    SqlRideTelemetryRepository,
+)
+
+MAX_CACHED_RIDES = 512
+
+
+class CachedCheckpointIndex(CheckpointIndexPort):
+    """
+    Индексы контрольных точек активных поездок в памяти воркера
+
+    Индекс строится один раз на поездку при открытии первой сессии телеметрии
+    и дальше переиспользуется для каждой отметки. Построения разных поездок
+    не ждут друг друга: блокировка своя у каждой строящейся поездки.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+            config: TelemetryConfig,
+    ):
+        self._session_factory = session_factory
+        self._radius = config.checkpoint_radius
+        self._grids: OrderedDict[UUID, CheckpointGrid] = OrderedDict()
+        self._locks: dict[UUID, asyncio.Lock] = {}
+
+    async def get(self, ride_id: UUID) -> CheckpointGrid:
+        """Получить индекс поездки, построив его при первом обращении"""
+        grid = self._grids.get(ride_id)
+        if grid is not None:
+            self._grids.move_to_end(ride_id)
+            return grid
+
+        lock = self._locks.setdefault(ride_id, asyncio.Lock())
+        async with lock:
+            grid = self._grids.get(ride_id)
+            if grid is not None:
+                return grid
+            try:
+                async with self._session_factory() as session:
+                    checkpoints = await SqlRideTelemetryRepository(session).get_checkpoints(ride_id)
+            finally:
+                # Сброс во время загрузки забирает блокировку: такой индекс уже устарел
+                current = self._locks.get(ride_id) is lock
+                if current:
+                    del self._locks[ride_id]
+            grid = CheckpointGrid(checkpoints, self._radius)
+            if current:
+                self._grids[ride_id] = grid
+                if len(self._grids) > MAX_CACHED_RIDES:
+                    self._grids.popitem(last=False)
+            return grid
+
+    def invalidate(self, ride_id: UUID) -> None:
+        """Сбросить индекс поездки: она завершена или её контрольные точки изменились"""
+        self._grids.pop(ride_id, None)
+        self._locks.pop(ride_id, None)
@@ -0,0 +1,63 @@
+# app/infrastructure/services/leaderboard.py
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from app.domain.entities.motokonig import MotoKonig
+from app.domain.ports.services.leaderboard import LeaderboardPort
+
+LEADERBOARD_KEY = "leaderboard:riders"
+REBUILD_KEY = "leaderboard:riders:rebuilt"
+
+# Не чаще одной пересборки из базы за интервал, сколько бы запросов ни пришло
+REBUILD_INTERVAL = 60
+
+# Рейтинг (0..5, две значащие цифры после запятой) важнее опыта:
+# score = rating * 100 * XP_SCALE + experience_points
+XP_SCALE = 10 ** 9
+
+
+def _score(motokonig: MotoKonig) -> float:
+    experience = min(motokonig.experience_points, XP_SCALE - 1)
+    return round(motokonig.rating * 100) * XP_SCALE + experience
+
+
+class RedisLeaderboard(LeaderboardPort):
+    """Рейтинговая таблица райдеров в сортированном множестве Redis"""
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    async def update(self, motokonigs: Sequence[MotoKonig]) -> None:
+        """Обновить позиции публичных профилей, скрытые убрать"""
+        public = {str(m.motokonig_id): _score(m) for m in motokonigs if m.is_public}
+        hidden = [str(m.motokonig_id) for m in motokonigs if not m.is_public]
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if public:
+                pipe.zadd(LEADERBOARD_KEY, public)
+            if hidden:
+                pipe.zrem(LEADERBOARD_KEY, *hidden)
+            await pipe.execute()
+
+    async def replace(self, motokonigs: Sequence[MotoKonig]) -> None:
+        """Пересобрать таблицу: удалённые и скрытые профили в ней не останутся"""
+        public = {str(m.motokonig_id): _score(m) for m in motokonigs if m.is_public}
+
+        # DEL и ZADD в одной транзакции: читатели не увидят пустую таблицу
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(LEADERBOARD_KEY)
+            if public:
+                pipe.zadd(LEADERBOARD_KEY, public)
+            await pipe.execute()
+
+    async def claim_rebuild(self) -> bool:
+        """Занять пересборку таблицы; False, если её недавно пересобирали"""
+        return bool(await self.redis.set(REBUILD_KEY, 1, nx=True, ex=REBUILD_INTERVAL))
+
+    async def top(self, limit: int) -> list[UUID]:
+        """ID лучших райдеров по убыванию рейтинга и опыта"""
+        members = await self.redis.zrevrange(LEADERBOARD_KEY, 0, limit - 1)
+        return [UUID(member) for member in members]
@@ -1,12 +1,68 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
 import bcrypt
+from prometheus_client import Gauge
 
 from app.domain.ports.services.password import PasswordService
 
+T = TypeVar("T")
+
+BCRYPT_QUEUE_DEPTH = Gauge(
+    "bcrypt_queue_depth",
+    "Операции bcrypt, ожидающие свободного потока",
+    multiprocess_mode="livesum",
+)
+BCRYPT_IN_PROGRESS = Gauge(
+    "bcrypt_in_progress",
+    "Операции bcrypt, выполняющиеся сейчас",
+    multiprocess_mode="livesum",
+)
+
 
 class PasswordServiceImpl(PasswordService):
+    """
+    Хэширование паролей bcrypt в отдельном пуле потоков
+
+    bcrypt отпускает GIL, поэтому хэши считаются параллельно и не
+    блокируют цикл событий. Глубина очереди показывает, хватает ли потоков.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+
     async def hash(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        hashed = await self._run(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt())
+        return hashed.decode("utf-8")
 
     async def verify(self, password: str, pwd_hash: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), pwd_hash.encode("utf-8"))
+        return await self._run(bcrypt.checkpw, password.encode("utf-8"), pwd_hash.encode("utf-8"))
+
+    def close(self) -> None:
+        """Остановить пул, не дожидаясь поставленных в очередь задач"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], *args: bytes) -> T:
+        BCRYPT_QUEUE_DEPTH.inc()
+        queued = [True]
+
+        def leave_queue() -> None:
+            # pop атомарен: из очереди задачу выводит либо поток, либо отмена, но не оба
+            try:
+                queued.pop()
+            except IndexError:
+                return
+            BCRYPT_QUEUE_DEPTH.dec()
+
+        def call() -> T:
+            leave_queue()
+            with BCRYPT_IN_PROGRESS.track_inprogress():
+                return func(*args)
 
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        finally:
+            # Отменённая в очереди задача так и не стартовала
+            leave_queue()
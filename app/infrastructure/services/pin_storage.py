@@ -7,13 +7,58 @@ from uuid import UUID
 from redis.asyncio import Redis
 
 from app.domain.ports.repositories.pin_storage import PinStoragePort
+from app.domain.value_objects.pin_check import PinCheck, PinCheckStatus
+
+ATTEMPTS_TTL = 3600  # 1 час
+
+# Проверка попыток, чтение PIN и сброс или увеличение счётчика за один вызов.
+# KEYS: PIN устройства, счётчик попыток
+# ARGV: хэш введённого PIN, лимит попыток, TTL счётчика, время входа
+# Сравниваются PBKDF2-хэши с солью, так что время сравнения ничего не выдаёт
+CHECK_PIN_SCRIPT = """
+local attempts = tonumber(redis.call("GET", KEYS[2]) or "0")
+if attempts >= tonumber(ARGV[2]) then
+    return {"locked", attempts}
+end
+local stored = redis.call("HMGET", KEYS[1], "pin_hash", "device_token", "device_name")
+if not stored[1] then
+    return {"not_found", attempts}
+end
+if stored[1] ~= ARGV[1] then
+    attempts = redis.call("INCR", KEYS[2])
+    redis.call("EXPIRE", KEYS[2], ARGV[3])
+    return {"invalid", attempts}
+end
+redis.call("DEL", KEYS[2])
+redis.call("HSET", KEYS[1], "last_login", ARGV[4])
+return {"verified", 0, stored[2] or "", stored[3] or ""}
+"""
+
+
+def _pin_key(user_id: UUID, device_id: str) -> str:
+    return f"pin:{user_id}:{device_id}"
+
+
+def _attempts_key(user_id: UUID, device_id: str) -> str:
+    return f"pin_attempts:{user_id}:{device_id}"
+
+
+def _devices_key(user_id: UUID) -> str:
+    return f"pin_devices:{user_id}"
 
 
 class RedisPinStorage(PinStoragePort):
-    """Redis реализация хранилища PIN-кодов"""
+    """
+    Redis реализация хранилища PIN-кодов
+
+    ID устройств пользователя ведутся в отдельном множестве, поэтому список
+    устройств не сканирует всё пространство ключей. Множество живёт не
+    меньше самого свежего PIN, устаревшие ID вычищаются при чтении.
+    """
 
     def __init__(self, redis: Redis):
         self.redis = redis
+        self._check_pin = redis.register_script(CHECK_PIN_SCRIPT)
 
     async def save_pin(
             self,
@@ -24,89 +69,90 @@ class RedisPinStorage(PinStoragePort):
             device_token: str,
             ttl: timedelta
     ) -> None:
-        key = f"pin:{user_id}:{device_id}"
+        key = _pin_key(user_id, device_id)
         data = {
             "pin_hash": pin_hash,
             "device_name": device_name,
             "device_token": device_token,
             "created_at": datetime.now(UTC).isoformat()
         }
+        seconds = int(ttl.total_seconds())
 
-        await self.redis.hset(key, mapping=data)
-        await self.redis.expire(key, int(ttl.total_seconds()))
-
-    async def get_pin_data(
-            self,
-            user_id: UUID,
-            device_id: str
-    ) -> dict[str, Any] | None:
-        key = f"pin:{user_id}:{device_id}"
-        data = await self.redis.hgetall(key)
-        return data if data else None
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=data)
+            pipe.expire(key, seconds)
+            pipe.sadd(_devices_key(user_id), device_id)
+            pipe.expire(_devices_key(user_id), seconds)
+            await pipe.execute()
 
     async def delete_pin(
             self,
             user_id: UUID,
             device_id: str
     ) -> None:
-        key = f"pin:{user_id}:{device_id}"
-        await self.redis.delete(key)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(_pin_key(user_id, device_id))
+            pipe.srem(_devices_key(user_id), device_id)
+            await pipe.execute()
 
-    async def increment_failed_attempts(
+    async def check_pin(
             self,
             user_id: UUID,
-            device_id: str
-    ) -> int:
-        key = f"pin_attempts:{user_id}:{device_id}"
-        count = await self.redis.incr(key)
-        await self.redis.expire(key, 3600)  # 1 час
-        return count
+            device_id: str,
+            pin_hash: str,
+            max_attempts: int,
+            timestamp: str
+    ) -> PinCheck:
+        status, attempts, *device = await self._check_pin(
+            keys=[_pin_key(user_id, device_id), _attempts_key(user_id, device_id)],
+            args=[pin_hash, max_attempts, ATTEMPTS_TTL, timestamp],
+        )
+        if not device:
+            return PinCheck(PinCheckStatus(status), int(attempts))
+        device_token, device_name = device
+        return PinCheck(
+            PinCheckStatus(status),
+            int(attempts),
+            device_token=device_token or None,
+            device_name=device_name or None,
+        )
 
     async def get_failed_attempts(
             self,
             user_id: UUID,
             device_id: str
     ) -> int:
-        key = f"pin_attempts:{user_id}:{device_id}"
-        count = await self.redis.get(key)
+        count = await self.redis.get(_attempts_key(user_id, device_id))
         return int(count) if count else 0
 
-    async def reset_failed_attempts(
-            self,
-            user_id: UUID,
-            device_id: str
-    ) -> None:
-        key = f"pin_attempts:{user_id}:{device_id}"
-        await self.redis.delete(key)
-
     async def get_user_devices(self, user_id: UUID) -> list[dict[str, Any]]:
         """Получить все устройства пользователя"""
-        pattern = f"pin:{user_id}:*"
-        devices = []
+        device_ids = sorted(await self.redis.smembers(_devices_key(user_id)))
+        if not device_ids:
+            return []
 
-        async for key in self.redis.scan_iter(match=pattern):
-            device_data = await self.redis.hgetall(key)
-            if device_data:
-                device_id = key.split(":")[-1]
-                devices.append({
-                    "device_id": device_id,
-                    "device_name": device_data.get("device_name"),
-                    "created_at": device_data.get("created_at"),
-                    "last_login": device_data.get("last_login")
-                })
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for device_id in device_ids:
+                pipe.hgetall(_pin_key(user_id, device_id))
+            rows = await pipe.execute()
 
+        devices = []
+        expired = []
+        for device_id, device_data in zip(device_ids, rows, strict=True):
+            if not device_data:
+                expired.append(device_id)
+                continue
+            devices.append({
+                "device_id": device_id,
+                "device_name": device_data.get("device_name"),
+                "created_at": device_data.get("created_at"),
+                "last_login": device_data.get("last_login")
+            })
+
+        if expired:
+            await self.redis.srem(_devices_key(user_id), *expired)
         return devices
 
-    async def update_last_login(
-            self,
-            user_id: UUID,
-            device_id: str,
-            timestamp: str
-    ) -> None:
-        """Обновить время последнего входа"""
-        key = f"pin:{user_id}:{device_id}"
-        await self.redis.hset(key, "last_login", timestamp)
-
     async def add_device_to_blacklist(
             self,
             user_id: UUID,
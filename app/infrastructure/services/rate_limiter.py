@@ -0,0 +1,85 @@
+# app/infrastructure/services/rate_limiter.py
+
+from collections.abc import Mapping
+
+from redis.asyncio import Redis
+
+from app.config.settings import RateLimitConfig
+from app.domain.ports.services.rate_limiter import RateLimiterPort
+from app.domain.value_objects.rate_limit import RateLimit, RateLimitDecision
+
+# GCRA по всем ключам запроса за один вызов. Для каждого ключа хранится
+# теоретическое время прихода (TAT) в мс. Запрос списывается со всех
+# ключей, только если проходит по каждому; время берётся у Redis, чтобы
+# часы воркеров не расходились.
+# ARGV: пары (интервал восстановления, период) в мс на каждый ключ.
+GCRA_SCRIPT = """
+local now_parts = redis.call("TIME")
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local allowed = 1
+local remaining = -1
+local retry_after = 0
+local new_tats = {}
+for i, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[i * 2 - 1])
+    local period = tonumber(ARGV[i * 2])
+    local tat = tonumber(redis.call("GET", key) or now)
+    if tat < now then
+        tat = now
+    end
+    local new_tat = tat + interval
+    local allow_at = new_tat - period
+    if now < allow_at then
+        allowed = 0
+        remaining = 0
+        retry_after = math.max(retry_after, allow_at - now)
+    else
+        local left = math.floor((period - (new_tat - now)) / interval)
+        if remaining < 0 or left < remaining then
+            remaining = left
+        end
+    end
+    new_tats[i] = new_tat
+end
+if allowed == 1 then
+    for i, key in ipairs(KEYS) do
+        redis.call("SET", key, new_tats[i], "PX", new_tats[i] - now)
+    end
+end
+return {allowed, remaining, retry_after}
+"""
+
+
+class RedisRateLimiter(RateLimiterPort):
+    """Ограничение частоты запросов по GCRA в Redis, общее для всех воркеров"""
+
+    def __init__(self, redis: Redis, config: RateLimitConfig):
+        self.redis = redis
+        self.enabled = config.enabled
+        self.prefix = config.key_prefix
+        self.policies = {
+            policy: {scope: RateLimit.parse(value) for scope, value in limits.items()}
+            for policy, limits in config.policies().items()
+        }
+        self._script = redis.register_script(GCRA_SCRIPT)
+
+    async def hit(self, policy: str, subjects: Mapping[str, str]) -> RateLimitDecision:
+        limits = self.policies[policy]
+        keys: list[str] = []
+        args: list[int] = []
+        for scope, subject in subjects.items():
+            limit = limits.get(scope)
+            if limit is None or not subject:
+                continue
+            keys.append(f"{self.prefix}:{policy}:{scope}:{subject}")
+            args += [max(1, round(limit.emission_interval * 1000)), round(limit.period * 1000)]
+
+        if not self.enabled or not keys:
+            return RateLimitDecision(allowed=True, remaining=min((lim.limit for lim in limits.values()), default=0))
+
+        allowed, remaining, retry_after = await self._script(keys=keys, args=args)
+        return RateLimitDecision(
+            allowed=bool(allowed),
+            remaining=max(int(remaining), 0),
+            retry_after=int(retry_after) / 1000,
+        )
@@ -0,0 +1,289 @@
+# app/infrastructure/services/ride_position_hub.py
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import Sequence
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from app.config.settings import TelemetryConfig
+from app.domain.ports.services.ride_position_hub import RidePositionHubPort
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.gps_fix import GpsFix
+
+logger = structlog.get_logger(__name__)
+
+# Позиция участника в кадре: [unix-время, широта, долгота, скорость]
+Position = tuple[int, float, float, float | None]
+# Прохождение контрольной точки в кадре: [участник, точка, unix-время]
+Arrival = tuple[str, str, int]
+
+COORD_PRECISION = 5  # ~1 м, дрожание GPS меньше не рассылается
+
+
+def _channel(ride_id: UUID) -> str:
+    return f"ride:{ride_id}:positions"
+
+
+def _frame(
+        kind: str,
+        seq: int,
+        positions: dict[str, Position],
+        checkpoints: Sequence[Arrival],
+) -> str:
+    payload = {"type": kind, "seq": seq, "positions": positions}
+    if checkpoints:
+        payload["checkpoints"] = checkpoints
+    return json.dumps(payload, separators=(",", ":"))
+
+
+class PositionSubscription:
+    """
+    Очередь кадров одного WebSocket-клиента
+
+    Очередь ограничена: если клиент не успевает читать, накопленные дельты
+    отбрасываются и следующим кадром он получает полный снимок.
+    """
+
+    def __init__(self, ride_id: UUID, maxsize: int):
+        self.ride_id = ride_id
+        self.needs_snapshot = True
+        self._frames: deque[str] = deque()
+        self._maxsize = maxsize
+        self._ready = asyncio.Event()
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._frames) >= self._maxsize
+
+    def put(self, frame: str) -> None:
+        self._frames.append(frame)
+        self._ready.set()
+
+    def reset(self, snapshot: str) -> None:
+        """Заменить устаревшие кадры полным снимком"""
+        self._frames.clear()
+        self.needs_snapshot = False
+        self.put(snapshot)
+
+    async def receive(self) -> str:
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._frames.popleft()
+
+
+class _RideState:
+    """Позиции участников одной поездки в памяти воркера"""
+
+    def __init__(self) -> None:
+        self.latest: dict[str, Position] = {}
+        self.sent: dict[str, Position] = {}
+        self.arrivals: dict[tuple[str, str], int] = {}
+        self.new_arrivals: list[Arrival] = []
+        self.seq = 0
+        self.subscribers: set[PositionSubscription] = set()
+
+
+class RedisRidePositionHub(RidePositionHubPort):
+    """
+    Рассылка позиций участников через Redis pub/sub
+
+    Каждый воркер подписывается на канал поездки, пока к нему подключён хотя бы
+    один клиент этой поездки, поэтому липкие сессии на балансировщике не нужны.
+    Входящие позиции схлопываются до последней по участнику и раз в
+    ``broadcast_tick`` секунд рассылаются клиентам дельтой: только участники,
+    чьи координаты изменились с прошлого кадра, и новые прохождения
+    контрольных точек. Полный снимок содержит все прохождения, поэтому
+    подключившиеся позже участники видят и уже пройденные точки.
+    """
+
+    def __init__(self, redis: Redis, config: TelemetryConfig):
+        self._redis = redis
+        self._tick = config.broadcast_tick
+        self._queue_size = config.client_queue_size
+
+        self._rides: dict[str, _RideState] = {}
+        self._pubsub: PubSub | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._running = False
+
+    async def publish(self, ride_id: UUID, motokonig_id: UUID, fix: GpsFix) -> None:
+        """Опубликовать последнюю позицию участника во все воркеры"""
+        message = json.dumps(
+            [
+                "p",
+                str(motokonig_id),
+                int(fix.recorded_at.timestamp()),
+                fix.latitude,
+                fix.longitude,
+                fix.speed,
+            ],
+            separators=(",", ":"),
+        )
+        await self._redis.publish(_channel(ride_id), message)
+
+    async def publish_arrival(self, arrival: CheckpointArrival) -> None:
+        """Опубликовать прохождение контрольной точки во все воркеры"""
+        message = json.dumps(
+            [
+                "c",
+                str(arrival.motokonig_id),
+                str(arrival.checkpoint_id),
+                int(arrival.reached_at.timestamp()),
+            ],
+            separators=(",", ":"),
+        )
+        await self._redis.publish(_channel(arrival.ride_id), message)
+
+    async def subscribe(
+            self,
+            ride_id: UUID,
+            arrivals: Sequence[CheckpointArrival] = (),
+    ) -> PositionSubscription:
+        """Подписать клиента, при первом клиенте поездки подписать воркер на канал"""
+        channel = _channel(ride_id)
+        state = self._rides.get(channel)
+        if state is None:
+            state = self._rides[channel] = _RideState()
+            if self._pubsub is not None:
+                await self._pubsub.subscribe(channel)
+
+        # Прохождения до подписки воркера на канал известны только из хранилища
+        for arrival in arrivals:
+            key = (str(arrival.motokonig_id), str(arrival.checkpoint_id))
+            state.arrivals.setdefault(key, int(arrival.reached_at.timestamp()))
+
+        subscription = PositionSubscription(ride_id, self._queue_size)
+        state.subscribers.add(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription: PositionSubscription) -> None:
+        """Отписать клиента, при последнем клиенте отписать воркер от канала"""
+        channel = _channel(subscription.ride_id)
+        state = self._rides.get(channel)
+        if state is None:
+            return
+
+        state.subscribers.discard(subscription)
+        if not state.subscribers:
+            del self._rides[channel]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(channel)
+
+    async def start(self) -> None:
+        """Запустить чтение канала и рассылку кадров"""
+        if self._pubsub is not None:
+            return
+
+        self._running = True
+        self._pubsub = self._redis.pubsub()
+        if self._rides:
+            await self._pubsub.subscribe(*self._rides)
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._broadcast()),
+        ]
+
+    async def stop(self) -> None:
+        """Остановить фоновые задачи и закрыть подписку"""
+        # Чтение pub/sub может поглотить отмену, поэтому цикл проверяет флаг
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    def handle_message(self, channel: str, data: str) -> None:
+        """Запомнить позицию участника или прохождение точки из сообщения канала"""
+        state = self._rides.get(channel)
+        if state is None:
+            return
+
+        try:
+            kind, *fields = json.loads(data)
+            if kind == "c":
+                motokonig_id, checkpoint_id, ts = fields
+            else:
+                motokonig_id, ts, lat, lon, speed = fields
+        except (TypeError, ValueError):
+            logger.warning("ride_position_malformed", channel=channel)
+            return
+
+        if kind == "c":
+            if (motokonig_id, checkpoint_id) not in state.arrivals:
+                state.arrivals[(motokonig_id, checkpoint_id)] = ts
+                state.new_arrivals.append((motokonig_id, checkpoint_id, ts))
+            return
+
+        current = state.latest.get(motokonig_id)
+        if current is not None and current[0] > ts:
+            return
+
+        state.latest[motokonig_id] = (
+            ts,
+            round(lat, COORD_PRECISION),
+            round(lon, COORD_PRECISION),
+            round(speed, 1) if speed is not None else None,
+        )
+
+    def tick(self) -> None:
+        """Разослать накопленные изменения всем клиентам воркера"""
+        for state in self._rides.values():
+            changed = {
+                motokonig_id: position
+                for motokonig_id, position in state.latest.items()
+                if state.sent.get(motokonig_id, (None,))[1:] != position[1:]
+            }
+            new_arrivals, state.new_arrivals = state.new_arrivals, []
+            needs_snapshot = any(s.needs_snapshot or s.is_full for s in state.subscribers)
+            if not changed and not new_arrivals and not needs_snapshot:
+                continue
+
+            state.sent.update(changed)
+            state.seq += 1
+            delta = None
+            if changed or new_arrivals:
+                delta = _frame("delta", state.seq, changed, new_arrivals)
+            snapshot = None
+            if needs_snapshot:
+                all_arrivals = [(*key, ts) for key, ts in state.arrivals.items()]
+                snapshot = _frame("snapshot", state.seq, state.sent, all_arrivals)
+
+            for subscription in state.subscribers:
+                if subscription.needs_snapshot or subscription.is_full:
+                    subscription.reset(snapshot)
+                elif delta is not None:
+                    subscription.put(delta)
+
+    async def _listen(self) -> None:
+        while self._running:
+            try:
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(self._tick)
+                    continue
+
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self._tick,
+                )
+                if message is not None:
+                    self.handle_message(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("ride_position_listen_failed")
+                await asyncio.sleep(self._tick)
+
+    async def _broadcast(self) -> None:
+        while self._running:
+            await asyncio.sleep(self._tick)
+            self.tick()
@@ -0,0 +1,195 @@
+# app/infrastructure/services/telemetry_buffer.py
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Sequence
+from uuid import UUID
+
+import structlog
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config.settings import TelemetryConfig
+from app.domain.entities.participant_track import ParticipantTrack
+from app.domain.ports.services.telemetry_buffer import TelemetryBufferPort
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.gps_fix import GpsFix
+from app.domain.value_objects.telemetry_point import TelemetryPoint
+from app.infrastructure.repositories.sql_ride_telemetry_repo import (
+    SqlRideTelemetryRepository,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Прохождений на порядки меньше отметок, но и их очередь не должна расти без предела
+MAX_BUFFERED_ARRIVALS = 10000
+
+
+class _RideBatch:
+    """Данные одной поездки в пакете записи"""
+
+    __slots__ = ("arrivals", "points", "tracks")
+
+    def __init__(self):
+        self.points: list[TelemetryPoint] = []
+        self.tracks: dict[tuple[UUID, UUID], ParticipantTrack] = {}
+        self.arrivals: list[CheckpointArrival] = []
+
+
+class BatchedTelemetryBuffer(TelemetryBufferPort):
+    """
+    Буфер телеметрии в памяти воркера
+
+    Отметки всех поездок копятся в одном списке и раз в ``flush_interval``
+    секунд (или при достижении ``max_batch_size``) пишутся по транзакции на
+    поездку: многострочный INSERT отметок и один executemany по статистике
+    участников и прохождениям контрольных точек.
+
+    Ошибка одной поездки не задерживает остальные. Данные поездки, чью строку
+    или контрольную точку удалили (нарушение целостности), отбрасываются;
+    при прочих ошибках они возвращаются в буфер в пределах лимитов.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+            config: TelemetryConfig,
+    ):
+        self._session_factory = session_factory
+        self._flush_interval = config.flush_interval
+        self._max_batch_size = config.max_batch_size
+        self._max_buffered_points = config.max_buffered_points
+
+        self._points: list[TelemetryPoint] = []
+        self._tracks: dict[tuple[UUID, UUID], ParticipantTrack] = {}
+        self._arrivals: list[CheckpointArrival] = []
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def load_track(self, ride_id: UUID, user_id: UUID) -> ParticipantTrack | None:
+        """Загрузить трек участника активной поездки"""
+        async with self._session_factory() as session:
+            return await SqlRideTelemetryRepository(session).get_active_track(ride_id, user_id)
+
+    async def load_arrivals(self, ride_id: UUID) -> list[CheckpointArrival]:
+        """Загрузить прохождения контрольных точек вместе с ожидающими записи"""
+        async with self._session_factory() as session:
+            arrivals = await SqlRideTelemetryRepository(session).get_arrivals(ride_id)
+        return arrivals + [a for a in self._arrivals if a.ride_id == ride_id]
+
+    async def push(
+            self,
+            track: ParticipantTrack,
+            fixes: Sequence[GpsFix],
+            arrivals: Sequence[CheckpointArrival] = (),
+    ) -> None:
+        """Поставить отметки и статистику участника в очередь на запись"""
+        self._points.extend(
+            TelemetryPoint(ride_id=track.ride_id, motokonig_id=track.motokonig_id, fix=fix)
+            for fix in fixes
+        )
+        self._tracks[(track.ride_id, track.motokonig_id)] = track
+        self._arrivals.extend(arrivals)
+
+        # Пока запись не идёт, память ограничиваем за счёт самых старых данных
+        overflow = len(self._points) - self._max_buffered_points
+        if overflow > 0:
+            logger.warning("telemetry_points_dropped", points=overflow)
+            del self._points[:overflow]
+        overflow = len(self._arrivals) - MAX_BUFFERED_ARRIVALS
+        if overflow > 0:
+            logger.warning("telemetry_arrivals_dropped", arrivals=overflow)
+            del self._arrivals[:overflow]
+
+        if len(self._points) >= self._max_batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Записать накопленные данные, по транзакции на поездку"""
+        async with self._flush_lock:
+            if not self._points and not self._tracks and not self._arrivals:
+                return 0
+
+            points, self._points = self._points, []
+            tracks, self._tracks = self._tracks, {}
+            arrivals, self._arrivals = self._arrivals, []
+
+            rides: defaultdict[UUID, _RideBatch] = defaultdict(_RideBatch)
+            for point in points:
+                rides[point.ride_id].points.append(point)
+            for key, track in tracks.items():
+                rides[key[0]].tracks[key] = track
+            for arrival in arrivals:
+                rides[arrival.ride_id].arrivals.append(arrival)
+
+            written = 0
+            for ride_id, batch in rides.items():
+                try:
+                    async with self._session_factory() as session, session.begin():
+                        repo = SqlRideTelemetryRepository(session)
+                        await repo.add_points(batch.points)
+                        await repo.save_tracks(list(batch.tracks.values()))
+                        await repo.add_arrivals(batch.arrivals)
+                except IntegrityError:
+                    # Поездку или точку удалили: повтор упадёт так же
+                    logger.warning(
+                        "telemetry_ride_dropped",
+                        ride_id=str(ride_id),
+                        points=len(batch.points),
+                        arrivals=len(batch.arrivals),
+                        exc_info=True,
+                    )
+                except Exception:
+                    logger.exception("telemetry_flush_failed", ride_id=str(ride_id), points=len(batch.points))
+                    self._requeue(batch)
+                else:
+                    written += len(batch.points)
+            return written
+
+    def _requeue(self, batch: _RideBatch) -> None:
+        """Вернуть неудачный пакет поездки в буфер, не превышая лимиты памяти"""
+        for key, track in batch.tracks.items():
+            self._tracks.setdefault(key, track)
+
+        # Повторная вставка прохождений идемпотентна
+        room = MAX_BUFFERED_ARRIVALS - len(self._arrivals)
+        if len(batch.arrivals) > room:
+            logger.warning("telemetry_arrivals_dropped", arrivals=len(batch.arrivals) - max(room, 0))
+        if room > 0:
+            self._arrivals[:0] = batch.arrivals[-room:]
+
+        points = batch.points
+        room = self._max_buffered_points - len(self._points)
+        if room <= 0:
+            logger.warning("telemetry_points_dropped", points=len(points))
+            return
+        if len(points) > room:
+            logger.warning("telemetry_points_dropped", points=len(points) - room)
+            points = points[-room:]
+        self._points[:0] = points
+
+    async def start(self) -> None:
+        """Запустить фоновую задачу периодической записи"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить фоновую задачу и записать остаток"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
@@ -0,0 +1,130 @@
+# app/infrastructure/services/viewer_relationship_cache.py
+
+import asyncio
+from collections.abc import Collection, Mapping
+from typing import Any
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.ports.services.viewer_relationship_cache import (
+    ViewerRelationshipCachePort,
+)
+
+__all__ = ["RedisViewerRelationshipCache", "SessionViewerRelationshipCache"]
+
+# Страховка от пропущенной инвалидации: запись живёт не дольше TTL
+RELATIONSHIP_TTL = 600  # секунды
+
+# Инвалидации, ждущие коммита сессии
+_PENDING = "viewer_relationship_pending"
+_LISTENING = "viewer_relationship_listening"
+
+
+def _key(viewer_id: UUID) -> str:
+    return f"viewer:{viewer_id}:club_peers"
+
+
+class RedisViewerRelationshipCache(ViewerRelationshipCachePort):
+    """
+    Кэш общих клубов в хэше Redis на каждого зрителя
+
+    Поле хэша — ID владельца профиля, значение — "1" или "0", поэтому
+    признаки для целой страницы профилей читаются одним HMGET.
+    """
+
+    def __init__(self, redis: Redis, ttl: int = RELATIONSHIP_TTL):
+        self.redis = redis
+        self.ttl = ttl
+        # Сбросы после коммита идут фоном, ссылки держим до завершения
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get_many(self, viewer_id: UUID, user_ids: Collection[UUID]) -> dict[UUID, bool]:
+        """Закэшированные признаки общего клуба, отсутствующие в кэше ID пропускаются"""
+        if not user_ids:
+            return {}
+
+        ids = list(user_ids)
+        values = await self.redis.hmget(_key(viewer_id), [str(user_id) for user_id in ids])
+        return {
+            user_id: value == "1"
+            for user_id, value in zip(ids, values, strict=True)
+            if value is not None
+        }
+
+    async def set_many(self, viewer_id: UUID, relations: Mapping[UUID, bool]) -> None:
+        """Сохранить признаки общего клуба для зрителя"""
+        if not relations:
+            return
+
+        key = _key(viewer_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping={str(user_id): int(shared) for user_id, shared in relations.items()})
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def invalidate(self, user_id: UUID, peer_ids: Collection[UUID]) -> None:
+        """Сбросить кэш пользователя и его записи у участников затронутого клуба"""
+        field = str(user_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(_key(user_id))
+            for peer_id in peer_ids:
+                if peer_id != user_id:
+                    pipe.hdel(_key(peer_id), field)
+            await pipe.execute()
+
+    async def invalidate_viewers(self, viewer_ids: Collection[UUID]) -> None:
+        """Сбросить кэш отношений этих зрителей целиком"""
+        if viewer_ids:
+            await self.redis.delete(*(_key(viewer_id) for viewer_id in viewer_ids))
+
+
+class SessionViewerRelationshipCache(ViewerRelationshipCachePort):
+    """
+    Кэш отношений в рамках сессии запроса
+
+    Сброс откладывается до коммита сессии: иначе параллельное чтение
+    успело бы закэшировать ещё не закоммиченное состояние на весь TTL.
+    При откате сбрасывать нечего.
+    """
+
+    def __init__(self, cache: RedisViewerRelationshipCache, session: AsyncSession):
+        self.cache = cache
+        self.session = session
+
+    async def get_many(self, viewer_id: UUID, user_ids: Collection[UUID]) -> dict[UUID, bool]:
+        return await self.cache.get_many(viewer_id, user_ids)
+
+    async def set_many(self, viewer_id: UUID, relations: Mapping[UUID, bool]) -> None:
+        await self.cache.set_many(viewer_id, relations)
+
+    async def invalidate(self, user_id: UUID, peer_ids: Collection[UUID]) -> None:
+        self._defer(self.cache.invalidate, user_id, list(peer_ids))
+
+    async def invalidate_viewers(self, viewer_ids: Collection[UUID]) -> None:
+        self._defer(self.cache.invalidate_viewers, list(viewer_ids))
+
+    def _defer(self, action: Any, *args: Any) -> None:
+        info = self.session.info
+        if not info.get(_LISTENING):
+            info[_LISTENING] = True
+            event.listen(self.session.sync_session, "after_commit", self._after_commit)
+            event.listen(self.session.sync_session, "after_rollback", self._after_rollback)
+        info.setdefault(_PENDING, []).append((action, args))
+
+    def _after_commit(self, sync_session: Any) -> None:
+        pending = sync_session.info.pop(_PENDING, None)
+        if pending:
+            task = asyncio.get_running_loop().create_task(self._run(pending))
+            self.cache._tasks.add(task)
+            task.add_done_callback(self.cache._tasks.discard)
+
+    def _after_rollback(self, sync_session: Any) -> None:
+        sync_session.info.pop(_PENDING, None)
+
+    @staticmethod
+    async def _run(pending: list) -> None:
+        for action, args in pending:
+            await action(*args)
@@ -0,0 +1,19 @@
+# app/infrastructure/specs/club_membership/membership_by_id.py
+
+from typing import Any
+from uuid import UUID
+
+from app.domain.ports.specs.club_membership import ClubMembershipSpecificationPort
+from app.infrastructure.models.club_membership import (
+    ClubMembership as ClubMembershipModel,
+)
+
+
+class ClubMembershipById(ClubMembershipSpecificationPort):
+    """Спецификация для поиска членства по ID"""
+
+    def __init__(self, membership_id: UUID):
+        self.membership_id = membership_id
+
+    def to_query(self, base_query: Any) -> Any:
+        return base_query.where(ClubMembershipModel.id == self.membership_id)
@@ -1,24 +1,97 @@
 # app/infrastructure/storage/minio_client.py
 
 import hashlib
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime
+from time import perf_counter
 from uuid import UUID, uuid4
 
-import aioboto3
-from botocore.exceptions import ClientError
+from prometheus_client import Histogram
 
 from app.config.settings import MinIOConfig
 from app.domain.entities.media_file import MediaFile
 from app.domain.ports.repositories.file_storage import FileStoragePort
 from app.domain.value_objects.file_type import FileType
 
+S3_REQUEST_DURATION = Histogram(
+    "s3_request_duration_seconds",
+    "Время запроса к S3 с учётом повторов",
+    ["operation", "outcome"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# Ключ в контексте запроса botocore: имя операции и время начала
+_STARTED = "metrics_started"
+
+
+def _before_call(model, context, **kwargs) -> None:
+    context[_STARTED] = (model.name, perf_counter())
+
+
+def _observe(context: dict, outcome: str) -> None:
+    operation, started = context[_STARTED]
+    S3_REQUEST_DURATION.labels(operation, outcome).observe(perf_counter() - started)
+
+
+def _after_call(http_response, context, **kwargs) -> None:
+    _observe(context, "ok" if http_response.status_code < 300 else "error")
+
+
+def _after_call_error(context, **kwargs) -> None:
+    # Сетевая ошибка после всех повторов, ответа нет
+    _observe(context, "error")
+
+
+def _client_error() -> type[Exception]:
+    """ClientError из botocore: пакет грузится вместе с aioboto3, а не при импорте модуля"""
+    from botocore.exceptions import ClientError
+
+    return ClientError
+
 
 class MinIOFileStorage(FileStoragePort):
-    """MinIO реализация файлового хранилища"""
+    """
+    MinIO реализация файлового хранилища
+
+    После ``start`` все операции идут через один клиент с общим пулом
+    соединений; до него клиент создаётся на каждую операцию.
+    """
 
     def __init__(self, config: MinIOConfig):
         self.config = config
-        self.session = aioboto3.Session()
+        self._session = None
+        self._stack: AsyncExitStack | None = None
+        self._shared = None
+
+    async def start(self) -> None:
+        """Создать общий клиент: модели botocore и пул готовы до первого запроса"""
+        if self._stack is not None:
+            return
+        stack = AsyncExitStack()
+        self._shared = await stack.enter_async_context(self._get_client())
+        self._stack = stack
+
+    async def stop(self) -> None:
+        """Закрыть общий клиент"""
+        if self._stack is None:
+            return
+        stack, self._stack, self._shared = self._stack, None, None
+        await stack.aclose()
+
+    @property
+    def session(self):
+        """Сессия aioboto3, создаётся при первом обращении к S3"""
+        if self._session is None:
+            # aioboto3 и aiobotocore импортируются долго, модулю API они при загрузке не нужны
+            import aioboto3
+
+            session = aioboto3.Session()
+            session.events.register("before-call.s3", _before_call)
+            session.events.register("after-call.s3", _after_call)
+            session.events.register("after-call-error.s3", _after_call_error)
+            self._session = session
+        return self._session
 
     def _get_client(self):
         """Получить S3 клиент"""
@@ -30,6 +103,15 @@ class MinIOFileStorage(FileStoragePort):
             region_name=self.config.region,
         )
 
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator:
+        """Общий клиент, если хранилище запущено, иначе временный"""
+        if self._shared is not None:
+            yield self._shared
+            return
+        async with self._get_client() as s3:
+            yield s3
+
     def _generate_file_key(self, owner_id: UUID, file_type: FileType, original_name: str) -> str:
         """Генерировать уникальный ключ файла"""
         # Используем timestamp + uuid для уникальности
@@ -49,14 +131,14 @@ class MinIOFileStorage(FileStoragePort):
 
     async def _ensure_bucket_exists(self, bucket_name: str) -> None:
         """Убедиться, что бакет существует"""
-        async with self._get_client() as s3:
+        async with self._client() as s3:
             try:
                 await s3.head_bucket(Bucket=bucket_name)
-            except ClientError:
+            except _client_error():
                 # Бакет не существует, создаем его
                 try:
                     await s3.create_bucket(Bucket=bucket_name)
-                except ClientError as e:
+                except _client_error() as e:
                     if e.response['Error']['Code'] != 'BucketAlreadyExists':
                         raise
 
@@ -75,7 +157,7 @@ class MinIOFileStorage(FileStoragePort):
         # Убеждаемся, что бакет существует
         await self._ensure_bucket_exists(bucket)
 
-        async with self._get_client() as s3:
+        async with self._client() as s3:
             try:
                 # Загружаем файл
                 await s3.put_object(
@@ -110,16 +192,16 @@ class MinIOFileStorage(FileStoragePort):
 
                 return media_file
 
-            except ClientError as e:
+            except _client_error() as e:
                 raise RuntimeError(f"Failed to upload file: {e}") from e
 
     async def delete_file(self, file_key: str, bucket: str) -> bool:
         """Удалить файл из MinIO"""
-        async with self._get_client() as s3:
+        async with self._client() as s3:
             try:
                 await s3.delete_object(Bucket=bucket, Key=file_key)
                 return True
-            except ClientError:
+            except _client_error():
                 return False
 
     async def get_presigned_url(
@@ -129,7 +211,7 @@ class MinIOFileStorage(FileStoragePort):
             expiry_seconds: int = 3600
     ) -> str:
         """Получить подписанную ссылку для скачивания"""
-        async with self._get_client() as s3:
+        async with self._client() as s3:
             try:
                 url = await s3.generate_presigned_url(
                     'get_object',
@@ -137,7 +219,7 @@ class MinIOFileStorage(FileStoragePort):
                     ExpiresIn=expiry_seconds
                 )
                 return url
-            except ClientError as e:
+            except _client_error() as e:
                 raise RuntimeError(f"Failed to generate presigned URL: {e}") from e
 
     async def get_upload_presigned_url(
@@ -148,7 +230,7 @@ class MinIOFileStorage(FileStoragePort):
             expiry_seconds: int = 3600
     ) -> str:
         """Получить подписанную ссылку для загрузки"""
-        async with self._get_client() as s3:
+        async with self._client() as s3:
             try:
                 # Убеждаемся, что бакет существует
                 await self._ensure_bucket_exists(bucket)
@@ -163,21 +245,21 @@ class MinIOFileStorage(FileStoragePort):
                     ExpiresIn=expiry_seconds
                 )
                 return url
-            except ClientError as e:
+            except _client_error() as e:
                 raise RuntimeError(f"Failed to generate upload presigned URL: {e}") from e
 
     async def file_exists(self, file_key: str, bucket: str) -> bool:
         """Проверить существование файла"""
-        async with self._get_client() as s3:
+        async with self._client() as s3:
             try:
                 await s3.head_object(Bucket=bucket, Key=file_key)
                 return True
-            except ClientError:
+            except _client_error():
                 return False
 
     async def get_file_info(self, file_key: str, bucket: str) -> dict:
         """Получить метаданные файла"""
-        async with self._get_client() as s3:
+        async with self._client() as s3:
             try:
                 response = await s3.head_object(Bucket=bucket, Key=file_key)
                 return {
@@ -186,5 +268,5 @@ class MinIOFileStorage(FileStoragePort):
                     'last_modified': response['LastModified'],
                     'metadata': response.get('Metadata', {})
                 }
-            except ClientError as e:
+            except _client_error() as e:
                 raise RuntimeError(f"Failed to get file info: {e}") from e
@@ -2,30 +2,53 @@
 
 from contextlib import asynccontextmanager
 
-import uvicorn
 from advanced_alchemy.extensions.fastapi import (
     AdvancedAlchemy,
     AsyncSessionConfig,
+    EngineConfig,
     SQLAlchemyAsyncConfig,
 )
 from dishka import make_async_container
 from dishka.integrations.fastapi import FastapiProvider, setup_dishka
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from redis.asyncio import Redis
 
 from app.config.logging import setup_logging
 from app.config.settings import Config
+from app.domain.ports.repositories.file_storage import FileStoragePort
+from app.domain.ports.services.ride_position_hub import RidePositionHubPort
+from app.domain.ports.services.telemetry_buffer import TelemetryBufferPort
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from app.infrastructure.database.query_stats import (
+    add_query_stats,
+    install_query_stats,
+)
+from app.infrastructure.database.replica_router import ReplicaRouter
 from app.infrastructure.di.container import (
     InfrastructureProvider,
     PresentationProvider,
     UseCaseProvider,
 )
 from app.infrastructure.messaging.redis_client import RedisClient
+from app.infrastructure.metrics.registry import (
+    CONTENT_TYPE_LATEST,
+    collect_metrics,
+    mark_process_dead,
+)
+from app.presentation.middleware.compression import (
+    CompressionMiddleware,
+    HotResponseCacheMiddleware,
+)
 from app.presentation.middleware.cors import add_cors_middleware
+from app.presentation.middleware.etag import ETagMiddleware
 from app.presentation.middleware.logging import LoggingContextMiddleware
+from app.presentation.middleware.metrics import PrometheusMiddleware
+from app.presentation.middleware.query_stats import QueryStatsMiddleware
+from app.presentation.responses import ORJSONResponse, SchemaResponse
 from app.presentation.routers.main import router as main_router
 
 # 1. Инициализируем логирование
-setup_logging()
+setup_logging(processors=[add_query_stats])
 
 # 2. Загружаем конфиг
 config = Config()
@@ -33,6 +56,11 @@ config = Config()
 # 3. Настраиваем Advanced-Alchemy вместе с FastAPI
 sqlalchemy_config = SQLAlchemyAsyncConfig(
     connection_string=config.postgres.get_dsn(),
+    engine_config=EngineConfig(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name="primary",
+        **config.postgres.get_engine_options(),
+    ),
     session_config=AsyncSessionConfig(expire_on_commit=False),
     create_all=False,
     commit_mode="autocommit",
@@ -44,9 +72,24 @@ async def lifespan(app_instance: FastAPI):
     # Startup
     app_config = app_instance.state.config
     await RedisClient.create_pool(app_config.redis)
+    # Прогрев до приёма запросов: воркер не отвечает, пока lifespan не завершён
+    redis = await container.get(Redis)
+    await redis.ping()
+    file_storage = await container.get(FileStoragePort)
+    await file_storage.start()
+    telemetry_buffer = await container.get(TelemetryBufferPort)
+    await telemetry_buffer.start()
+    position_hub = await container.get(RidePositionHubPort)
+    await position_hub.start()
+    replica_router = await container.get(ReplicaRouter)
+    await replica_router.start()
     yield
     # Shutdown
+    await position_hub.stop()
+    await telemetry_buffer.stop()
+    await container.close()
     await RedisClient.close_pool()
+    mark_process_dead()
 
 # 4. Создаём приложение с lifecycle manager
 app = FastAPI(
@@ -54,11 +97,13 @@ app = FastAPI(
     version=config.project.version,
     docs_url="/openapi",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # 5. Сохраняем конфиг в state
 app.state.config = config  # noqa
+SchemaResponse.validate = config.project.validate_responses
 
 # 6. Инициализируем Advanced-Alchemy
 alchemy = AdvancedAlchemy(config=sqlalchemy_config, app=app)
@@ -72,8 +117,19 @@ container = make_async_container(
 )
 
 # 8. Подключаем middleware
+app.add_middleware(ETagMiddleware)
+app.add_middleware(CompressionMiddleware, config=config.compression)
+# Публичные списки, которые опрашивают без авторизации
+app.add_middleware(
+    HotResponseCacheMiddleware,
+    paths=("/rides/upcoming", "/motokonig/top"),
+    config=config.compression,
+)
+install_query_stats()
+app.add_middleware(QueryStatsMiddleware, config=config.query_stats)
 app.add_middleware(LoggingContextMiddleware)
 add_cors_middleware(app)
+app.add_middleware(PrometheusMiddleware)
 
 # 9. Подключаем Dishka и роуты
 setup_dishka(container, app)
@@ -84,6 +140,14 @@ async def health_check() -> dict:
     return {"status": "ok", "version": config.project.version}
 
 
-# 10. Точка входа
+@app.get("/metrics", tags=["System"], include_in_schema=False)
+def metrics() -> Response:
+    # Синхронный обработчик: сбор из файлов воркеров уходит в пул потоков
+    return Response(collect_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
+# 10. Точка входа для разработки, в production — python -m app.server
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run("app.presentation.api:app", host="0.0.0.0", port=8000, reload=True)
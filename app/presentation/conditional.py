@@ -0,0 +1,51 @@
+# app/presentation/conditional.py
+
+from datetime import UTC, datetime
+from hashlib import blake2b
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.domain.value_objects.entity_version import EntityVersion
+
+__all__ = ["body_etag", "etag_matches", "not_modified", "version_etag"]
+
+
+def _token(part: object) -> str:
+    if isinstance(part, datetime):
+        # Одно и то же время из БД и из кэша сущностей даёт одну строку
+        return (part.astimezone(UTC) if part.tzinfo else part).isoformat()
+    if isinstance(part, EntityVersion):
+        return f"{_token(part.updated_at)}/{part.revision}"
+    return str(part)
+
+
+def _weak(digest: str) -> str:
+    return f'W/"{digest}"'
+
+
+def version_etag(*parts: object) -> str:
+    """Слабый ETag по версии сущности и всему, от чего зависит ответ"""
+    key = "\x1f".join(_token(part) for part in parts)
+    return _weak(blake2b(key.encode(), digest_size=16).hexdigest())
+
+
+def body_etag(body: bytes) -> str:
+    """Слабый ETag по готовому телу ответа"""
+    return _weak(blake2b(body, digest_size=16).hexdigest())
+
+
+def etag_matches(request: Request | str | None, etag: str) -> bool:
+    """Совпадает ли ETag с ``If-None-Match`` (слабое сравнение, RFC 9110)"""
+    header = request.headers.get("if-none-match") if isinstance(request, Request) else request
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Ответ 304 без тела"""
+    return Response(status_code=304, headers={"ETag": etag})
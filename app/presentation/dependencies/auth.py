@@ -5,15 +5,20 @@ from uuid import UUID
 
 import structlog
 from dishka.integrations.fastapi import FromDishka
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, WebSocket, WebSocketException
 from fastapi.security.utils import get_authorization_scheme_param
-from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
+from starlette.requests import HTTPConnection
+from starlette.status import (
+    HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
+    WS_1008_POLICY_VIOLATION,
+)
 
 from app.domain.entities.user import UserRole
 from app.domain.ports.services.token import TokenServicePort
 
 
-async def get_token_from_header(request: Request) -> str | None:
+async def get_token_from_header(request: HTTPConnection) -> str | None:
     """Извлечь токен из заголовка Authorization"""
     authorization = request.headers.get("Authorization")
     if not authorization:
@@ -32,6 +37,33 @@ async def get_current_user_dishka(
 ) -> dict[str, Any]:
     """Получить текущего пользователя используя только Dishka"""
     token = await get_token_from_header(request)
+    return await _authenticate(token, token_service)
+
+
+async def get_current_user_ws(
+        websocket: WebSocket,
+        token_service: TokenServicePort
+) -> dict[str, Any]:
+    """Получить текущего пользователя WebSocket-соединения
+
+    Браузеры не умеют передавать заголовки при открытии WebSocket,
+    поэтому токен допускается также в query-параметре ``token``.
+    """
+    token = await get_token_from_header(websocket) or websocket.query_params.get("token")
+    try:
+        return await _authenticate(token, token_service)
+    except HTTPException as ex:
+        raise WebSocketException(
+            code=WS_1008_POLICY_VIOLATION,
+            reason=str(ex.detail),
+        ) from ex
+
+
+async def _authenticate(
+        token: str | None,
+        token_service: TokenServicePort
+) -> dict[str, Any]:
+    """Проверить access token и вернуть данные пользователя"""
     if not token:
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED,
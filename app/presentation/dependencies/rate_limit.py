@@ -0,0 +1,89 @@
+# app/presentation/dependencies/rate_limit.py
+
+import binascii
+import math
+from base64 import b64decode
+from collections.abc import Awaitable, Callable
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import HTTPException, Request, status
+from fastapi.security.utils import get_authorization_scheme_param
+from prometheus_client import Counter
+
+from app.domain.ports.services.rate_limiter import RateLimiterPort
+from app.domain.ports.services.token import TokenServicePort
+
+RATE_LIMITED = Counter(
+    "rate_limited_requests",
+    "Запросы, отклонённые ограничением частоты",
+    ["policy"],
+)
+
+SCOPES = ("ip", "user", "device")
+
+
+async def _user_subject(request: Request, token_service: TokenServicePort) -> str | None:
+    """Пользователь из Bearer-токена или логин из Basic-авторизации"""
+    scheme, credentials = get_authorization_scheme_param(request.headers.get("Authorization"))
+    scheme = scheme.lower()
+    if scheme == "bearer" and credentials:
+        try:
+            payload = await token_service.decode_token(credentials)
+        except ValueError:
+            # Невалидный токен отклонит сама авторизация
+            return None
+        return payload.get("sub")
+    if scheme == "basic" and credentials:
+        try:
+            username, _, _ = b64decode(credentials).decode().partition(":")
+        except (binascii.Error, UnicodeDecodeError):
+            return None
+        return username or None
+    return None
+
+
+async def _device_subject(request: Request) -> str | None:
+    """``device_id`` из JSON-тела; FastAPI к этому моменту уже прочитал и закэшировал его"""
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    device_id = body.get("device_id") if isinstance(body, dict) else None
+    return str(device_id) if device_id else None
+
+
+def rate_limit(policy: str, *scopes: str) -> Callable[..., Awaitable[None]]:
+    """
+    Зависимость FastAPI, ограничивающая частоту запросов по политике
+
+    ``scopes`` — субъекты, по которым считаются лимиты: ``ip``, ``user``,
+    ``device``. Значения лимитов задаются в ``RateLimitConfig``.
+    """
+    unknown = set(scopes) - set(SCOPES)
+    if unknown:
+        raise ValueError(f"Unknown rate limit scopes: {sorted(unknown)}")
+
+    @inject
+    async def dependency(
+            request: Request,
+            limiter: FromDishka[RateLimiterPort],
+            token_service: FromDishka[TokenServicePort],
+    ) -> None:
+        subjects: dict[str, str] = {}
+        if "ip" in scopes and request.client is not None:
+            subjects["ip"] = request.client.host
+        if "user" in scopes and (user := await _user_subject(request, token_service)):
+            subjects["user"] = user
+        if "device" in scopes and (device := await _device_subject(request)):
+            subjects["device"] = device
+
+        decision = await limiter.hit(policy, subjects)
+        if not decision.allowed:
+            RATE_LIMITED.labels(policy).inc()
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+            )
+
+    return dependency
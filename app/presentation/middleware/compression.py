@@ -0,0 +1,263 @@
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from prometheus_client import Counter
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.settings import CompressionConfig
+from app.presentation.conditional import etag_matches
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - необязательная зависимость
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - необязательная зависимость
+    zstandard = None
+
+HOT_RESPONSE_CACHE = Counter(
+    "hot_response_cache",
+    "Обращения к кэшу сжатых публичных ответов",
+    ["result"],
+)
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _Brotli:
+    def __init__(self, quality: int):
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+def available_encoders(config: CompressionConfig) -> dict[str, Callable[[], Any]]:
+    """Поддерживаемые кодировки в порядке предпочтения сервера"""
+    encoders: dict[str, Callable[[], Any]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = lambda: _Zstd(config.zstd_level)
+    if brotli is not None:
+        encoders["br"] = lambda: _Brotli(config.brotli_quality)
+    encoders["gzip"] = lambda: _Gzip(config.gzip_level)
+    return encoders
+
+
+def negotiate(accept_encoding: str | None, supported: Collection[str]) -> str | None:
+    """Кодировка с наибольшим q из Accept-Encoding, при равенстве — по порядку ``supported``"""
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for coding in supported:
+        weight = weights.get(coding, wildcard)
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def _compressible(headers: Headers) -> bool:
+    return "content-encoding" not in headers and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """
+    Сжатие ответов zstd, brotli или gzip по Accept-Encoding
+
+    zstd и brotli подключаются, если установлены пакеты ``zstandard`` и
+    ``brotli``, gzip доступен всегда. Тела меньше ``minimum_size`` уходят
+    без сжатия, потоковые ответы сжимаются по частям.
+    """
+
+    def __init__(self, app: ASGIApp, config: CompressionConfig):
+        self.app = app
+        self.config = config
+        self.encoders = available_encoders(config)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not self.config.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.encoders)
+        start: Message | None = None
+        encoder: Any = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, encoder, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                if message["status"] in (204, 304) or not _compressible(Headers(raw=message.get("headers", []))):
+                    passthrough = True
+                    await send(message)
+                else:
+                    MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+                    start = message
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                if encoding is None or (not more_body and len(body) < self.config.minimum_size):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                encoder = self.encoders[encoding]()
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = encoding
+                if more_body:
+                    del headers["Content-Length"]
+                    await send(start)
+                else:
+                    body = encoder.compress(body) + encoder.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send({"type": "http.response.body", "body": encoder.compress(body), "more_body": True})
+                return
+
+            chunk = encoder.compress(body)
+            if more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": chunk + encoder.finish()})
+
+        await self.app(scope, receive, send_compressed)
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedResponse:
+    expires_at: float
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    route: Any
+
+
+class HotResponseCacheMiddleware:
+    """
+    Кэш готовых ответов для горячих публичных списков
+
+    Стоит снаружи сжатия, поэтому хранит уже сжатое тело: на каждую
+    кодировку список сжимается один раз за TTL, а не на каждый запрос.
+    Кэшируются только GET без авторизации с ответом 200. Кэш свой у
+    каждого воркера, устаревание — только по TTL.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Collection[str], config: CompressionConfig):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.config = config
+        self.encodings = tuple(available_encoders(config))
+        self._entries: OrderedDict[tuple, _CachedResponse] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        if "authorization" in request_headers:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(request_headers.get("accept-encoding"), self.encodings) if self.config.enabled else None
+        key = (scope["path"], scope["query_string"], encoding)
+        cached = self._entries.get(key)
+        if cached is not None and cached.expires_at > monotonic():
+            HOT_RESPONSE_CACHE.labels("hit").inc()
+            self._entries.move_to_end(key)
+            # Для метрик по шаблону маршрута, как при обычной обработке
+            scope["route"] = cached.route
+            await self._replay(cached, request_headers, send)
+            return
+
+        HOT_RESPONSE_CACHE.labels("miss").inc()
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def send_and_keep(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                # Копия до отправки: внешние middleware дописывают заголовки на месте
+                start = {"status": message["status"], "headers": list(message.get("headers", []))}
+            elif start is not None:
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    self._store(key, start, b"".join(chunks), scope.get("route"))
+            await send(message)
+
+        await self.app(scope, receive, send_and_keep)
+
+    def _store(self, key: tuple, start: Message, body: bytes, route: Any) -> None:
+        if start["status"] != 200 or "set-cookie" in Headers(raw=start["headers"]):
+            return
+        self._entries[key] = _CachedResponse(
+            expires_at=monotonic() + self.config.hot_response_ttl,
+            status=start["status"],
+            headers=start["headers"],
+            body=body,
+            route=route,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.hot_response_max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    async def _replay(cached: _CachedResponse, request_headers: Headers, send: Send) -> None:
+        etag = Headers(raw=cached.headers).get("etag")
+        if etag and etag_matches(request_headers.get("if-none-match"), etag):
+            await send({"type": "http.response.start", "status": 304, "headers": [(b"etag", etag.encode())]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send({"type": "http.response.start", "status": cached.status, "headers": list(cached.headers)})
+        await send({"type": "http.response.body", "body": cached.body})
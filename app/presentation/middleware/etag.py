@@ -0,0 +1,63 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.presentation.conditional import body_etag, etag_matches
+
+
+class ETagMiddleware:
+    """
+    Слабые ETag по хэшу тела для JSON-ответов на GET
+
+    Нужен спискам, у которых нет одной версии: тело всё равно собирается,
+    но при совпадении ``If-None-Match`` клиент получает 304 без него.
+    Ответы с собственным ETag (версия сущности) и потоковые не трогаются.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Message | None = None
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if (
+                        message["status"] != 200
+                        or "etag" in headers
+                        or not headers.get("content-type", "").startswith("application/json")
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if message.get("more_body", False):
+                # Потоковое тело целиком не буферизуем
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            etag = body_etag(message.get("body", b""))
+            if etag_matches(if_none_match, etag):
+                await send({"type": "http.response.start", "status": 304, "headers": [(b"etag", etag.encode())]})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            MutableHeaders(scope=start).append("ETag", etag)
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,34 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.settings import QueryStatsConfig
+from app.infrastructure.database.query_stats import track_queries
+
+
+class QueryStatsMiddleware:
+    """
+    Учёт запросов к БД на HTTP-запрос
+
+    Количество и суммарное время попадают в заголовок ``Server-Timing`` и
+    в каждую запись structlog. Если одна форма запроса повторилась больше
+    порога — вероятный N+1 — пишется предупреждение, а в строгом режиме
+    (в тестах) запрос падает с ``RepeatedQueryError``.
+    """
+
+    def __init__(self, app: ASGIApp, config: QueryStatsConfig):
+        self.app = app
+        self.config = config
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.config.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(self.config.repeat_threshold, self.config.strict) as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
@@ -0,0 +1,65 @@
+# app/presentation/responses.py
+
+from collections.abc import Mapping, Sequence
+from functools import cache
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+from typing_extensions import TypedDict
+
+__all__ = ["ORJSONResponse", "SchemaResponse"]
+
+
+class ORJSONResponse(JSONResponse):
+    """Ответ по умолчанию: orjson сам кодирует UUID, datetime и dataclass"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@cache
+def _adapter(schema: type[BaseModel], many: bool) -> TypeAdapter:
+    # Те же поля в виде TypedDict: словари сериализуются в Rust без создания
+    # экземпляров модели, а лишние ключи отбрасываются
+    fields = {name: field.annotation for name, field in schema.model_fields.items()}
+    payload = TypedDict(f"{schema.__name__}Payload", fields)
+    return TypeAdapter(list[payload] if many else payload)
+
+
+class SchemaResponse(Response):
+    """
+    Ответ, сериализованный по схеме без повторной валидации
+
+    DTO из ``to_dto()`` уже собраны из провалидированных сущностей, поэтому
+    по умолчанию поля схемы только отбираются (лишние, например приватные,
+    отбрасываются) и сразу кодируются в JSON ядром pydantic. С
+    ``validate = True`` (в тестах и на стендах) типы полей проверяются, как
+    это делает ``response_model``. Рассчитан на плоские схемы ответов.
+    """
+
+    media_type = "application/json"
+    validate: bool = False
+
+    def __init__(
+            self,
+            content: Mapping[str, Any] | Sequence[Mapping[str, Any]],
+            schema: type[BaseModel],
+            status_code: int = 200,
+            headers: Mapping[str, str] | None = None,
+            background: BackgroundTask | None = None,
+    ):
+        self.schema = schema
+        super().__init__(content, status_code, headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        many = not isinstance(content, Mapping)
+        adapter = _adapter(self.schema, many)
+        if self.validate:
+            content = adapter.validate_python(content)
+        # Без валидации enum из DTO остаются enum: pydantic кодирует их
+        # значением, как и response_model, но предупреждает о несовпадении типа
+        return adapter.dump_json(content, warnings=False)
@@ -18,6 +18,7 @@ from app.presentation.dependencies.auth import (
     get_current_user_dishka,
     get_token_from_header,
 )
+from app.presentation.dependencies.rate_limit import rate_limit
 from app.presentation.schemas.auth import (
     CurrentUser,
     DeviceInfo,
@@ -34,7 +35,11 @@ router = APIRouter(route_class=DishkaRoute)
 
 security = HTTPBasic()
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(rate_limit("login", "ip", "user"))],
+)
 async def login(
         controller: FromDishka[AuthController],
         credentials: Annotated[HTTPBasicCredentials, Depends(security)]
@@ -96,7 +101,11 @@ async def get_me(
         role=current_user["role"].name
     )
 
-@router.post("/register", response_model=RegisterResponse)
+@router.post(
+    "/register",
+    response_model=RegisterResponse,
+    dependencies=[Depends(rate_limit("register", "ip"))],
+)
 async def register(
     request: RegisterRequest,
     controller: FromDishka[AuthController]
@@ -138,7 +147,11 @@ async def setup_pin(
         ) from ex
 
 
-@router.post("/pin-login", response_model=TokenResponse)
+@router.post(
+    "/pin-login",
+    response_model=TokenResponse,
+    dependencies=[Depends(rate_limit("pin_login", "ip", "device"))],
+)
 async def pin_login(
         request: PinLoginRequest,
         controller: FromDishka[AuthController]
@@ -13,6 +13,8 @@ from app.domain.value_objects.listing_category import (
     ListingCategory as DomainListingCategory,
 )
 from app.presentation.dependencies.auth import get_current_user_dishka
+from app.presentation.dependencies.rate_limit import rate_limit
+from app.presentation.responses import SchemaResponse
 from app.presentation.schemas.listing import (
     CreateListingSchema,
     FavoriteResponseSchema,
@@ -33,7 +35,12 @@ def convert_enum_to_domain_category(schema_enum):
     return DomainListingCategory(schema_enum.value)
 
 
-@router.post("/", response_model=ListingResponseSchema, status_code=201)
+@router.post(
+    "/",
+    response_model=ListingResponseSchema,
+    status_code=201,
+    dependencies=[Depends(rate_limit("listing_create", "user"))],
+)
 async def create_listing(
         request: Request,
         dto: CreateListingSchema,
@@ -56,7 +63,7 @@ async def create_listing(
             contact_email=dto.contact_email,
             photo_urls=dto.photo_urls,
         )
-        return listing.to_dto()
+        return SchemaResponse(listing.to_dto(), ListingResponseSchema, status_code=201)
     except BadRequestError as ex:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -83,7 +90,7 @@ async def search_listings(
         seller_id=search_params.seller_id,
         featured_first=search_params.featured_first,
     )
-    return listings
+    return SchemaResponse(listings, ListingResponseSchema)
 
 
 @router.get("/my", response_model=list[ListingDetailResponseSchema])
@@ -100,10 +107,13 @@ async def get_my_listings(
         active_only=False,  # Показываем все статусы для владельца
     )
     # Конвертируем в расширенный формат с приватной информацией
-    return [
-        {**listing, "contact_phone": None, "contact_email": None, "moderation_notes": None}
-        for listing in listings
-    ]
+    return SchemaResponse(
+        [
+            {**listing, "contact_phone": None, "contact_email": None, "moderation_notes": None}
+            for listing in listings
+        ],
+        ListingDetailResponseSchema,
+    )
 
 
 @router.get("/{listing_id}", response_model=ListingResponseSchema)
@@ -123,9 +133,9 @@ async def get_listing(
         if (current_user["role"] in [UserRole.ADMIN, UserRole.OPERATOR] or
                 str(current_user["user_id"]) == str(listing["seller_id"])):
             listing_with_private = await controller.get_listing_with_private_info(listing_id)
-            return listing_with_private
+            return SchemaResponse(listing_with_private, ListingResponseSchema)
 
-        return listing
+        return SchemaResponse(listing, ListingResponseSchema)
     except NotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -165,7 +175,7 @@ async def update_listing(
             contact_phone=dto.contact_phone,
             contact_email=dto.contact_email,
         )
-        return listing
+        return SchemaResponse(listing, ListingDetailResponseSchema)
     except NotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,13 +1,23 @@
 # app/presentation/routers/media.py
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    UploadFile,
+    status,
+)
 
 from app.application.controllers.media_controller import MediaController
 from app.application.exceptions import BadRequestError, NotFoundError
 from app.domain.ports.services.token import TokenServicePort
 from app.domain.value_objects.file_type import FileType
 from app.presentation.dependencies.auth import get_current_user_dishka
+from app.presentation.dependencies.rate_limit import rate_limit
 from app.presentation.schemas.media import (
     DeleteFileRequest,
     FileUploadResponse,
@@ -21,7 +31,12 @@ from app.presentation.schemas.media import (
 router = APIRouter(route_class=DishkaRoute)
 
 
-@router.post("/upload", response_model=FileUploadResponse, status_code=201)
+@router.post(
+    "/upload",
+    response_model=FileUploadResponse,
+    status_code=201,
+    dependencies=[Depends(rate_limit("media_upload", "user"))],
+)
 async def upload_file(
         request: Request,
         file: UploadFile = File(...),
@@ -2,13 +2,15 @@
 from uuid import UUID
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from app.application.controllers.motoclub_controller import MotoClubController
 from app.application.exceptions import BadRequestError, NotFoundError
 from app.domain.ports.services.token import TokenServicePort
 from app.domain.value_objects.club_role import ClubRole
+from app.domain.value_objects.entity_version import EntityVersion
 from app.domain.value_objects.user_role import UserRole
+from app.presentation.conditional import etag_matches, not_modified, version_etag
 from app.presentation.dependencies.auth import get_current_user_dishka
 from app.presentation.schemas.moto_club import (
     ClubInvitationResponseSchema,
@@ -80,6 +82,7 @@ async def list_moto_clubs(
 @router.get("/{club_id}", response_model=MotoClubResponseSchema)
 async def get_moto_club(
         request: Request,
+        response: Response,
         club_id: UUID,
         controller: FromDishka[MotoClubController],
         token_service: FromDishka[TokenServicePort]
@@ -88,7 +91,13 @@ async def get_moto_club(
     current_user = await get_current_user_dishka(request, token_service)
 
     try:
+        etag = version_etag("moto_club", club_id, await controller.get_club_version(club_id))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
         club = await controller.get_club_by_id(club_id)
+        loaded = EntityVersion(club["updated_at"], club["member_count"])
+        response.headers["ETag"] = version_etag("moto_club", club_id, loaded)
 
         # Проверяем права доступа к приватным клубам
         if not club["is_public"] and current_user["role"] == UserRole.USER:
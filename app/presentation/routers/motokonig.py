@@ -3,10 +3,12 @@
 from uuid import UUID
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from app.application.controllers.motokonig_controller import MotoKonigController
 from app.domain.ports.services.token import TokenServicePort
+from app.domain.value_objects.entity_version import EntityVersion
+from app.presentation.conditional import etag_matches, not_modified, version_etag
 from app.presentation.dependencies.auth import get_current_user_dishka
 from app.presentation.schemas.motokonig import (
     CreateMotoKonigProfileSchema,
@@ -44,16 +46,28 @@ async def create_profile(
 @router.get("/me", response_model=MotoKonigResponseSchema)
 async def get_my_profile(
         request: Request,
+        response: Response,
         controller: FromDishka[MotoKonigController],
         token_service: FromDishka[TokenServicePort]
 ):
     """Получить свой профиль MotoKonig"""
     current_user = await get_current_user_dishka(request, token_service)
+    user_id = current_user["user_id"]
 
-    profile = await controller.get_profile_by_user_id(current_user["user_id"])
+    # Сначала только версия: неизменившийся профиль не загружается
+    version = await controller.get_profile_version_by_user_id(user_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="MotoKonig profile not found")
+    etag = version_etag("motokonig", user_id, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    profile = await controller.get_profile_by_user_id(user_id)
     if not profile:
         raise HTTPException(status_code=404, detail="MotoKonig profile not found")
 
+    loaded = EntityVersion(profile.updated_at, len(profile.achievements))
+    response.headers["ETag"] = version_etag("motokonig", user_id, loaded)
     return profile.to_dto()
 
 
@@ -14,6 +14,7 @@ from app.domain.value_objects.motorcycle_type import (
     MotorcycleType as DomainMotorcycleType,
 )
 from app.presentation.dependencies.auth import get_current_user_dishka
+from app.presentation.responses import SchemaResponse
 from app.presentation.schemas.motorcycle import (
     CreateMotorcycleSchema,
     MotorcycleResponseSchema,
@@ -55,7 +56,7 @@ async def create_motorcycle(
             color=dto.color,
             description=dto.description,
         )
-        return motorcycle.to_dto()
+        return SchemaResponse(motorcycle.to_dto(), MotorcycleResponseSchema, status_code=201)
     except ValueError as ex:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -76,7 +77,7 @@ async def get_my_motorcycles(
         owner_id=current_user["user_id"],
         active_only=active_only
     )
-    return motorcycles
+    return SchemaResponse(motorcycles, MotorcycleResponseSchema)
 
 
 @router.get("/user/{user_id}", response_model=list[MotorcycleResponseSchema])
@@ -99,7 +100,7 @@ async def get_user_motorcycles(
         owner_id=user_id,
         active_only=active_only
     )
-    return motorcycles
+    return SchemaResponse(motorcycles, MotorcycleResponseSchema)
 
 
 @router.get("/search", response_model=list[MotorcycleResponseSchema])
@@ -125,7 +126,7 @@ async def search_motorcycles(
         power_to=search_params.power_to,
         active_only=search_params.active_only
     )
-    return motorcycles
+    return SchemaResponse(motorcycles, MotorcycleResponseSchema)
 
 
 @router.get("/{motorcycle_id}", response_model=MotorcycleResponseSchema)
@@ -146,7 +147,7 @@ async def get_motorcycle(
                 str(current_user["user_id"]) != str(motorcycle["owner_id"])):
             raise HTTPException(status_code=403, detail="Access denied")
 
-        return motorcycle
+        return SchemaResponse(motorcycle, MotorcycleResponseSchema)
     except NotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -189,7 +190,7 @@ async def update_motorcycle(
             description=dto.description,
             is_active=dto.is_active,
         )
-        return motorcycle
+        return SchemaResponse(motorcycle, MotorcycleResponseSchema)
     except NotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,15 +1,18 @@
 # app/presentation/routers/profile.py
 
+from datetime import date
 from uuid import UUID
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from app.application.controllers.profile_controller import ProfileController
 from app.application.exceptions import NotFoundError
 from app.domain.ports.services.token import TokenServicePort
+from app.domain.value_objects.entity_version import EntityVersion
 from app.domain.value_objects.privacy_level import PrivacyLevel as DomainPrivacyLevel
 from app.domain.value_objects.social_link import SocialPlatform as DomainSocialPlatform
+from app.presentation.conditional import etag_matches, not_modified, version_etag
 from app.presentation.dependencies.auth import get_current_user_dishka
 from app.presentation.schemas.profile import (
     AddSocialLinkSchema,
@@ -69,20 +72,31 @@ async def create_profile(
 @router.get("/my", response_model=ProfileResponseSchema)
 async def get_my_profile(
         request: Request,
+        response: Response,
         controller: FromDishka[ProfileController],
         token_service: FromDishka[TokenServicePort]
 ):
     """Получить профиль текущего пользователя"""
     current_user = await get_current_user_dishka(request, token_service)
+    user_id = current_user["user_id"]
+    viewer_role = current_user["role"].name
+    # Возраст в ответе считается от сегодняшней даты
+    today = date.today()
 
     try:
+        version = await controller.get_profile_version_by_user_id(user_id)
+        etag = version_etag("profile", user_id, viewer_role, today, version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
         # Для собственного профиля показываем всё
         profile_dto = await controller.get_profile_by_user_id(
-            user_id=current_user["user_id"],
-            viewer_role=current_user["role"].name,
-            is_friend=True,  # Для себя всегда true
-            is_club_member=True
+            user_id=user_id,
+            viewer_id=user_id,
+            viewer_role=viewer_role,
         )
+        loaded = EntityVersion(profile_dto["updated_at"])
+        response.headers["ETag"] = version_etag("profile", user_id, viewer_role, today, loaded)
         return profile_dto
     except NotFoundError as ex:
         raise HTTPException(
@@ -102,15 +116,10 @@ async def get_user_profile(
     current_user = await get_current_user_dishka(request, token_service)
 
     try:
-        # TODO: Здесь нужно будет проверять дружбу и членство в клубах
-        is_friend = False  # Заглушка
-        is_club_member = False  # Заглушка
-
         profile_dto = await controller.get_profile_by_user_id(
             user_id=user_id,
+            viewer_id=current_user["user_id"],
             viewer_role=current_user["role"].name,
-            is_friend=is_friend,
-            is_club_member=is_club_member
         )
         return profile_dto
     except NotFoundError as ex:
@@ -131,15 +140,10 @@ async def get_profile(
     current_user = await get_current_user_dishka(request, token_service)
 
     try:
-        # TODO: Здесь нужно будет проверять дружбу и членство в клубах
-        is_friend = False  # Заглушка
-        is_club_member = False  # Заглушка
-
         profile_dto = await controller.get_profile_by_id(
             profile_id=profile_id,
+            viewer_id=current_user["user_id"],
             viewer_role=current_user["role"].name,
-            is_friend=is_friend,
-            is_club_member=is_club_member
         )
         return profile_dto
     except NotFoundError as ex:
@@ -344,15 +348,10 @@ async def get_profile_social_links(
     current_user = await get_current_user_dishka(request, token_service)
 
     try:
-        # TODO: Здесь нужно будет проверять дружбу и членство в клубах
-        is_friend = False  # Заглушка
-        is_club_member = False  # Заглушка
-
         links = await controller.get_profile_social_links(
             profile_id=profile_id,
+            viewer_id=current_user["user_id"],
             viewer_role=current_user["role"].name,
-            is_friend=is_friend,
-            is_club_member=is_club_member
         )
         return links
     except NotFoundError as ex:
@@ -1,20 +1,38 @@
 # app/presentation/routers/ride.py
 
+import asyncio
+from datetime import UTC, datetime
 from uuid import UUID
 
-from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, HTTPException, Request
+from dishka.integrations.fastapi import DishkaRoute, FromDishka, inject
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    WebSocketException,
+    status,
+)
+from pydantic import ValidationError
 
 from app.application.controllers.motokonig_controller import MotoKonigController
 from app.application.controllers.ride_controller import RideController
+from app.application.use_cases.ride.ingest_telemetry import IngestTelemetryUseCase
+from app.application.use_cases.ride.watch_positions import WatchRidePositionsUseCase
 from app.domain.ports.services.token import TokenServicePort
-from app.presentation.dependencies.auth import get_current_user_dishka
+from app.domain.value_objects.gps_fix import GpsFix
+from app.presentation.dependencies.auth import (
+    get_current_user_dishka,
+    get_current_user_ws,
+)
 from app.presentation.schemas.ride import (
     CompleteRideSchema,
     CreateRideSchema,
     RateRideSchema,
     RideListItemSchema,
     RideResponseSchema,
+    TelemetryFrameSchema,
 )
 
 router = APIRouter(route_class=DishkaRoute)
@@ -248,3 +266,91 @@ async def rate_ride(
         return ride.to_dto()
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.websocket("/{ride_id}/telemetry")
+@inject
+async def ride_telemetry(
+        websocket: WebSocket,
+        ride_id: UUID,
+        ingest_uc: FromDishka[IngestTelemetryUseCase],
+        token_service: FromDishka[TokenServicePort]
+):
+    """Поток GPS-телеметрии участника активной поездки"""
+    current_user = await get_current_user_ws(websocket, token_service)
+
+    try:
+        track = await ingest_uc.start_session(ride_id, current_user["user_id"])
+    except ValueError as e:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason=str(e),
+        ) from e
+
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                frame = TelemetryFrameSchema.model_validate_json(message)
+                fixes = [
+                    GpsFix(
+                        recorded_at=datetime.fromtimestamp(ts, UTC),
+                        latitude=lat,
+                        longitude=lon,
+                        speed=speed,
+                    )
+                    for ts, lat, lon, speed in frame.fixes
+                ]
+            except (ValidationError, ValueError, OverflowError, OSError):
+                await websocket.send_json({"error": "Invalid telemetry frame"})
+                continue
+
+            accepted = await ingest_uc.execute(track, fixes)
+            await websocket.send_json({"accepted": accepted})
+    except WebSocketDisconnect:
+        pass
+
+
+@router.websocket("/{ride_id}/positions")
+@inject
+async def ride_positions(
+        websocket: WebSocket,
+        ride_id: UUID,
+        watch_uc: FromDishka[WatchRidePositionsUseCase],
+        token_service: FromDishka[TokenServicePort]
+):
+    """Поток позиций участников активной поездки (снимок, затем дельты)"""
+    current_user = await get_current_user_ws(websocket, token_service)
+
+    try:
+        subscription = await watch_uc.subscribe(ride_id, current_user["user_id"])
+    except ValueError as e:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason=str(e),
+        ) from e
+
+    async def send_frames() -> None:
+        while True:
+            await websocket.send_text(await subscription.receive())
+
+    async def wait_disconnect() -> None:
+        # Клиент ничего не присылает, чтение нужно только чтобы заметить отключение
+        while True:
+            await websocket.receive_text()
+
+    await websocket.accept()
+    sender = asyncio.create_task(send_frames())
+    receiver = asyncio.create_task(wait_disconnect())
+    try:
+        done, _ = await asyncio.wait((sender, receiver), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        sender.cancel()
+        receiver.cancel()
+        await watch_uc.unsubscribe(subscription)
+
+    # Отключение клиента — штатный конец потока, остальные ошибки не глотаем
+    for task in done:
+        if not isinstance(task.exception(), WebSocketDisconnect):
+            task.result()
@@ -72,6 +72,7 @@ class MotoClubResponseSchema(BaseModel):
     founded_date: datetime | None
     avatar_url: str | None
     is_active: bool
+    member_count: int = 0
     created_at: datetime
     updated_at: datetime
 
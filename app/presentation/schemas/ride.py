@@ -53,6 +53,16 @@ class RateRideSchema(_BaseModel):
     rating: float = Field(..., ge=0, le=5, description="Оценка от 0 до 5")
 
 
+class TelemetryFrameSchema(_BaseModel):
+    """Пакет GPS-отметок с телефона: [[unix_ts, lat, lon, speed_kmh | null], ...]"""
+    fixes: list[tuple[float, float, float, float | None]] = Field(
+        ...,
+        min_length=1,
+        max_length=300,
+        description="Отметки в компактном виде",
+    )
+
+
 class RideParticipantSchema(BaseModel):
     """Схема участника поездки"""
     motokonig_id: UUID
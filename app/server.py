@@ -0,0 +1,81 @@
+# app/server.py
+"""Production-запуск API: несколько воркеров uvicorn под одним супервизором.
+
+Запуск: ``python -m app.server``. Воркеры делят один сокет, работают на
+uvloop и httptools и перезапускаются после ``SERVER_MAX_REQUESTS`` запросов
+(с разбросом), чтобы рост памяти не копился. По SIGTERM каждый воркер
+перестаёт принимать соединения и дожидается текущих запросов не дольше
+``SERVER_GRACEFUL_TIMEOUT``. Воркер берёт запросы только после lifespan,
+где прогреваются Redis и клиент S3. Пул Postgres каждого воркера — его
+доля ``POSTGRES_CONNECTION_BUDGET``.
+"""
+
+import os
+import shutil
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from app.config.logging import setup_logging
+from app.config.settings import Config, ServerConfig
+
+APP = "app.presentation.api:app"
+
+
+def worker_count(config: ServerConfig) -> int:
+    """Число воркеров: из настроек или по ядрам, доступным процессу"""
+    if config.workers > 0:
+        return config.workers
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+def prepare_metrics_dir(path: str) -> None:
+    """Каталог метрик воркеров: файлы прошлого запуска исказили бы счётчики"""
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+    # Воркеры наследуют окружение и подхватывают каталог при импорте prometheus_client
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+
+
+def share_connection_budget(workers: int) -> None:
+    """Разделить бюджет соединений Postgres между воркерами"""
+    # Воркеры читают настройки из унаследованного окружения
+    os.environ["POSTGRES_POOL_PROCESSES"] = str(workers)
+
+
+def build_config(config: ServerConfig) -> uvicorn.Config:
+    return uvicorn.Config(
+        APP,
+        host=config.host,
+        port=config.port,
+        workers=worker_count(config),
+        loop="uvloop",
+        http="httptools",
+        backlog=config.backlog,
+        timeout_keep_alive=config.keep_alive_timeout,
+        timeout_graceful_shutdown=config.graceful_timeout,
+        limit_max_requests=config.max_requests or None,
+        limit_max_requests_jitter=config.max_requests_jitter,
+        proxy_headers=True,
+        forwarded_allow_ips=config.forwarded_allow_ips,
+        server_header=False,
+        # Логи перехватывает setup_logging в каждом воркере
+        log_config=None,
+    )
+
+
+def main() -> None:
+    setup_logging()
+    server_config = Config().server
+    prepare_metrics_dir(server_config.prometheus_multiproc_dir)
+
+    config = build_config(server_config)
+    share_connection_budget(config.workers)
+    # Супервизор и при одном воркере: иначе после max_requests процесс просто завершится
+    Multiprocess(config, sockets=[config.bind_socket()]).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# app/worker/handlers/ride.py
+
+from typing import Any
+
+import structlog
+from dishka import AsyncContainer
+from faststream import Context
+from faststream.rabbit import RabbitRouter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.use_cases.motokonig.apply_ride_results import (
+    ApplyRideResultsUseCase,
+)
+from app.domain.events.ride import RideCompleted
+from app.domain.ports.services.leaderboard import LeaderboardPort
+
+logger = structlog.get_logger(__name__)
+
+router = RabbitRouter()
+
+
+@router.subscriber(RideCompleted.topic)
+async def handle_ride_completed(
+        payload: dict[str, Any],
+        container: AsyncContainer = Context(),
+) -> None:
+    """Учесть итоги поездки в профилях всех участников одной транзакцией"""
+    event = RideCompleted.from_payload(payload)
+
+    async with container() as request_container:
+        apply_results_uc = await request_container.get(ApplyRideResultsUseCase)
+        session = await request_container.get(AsyncSession)
+        leaderboard = await request_container.get(LeaderboardPort)
+
+        updated = await apply_results_uc.execute(event)
+        await session.commit()
+
+    # Таблица в Redis не откатывается вместе с транзакцией, поэтому только после коммита
+    if updated:
+        await leaderboard.update(updated)
+
+    logger.info("ride_results_applied", ride_id=str(event.ride_id), participants=len(updated))
@@ -0,0 +1,85 @@
+# app/worker/main.py
+"""Фоновый обработчик событий из RabbitMQ и ретранслятор outbox.
+
+Запуск: ``faststream run app.worker.main:app``. Воркеров можно запускать
+несколько: ретрансляторы делят outbox через SKIP LOCKED.
+"""
+
+from advanced_alchemy.extensions.fastapi import (
+    AdvancedAlchemy,
+    AsyncSessionConfig,
+    EngineConfig,
+    SQLAlchemyAsyncConfig,
+)
+from dishka import make_async_container
+from faststream import ContextRepo, FastStream
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config.logging import setup_logging
+from app.config.settings import Config
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from app.infrastructure.database.query_stats import add_query_stats
+from app.infrastructure.di.container import (
+    InfrastructureProvider,
+    UseCaseProvider,
+    WorkerProvider,
+)
+from app.infrastructure.messaging.broker import new_broker
+from app.infrastructure.messaging.outbox import OutboxRelay
+from app.infrastructure.messaging.redis_client import RedisClient
+from app.worker.handlers.ride import router as ride_router
+
+setup_logging(processors=[add_query_stats])
+
+config = Config()
+
+sqlalchemy_config = SQLAlchemyAsyncConfig(
+    connection_string=config.postgres.get_dsn(),
+    engine_config=EngineConfig(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name="primary",
+        **config.postgres.get_engine_options(),
+    ),
+    session_config=AsyncSessionConfig(expire_on_commit=False),
+    create_all=False,
+)
+alchemy = AdvancedAlchemy(config=sqlalchemy_config)
+
+container = make_async_container(
+    InfrastructureProvider(alchemy, config),
+    UseCaseProvider(),
+    WorkerProvider(),
+)
+
+broker = new_broker(config.rabbitmq)
+broker.include_router(ride_router)
+
+
+relay: OutboxRelay | None = None
+
+
+async def on_startup(context: ContextRepo) -> None:
+    context.set_global("container", container)
+    await RedisClient.create_pool(config.redis)
+
+
+async def after_startup() -> None:
+    global relay
+    session_factory = await container.get(async_sessionmaker[AsyncSession])
+    relay = OutboxRelay(broker, session_factory, config.outbox)
+    await relay.start()
+
+
+async def on_shutdown() -> None:
+    if relay is not None:
+        await relay.stop()
+    await container.close()
+    await RedisClient.close_pool()
+
+
+app = FastStream(
+    broker,
+    on_startup=[on_startup],
+    after_startup=[after_startup],
+    on_shutdown=[on_shutdown],
+)
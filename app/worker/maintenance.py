@@ -0,0 +1,124 @@
+# app/worker/maintenance.py
+"""Обслуживающий воркер: периодические задачи по cron-расписанию.
+
+Запуск: ``python -m app.worker.maintenance``. Процессов можно запускать
+несколько: задачи выполняет только выбранный через Redis лидер, остальные
+ждут, пока он не пропадёт. Метрики отдаются на ``MAINTENANCE_METRICS_PORT``.
+"""
+
+import asyncio
+import signal
+from collections.abc import Awaitable, Callable
+
+from advanced_alchemy.extensions.fastapi import (
+    AdvancedAlchemy,
+    AsyncSessionConfig,
+    EngineConfig,
+    SQLAlchemyAsyncConfig,
+)
+from dishka import make_async_container
+from prometheus_client import start_http_server
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config.logging import setup_logging
+from app.config.settings import Config, MaintenanceConfig
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from app.infrastructure.di.container import InfrastructureProvider, WorkerProvider
+from app.infrastructure.messaging.redis_client import RedisClient
+from app.infrastructure.repositories.sql_club_invitation_repo import (
+    SqlClubInvitationRepository,
+)
+from app.infrastructure.repositories.sql_listing_repo import SqlListingRepository
+from app.infrastructure.scheduling.cron import CronSchedule
+from app.infrastructure.scheduling.leader import RedisLeaderElection
+from app.infrastructure.scheduling.scheduler import MaintenanceScheduler, ScheduledJob
+
+
+async def run_in_batches(
+        session_factory: async_sessionmaker[AsyncSession],
+        batch: Callable[[AsyncSession], Awaitable[int]],
+        batch_size: int,
+) -> int:
+    """Повторять пачку, каждую в своей транзакции, пока пачка не станет неполной"""
+    total = 0
+    while True:
+        async with session_factory() as session, session.begin():
+            affected = await batch(session)
+        total += affected
+        if affected < batch_size:
+            return total
+
+
+def build_jobs(
+        session_factory: async_sessionmaker[AsyncSession],
+        config: MaintenanceConfig,
+) -> list[ScheduledJob]:
+    size = config.batch_size
+
+    async def expire_listings() -> int:
+        return await run_in_batches(
+            session_factory,
+            lambda session: SqlListingRepository(session).expire_old_listings(limit=size),
+            size,
+        )
+
+    async def expire_invitations() -> int:
+        return await run_in_batches(
+            session_factory,
+            lambda session: SqlClubInvitationRepository(session).expire_old_invitations(limit=size),
+            size,
+        )
+
+    return [
+        ScheduledJob("expire_listings", CronSchedule(config.expire_listings_cron), expire_listings),
+        ScheduledJob("expire_invitations", CronSchedule(config.expire_invitations_cron), expire_invitations),
+    ]
+
+
+async def main() -> None:
+    setup_logging()
+    config = Config()
+
+    sqlalchemy_config = SQLAlchemyAsyncConfig(
+        connection_string=config.postgres.get_dsn(),
+        engine_config=EngineConfig(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_logging_name="primary",
+            **config.postgres.get_engine_options(),
+        ),
+        session_config=AsyncSessionConfig(expire_on_commit=False),
+        create_all=False,
+    )
+    container = make_async_container(
+        InfrastructureProvider(AdvancedAlchemy(config=sqlalchemy_config), config),
+        WorkerProvider(),
+    )
+
+    session_factory = await container.get(async_sessionmaker[AsyncSession])
+    redis = await container.get(Redis)
+    election = RedisLeaderElection(
+        redis,
+        config.maintenance.leader_key,
+        config.maintenance.leader_ttl,
+    )
+    scheduler = MaintenanceScheduler(build_jobs(session_factory, config.maintenance), election)
+
+    start_http_server(config.maintenance.metrics_port)
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    await scheduler.start()
+    try:
+        await stopping.wait()
+    finally:
+        await scheduler.stop()
+        await container.close()
+        await RedisClient.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,150 @@
+# benchmarks/hydration.py
+"""Стоимость сборки доменных сущностей из строк БД.
+
+Запуск: ``python -m benchmarks.hydration --rows 10000 --rounds 5``.
+
+Для каждой сущности сравнивает конструктор с проверками (так маппили
+репозитории раньше) и ``hydrate`` из доверенных данных: время на строку
+и память на удержание всех строк (tracemalloc). Для сравнения по памяти
+приведены те же атрибуты в обычном словаре.
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from app.domain.entities.event import Event
+from app.domain.entities.hydration import Hydratable
+from app.domain.entities.listing import Listing
+from app.domain.entities.moto_club import MotoClub
+from app.domain.entities.motokonig import MotoKonig
+from app.domain.entities.motorcycle import Motorcycle
+from app.domain.entities.profile import Profile
+from app.domain.entities.ride import Ride
+from app.domain.value_objects.engine_type import EngineType
+from app.domain.value_objects.event_type import EventType
+from app.domain.value_objects.listing_category import ListingCategory
+from app.domain.value_objects.listing_status import ListingStatus
+from app.domain.value_objects.location import Location
+from app.domain.value_objects.motokonig_status import MotoKonigStatus
+from app.domain.value_objects.motorcycle_type import MotorcycleType
+from app.domain.value_objects.privacy_level import PrivacyLevel
+from app.domain.value_objects.ride_difficulty import RideDifficulty
+
+NOW = datetime.now(UTC)
+
+# Аргументы конструктора для строки с номером index
+ROWS: dict[type[Hydratable], Callable[[int], dict[str, Any]]] = {
+    Listing: lambda index: {
+        "listing_id": uuid4(), "seller_id": uuid4(), "title": f"Комплект зимней резины №{index}",
+        "description": "Два сезона, без порезов, хранилась в помещении",
+        "category": ListingCategory.PARTS, "price": 2500000 + index, "location": "Калининград",
+        "status": ListingStatus.ACTIVE, "contact_phone": "+79001234567",
+        "photo_urls": [f"https://cdn.example/{index}/{n}.jpg" for n in range(3)],
+        "expires_at": NOW + timedelta(days=30), "created_at": NOW, "updated_at": NOW,
+    },
+    Ride: lambda index: {
+        "ride_id": uuid4(), "organizer_id": uuid4(), "title": f"Покатушка №{index}",
+        "description": "Вдоль побережья до маяка", "difficulty": RideDifficulty.MODERATE,
+        "planned_distance": 180, "start_location": "Калининград", "end_location": "Балтийск",
+        "planned_start": NOW + timedelta(days=3), "planned_duration": 240,
+        "created_at": NOW, "updated_at": NOW,
+    },
+    MotoKonig: lambda index: {
+        "motokonig_id": uuid4(), "user_id": uuid4(), "nickname": f"rider_{index}",
+        "status": MotoKonigStatus.RIDER, "experience_points": 1200 + index, "total_distance": 5400,
+        "total_rides": 37, "average_speed": 72.5, "max_speed": 181.0, "rating": 4.7,
+        "bio": "Катаюсь с 2012 года", "created_at": NOW, "updated_at": NOW,
+    },
+    Motorcycle: lambda index: {
+        "motorcycle_id": uuid4(), "owner_id": uuid4(), "brand": "Yamaha", "model": "MT-07",
+        "year": 2019, "engine_volume": 689, "engine_type": EngineType.INLINE_2,
+        "motorcycle_type": MotorcycleType.NAKED, "power": 74, "mileage": 21000 + index,
+        "color": "Синий", "created_at": NOW, "updated_at": NOW,
+    },
+    MotoClub: lambda index: {
+        "club_id": uuid4(), "name": f"Балтийские волки {index}", "description": "Клуб туристов",
+        "president_id": uuid4(), "max_members": 200, "location": "Калининград",
+        "founded_date": NOW - timedelta(days=3650), "member_count": 42,
+        "created_at": NOW, "updated_at": NOW,
+    },
+    Profile: lambda index: {
+        "profile_id": uuid4(), "user_id": uuid4(), "bio": "Люблю дальние поездки",
+        "location": "Калининград", "phone": "+79001234567", "date_of_birth": date(1990, 5, 17),
+        "riding_experience": 10, "privacy_level": PrivacyLevel.PUBLIC,
+        "created_at": NOW, "updated_at": NOW,
+    },
+    Event: lambda index: {
+        "event_id": uuid4(), "organizer_id": uuid4(), "title": f"Открытие сезона {index}",
+        "description": "Сбор на набережной и колонна по городу",
+        "location": Location(54.7104, 20.4522, "Калининград"),
+        "start_time": NOW + timedelta(days=10), "end_time": NOW + timedelta(days=10, hours=4),
+        "event_type": EventType.PUBLIC, "max_participants": 300,
+        "created_at": NOW, "updated_at": NOW,
+    },
+}
+
+
+def _state(entity: Hydratable) -> dict[str, Any]:
+    return {name: getattr(entity, name) for name in type(entity).__slots__}
+
+
+def best_time(func: Callable[[], list], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def retained(func: Callable[[], list]) -> int:
+    """Байт, удерживаемых результатом ``func``"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(rows: int, rounds: int) -> None:
+    print(f"Сборка {rows} строк каждой сущности, лучший из {rounds} прогонов")
+    print(f"{'':<12}{'конструктор':>14}{'hydrate':>10}{'байт/строка':>14}{'dict':>8}")
+    for entity_cls, row in ROWS.items():
+        kwargs = [row(index) for index in range(rows)]
+        # Данные в том виде, в каком их отдаёт маппер репозитория
+        states = [_state(entity_cls(**item)) for item in kwargs]
+
+        # Значения цикла привязаны по умолчанию, чтобы замыкания не делили переменные
+        def construct(entity_cls=entity_cls, kwargs=kwargs) -> list:
+            return [entity_cls(**item) for item in kwargs]
+
+        def hydrate(entity_cls=entity_cls, states=states) -> list:
+            return [entity_cls.hydrate(**state) for state in states]
+
+        def as_dict(states=states) -> list:
+            return [dict(state) for state in states]
+
+        assert [_state(entity) for entity in hydrate()] == states
+        per_row = 1_000_000 / rows
+        print(
+            f"{entity_cls.__name__:<12}"
+            f"{best_time(construct, rounds) * per_row:>11.2f}мкс"
+            f"{best_time(hydrate, rounds) * per_row:>7.2f}мкс"
+            f"{retained(hydrate) / rows:>14.0f}"
+            f"{retained(as_dict) / rows:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.rounds)
@@ -0,0 +1,112 @@
+# benchmarks/import_time.py
+"""Время импорта модуля API в чистом интерпретаторе.
+
+Запуск: ``python -m benchmarks.import_time --rounds 5``.
+
+Каждый раунд — отдельный процесс с ``-X importtime``: столько платит каждый
+воркер при старте и перезапуске. Печатает медиану суммарного времени,
+самые дорогие пакеты верхнего уровня и проверяет, что тяжёлые
+необязательные стеки (S3, брокер) не загружаются вместе с API. С
+``--budget-ms`` завершается с ошибкой при превышении бюджета.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+MODULE = "app.presentation.api"
+
+# Бюджет на импорт API, мс; заметно выше медианы, чтобы ловить регрессии, а не шум
+IMPORT_BUDGET_MS = 4000
+
+# Загружаются при первом обращении, а не при импорте API
+LAZY_MODULES = ("aioboto3", "aiobotocore", "botocore", "faststream", "aio_pika", "uvicorn")
+
+
+@dataclass(frozen=True, slots=True)
+class ImportProfile:
+    total_ms: float
+    packages_ms: dict[str, float]
+    loaded_lazy: tuple[str, ...]
+
+
+def profile_import(module: str = MODULE) -> ImportProfile:
+    """Импортировать модуль в новом процессе и разобрать вывод ``-X importtime``"""
+    probe = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    packages: dict[str, float] = defaultdict(float)
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        if not own.strip().isdigit():
+            continue  # строка заголовка
+        indent = len(name) - len(name.lstrip())
+        name = name.strip()
+        # Собственное время модуля идёт его пакету верхнего уровня
+        packages[name.split(".")[0]] += int(own) / 1000
+        if indent == 1:
+            # Суммы модулей верхнего уровня не пересекаются
+            total_us += int(cumulative)
+
+    loaded = result.stdout.strip()
+    return ImportProfile(
+        total_ms=total_us / 1000,
+        packages_ms=dict(packages),
+        loaded_lazy=tuple(loaded.split(",")) if loaded else (),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=MODULE)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--json", action="store_true", help="вывести результат в JSON")
+    args = parser.parse_args()
+
+    profiles = [profile_import(args.module) for _ in range(args.rounds)]
+    median = statistics.median(p.total_ms for p in profiles)
+    packages = {
+        name: statistics.median(p.packages_ms.get(name, 0.0) for p in profiles)
+        for name in profiles[0].packages_ms
+    }
+    top = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    loaded_lazy = sorted({name for p in profiles for name in p.loaded_lazy})
+
+    if args.json:
+        print(json.dumps({
+            "module": args.module,
+            "median_ms": round(median, 1),
+            "rounds": args.rounds,
+            "top_packages_ms": {name: round(ms, 1) for name, ms in top},
+            "loaded_lazy_modules": loaded_lazy,
+        }, ensure_ascii=False, indent=2))
+    else:
+        print(f"{args.module}: медиана {median:.0f} мс за {args.rounds} раундов")
+        for name, ms in top:
+            print(f"  {name:<32} {ms:8.1f} мс")
+        if loaded_lazy:
+            print(f"Загружены при импорте, хотя должны лениво: {', '.join(loaded_lazy)}")
+
+    if loaded_lazy or (args.budget_ms is not None and median > args.budget_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+# benchmarks/load.py
+"""Нагрузочный прогон настоящего приложения API в одном процессе.
+
+Запуск: ``python -m benchmarks.load --requests 200 --concurrency 10``.
+
+Запросы идут в ``app.presentation.api:app`` через httpx ``ASGITransport``,
+без сети и сервера. Все middleware и DI те же, что в бою, но БД — SQLite
+через aiosqlite во временном файле, Redis — fakeredis (со скриптами Lua),
+S3 — хранилище в памяти за настоящим ``MinIOFileStorage``. Сценарии: вход,
+свой профиль, поиск объявлений, предстоящие поездки с участниками,
+загрузка файла и топ райдеров (анонимно, через кэш горячих ответов).
+
+Вход упирается в хэширование пароля и на порядки медленнее остальных
+сценариев. Для каждого сценария печатает req/s, p50/p95/p99 и память отдельного
+прохода под tracemalloc (пик и остаток). ``--save-baseline`` сохраняет
+результат, ``--baseline`` сравнивает с ним и завершается с ошибкой, если
+p95 или req/s хуже больше чем на ``--tolerance``. Базовая линия зависит
+от машины: снимать её нужно там же, где идёт сравнение.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+PASSWORD = "Benchmark-Passw0rd"
+
+# Лимиты частоты остаются включены, чтобы скрипт лимитера был в замере,
+# но не мешают прогону
+RATE_LIMITS = {
+    f"RATE_LIMIT_{name}": "1000000/second"
+    for name in (
+        "LOGIN_PER_IP", "LOGIN_PER_USER", "REGISTER_PER_IP", "PIN_LOGIN_PER_IP",
+        "PIN_LOGIN_PER_DEVICE", "MEDIA_UPLOAD_PER_USER", "LISTING_CREATE_PER_USER",
+    )
+}
+
+
+@dataclass(slots=True)
+class Seed:
+    """Данные, созданные до прогона"""
+
+    usernames: list[str] = field(default_factory=list)
+    tokens: list[str] = field(default_factory=list)
+    upload: bytes = b""
+
+    def token(self, index: int) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[index % len(self.tokens)]}"}
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    name: str
+    send: Callable[[Any, Seed, int], Awaitable[Any]]
+
+
+SCENARIOS = (
+    Scenario(
+        "login",
+        lambda client, seed, i: client.post(
+            "/auth/login", auth=(seed.usernames[i % len(seed.usernames)], PASSWORD)
+        ),
+    ),
+    Scenario("motokonig_me", lambda client, seed, i: client.get("/motokonig/me", headers=seed.token(i))),
+    Scenario(
+        "listing_search",
+        lambda client, seed, i: client.get(
+            "/listings/search",
+            params={"location": "Калининград", "price_max": 5000000},
+            headers=seed.token(i),
+        ),
+    ),
+    # С токеном, чтобы запрос прошёл мимо кэша горячих ответов до обработчика
+    Scenario("rides_upcoming", lambda client, seed, i: client.get("/rides/upcoming", headers=seed.token(i))),
+    Scenario(
+        "media_upload",
+        lambda client, seed, i: client.post(
+            "/media/upload",
+            files={"file": (f"bike_{i}.jpg", seed.upload, "image/jpeg")},
+            data={"file_type": "motorcycle_photo"},
+            headers=seed.token(i),
+        ),
+    ),
+    Scenario("motokonig_top", lambda client, seed, i: client.get("/motokonig/top")),
+)
+
+
+def configure_environment(database_path: Path) -> None:
+    """Окружение до импорта приложения: настройки читаются при импорте"""
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{database_path}"
+    os.environ["DB_QUERY_REPEAT_STRICT"] = "false"
+    os.environ["API_VALIDATE_RESPONSES"] = "false"
+    os.environ.update(RATE_LIMITS)
+
+
+class _MemoryS3:
+    """Клиент S3 в памяти с теми методами, что вызывает MinIOFileStorage"""
+
+    def __init__(self) -> None:
+        self.buckets: set[str] = set()
+        self.objects: dict[tuple[str, str], bytes] = {}
+
+    async def head_bucket(self, Bucket: str) -> dict:  # noqa: N803 - имена как в boto3
+        from botocore.exceptions import ClientError
+
+        if Bucket not in self.buckets:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadBucket")
+        return {}
+
+    async def create_bucket(self, Bucket: str) -> dict:  # noqa: N803
+        self.buckets.add(Bucket)
+        return {}
+
+    async def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs: Any) -> dict:  # noqa: N803
+        self.objects[Bucket, Key] = bytes(Body)
+        return {}
+
+    async def delete_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803
+        self.objects.pop((Bucket, Key), None)
+        return {}
+
+    async def generate_presigned_url(self, ClientMethod: str, Params: dict, ExpiresIn: int) -> str:  # noqa: N803
+        return f"http://s3.local/{Params['Bucket']}/{Params['Key']}?expires={ExpiresIn}"
+
+
+def build_container(api: Any) -> Any:
+    """Контейнер приложения, где Redis, кэш сущностей и S3 заменены локальными"""
+    import fakeredis
+    from dishka import Provider, Scope, make_async_container, provide
+    from dishka.integrations.fastapi import FastapiProvider
+    from redis.asyncio import Redis
+
+    from app.domain.ports.repositories.file_storage import FileStoragePort
+    from app.infrastructure.cache.entity_cache import RedisEntityCache
+    from app.infrastructure.di.container import (
+        InfrastructureProvider,
+        PresentationProvider,
+        UseCaseProvider,
+    )
+    from app.infrastructure.messaging.redis_client import InstrumentedRedis
+    from app.infrastructure.storage.minio_client import MinIOFileStorage
+
+    class LocalFileStorage(MinIOFileStorage):
+        def __init__(self, config: Any):
+            super().__init__(config)
+            self._memory = _MemoryS3()
+
+        def _get_client(self):
+            return nullcontext(self._memory)
+
+    server = fakeredis.FakeServer()
+
+    def fake_redis(decode_responses: bool) -> InstrumentedRedis:
+        pool = fakeredis.aioredis.FakeRedis(server=server, decode_responses=decode_responses).connection_pool
+        return InstrumentedRedis(connection_pool=pool)
+
+    class LocalServicesProvider(Provider):
+        @provide(scope=Scope.APP)
+        def provide_redis(self) -> Redis:
+            return fake_redis(decode_responses=True)
+
+        @provide(scope=Scope.APP)
+        def provide_entity_cache(self) -> RedisEntityCache:
+            return RedisEntityCache(fake_redis(decode_responses=False), api.config.entity_cache.enabled)
+
+        @provide(scope=Scope.APP)
+        def provide_file_storage(self) -> FileStoragePort:
+            return LocalFileStorage(api.config.minio)
+
+    return make_async_container(
+        InfrastructureProvider(api.alchemy, api.config),
+        UseCaseProvider(),
+        PresentationProvider(),
+        FastapiProvider(),
+        LocalServicesProvider(),
+    )
+
+
+async def create_schema(database_url: str) -> None:
+    from advanced_alchemy.base import orm_registry
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    import app.infrastructure.models  # noqa: F401 - регистрирует таблицы
+
+    engine = create_async_engine(database_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(orm_registry.metadata.create_all)
+    await engine.dispose()
+
+
+async def seed_database(container: Any, users: int, listings: int, rides: int) -> list[str]:
+    """Пользователи с профилями MotoKonig, объявления и поездки с участниками"""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.domain.ports.services.password import PasswordService
+    from app.domain.value_objects.listing_category import ListingCategory
+    from app.domain.value_objects.motokonig_status import MotoKonigStatus
+    from app.domain.value_objects.ride_difficulty import RideDifficulty
+    from app.domain.value_objects.user_role import UserRole
+    from app.infrastructure.models import (
+        Listing,
+        MotoKonig,
+        Ride,
+        RideParticipant,
+        User,
+    )
+
+    password_hash = await (await container.get(PasswordService)).hash(PASSWORD)
+    factory = await container.get(async_sessionmaker[AsyncSession])
+    now = datetime.now(UTC)
+    usernames = [f"rider_{index:04d}" for index in range(users)]
+
+    async with factory() as session, session.begin():
+        user_ids = [uuid4() for _ in usernames]
+        motokonig_ids = [uuid4() for _ in usernames]
+        session.add_all(
+            User(id=user_id, username=username, password_hash=password_hash, role=UserRole.USER)
+            for user_id, username in zip(user_ids, usernames, strict=True)
+        )
+        session.add_all(
+            MotoKonig(
+                id=motokonig_id, user_id=user_id, nickname=f"konig_{index:04d}",
+                status=MotoKonigStatus.RIDER, experience_points=100 * index,
+                total_distance=1500 + index, total_rides=index, rating=round(3 + index % 20 / 10, 1),
+                is_public=True,
+            )
+            for index, (user_id, motokonig_id) in enumerate(zip(user_ids, motokonig_ids, strict=True))
+        )
+        session.add_all(
+            Listing(
+                seller_id=user_ids[index % users], title=f"Комплект зимней резины №{index}",
+                description="Два сезона, без порезов, хранилась в помещении",
+                category=ListingCategory.PARTS, price=1000000 + 10000 * index,
+                location="Калининград", contact_phone="+79001234567",
+                photo_urls=[f"https://cdn.example/{index}/{n}.jpg" for n in range(3)],
+                expires_at=now + timedelta(days=30),
+            )
+            for index in range(listings)
+        )
+        for index in range(rides):
+            ride_id = uuid4()
+            session.add(Ride(
+                id=ride_id, organizer_id=motokonig_ids[index % users], title=f"Покатушка №{index}",
+                description="Вдоль побережья до маяка", difficulty=RideDifficulty.MODERATE,
+                planned_distance=180, start_location="Калининград", end_location="Балтийск",
+                planned_start=now + timedelta(days=1 + index), planned_duration=240,
+            ))
+            session.add_all(
+                RideParticipant(ride_id=ride_id, motokonig_id=motokonig_ids[(index + n) % users])
+                for n in range(min(5, users))
+            )
+    return usernames
+
+
+async def run_scenario(client: Any, scenario: Scenario, seed: Seed, requests: int, concurrency: int) -> dict:
+    """Прогнать сценарий, вернуть пропускную способность и перцентили задержки"""
+    latencies: list[float] = []
+    errors = 0
+    counter = itertools.count()
+
+    async def worker() -> None:
+        nonlocal errors
+        while (index := next(counter)) < requests:
+            started = time.perf_counter()
+            response = await scenario.send(client, seed, index)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p95_ms": round(cuts[94] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+    }
+
+
+async def measure_allocations(client: Any, scenario: Scenario, seed: Seed, requests: int, concurrency: int) -> dict:
+    """Отдельный проход под tracemalloc: он замедляет запросы и исказил бы задержки"""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    await run_scenario(client, scenario, seed, requests, concurrency)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "peak_kib": round((peak - baseline) / 1024, 1),
+        "retained_kib": round((current - baseline) / 1024, 1),
+    }
+
+
+async def benchmark(args: argparse.Namespace) -> dict[str, dict]:
+    from httpx import ASGITransport, AsyncClient
+
+    import app.presentation.api as api
+    from app.infrastructure.messaging.redis_client import RedisClient
+
+    # Строка лога на каждый запрос клиента забивает вывод и время прогона
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await create_schema(os.environ["DATABASE_URL"])
+    container = build_container(api)
+    # lifespan и middleware Dishka берут контейнер отсюда
+    api.container = container
+    api.app.state.dishka_container = container
+
+    seed = Seed(upload=os.urandom(int(args.upload_mb * 1024 * 1024)))
+    async with api.app.router.lifespan_context(api.app):
+        seed.usernames = await seed_database(container, args.users, args.listings, args.rides)
+        async with AsyncClient(transport=ASGITransport(app=api.app), base_url="http://bench") as client:
+            for username in seed.usernames[:max(args.concurrency, 1)]:
+                response = await client.post("/auth/login", auth=(username, PASSWORD))
+                response.raise_for_status()
+                seed.tokens.append(response.json()["access_token"])
+
+            results = {}
+            selected = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+            for scenario in selected:
+                await run_scenario(client, scenario, seed, args.warmup, args.concurrency)
+                result = await run_scenario(client, scenario, seed, args.requests, args.concurrency)
+                if args.alloc_requests:
+                    result |= await measure_allocations(
+                        client, scenario, seed, args.alloc_requests, args.concurrency
+                    )
+                results[scenario.name] = result
+    # Пул lifespan указывал на несуществующий Redis, запросы его не трогали
+    RedisClient._pool = None
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Сценарии, где p95 или req/s хуже базовой линии больше допуска"""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {current['p95_ms']} мс против {base['p95_ms']} мс")
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: {current['rps']} req/s против {base['rps']} req/s")
+        if current["errors"]:
+            regressions.append(f"{name}: {current['errors']} ошибок")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="запросов на сценарий")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20, help="запросов прогрева на сценарий")
+    parser.add_argument("--alloc-requests", type=int, default=50, help="запросов в проходе tracemalloc, 0 — без него")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--listings", type=int, default=500)
+    parser.add_argument("--rides", type=int, default=30)
+    parser.add_argument("--upload-mb", type=float, default=1.0)
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS])
+    parser.add_argument("--baseline", type=Path, help="сравнить с сохранённым JSON")
+    parser.add_argument("--save-baseline", type=Path, help="сохранить результат как базовую линию")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="допустимое ухудшение, доля")
+    parser.add_argument("--json", action="store_true", help="вывести результат в JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="motokonig-bench-") as directory:
+        configure_environment(Path(directory) / "bench.db")
+        results = asyncio.run(benchmark(args))
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "settings": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "upload_mb": args.upload_mb,
+        },
+        "scenarios": results,
+    }
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'сценарий':<16} {'req/s':>8} {'p50 мс':>8} {'p95 мс':>8} {'p99 мс':>8} {'пик КиБ':>9} {'ошибки':>7}")
+        for name, result in results.items():
+            print(
+                f"{name:<16} {result['rps']:>8} {result['p50_ms']:>8} {result['p95_ms']:>8} "
+                f"{result['p99_ms']:>8} {result.get('peak_kib', '-'):>9} {result['errors']:>7}"
+            )
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+
+    failed = any(result["errors"] for result in results.values())
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text())["scenarios"], args.tolerance)
+        for line in regressions:
+            print(f"Регрессия: {line}", file=sys.stderr)
+        failed = failed or bool(regressions)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
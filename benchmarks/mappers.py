@@ -0,0 +1,340 @@
+# benchmarks/mappers.py
+"""Микробенчмарки маппинга: строка ORM → сущность → DTO → JSON.
+
+Запуск: ``python -m benchmarks.mappers --sizes 1000 10000 100000 --output mappers.json``.
+
+Для каждой сущности со списочным эндпоинтом по отдельности меряет три
+шага, из которых состоит CPU-часть любого списка: ``_to_domain_entity``
+репозитория над синтетическими моделями ORM (без сессии и БД),
+``to_dto`` сущности и сериализацию DTO тем путём, что и роутер
+(``SchemaResponse`` или ``response_model``). Время — статистика по
+раундам, память — пик tracemalloc за отдельный запуск шага. JSON по
+раскладке повторяет отчёт pytest-benchmark (``benchmarks`` с ``group``,
+``name``, ``params``, ``stats``), чтобы его читали те же инструменты для
+трендов.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.domain.value_objects.achievement_type import AchievementType
+from app.domain.value_objects.engine_type import EngineType
+from app.domain.value_objects.event_type import EventType
+from app.domain.value_objects.file_type import FileType
+from app.domain.value_objects.listing_category import ListingCategory
+from app.domain.value_objects.listing_status import ListingStatus
+from app.domain.value_objects.motokonig_status import MotoKonigStatus
+from app.domain.value_objects.motorcycle_type import MotorcycleType
+from app.domain.value_objects.privacy_level import PrivacyLevel
+from app.domain.value_objects.ride_difficulty import RideDifficulty
+from app.infrastructure.models import (
+    Event,
+    Listing,
+    MediaFile,
+    MotoClub,
+    MotoKonig,
+    MotoKonigAchievement,
+    Motorcycle,
+    Profile,
+    Ride,
+    RideCheckpoint,
+    RideParticipant,
+)
+from app.infrastructure.repositories.sql_event_repo import SqlEventRepository
+from app.infrastructure.repositories.sql_listing_repo import SqlListingRepository
+from app.infrastructure.repositories.sql_media_file_repo import SqlMediaFileRepository
+from app.infrastructure.repositories.sql_moto_club_repo import SqlMotoClubRepository
+from app.infrastructure.repositories.sql_motokonig_repo import SqlMotoKonigRepository
+from app.infrastructure.repositories.sql_motorcycle_repo import SqlMotorcycleRepository
+from app.infrastructure.repositories.sql_profile_repo import SqlProfileRepository
+from app.infrastructure.repositories.sql_ride_repo import SqlRideRepository
+from app.presentation.responses import SchemaResponse
+from app.presentation.schemas.event import EventResponseSchema
+from app.presentation.schemas.listing import ListingResponseSchema
+from app.presentation.schemas.moto_club import MotoClubResponseSchema
+from app.presentation.schemas.motokonig import MotoKonigResponseSchema
+from app.presentation.schemas.motorcycle import MotorcycleResponseSchema
+from app.presentation.schemas.profile import ProfileResponseSchema
+from app.presentation.schemas.ride import RideListItemSchema
+
+NOW = datetime.now(UTC)
+SIZES = (1_000, 10_000, 100_000)
+MIN_ROUNDS = 3
+
+
+def _audit() -> dict[str, Any]:
+    return {"id": uuid4(), "created_at": NOW, "updated_at": NOW}
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """Сущность и то, как её отдаёт список"""
+
+    name: str
+    repository: type
+    row: Callable[[int], Any]
+    schema: type[BaseModel] | None = None
+    # SchemaResponse отбирает поля без валидации, иначе путь response_model
+    schema_response: bool = False
+    # Поля, которые роутер добавляет к DTO перед ответом (в замер не входит)
+    enrich: Callable[[dict], dict] | None = None
+
+
+CASES = (
+    Case(
+        "Listing",
+        SqlListingRepository,
+        lambda index: Listing(
+            **_audit(), seller_id=uuid4(), title=f"Комплект зимней резины №{index}",
+            description="Два сезона, без порезов, хранилась в помещении",
+            category=ListingCategory.PARTS, price=2500000 + index, currency="RUB",
+            is_negotiable=True, location="Калининград", status=ListingStatus.ACTIVE,
+            contact_phone="+79001234567", contact_email=None, moderation_notes=None,
+            photo_urls=[f"https://cdn.example/{index}/{n}.jpg" for n in range(3)],
+            views_count=index % 500, is_featured=False, expires_at=NOW + timedelta(days=30),
+        ),
+        ListingResponseSchema,
+        schema_response=True,
+    ),
+    Case(
+        "Motorcycle",
+        SqlMotorcycleRepository,
+        lambda index: Motorcycle(
+            **_audit(), owner_id=uuid4(), brand="Yamaha", model="MT-07", year=2019,
+            engine_volume=689, engine_type=EngineType.INLINE_2,
+            motorcycle_type=MotorcycleType.NAKED, power=74, mileage=21000 + index,
+            color="Синий", description=None, is_active=True,
+        ),
+        MotorcycleResponseSchema,
+        schema_response=True,
+    ),
+    Case(
+        "Ride",
+        SqlRideRepository,
+        lambda index: Ride(
+            **_audit(), organizer_id=uuid4(), title=f"Покатушка №{index}",
+            description="Вдоль побережья до маяка", difficulty=RideDifficulty.MODERATE,
+            planned_distance=180, max_participants=10, start_location="Калининград",
+            end_location="Балтийск", planned_start=NOW + timedelta(days=3),
+            planned_duration=240, actual_start=None, actual_end=None, actual_distance=None,
+            route_gpx=None, weather_conditions=None, is_public=True, is_completed=False,
+            rating=None,
+            participants=[
+                RideParticipant(
+                    **_audit(), motokonig_id=uuid4(), joined_at=NOW, left_at=None,
+                    distance_covered=0, average_speed=None, max_speed=None, is_leader=n == 0,
+                )
+                for n in range(4)
+            ],
+            checkpoints=[
+                RideCheckpoint(
+                    **_audit(), latitude=54.71 + n / 100, longitude=20.45, name=f"Точка {n}",
+                    reached_at=None, order_index=n,
+                )
+                for n in range(2)
+            ],
+        ),
+        RideListItemSchema,
+        enrich=lambda dto: dto | {
+            "current_participants": len(dto["participants"]),
+            "organizer_nickname": "rider_0",
+        },
+    ),
+    Case(
+        "MotoKonig",
+        SqlMotoKonigRepository,
+        lambda index: MotoKonig(
+            **_audit(), user_id=uuid4(), nickname=f"rider_{index}",
+            status=MotoKonigStatus.RIDER, experience_points=1200 + index, total_distance=5400,
+            total_rides=37, average_speed=72.5, max_speed=181.0, rating=4.7,
+            bio="Катаюсь с 2012 года", avatar_url=None, is_public=True,
+            achievements=[
+                MotoKonigAchievement(
+                    **_audit(), achievement_type=AchievementType.FIRST_RIDE,
+                    # Конструктор Achievement сравнивает со временем без пояса
+                    earned_at=NOW.replace(tzinfo=None),
+                    description="Первая поездка", achievement_metadata=None,
+                ),
+            ],
+        ),
+        MotoKonigResponseSchema,
+    ),
+    Case(
+        "MotoClub",
+        SqlMotoClubRepository,
+        lambda index: MotoClub(
+            **_audit(), name=f"Балтийские волки {index}", description="Клуб туристов",
+            president_id=uuid4(), is_public=True, max_members=200, location="Калининград",
+            website=None, avatar_url=None, is_active=True,
+            founded_date=NOW - timedelta(days=3650),
+        ),
+        MotoClubResponseSchema,
+    ),
+    Case(
+        "Profile",
+        SqlProfileRepository,
+        lambda index: Profile(
+            **_audit(), user_id=uuid4(), bio="Люблю дальние поездки", location="Калининград",
+            phone="+79001234567", date_of_birth=date(1990, 5, 17), riding_experience=10,
+            avatar_url=None, privacy_level=PrivacyLevel.PUBLIC,
+            phone_privacy=PrivacyLevel.PRIVATE, location_privacy=PrivacyLevel.PUBLIC,
+        ),
+        ProfileResponseSchema,
+    ),
+    Case(
+        "Event",
+        SqlEventRepository,
+        lambda index: Event(
+            **_audit(), organizer_id=uuid4(), title=f"Открытие сезона {index}",
+            description="Сбор на набережной и колонна по городу",
+            latitude=54.7104, longitude=20.4522, address="Калининград",
+            start_time=NOW + timedelta(days=10), end_time=NOW + timedelta(days=10, hours=4),
+            event_type=EventType.PUBLIC, max_participants=300, photo_urls=[],
+        ),
+        EventResponseSchema,
+    ),
+    # Список файлов наружу не отдаётся, сериализации нет
+    Case(
+        "MediaFile",
+        SqlMediaFileRepository,
+        lambda index: MediaFile(
+            **_audit(), owner_id=uuid4(), file_type=FileType.MOTORCYCLE_PHOTO,
+            original_name=f"bike_{index}.jpg", file_key=f"motorcycles/{index}.jpg",
+            bucket="motokonig", content_type="image/jpeg", size_bytes=512_000,
+            url=f"https://cdn.example/motorcycles/{index}.jpg", is_public=True,
+            file_metadata=None,
+        ),
+    ),
+)
+
+
+def serializer(case: Case) -> Callable[[list[dict]], bytes]:
+    """Сериализация списка DTO так, как это делает роутер сущности"""
+    if case.schema_response:
+        return lambda dtos: SchemaResponse(dtos, case.schema).body
+    # response_model: валидация по схеме, затем JSON ядром pydantic
+    adapter = TypeAdapter(list[case.schema])
+    return lambda dtos: adapter.dump_json(adapter.validate_python(dtos, from_attributes=True))
+
+
+def measure(func: Callable[[], Any], rounds: int) -> dict[str, float]:
+    """Статистика раундов в секундах, как в отчёте pytest-benchmark"""
+    func()  # прогрев кэшей схем и адаптеров
+    timings = []
+    for _ in range(rounds):
+        # Мусор прошлых раундов не должен собираться внутри замера
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return {
+        "min": min(timings),
+        "max": max(timings),
+        "mean": statistics.fmean(timings),
+        "median": statistics.median(timings),
+        "stddev": statistics.stdev(timings) if rounds > 1 else 0.0,
+        "rounds": rounds,
+        "ops": 1 / statistics.fmean(timings),
+    }
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Пик байт, выделенных за один вызов ``func``, вместе с результатом"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def run_case(case: Case, rows: int, rounds: int) -> list[dict[str, Any]]:
+    """Замеры трёх шагов сущности на ``rows`` строках"""
+    repository = case.repository(None)  # маппер к сессии не обращается
+    models = [case.row(index) for index in range(rows)]
+    entities = [repository._to_domain_entity(model) for model in models]
+    dtos = [entity.to_dto() for entity in entities]
+    if case.enrich is not None:
+        dtos = [case.enrich(dto) for dto in dtos]
+
+    steps: dict[str, Callable[[], Any]] = {
+        "to_domain_entity": lambda: [repository._to_domain_entity(model) for model in models],
+        "to_dto": lambda: [entity.to_dto() for entity in entities],
+    }
+    if case.schema is not None:
+        serialize = serializer(case)
+        steps["serialize"] = lambda: serialize(dtos)
+
+    results = []
+    for step, func in steps.items():
+        stats = measure(func, rounds)
+        results.append({
+            "group": case.name,
+            "name": f"{case.name}.{step}[{rows}]",
+            "params": {"step": step, "rows": rows},
+            "stats": stats,
+            "extra_info": {
+                "per_row_us": round(stats["min"] / rows * 1_000_000, 3),
+                "peak_kib": round(peak_memory(func) / 1024, 1),
+            },
+        })
+    return results
+
+
+def run(sizes: Sequence[int], rounds: int, only: Sequence[str] = ()) -> dict[str, Any]:
+    benchmarks = [
+        result
+        for case in CASES if not only or case.name in only
+        for rows in sizes
+        # Раунды на больших размерах сокращаются: время растёт линейно
+        for result in run_case(case, rows, max(MIN_ROUNDS, rounds * min(sizes) // rows))
+    ]
+    return {
+        "machine_info": {
+            "python_version": platform.python_version(),
+            "python_implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+        },
+        "datetime": datetime.now(UTC).isoformat(),
+        "benchmarks": benchmarks,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--rounds", type=int, default=10, help="раундов на наименьшем размере")
+    parser.add_argument("--entity", action="append", choices=[case.name for case in CASES])
+    parser.add_argument("--output", help="записать отчёт JSON в файл")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.rounds, args.entity or ())
+
+    print(f"{'':<36}{'мкс/строка':>12}{'пик КиБ':>12}{'раунды':>8}")
+    for result in report["benchmarks"]:
+        print(
+            f"{result['name']:<36}"
+            f"{result['extra_info']['per_row_us']:>12.2f}"
+            f"{result['extra_info']['peak_kib']:>12.1f}"
+            f"{result['stats']['rounds']:>8}"
+        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/serialization.py
+"""Стоимость сериализации ответа на один элемент списка объявлений.
+
+Запуск: ``python -m benchmarks.serialization --items 1000 --rounds 20``.
+
+Сравнивает путь ``response_model`` (валидация DTO по схеме с
+``from_attributes``, затем ``jsonable_encoder`` и ``json.dumps``), тот же
+путь с ``dump_json`` из ядра pydantic (так делают свежие версии FastAPI)
+и ``SchemaResponse`` без валидации и с ней.
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.domain.entities.listing import Listing
+from app.domain.value_objects.listing_category import ListingCategory
+from app.domain.value_objects.listing_status import ListingStatus
+from app.presentation.responses import SchemaResponse
+from app.presentation.schemas.listing import ListingResponseSchema
+
+
+def _dtos(items: int) -> list[dict]:
+    now = datetime.now(UTC)
+    listings = []
+    for index in range(items):
+        listing = Listing(
+            seller_id=uuid4(),
+            title=f"Комплект зимней резины №{index}",
+            description="Два сезона, без порезов, хранилась в помещении",
+            category=ListingCategory.PARTS,
+            price=2500000 + index,
+            location="Калининград",
+            status=ListingStatus.ACTIVE,
+            photo_urls=[f"https://cdn.example/{index}/{n}.jpg" for n in range(3)],
+            expires_at=now + timedelta(days=30),
+        )
+        listing.id = uuid4()
+        listing.created_at = listing.updated_at = now
+        listings.append(listing)
+    return [listing.to_dto() for listing in listings]
+
+
+def response_model_stdlib(dtos: list[dict]) -> bytes:
+    adapter = TypeAdapter(list[ListingResponseSchema])
+    value = adapter.validate_python(dtos, from_attributes=True)
+    return json.dumps(jsonable_encoder(value)).encode()
+
+
+def response_model_dump_json(dtos: list[dict]) -> bytes:
+    adapter = TypeAdapter(list[ListingResponseSchema])
+    return adapter.dump_json(adapter.validate_python(dtos, from_attributes=True))
+
+
+def schema_response(dtos: list[dict]) -> bytes:
+    SchemaResponse.validate = False
+    return SchemaResponse(dtos, ListingResponseSchema).body
+
+
+def schema_response_validated(dtos: list[dict]) -> bytes:
+    SchemaResponse.validate = True
+    return SchemaResponse(dtos, ListingResponseSchema).body
+
+
+def measure(func: Callable[[list[dict]], bytes], dtos: list[dict], rounds: int) -> float:
+    func(dtos)  # прогрев кэшей схем
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func(dtos)
+        best = min(best, time.perf_counter() - started)
+    return best / len(dtos) * 1_000_000
+
+
+def main(items: int, rounds: int) -> None:
+    dtos = _dtos(items)
+    assert json.loads(schema_response(dtos)) == json.loads(response_model_stdlib(dtos))
+
+    print(f"Сериализация списка из {items} объявлений, лучший из {rounds} прогонов")
+    print(f"{'':<34}{'мкс/элемент':>12}")
+    for name, func in (
+            ("response_model + json.dumps", response_model_stdlib),
+            ("response_model + dump_json", response_model_dump_json),
+            ("SchemaResponse", schema_response),
+            ("SchemaResponse, validate=True", schema_response_validated),
+    ):
+        print(f"{name:<34}{measure(func, dtos, rounds):>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    main(args.items, args.rounds)
@@ -0,0 +1,138 @@
+# benchmarks/write_path.py
+"""Задержка записи объявлений: flush + refresh против одного запроса.
+
+Запуск: ``python -m benchmarks.write_path --ops 500 --rtt-ms 0.5``.
+
+Сравнивает прежний путь записи (INSERT и перечитывание строки, чтение
+строки, UPDATE и перечитывание) с текущим ``SqlListingRepository``.
+База — SQLite в памяти, поэтому задержка сети до PostgreSQL
+имитируется паузой ``--rtt-ms`` перед каждым запросом.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from advanced_alchemy.base import orm_registry
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.entities.listing import Listing
+from app.domain.value_objects.listing_category import ListingCategory
+from app.infrastructure.models.listing import Listing as ListingModel
+from app.infrastructure.models.listing_favorite import ListingFavorite as FavoriteModel
+from app.infrastructure.models.user import User as UserModel
+from app.infrastructure.repositories.sql_listing_repo import SqlListingRepository
+
+
+def _listing() -> Listing:
+    return Listing(
+        seller_id=uuid4(),
+        title="Комплект зимней резины",
+        description="Два сезона, без порезов",
+        category=ListingCategory.PARTS,
+        price=2500000,
+        location="Калининград",
+    )
+
+
+async def legacy_add(session: AsyncSession, listing: Listing) -> None:
+    db_listing = ListingModel(
+        seller_id=listing.seller_id,
+        title=listing.title,
+        description=listing.description,
+        category=listing.category,
+        price=listing.price,
+        location=listing.location,
+    )
+    session.add(db_listing)
+    await session.flush()
+    await session.refresh(db_listing)
+    listing.id = db_listing.id
+
+
+async def legacy_update(session: AsyncSession, listing: Listing) -> None:
+    # В отдельном запросе строки нет в identity map: читаем её заново
+    db_listing = await session.get(ListingModel, listing.id, populate_existing=True)
+    db_listing.title = listing.title
+    db_listing.price = listing.price
+    await session.flush()
+    await session.refresh(db_listing)
+
+
+async def current_add(session: AsyncSession, listing: Listing) -> None:
+    await SqlListingRepository(session).add(listing)
+
+
+async def current_update(session: AsyncSession, listing: Listing) -> None:
+    await SqlListingRepository(session).update(listing)
+
+
+async def measure(
+        factory: async_sessionmaker[AsyncSession],
+        counter: list[int],
+        ops: int,
+        add: Callable[[AsyncSession, Listing], Awaitable[None]],
+        update: Callable[[AsyncSession, Listing], Awaitable[None]],
+) -> dict[str, float]:
+    latencies: list[float] = []
+    counter[0] = 0
+    async with factory() as session:
+        for _ in range(ops):
+            listing = _listing()
+            started = time.perf_counter()
+            await add(session, listing)
+            listing.price += 100000
+            await update(session, listing)
+            latencies.append((time.perf_counter() - started) * 1000)
+        await session.commit()
+
+    latencies.sort()
+    return {
+        "statements_per_op": counter[0] / ops,
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+async def main(ops: int, rtt_ms: float) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        tables = [UserModel.__table__, ListingModel.__table__, FavoriteModel.__table__]
+        await conn.run_sync(orm_registry.metadata.create_all, tables=tables)
+
+    counter = [0]
+
+    def before_cursor_execute(*_args) -> None:
+        counter[0] += 1
+        if rtt_ms:
+            time.sleep(rtt_ms / 1000)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    results = {
+        "flush + refresh": await measure(factory, counter, ops, legacy_add, legacy_update),
+        "single statement": await measure(factory, counter, ops, current_add, current_update),
+    }
+    await engine.dispose()
+
+    print(f"add + update объявления, {ops} операций, RTT {rtt_ms} мс")
+    print(f"{'':<18}{'запросов':>10}{'mean, мс':>10}{'p50, мс':>10}{'p95, мс':>10}")
+    for name, row in results.items():
+        print(
+            f"{name:<18}{row['statements_per_op']:>10.1f}{row['mean_ms']:>10.2f}"
+            f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(main(args.ops, args.rtt_ms))
@@ -4,5 +4,5 @@ set -e
 # Apply database migrations
 alembic upgrade head
 
-# Run the application
-exec uvicorn app.presentation.api:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+# Run the application: workers, recycling and proxy headers come from SERVER_* settings
+exec python -m app.server
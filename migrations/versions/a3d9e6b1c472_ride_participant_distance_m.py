@@ -0,0 +1,33 @@
+"""ride participant distance in metres
+
+Revision ID: a3d9e6b1c472
+Revises: f1c83d5a7b92
+Create Date: 2026-10-19 18:10:12.384105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d9e6b1c472'
+down_revision: Union[str, None] = 'f1c83d5a7b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'ride_participants',
+        sa.Column('distance_m', sa.Float(), server_default='0', nullable=False),
+    )
+    # Для уже идущих поездок точнее километров ничего не сохранилось
+    op.execute("UPDATE ride_participants SET distance_m = distance_covered * 1000")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('ride_participants', 'distance_m')
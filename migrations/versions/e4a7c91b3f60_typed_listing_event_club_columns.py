@@ -0,0 +1,82 @@
+"""typed listing event club columns
+
+Revision ID: e4a7c91b3f60
+Revises: d2e9a4f17c03
+Create Date: 2026-10-19 16:40:12.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c91b3f60'
+down_revision: Union[str, None] = 'd2e9a4f17c03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Даты хранились ISO-строками без зоны, записанными в UTC
+    op.alter_column(
+        'listings', 'expires_at',
+        existing_type=sa.String(length=50),
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        postgresql_using="NULLIF(expires_at, '')::timestamp AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        'moto_clubs', 'founded_date',
+        existing_type=sa.String(length=50),
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        postgresql_using="NULLIF(founded_date, '')::timestamp AT TIME ZONE 'UTC'",
+    )
+
+    for table in ('listings', 'events'):
+        op.alter_column(
+            table, 'photo_urls',
+            existing_type=sa.Text(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using="COALESCE(NULLIF(photo_urls, '')::jsonb, '[]'::jsonb)",
+        )
+        op.alter_column(table, 'photo_urls', existing_type=postgresql.JSONB(astext_type=sa.Text()), nullable=False)
+
+    # Составной индекс покрывает и выборки по одному статусу
+    op.drop_index(op.f('ix_listings_status'), table_name='listings')
+    op.create_index('ix_listings_status_expires_at', 'listings', ['status', 'expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_listings_status_expires_at', table_name='listings')
+    op.create_index(op.f('ix_listings_status'), 'listings', ['status'], unique=False)
+
+    for table in ('listings', 'events'):
+        op.alter_column(
+            table, 'photo_urls',
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.Text(),
+            nullable=True,
+            postgresql_using="photo_urls::text",
+        )
+
+    op.alter_column(
+        'moto_clubs', 'founded_date',
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.String(length=50),
+        existing_nullable=True,
+        postgresql_using="to_char(founded_date AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS.US')",
+    )
+    op.alter_column(
+        'listings', 'expires_at',
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.String(length=50),
+        existing_nullable=True,
+        postgresql_using="to_char(expires_at AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS.US')",
+    )
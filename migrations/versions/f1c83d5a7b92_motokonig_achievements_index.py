@@ -0,0 +1,32 @@
+"""motokonig achievements index
+
+Revision ID: f1c83d5a7b92
+Revises: e4a7c91b3f60
+Create Date: 2026-10-19 18:05:41.772310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c83d5a7b92'
+down_revision: Union[str, None] = 'e4a7c91b3f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Достижения выбираются и считаются по профилю: и при загрузке, и для ETag
+    op.create_index(
+        op.f('ix_motokonig_achievements_motokonig_id'),
+        'motokonig_achievements', ['motokonig_id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_motokonig_achievements_motokonig_id'), table_name='motokonig_achievements')
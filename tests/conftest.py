@@ -1,9 +1,15 @@
+import os
 from collections.abc import Generator
 
 import pytest
 from pytest import MonkeyPatch
 from pytest_databases.docker.postgres import PostgresService
 
+# Повтор одного запроса больше порога за HTTP-запрос (N+1) роняет тест
+os.environ.setdefault("DB_QUERY_REPEAT_STRICT", "true")
+# Ответы проверяются по схемам, как response_model
+os.environ.setdefault("API_VALIDATE_RESPONSES", "true")
+
 pytest_plugins = [
     "pytest_databases.docker",
     "pytest_databases.docker.postgres",
@@ -0,0 +1,90 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.config.settings import CompressionConfig
+from app.presentation.middleware.compression import (
+    CompressionMiddleware,
+    HotResponseCacheMiddleware,
+    negotiate,
+)
+from app.presentation.middleware.etag import ETagMiddleware
+
+RIDES = [{"title": f"Покатушка к маяку №{i}", "start_location": "Калининград"} for i in range(50)]
+
+
+def test_negotiate_prefers_highest_weight_then_server_order():
+    supported = ("zstd", "br", "gzip")
+    assert negotiate("gzip, deflate, br", supported) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", supported) == "gzip"
+    assert negotiate("*", supported) == "zstd"
+    assert negotiate("br;q=0, *;q=0.1", ("br", "gzip")) == "gzip"
+    assert negotiate("identity", supported) is None
+    assert negotiate(None, supported) is None
+
+
+def _app(calls: list[str]) -> FastAPI:
+    config = CompressionConfig(COMPRESSION_MINIMUM_SIZE=500)
+    app = FastAPI()
+
+    @app.get("/rides/upcoming")
+    async def upcoming():
+        calls.append("upcoming")
+        return RIDES
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        chunks = (b"{\"part\": %d}\n" % i for i in range(200))
+        return StreamingResponse(chunks, media_type="application/json")
+
+    app.add_middleware(ETagMiddleware)
+    app.add_middleware(CompressionMiddleware, config=config)
+    app.add_middleware(HotResponseCacheMiddleware, paths=("/rides/upcoming",), config=config)
+    return app
+
+
+def test_large_and_streaming_bodies_are_compressed_small_are_not():
+    client = TestClient(_app([]))
+
+    large = client.get("/rides/upcoming", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in large.headers["vary"]
+    assert large.json() == RIDES
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert small.json() == {"ok": True}
+
+    streamed = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert streamed.headers["content-encoding"] == "gzip"
+    assert streamed.text.count("part") == 200
+
+    plain = client.get("/rides/upcoming", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+
+def test_hot_public_list_is_compressed_once_per_ttl():
+    calls: list[str] = []
+    client = TestClient(_app(calls))
+    headers = {"Accept-Encoding": "gzip"}
+
+    first = client.get("/rides/upcoming", headers=headers)
+    with client.stream("GET", "/rides/upcoming", headers=headers) as second:
+        raw = b"".join(second.iter_raw())
+    assert calls == ["upcoming"]
+    assert gzip.decompress(raw) == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+
+    revalidated = client.get("/rides/upcoming", headers=headers | {"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert calls == ["upcoming"]
+
+    client.get("/rides/upcoming", headers={"Accept-Encoding": "gzip", "Authorization": "Bearer token"})
+    client.get("/rides/upcoming", headers={"Accept-Encoding": "identity"})
+    assert calls == ["upcoming", "upcoming", "upcoming"]
@@ -0,0 +1,80 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from app.domain.value_objects.entity_version import EntityVersion
+from app.presentation.conditional import etag_matches, not_modified, version_etag
+from app.presentation.middleware.etag import ETagMiddleware
+
+
+def test_version_etag_is_stable_across_time_zones():
+    moment = datetime(2026, 5, 1, 12, tzinfo=UTC)
+    shifted = moment.astimezone(timezone(timedelta(hours=2)))
+
+    etag = version_etag("club", EntityVersion(moment, 3))
+    assert etag.startswith('W/"')
+    assert etag == version_etag("club", EntityVersion(shifted, 3))
+    assert etag != version_etag("club", EntityVersion(moment, 4))
+
+
+def test_if_none_match_uses_weak_comparison():
+    etag = 'W/"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"old", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"old"', etag)
+    assert not etag_matches(None, etag)
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ETagMiddleware)
+    state = {"rides": ["Ладога"]}
+
+    @app.get("/rides")
+    async def rides():
+        return state["rides"]
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse("ok")
+
+    @app.get("/versioned")
+    async def versioned(request: Request, response: Response):
+        etag = version_etag("versioned", 1)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+        return {"version": 1}
+
+    client = TestClient(app)
+    client.state = state
+    return client
+
+
+def test_list_gets_body_etag_and_304_without_body():
+    client = _client()
+    first = client.get("/rides")
+    etag = first.headers["etag"]
+
+    cached = client.get("/rides", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    client.state["rides"].append("Карелия")
+    changed = client.get("/rides", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json() == ["Ладога", "Карелия"]
+    assert changed.headers["etag"] != etag
+
+
+def test_middleware_keeps_endpoint_etags_and_skips_non_json():
+    client = _client()
+    assert "etag" not in client.get("/text").headers
+
+    first = client.get("/versioned")
+    assert first.headers["etag"] == version_etag("versioned", 1)
+    assert client.get("/versioned", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
@@ -0,0 +1,51 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config.settings import PostgresConfig
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool
+
+
+def _sample(name: str, pool: str) -> float | None:
+    return REGISTRY.get_sample_value(name, {"pool": pool})
+
+
+async def test_pool_publishes_checkout_gauges_and_wait(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name="test",
+        pool_size=2,
+        max_overflow=1,
+    )
+    waits_before = _sample("db_pool_checkout_wait_seconds_count", "test") or 0
+
+    async with engine.connect() as first, engine.connect() as second, engine.connect() as third:
+        for conn in (first, second, third):
+            await conn.execute(text("SELECT 1"))
+        assert _sample("db_pool_checked_out", "test") == 3
+        assert _sample("db_pool_overflow", "test") == 1
+
+    assert _sample("db_pool_checked_out", "test") == 0
+    assert _sample("db_pool_size", "test") == 2
+    assert _sample("db_pool_checkout_wait_seconds_count", "test") == waits_before + 3
+    await engine.dispose()
+
+
+def test_engine_options_pass_statement_settings_to_asyncpg():
+    config = PostgresConfig(POSTGRES_STATEMENT_CACHE_SIZE=0, POSTGRES_STATEMENT_TIMEOUT=5000)
+
+    connect_args = config.get_engine_options()["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["server_settings"] == {"statement_timeout": "5000"}
+
+
+def test_pool_size_splits_connection_budget_between_processes():
+    assert PostgresConfig(POSTGRES_CONNECTION_BUDGET=60, POSTGRES_POOL_PROCESSES=8).get_pool_size() == 7
+    assert PostgresConfig(POSTGRES_CONNECTION_BUDGET=4, POSTGRES_POOL_PROCESSES=8).get_pool_size() == 1
+    # Явный размер пула важнее бюджета
+    assert PostgresConfig(POSTGRES_POOL_SIZE=20, POSTGRES_POOL_PROCESSES=8).get_pool_size() == 20
+
+    options = PostgresConfig(POSTGRES_POOL_PROCESSES=16).get_engine_options()
+    assert 16 * (options["pool_size"] + options["max_overflow"]) <= 100
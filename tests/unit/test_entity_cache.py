@@ -0,0 +1,138 @@
+import asyncio
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import fakeredis.aioredis as fakeredis
+import msgpack
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.domain.entities.achievement import Achievement
+from app.domain.entities.club_membership import ClubMembership
+from app.domain.entities.motokonig import MotoKonig
+from app.domain.entities.profile import PrivacyLevel, Profile
+from app.domain.value_objects.achievement_type import AchievementType
+from app.domain.value_objects.motokonig_status import MotoKonigStatus
+from app.infrastructure.cache.codec import decode_entity, encode_entity
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.cache.repositories import CachedClubMembershipRepository
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def cache():
+    return RedisEntityCache(fakeredis.FakeRedis())
+
+
+def _state(entity) -> dict:
+    if hasattr(entity, "__dict__"):
+        return vars(entity)
+    return {name: getattr(entity, name) for name in entity.__slots__}
+
+
+class CountingLoader:
+    def __init__(self, value, delay: float = 0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+def test_codec_round_trip_keeps_nested_entities_and_types():
+    rider = MotoKonig(
+        user_id=uuid4(),
+        nickname="Ветер",
+        status=MotoKonigStatus.EXPERT,
+        achievements=[Achievement(achievement_type=AchievementType.FIRST_RIDE, metadata={"ride": "1"})],
+        created_at=datetime(2025, 5, 1, 12, 30, tzinfo=UTC),
+    )
+    profile = Profile(user_id=uuid4(), date_of_birth=date(1990, 4, 12), privacy_level=PrivacyLevel.FRIENDS_ONLY)
+
+    restored_rider = decode_entity(encode_entity(rider))
+    restored_profile = decode_entity(encode_entity(profile))
+
+    assert _state(restored_rider) | {"achievements": None} == _state(rider) | {"achievements": None}
+    assert _state(restored_rider.achievements[0]) == _state(rider.achievements[0])
+    assert restored_rider.status is MotoKonigStatus.EXPERT
+    assert _state(restored_profile) == _state(profile)
+
+
+def test_codec_refuses_types_outside_domain():
+    payload = msgpack.packb(["builtins:dict", {}])
+    with pytest.raises(TypeError):
+        decode_entity(msgpack.packb(msgpack.ExtType(5, payload)))
+
+
+async def test_concurrent_misses_trigger_one_load(cache, session_factory):
+    club_id = uuid4()
+    loader = CountingLoader({"id": club_id}, delay=0.01)
+
+    async with session_factory() as session:
+        results = await asyncio.gather(
+            *(cache.get_or_load(session, "moto_club", club_id, 60, loader) for _ in range(20))
+        )
+        assert await cache.get_or_load(session, "moto_club", club_id, 60, loader) == {"id": club_id}
+
+    assert loader.calls == 1
+    assert all(result == {"id": club_id} for result in results)
+    # Ожидающие получают собственные копии, а не общий объект
+    assert len({id(result) for result in results}) == 20
+
+
+async def test_write_bypasses_cache_until_commit_then_invalidates(cache, session_factory):
+    profile_id = uuid4()
+    old, new = CountingLoader("old"), CountingLoader("new")
+
+    async with session_factory() as reader:
+        assert await cache.get_or_load(reader, "profile", profile_id, 60, old) == "old"
+
+    async with session_factory() as writer:
+        await writer.begin()
+        await cache.invalidate(writer, "profile", [profile_id])
+        # Своя незакоммиченная запись читается мимо кэша
+        assert await cache.get_or_load(writer, "profile", profile_id, 60, new) == "new"
+        # Параллельный читатель успевает закэшировать старое значение
+        async with session_factory() as reader:
+            assert await cache.get_or_load(reader, "profile", profile_id, 60, old) == "old"
+        await writer.commit()
+        await asyncio.gather(*cache._tasks)
+
+    async with session_factory() as reader:
+        assert await cache.get_or_load(reader, "profile", profile_id, 60, new) == "new"
+    assert old.calls == 2
+
+
+class MembershipRepo:
+    def __init__(self, membership: ClubMembership):
+        self.memberships = {membership.id: membership}
+
+    async def get(self, spec):
+        return self.memberships.get(spec.membership_id)
+
+    async def delete(self, membership_id):
+        return self.memberships.pop(membership_id, None) is not None
+
+
+async def test_membership_delete_invalidates_cached_club(cache, session_factory):
+    membership = ClubMembership(club_id=uuid4(), user_id=uuid4())
+    old, new = CountingLoader({"member_count": 1}), CountingLoader({"member_count": 0})
+
+    async with session_factory() as session:
+        assert await cache.get_or_load(session, "moto_club", membership.club_id, 60, old) == {"member_count": 1}
+        repo = CachedClubMembershipRepository(MembershipRepo(membership), cache, session)
+        assert await repo.delete(membership.id)
+        await session.commit()
+        await asyncio.gather(*cache._tasks)
+
+    async with session_factory() as session:
+        assert await cache.get_or_load(session, "moto_club", membership.club_id, 60, new) == {"member_count": 0}
@@ -0,0 +1,71 @@
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.event import Event
+from app.domain.entities.listing import Listing
+from app.domain.entities.moto_club import MotoClub
+from app.domain.entities.motokonig import MotoKonig
+from app.domain.entities.motorcycle import Motorcycle
+from app.domain.entities.profile import Profile
+from app.domain.entities.ride import Ride
+from app.domain.value_objects.privacy_level import PrivacyLevel
+from app.infrastructure.models.profile import Profile as ProfileModel
+from app.infrastructure.repositories.sql_profile_repo import SqlProfileRepository
+
+ENTITIES = [Event, Listing, MotoClub, MotoKonig, Motorcycle, Profile, Ride]
+
+
+def _state(entity) -> dict:
+    return {name: getattr(entity, name) for name in type(entity).__slots__}
+
+
+@pytest.mark.parametrize("entity_cls", ENTITIES)
+def test_entities_have_no_instance_dict(entity_cls):
+    assert "__dict__" not in dir(entity_cls)
+    assert "hydrate" in entity_cls.__dict__
+
+
+def test_hydrate_restores_constructor_state_without_validation():
+    profile = Profile(user_id=uuid4(), bio="  Катаюсь  ", phone="+79001234567",
+                      date_of_birth=date(1990, 5, 17))
+
+    restored = Profile.hydrate(**_state(profile))
+    assert _state(restored) == _state(profile)
+
+    # Доверенные данные не проверяются повторно
+    raw = Profile.hydrate(**_state(profile) | {"phone": "не телефон"})
+    assert raw.phone == "не телефон"
+
+
+def test_hydrate_requires_exactly_the_entity_attributes():
+    state = _state(Profile(user_id=uuid4()))
+    with pytest.raises(TypeError):
+        Profile.hydrate(**{name: value for name, value in state.items() if name != "bio"})
+    with pytest.raises(TypeError):
+        Profile.hydrate(**state, profile_id=uuid4())
+
+
+def test_repository_maps_row_through_hydrate():
+    now = datetime.now(UTC)
+    row = ProfileModel(
+        id=uuid4(),
+        user_id=uuid4(),
+        bio="Люблю дальние поездки",
+        location="Калининград",
+        phone="+79001234567",
+        riding_experience=10,
+        privacy_level=PrivacyLevel.FRIENDS_ONLY,
+        phone_privacy=PrivacyLevel.PRIVATE,
+        location_privacy=PrivacyLevel.PUBLIC,
+        created_at=now,
+        updated_at=now,
+    )
+
+    profile = SqlProfileRepository(session=None)._to_domain_entity(row)
+
+    assert profile.id == row.id
+    assert profile.privacy_level is PrivacyLevel.FRIENDS_ONLY
+    assert profile.phone_privacy is PrivacyLevel.PRIVATE
+    assert profile.created_at == now
@@ -0,0 +1,7 @@
+from benchmarks.import_time import IMPORT_BUDGET_MS, profile_import
+
+
+def test_api_import_stays_within_budget_and_skips_heavy_stacks():
+    profile = profile_import()
+    assert profile.loaded_lazy == ()
+    assert profile.total_ms < IMPORT_BUDGET_MS, profile.packages_ms
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
@@ -57,7 +57,7 @@ def test_listing_status_flow():
 
 def test_listing_expiry_and_visibility():
     listing = create_listing(status=ListingStatus.ACTIVE,
-                             expires_at=datetime.utcnow() - timedelta(days=1))
+                             expires_at=datetime.now(UTC) - timedelta(days=1))
     assert listing.is_expired() is True
     assert listing.is_visible_to_public() is False
     listing.extend_expiry(10)
@@ -0,0 +1,17 @@
+from benchmarks.load import compare
+
+BASELINE = {"login": {"rps": 100.0, "p95_ms": 10.0, "errors": 0}}
+
+
+def test_compare_flags_only_changes_beyond_tolerance():
+    within = {"login": {"rps": 80.0, "p95_ms": 12.0, "errors": 0}}
+    assert compare(within, BASELINE, tolerance=0.25) == []
+
+    slower = {"login": {"rps": 70.0, "p95_ms": 13.0, "errors": 0}}
+    assert len(compare(slower, BASELINE, tolerance=0.25)) == 2
+
+    failing = {"login": {"rps": 100.0, "p95_ms": 10.0, "errors": 3}}
+    assert compare(failing, BASELINE, tolerance=0.25) == ["login: 3 ошибок"]
+
+    # Новый сценарий без базовой линии не сравнивается
+    assert compare({"upload": {"rps": 1.0, "p95_ms": 999.0, "errors": 0}}, BASELINE, 0.25) == []
@@ -0,0 +1,121 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import fakeredis.aioredis as fakeredis
+import pytest
+from advanced_alchemy.base import orm_registry
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.config.settings import MaintenanceConfig
+from app.domain.entities.listing import Listing
+from app.domain.value_objects.listing_category import ListingCategory
+from app.domain.value_objects.listing_status import ListingStatus
+from app.infrastructure.models.listing import Listing as ListingModel
+from app.infrastructure.models.listing_favorite import ListingFavorite as FavoriteModel
+from app.infrastructure.models.user import User as UserModel
+from app.infrastructure.repositories.sql_listing_repo import SqlListingRepository
+from app.infrastructure.scheduling.cron import CronSchedule
+from app.infrastructure.scheduling.leader import RedisLeaderElection
+from app.infrastructure.scheduling.scheduler import (
+    MAINTENANCE_JOB_ROWS,
+    MaintenanceScheduler,
+)
+from app.worker.maintenance import build_jobs
+
+
+@pytest.mark.parametrize(
+    ("expression", "moment", "expected"),
+    [
+        ("*/5 * * * *", datetime(2026, 3, 1, 10, 3, 30), datetime(2026, 3, 1, 10, 5)),
+        ("*/5 * * * *", datetime(2026, 3, 1, 10, 5), datetime(2026, 3, 1, 10, 10)),
+        ("30 2 * * *", datetime(2026, 3, 1, 10, 0), datetime(2026, 3, 2, 2, 30)),
+        ("0 0 1 1 *", datetime(2026, 3, 1), datetime(2027, 1, 1)),
+        # 1 марта 2026 — воскресенье
+        ("0 9 * * 1-5", datetime(2026, 2, 27, 9, 0), datetime(2026, 3, 2, 9, 0)),
+        ("0 9 * * 0", datetime(2026, 2, 27), datetime(2026, 3, 1, 9, 0)),
+        # День месяца и день недели объединяются через «или»
+        ("0 0 15 * 1", datetime(2026, 3, 1), datetime(2026, 3, 2)),
+    ],
+)
+def test_cron_next_after(expression, moment, expected):
+    assert CronSchedule(expression).next_after(moment) == expected
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "*/0 * * * *", "0 0 31 2 *"])
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression).next_after(datetime(2026, 1, 1))
+
+
+async def test_only_one_node_is_leader_until_it_resigns():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    first = RedisLeaderElection(redis, "maintenance:leader", ttl=30)
+    second = RedisLeaderElection(redis, "maintenance:leader", ttl=30)
+
+    assert await first.campaign()
+    assert not await second.campaign()
+    # Лидер продлевает свой ключ
+    assert await first.campaign()
+
+    # Отказ чужого узла не снимает лидерство
+    await second.resign()
+    assert await redis.get("maintenance:leader") == first.token
+
+    await first.resign()
+    assert await second.campaign()
+    assert not first.is_leader
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [UserModel.__table__, ListingModel.__table__, FavoriteModel.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(orm_registry.metadata.create_all, tables=tables)
+
+    updates: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: updates.append(args[2]) if args[2].startswith("UPDATE") else None,
+    )
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    factory.kw["info"] = {"updates": updates}
+    yield factory
+    await engine.dispose()
+
+
+async def test_expire_listings_job_runs_in_bounded_batches(session_factory):
+    expired_at = datetime.now(UTC) - timedelta(hours=1)
+    async with session_factory() as session, session.begin():
+        repo = SqlListingRepository(session)
+        for index in range(5):
+            await repo.add(Listing(
+                seller_id=uuid4(),
+                title=f"Шлем AGV K{index}",
+                description="Почти новый, без царапин",
+                category=ListingCategory.EQUIPMENT,
+                price=1500000,
+                location="Москва",
+                status=ListingStatus.ACTIVE,
+                expires_at=expired_at,
+            ))
+
+    jobs = build_jobs(session_factory, MaintenanceConfig(MAINTENANCE_BATCH_SIZE=2))
+    expire_listings = next(job for job in jobs if job.name == "expire_listings")
+    election = RedisLeaderElection(fakeredis.FakeRedis(decode_responses=True), "leader", ttl=30)
+    rows_before = MAINTENANCE_JOB_ROWS.labels("expire_listings")._value.get()
+
+    assert await MaintenanceScheduler(jobs, election).run_job(expire_listings) == 5
+
+    # Пачки по две строки и последняя неполная
+    updates = session_factory.kw["info"]["updates"]
+    assert len(updates) == 3
+    assert all("LIMIT" in statement for statement in updates)
+    assert MAINTENANCE_JOB_ROWS.labels("expire_listings")._value.get() - rows_before == 5
+
+    async with session_factory() as session:
+        statuses = await session.scalars(select(ListingModel.status))
+        assert set(statuses) == {ListingStatus.EXPIRED}
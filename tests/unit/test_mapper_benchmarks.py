@@ -0,0 +1,11 @@
+from benchmarks.mappers import CASES, run
+
+
+def test_every_case_maps_and_serializes_synthetic_rows():
+    report = run(sizes=[5], rounds=1)
+
+    names = {result["name"] for result in report["benchmarks"]}
+    for case in CASES:
+        steps = ("to_domain_entity", "to_dto") + (("serialize",) if case.schema else ())
+        assert {f"{case.name}.{step}[5]" for step in steps} <= names
+    assert all(result["extra_info"]["peak_kib"] > 0 for result in report["benchmarks"])
@@ -0,0 +1,70 @@
+import asyncio
+
+import fakeredis.aioredis as fakeredis
+import httpx
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from app.infrastructure.messaging.redis_client import InstrumentedRedis
+from app.infrastructure.metrics.registry import collect_metrics
+from app.infrastructure.services.password_service import PasswordServiceImpl
+from app.presentation.middleware.metrics import PrometheusMiddleware
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+async def test_request_duration_is_labelled_by_route_template():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    app.add_middleware(PrometheusMiddleware)
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    unmatched = {"method": "GET", "route": "unmatched", "status": "404"}
+    before = _sample("http_request_duration_seconds_count", **labels)
+    before_unmatched = _sample("http_request_duration_seconds_count", **unmatched)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for item_id in (1, 2, 3):
+            assert (await client.get(f"/items/{item_id}")).status_code == 200
+        assert (await client.get("/missing")).status_code == 404
+
+    assert _sample("http_request_duration_seconds_count", **labels) - before == 3
+    assert _sample("http_request_duration_seconds_count", **unmatched) - before_unmatched == 1
+    assert _sample("http_requests_in_flight", method="GET") == 0
+    assert b"http_request_duration_seconds_bucket" in collect_metrics()
+
+
+async def test_bcrypt_calls_wait_in_bounded_pool_and_report_queue_depth():
+    service = PasswordServiceImpl(max_workers=1)
+    try:
+        tasks = [asyncio.create_task(service.hash("secret")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        # Один хэш считается, два ждут потока
+        assert _sample("bcrypt_in_progress") == 1
+        assert _sample("bcrypt_queue_depth") == 2
+
+        hashes = await asyncio.gather(*tasks)
+        assert await service.verify("secret", hashes[0])
+        assert _sample("bcrypt_queue_depth") == 0
+        assert _sample("bcrypt_in_progress") == 0
+    finally:
+        service.close()
+
+
+async def test_redis_commands_and_pipelines_are_timed():
+    redis = InstrumentedRedis(connection_pool=fakeredis.FakeRedis().connection_pool)
+    before_set = _sample("redis_command_duration_seconds_count", command="SET")
+    before_multi = _sample("redis_command_duration_seconds_count", command="MULTI")
+
+    await redis.set("key", "value")
+    async with redis.pipeline() as pipe:
+        await pipe.incr("counter").expire("counter", 10).execute()
+
+    assert _sample("redis_command_duration_seconds_count", command="SET") - before_set == 1
+    assert _sample("redis_command_duration_seconds_count", command="MULTI") - before_multi == 1
@@ -0,0 +1,99 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from advanced_alchemy.base import orm_registry
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.domain.entities.club_membership import ClubMembership
+from app.domain.entities.moto_club import MotoClub
+from app.domain.value_objects.club_role import ClubRole
+from app.domain.value_objects.entity_version import EntityVersion
+from app.infrastructure.models.club_membership import (
+    ClubMembership as ClubMembershipModel,
+)
+from app.infrastructure.models.motoclub import MotoClub as MotoClubModel
+from app.infrastructure.repositories.sql_club_membership_repo import (
+    SqlClubMembershipRepository,
+)
+from app.infrastructure.repositories.sql_moto_club_repo import SqlMotoClubRepository
+from app.infrastructure.specs.moto_club.club_by_id import MotoClubById
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [MotoClubModel.__table__, ClubMembershipModel.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(orm_registry.metadata.create_all, tables=tables)
+
+    statements: list[str] = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.info["statements"] = statements
+        yield session
+    await engine.dispose()
+
+
+async def add_club(session, name: str, members: int, suspended: int = 0) -> MotoClub:
+    club = await SqlMotoClubRepository(session).add(MotoClub(name=name, president_id=uuid4()))
+    if members or suspended:
+        await session.execute(insert(ClubMembershipModel), [
+            {
+                "id": uuid4(),
+                "club_id": club.id,
+                "user_id": uuid4(),
+                "role": ClubRole.MEMBER,
+                "status": "active" if i < members else "suspended",
+                "joined_at": datetime.utcnow().isoformat(),
+            }
+            for i in range(members + suspended)
+        ])
+    return club
+
+
+async def test_club_list_counts_active_members_in_one_query(session):
+    first = await add_club(session, "Северный ветер", members=3, suspended=1)
+    second = await add_club(session, "Балтийские волки", members=0)
+    repo = SqlMotoClubRepository(session)
+    session.expunge_all()
+    session.info["statements"].clear()
+
+    clubs = {club.id: club for club in await repo.get_list()}
+
+    assert len(session.info["statements"]) == 1
+    assert clubs[first.id].member_count == 3
+    assert clubs[second.id].member_count == 0
+    assert (await repo.get(MotoClubById(first.id))).to_dto()["member_count"] == 3
+
+
+async def test_club_peers_are_found_with_self_join(session):
+    club = await add_club(session, "Северный ветер", members=2, suspended=1)
+    other = await add_club(session, "Балтийские волки", members=1)
+    repo = SqlClubMembershipRepository(session)
+    viewer, peer = await repo.get_club_member_ids(club.id)
+    [stranger] = await repo.get_club_member_ids(other.id)
+
+    assert await repo.get_club_peer_ids(viewer, [peer, stranger]) == {peer}
+    assert await repo.get_club_peer_ids(viewer, []) == set()
+
+
+async def test_club_version_matches_loaded_club_without_loading_it(session):
+    club = await add_club(session, "Северный ветер", members=2, suspended=1)
+    repo = SqlMotoClubRepository(session)
+    session.expunge_all()
+    session.info["statements"].clear()
+
+    version = await repo.get_version(club.id)
+
+    assert len(session.info["statements"]) == 1
+    loaded = await repo.get(MotoClubById(club.id))
+    assert version == EntityVersion(loaded.updated_at, loaded.member_count)
+    assert await repo.get_version(uuid4()) is None
+
+    await SqlClubMembershipRepository(session).add(ClubMembership(
+        club_id=club.id, user_id=uuid4(), role=ClubRole.MEMBER,
+    ))
+    assert (await repo.get_version(club.id)).revision == 3
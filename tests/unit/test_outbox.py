@@ -0,0 +1,87 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.config.settings import OutboxConfig
+from app.domain.events.ride import CompletedRideParticipant, RideCompleted
+from app.infrastructure.messaging.outbox import OutboxEventPublisher, OutboxRelay
+from app.infrastructure.models.outbox_message import OutboxMessage
+
+
+class FakeBroker:
+    def __init__(self, fail_topics: set[str] = frozenset()):
+        self.fail_topics = fail_topics
+        self.published: list[tuple[str, dict]] = []
+
+    async def publish(self, message: dict, queue: str) -> None:
+        if queue in self.fail_topics:
+            raise ConnectionError("broker is unavailable")
+        self.published.append((queue, message))
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(OutboxMessage.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def make_event() -> RideCompleted:
+    return RideCompleted(
+        ride_id=uuid4(),
+        completed_at=datetime.utcnow(),
+        duration=60,
+        participants=(CompletedRideParticipant(motokonig_id=uuid4(), distance=50, max_speed=90.0),),
+    )
+
+
+async def count_pending(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(OutboxMessage))
+
+
+async def test_event_is_stored_only_with_transaction(session_factory):
+    async with session_factory() as session:
+        await OutboxEventPublisher(session).publish(make_event())
+        await session.rollback()
+    assert await count_pending(session_factory) == 0
+
+    async with session_factory() as session:
+        await OutboxEventPublisher(session).publish(make_event())
+        await session.commit()
+    assert await count_pending(session_factory) == 1
+
+
+async def test_relay_publishes_in_batches_and_deletes_delivered(session_factory):
+    events = [make_event() for _ in range(5)]
+    async with session_factory() as session:
+        publisher = OutboxEventPublisher(session)
+        for event in events:
+            await publisher.publish(event)
+        await session.commit()
+
+    broker = FakeBroker()
+    relay = OutboxRelay(broker, session_factory, OutboxConfig(OUTBOX_BATCH_SIZE=3))
+
+    assert await relay.relay_batch() == 3
+    assert await relay.relay_batch() == 2
+    assert await relay.relay_batch() == 0
+    assert await count_pending(session_factory) == 0
+    assert [RideCompleted.from_payload(payload) for _, payload in broker.published] == events
+    assert {topic for topic, _ in broker.published} == {RideCompleted.topic}
+
+
+async def test_relay_keeps_undelivered_messages(session_factory):
+    async with session_factory() as session:
+        await OutboxEventPublisher(session).publish(make_event())
+        await session.commit()
+
+    relay = OutboxRelay(FakeBroker({RideCompleted.topic}), session_factory, OutboxConfig())
+
+    assert await relay.relay_batch() == 0
+    assert await count_pending(session_factory) == 1
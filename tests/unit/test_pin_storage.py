@@ -5,6 +5,8 @@ import fakeredis.aioredis as fakeredis
 import pytest
 from redis.asyncio import Redis
 
+from app.application.use_cases.auth.pin_auth import PinAuthUseCase
+from app.domain.value_objects.pin_check import PinCheck, PinCheckStatus
 from app.infrastructure.services.pin_storage import RedisPinStorage
 
 
@@ -15,16 +17,85 @@ async def test_pin_storage_basic_ops():
     user_id = uuid4()
     device_id = "dev1"
     await storage.save_pin(user_id, device_id, "hash", "phone", "token", ttl=timedelta(seconds=1))
-    data = await storage.get_pin_data(user_id, device_id)
-    assert data["device_name"] == "phone"
-    await storage.increment_failed_attempts(user_id, device_id)
+    assert (await redis.hgetall(f"pin:{user_id}:{device_id}"))["device_name"] == "phone"
+    await storage.check_pin(user_id, device_id, "other", 5, "now")
     assert await storage.get_failed_attempts(user_id, device_id) == 1
-    await storage.reset_failed_attempts(user_id, device_id)
-    assert await storage.get_failed_attempts(user_id, device_id) == 0
-    await storage.update_last_login(user_id, device_id, "now")
     devices = await storage.get_user_devices(user_id)
     assert devices[0]["device_id"] == device_id
     await storage.delete_pin(user_id, device_id)
-    assert await storage.get_pin_data(user_id, device_id) is None
+    assert not await redis.exists(f"pin:{user_id}:{device_id}")
     await storage.add_device_to_blacklist(user_id, device_id, ttl=1)
     await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_check_pin_resets_or_counts_attempts_atomically():
+    redis: Redis = fakeredis.FakeRedis(decode_responses=True)
+    storage = RedisPinStorage(redis)
+    user_id = uuid4()
+    await storage.save_pin(user_id, "dev1", "hash", "phone", "token", ttl=timedelta(days=30))
+
+    missing = await storage.check_pin(user_id, "dev2", "hash", 2, "now")
+    assert missing.status is PinCheckStatus.NOT_FOUND
+
+    wrong = await storage.check_pin(user_id, "dev1", "other", 2, "now")
+    assert (wrong.status, wrong.attempts) == (PinCheckStatus.INVALID, 1)
+    assert 0 < await redis.ttl(f"pin_attempts:{user_id}:dev1") <= 3600
+
+    ok = await storage.check_pin(user_id, "dev1", "hash", 2, "2026-01-01T00:00:00")
+    assert ok == PinCheck(PinCheckStatus.VERIFIED, 0, device_token="token", device_name="phone")
+    assert await storage.get_failed_attempts(user_id, "dev1") == 0
+    assert await redis.hget(f"pin:{user_id}:dev1", "last_login") == "2026-01-01T00:00:00"
+
+    await storage.check_pin(user_id, "dev1", "other", 2, "now")
+    await storage.check_pin(user_id, "dev1", "other", 2, "now")
+    locked = await storage.check_pin(user_id, "dev1", "hash", 2, "now")
+    assert (locked.status, locked.attempts) == (PinCheckStatus.LOCKED, 2)
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_user_devices_come_from_index_and_drop_expired():
+    redis: Redis = fakeredis.FakeRedis(decode_responses=True)
+    storage = RedisPinStorage(redis)
+    user_id = uuid4()
+    for device_id in ("a", "b", "c"):
+        await storage.save_pin(user_id, device_id, "hash", device_id, "token", ttl=timedelta(days=30))
+    await storage.save_pin(uuid4(), "x", "hash", "x", "token", ttl=timedelta(days=30))
+
+    await storage.delete_pin(user_id, "a")
+    # PIN истёк сам, а ID устройства остался в индексе
+    await redis.delete(f"pin:{user_id}:b")
+
+    devices = await storage.get_user_devices(user_id)
+    assert [d["device_id"] for d in devices] == ["c"]
+    assert await redis.smembers(f"pin_devices:{user_id}") == {"c"}
+    assert 0 < await redis.ttl(f"pin_devices:{user_id}") <= 30 * 86400
+    await redis.aclose()
+
+
+class FakeTokenService:
+    def __init__(self, user_id):
+        self.user_id = user_id
+
+    async def decode_token(self, token):
+        return {"sub": str(self.user_id)}
+
+    async def is_token_blacklisted(self, token):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_locked_device_is_rejected_before_hashing_pin(monkeypatch):
+    redis: Redis = fakeredis.FakeRedis(decode_responses=True)
+    user_id = uuid4()
+    uc = PinAuthUseCase(None, FakeTokenService(user_id), RedisPinStorage(redis))
+    await redis.set(f"pin_attempts:{user_id}:dev1", PinAuthUseCase.MAX_ATTEMPTS)
+
+    def fail_hash(pin, salt):
+        raise AssertionError("PIN hashed for a locked device")
+
+    monkeypatch.setattr(uc, "_hash_pin", fail_hash)
+    with pytest.raises(ValueError, match="Too many failed attempts"):
+        await uc.verify_pin("1234", "dev1", "refresh")
+    await redis.aclose()
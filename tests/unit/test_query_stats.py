@@ -0,0 +1,92 @@
+import httpx
+import pytest
+import structlog
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config.settings import QueryStatsConfig
+from app.infrastructure.database.query_stats import (
+    RepeatedQueryError,
+    add_query_stats,
+    install_query_stats,
+    statement_shape,
+    track_queries,
+)
+from app.presentation.middleware.query_stats import QueryStatsMiddleware
+
+
+@pytest.fixture
+async def engine():
+    install_query_stats()
+    engine = create_async_engine("sqlite+aiosqlite://")
+    yield engine
+    await engine.dispose()
+
+
+def test_statement_shape_ignores_parameter_list_length():
+    assert statement_shape("SELECT * FROM users WHERE id IN ($1, $2, $3)") == (
+        statement_shape("SELECT *\n  FROM users WHERE id IN ($1)")
+    )
+    assert statement_shape("SELECT 1 WHERE a = ? AND b IN (?, ?)") == "SELECT 1 WHERE a = ? AND b IN (?)"
+
+
+async def test_track_queries_counts_and_fails_on_repeated_statement(engine):
+    async with engine.connect() as conn:
+        with track_queries(repeat_threshold=3) as stats:
+            for value in range(3):
+                await conn.execute(text("SELECT :value"), {"value": value})
+        assert stats.count == 3
+        assert stats.duration > 0
+
+        with pytest.raises(RepeatedQueryError, match="4 times"):
+            with track_queries(repeat_threshold=3, strict=True):
+                for value in range(4):
+                    await conn.execute(text("SELECT :value"), {"value": value})
+
+
+async def test_failed_statement_does_not_leak_its_start_time(engine):
+    async with engine.connect() as conn:
+        with track_queries():
+            with pytest.raises(OperationalError):
+                await conn.execute(text("SELECT * FROM missing_table"))
+            await conn.execute(text("SELECT 1"))
+        assert not conn.sync_connection.info["query_stats_started"]
+
+
+def _fan_out_app(engine, config: QueryStatsConfig, events: list[dict]) -> httpx.AsyncClient:
+    app = FastAPI()
+
+    @app.get("/fan-out/{times}")
+    async def fan_out(times: int) -> dict:
+        async with engine.connect() as conn:
+            for value in range(times):
+                await conn.execute(text("SELECT :value"), {"value": value})
+        events.append(add_query_stats(None, "info", {"event": "done"}))
+        return {}
+
+    app.add_middleware(QueryStatsMiddleware, config=config)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_middleware_reports_server_timing_and_log_context(engine):
+    events: list[dict] = []
+    config = QueryStatsConfig(DB_QUERY_REPEAT_THRESHOLD=5, DB_QUERY_REPEAT_STRICT=False)
+    async with _fan_out_app(engine, config, events) as client:
+        response = await client.get("/fan-out/2")
+        assert response.headers["server-timing"].endswith('desc="2 queries"')
+        assert events[0]["db_queries"] == 2
+
+        # Нестрогий режим: превышение только в логе
+        with structlog.testing.capture_logs() as logs:
+            assert (await client.get("/fan-out/6")).status_code == 200
+        assert [log["times"] for log in logs if log["event"] == "db_query_repeated"] == [6]
+
+
+async def test_middleware_fails_request_on_repeated_statement_in_strict_mode(engine):
+    config = QueryStatsConfig(DB_QUERY_REPEAT_THRESHOLD=5, DB_QUERY_REPEAT_STRICT=True)
+    async with _fan_out_app(engine, config, []) as client:
+        assert (await client.get("/fan-out/5")).status_code == 200
+        with pytest.raises(RepeatedQueryError):
+            await client.get("/fan-out/6")
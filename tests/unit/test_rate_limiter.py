@@ -0,0 +1,127 @@
+import fakeredis.aioredis as fakeredis
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.config.settings import RateLimitConfig
+from app.domain.ports.services.rate_limiter import RateLimiterPort
+from app.domain.ports.services.token import TokenServicePort
+from app.domain.value_objects.rate_limit import RateLimit
+from app.infrastructure.services.rate_limiter import RedisRateLimiter
+from app.presentation.dependencies.rate_limit import rate_limit
+
+
+def _limiter(redis, **limits) -> RedisRateLimiter:
+    return RedisRateLimiter(redis, RateLimitConfig(**limits))
+
+
+def test_rate_limit_parse():
+    assert RateLimit.parse("10/minute") == RateLimit(10, 60)
+    assert RateLimit.parse("5 / 30s") == RateLimit(5, 30)
+    assert RateLimit.parse("2/hour").emission_interval == 1800
+    with pytest.raises(ValueError):
+        RateLimit.parse("10/fortnight")
+
+
+@pytest.mark.asyncio
+async def test_burst_then_reject_with_retry_after():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    limiter = _limiter(redis, RATE_LIMIT_REGISTER_PER_IP="3/minute")
+
+    decisions = [await limiter.hit("register", {"ip": "10.0.0.1"}) for _ in range(4)]
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+    assert 19 < decisions[3].retry_after <= 20
+
+    # Другой адрес считается отдельно
+    assert (await limiter.hit("register", {"ip": "10.0.0.2"})).allowed
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_all_subjects_must_allow_and_denied_hit_is_not_consumed():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    limiter = _limiter(
+        redis,
+        RATE_LIMIT_PIN_LOGIN_PER_IP="100/minute",
+        RATE_LIMIT_PIN_LOGIN_PER_DEVICE="2/minute",
+    )
+    subjects = {"ip": "10.0.0.1", "device": "phone"}
+
+    assert (await limiter.hit("pin_login", subjects)).allowed
+    assert (await limiter.hit("pin_login", subjects)).allowed
+    assert not (await limiter.hit("pin_login", subjects)).allowed
+
+    # Отклонённая попытка не списалась с лимита по IP
+    tat_ip = int(await redis.get("ratelimit:pin_login:ip:10.0.0.1"))
+    assert (await limiter.hit("pin_login", {"ip": "10.0.0.1", "device": "tablet"})).allowed
+    assert int(await redis.get("ratelimit:pin_login:ip:10.0.0.1")) - tat_ip <= 600 + 50
+    assert 0 < await redis.pttl("ratelimit:pin_login:device:phone") <= 60_000
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_disabled_limiter_and_unknown_subjects_pass():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    limiter = _limiter(redis, RATE_LIMIT_ENABLED=False, RATE_LIMIT_REGISTER_PER_IP="1/hour")
+    for _ in range(3):
+        assert (await limiter.hit("register", {"ip": "10.0.0.1"})).allowed
+    assert (await _limiter(redis).hit("media_upload", {"ip": "10.0.0.1"})).allowed
+    assert await redis.keys("*") == []
+    await redis.aclose()
+
+
+class _FakeTokenService:
+    async def decode_token(self, token: str) -> dict:
+        if token == "bad":
+            raise ValueError("Invalid token")
+        return {"sub": token}
+
+
+def test_dependency_keys_by_user_and_device_and_returns_429():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    limiter = _limiter(
+        redis,
+        RATE_LIMIT_LOGIN_PER_USER="1/minute",
+        RATE_LIMIT_PIN_LOGIN_PER_DEVICE="1/minute",
+        RATE_LIMIT_LISTING_CREATE_PER_USER="1/hour",
+    )
+    provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: limiter, provides=RateLimiterPort)
+    provider.provide(lambda: _FakeTokenService(), provides=TokenServicePort)
+
+    app = FastAPI()
+
+    @app.post("/login", dependencies=[Depends(rate_limit("login", "ip", "user"))])
+    async def login():
+        return {"ok": True}
+
+    @app.post("/pin-login", dependencies=[Depends(rate_limit("pin_login", "ip", "device"))])
+    async def pin_login(body: dict):
+        return {"ok": True}
+
+    @app.post("/listings", dependencies=[Depends(rate_limit("listing_create", "user"))])
+    async def create_listing():
+        return {"ok": True}
+
+    setup_dishka(make_async_container(provider), app)
+    client = TestClient(app)
+
+    assert client.post("/login", auth=("rider", "x")).status_code == 200
+    rejected = client.post("/login", auth=("rider", "y"))
+    assert rejected.status_code == 429
+    assert int(rejected.headers["retry-after"]) >= 59
+    assert client.post("/login", auth=("other", "x")).status_code == 200
+
+    assert client.post("/pin-login", json={"device_id": "d1"}).status_code == 200
+    assert client.post("/pin-login", json={"device_id": "d1"}).status_code == 429
+    assert client.post("/pin-login", json={"device_id": "d2"}).status_code == 200
+
+    bearer = {"Authorization": "Bearer user-1"}
+    assert client.post("/listings", headers=bearer).status_code == 200
+    assert client.post("/listings", headers=bearer).status_code == 429
+    # Без валидного токена лимит по пользователю не применяется, отказ — дело авторизации
+    assert client.post("/listings", headers={"Authorization": "Bearer bad"}).status_code == 200
+
@@ -0,0 +1,112 @@
+import asyncio
+from uuid import uuid4
+
+import fakeredis.aioredis as fakeredis
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.config.settings import ReplicaConfig
+from app.infrastructure.cache.entity_cache import RedisEntityCache
+from app.infrastructure.database.replica_router import ReplicaRouter
+
+metadata = MetaData()
+marker = Table("marker", metadata, Column("id", Integer, primary_key=True), Column("source", String))
+
+
+async def _engine(source: str):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(insert(marker).values(source=source))
+    return engine
+
+
+@pytest.fixture
+async def engines():
+    primary, replica = await _engine("primary"), await _engine("replica")
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.fixture
+def router(engines):
+    return ReplicaRouter([engines[1]], fakeredis.FakeRedis(decode_responses=True), ReplicaConfig())
+
+
+async def _source(session: AsyncSession) -> str:
+    return (await session.execute(select(marker.c.source))).scalars().first()
+
+
+async def test_read_only_session_reads_replica_until_first_write(engines, router):
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=True)
+        assert await _source(session) == "replica"
+
+        await session.execute(insert(marker).values(source="primary"))
+        assert await _source(session) == "primary"
+
+
+async def test_write_session_and_locking_reads_use_primary(engines, router):
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=False)
+        assert await _source(session) == "primary"
+
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=True)
+        await session.execute(select(marker).with_for_update())
+        assert await _source(session) == "primary"
+
+
+async def test_client_reads_primary_after_own_commit(engines, router):
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=False, client="Bearer token")
+        await session.execute(insert(marker).values(source="primary"))
+        await session.commit()
+    await asyncio.gather(*router._tasks)
+
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=True, client="Bearer token")
+        assert await _source(session) == "primary"
+
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=True, client="Bearer other")
+        assert await _source(session) == "replica"
+
+
+async def test_cache_fill_reads_primary_after_write_not_yet_replicated(engines, router):
+    cache = RedisEntityCache(fakeredis.FakeRedis())
+    async with AsyncSession(engines[0]) as session:
+        await session.execute(update(marker).values(source="committed"))
+        await session.commit()
+
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=True)
+        marker_id = uuid4()
+        assert await cache.get_or_load(session, "marker", marker_id, 60, lambda: _source(session)) == "committed"
+        # Остальные чтения запроса по-прежнему идут на реплику
+        assert await _source(session) == "replica"
+
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=True)
+        assert await cache.get_or_load(session, "marker", marker_id, 60, lambda: _source(session)) == "committed"
+
+
+async def test_lagging_replica_is_ejected_and_restored(engines, router, monkeypatch):
+    lag = 30.0
+
+    async def fake_lag(engine):
+        return lag
+
+    monkeypatch.setattr(router, "_lag", fake_lag)
+
+    await router.check_lag()
+    assert router.healthy == []
+    async with AsyncSession(engines[0]) as session:
+        await router.attach(session, read_only=True)
+        assert await _source(session) == "primary"
+
+    lag = 0.5
+    await router.check_lag()
+    assert router.healthy == [engines[1]]
@@ -0,0 +1,189 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from advanced_alchemy.base import orm_registry
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.domain.entities.achievement import Achievement
+from app.domain.entities.listing import Listing
+from app.domain.entities.motokonig import MotoKonig
+from app.domain.entities.ride import Ride, RideParticipant
+from app.domain.value_objects.achievement_type import AchievementType
+from app.domain.value_objects.entity_version import EntityVersion
+from app.domain.value_objects.listing_category import ListingCategory
+from app.domain.value_objects.listing_status import ListingStatus
+from app.domain.value_objects.ride_difficulty import RideDifficulty
+from app.infrastructure.models.listing import Listing as ListingModel
+from app.infrastructure.models.listing_favorite import ListingFavorite as FavoriteModel
+from app.infrastructure.models.motokonig import MotoKonig as MotoKonigModel
+from app.infrastructure.models.motokonig_achievement import (
+    MotoKonigAchievement as AchievementModel,
+)
+from app.infrastructure.models.ride import Ride as RideModel
+from app.infrastructure.models.ride_checkpoint import RideCheckpoint as CheckpointModel
+from app.infrastructure.models.ride_participant import (
+    RideParticipant as ParticipantModel,
+)
+from app.infrastructure.models.user import User as UserModel
+from app.infrastructure.repositories.sql_listing_repo import SqlListingRepository
+from app.infrastructure.repositories.sql_motokonig_repo import SqlMotoKonigRepository
+from app.infrastructure.repositories.sql_ride_repo import SqlRideRepository
+from app.infrastructure.specs.listing.listing_by_id import ListingById
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [
+        UserModel.__table__,
+        ListingModel.__table__,
+        FavoriteModel.__table__,
+        MotoKonigModel.__table__,
+        AchievementModel.__table__,
+        RideModel.__table__,
+        ParticipantModel.__table__,
+        CheckpointModel.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(orm_registry.metadata.create_all, tables=tables)
+
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2].split()[0]),
+    )
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.info["statements"] = statements
+        yield session
+    await engine.dispose()
+
+
+def _listing(**overrides) -> Listing:
+    return Listing(**{
+        "seller_id": uuid4(),
+        "title": "Шлем AGV K3",
+        "description": "Почти новый, без царапин",
+        "category": ListingCategory.EQUIPMENT,
+        "price": 1500000,
+        "location": "Москва",
+    } | overrides)
+
+
+async def test_listing_add_and_update_issue_no_read_back(session):
+    repo = SqlListingRepository(session)
+    statements = session.info["statements"]
+
+    listing = await repo.add(_listing())
+    assert statements == ["INSERT"]
+    assert listing.id is not None and listing.created_at is not None
+
+    created_at = listing.updated_at
+    statements.clear()
+    listing.title = "Шлем AGV K5"
+    await repo.update(listing)
+
+    assert statements == ["UPDATE"]
+    assert listing.updated_at > created_at
+
+
+async def test_motokonig_add_and_achievement_update_return_full_entity(session):
+    repo = SqlMotoKonigRepository(session)
+    statements = session.info["statements"]
+
+    motokonig = await repo.add(MotoKonig(user_id=uuid4(), nickname="Гонщик"))
+    assert statements == ["INSERT"]
+    assert motokonig.achievements == []
+
+    statements.clear()
+    motokonig.add_achievement(Achievement(achievement_type=AchievementType.FIRST_RIDE))
+    updated = await repo.update(motokonig)
+
+    # Строка и достижения читаются один раз, после записи ничего не перечитывается
+    assert statements == ["SELECT", "SELECT", "UPDATE", "INSERT"]
+    assert [a.achievement_type for a in updated.achievements] == [AchievementType.FIRST_RIDE]
+    assert updated.experience_points == motokonig.experience_points
+
+
+async def test_motokonig_version_counts_achievements(session):
+    repo = SqlMotoKonigRepository(session)
+    motokonig = await repo.add(MotoKonig(user_id=uuid4(), nickname="Гонщик"))
+    assert await repo.get_version_by_user_id(motokonig.user_id) == EntityVersion(motokonig.updated_at, 0)
+
+    motokonig.add_achievement(Achievement(achievement_type=AchievementType.FIRST_RIDE))
+    updated = await repo.update(motokonig)
+
+    version = await repo.get_version_by_user_id(motokonig.user_id)
+    assert version == EntityVersion(updated.updated_at, 1)
+    assert await repo.get_version_by_user_id(uuid4()) is None
+
+
+async def test_ride_add_inserts_participants_in_same_flush(session):
+    repo = SqlRideRepository(session)
+    statements = session.info["statements"]
+    organizer_id = uuid4()
+
+    ride = await repo.add(Ride(
+        organizer_id=organizer_id,
+        title="Вокруг Ладоги",
+        difficulty=RideDifficulty.MODERATE,
+        planned_distance=900,
+        start_location="Санкт-Петербург",
+        planned_start=datetime.now(UTC) + timedelta(days=1),
+        planned_duration=720,
+        participants=[
+            RideParticipant(motokonig_id=organizer_id, is_leader=True),
+            RideParticipant(motokonig_id=uuid4()),
+        ],
+    ))
+
+    assert statements == ["INSERT", "INSERT"]
+    assert ride.ride_id is not None
+    assert {p.is_leader for p in ride.participants} == {True, False}
+
+
+async def test_listing_columns_round_trip_without_parsing_and_expire_by_timestamp(session):
+    repo = SqlListingRepository(session)
+    photos = ["https://cdn.example/1.jpg", "https://cdn.example/2.jpg"]
+    fresh = _listing(photo_urls=photos, status=ListingStatus.ACTIVE)
+    stale = _listing(status=ListingStatus.ACTIVE, expires_at=datetime.now(UTC) - timedelta(hours=1))
+    await repo.add(fresh)
+    await repo.add(stale)
+    session.expunge_all()
+
+    assert await repo.expire_old_listings() == 1
+
+    loaded = await repo.get(ListingById(fresh.id))
+    assert loaded.photo_urls == photos
+    assert loaded.expires_at == fresh.expires_at
+    assert not loaded.is_expired()
+    assert (await repo.get(ListingById(stale.id))).status == ListingStatus.EXPIRED
+
+
+async def test_reads_load_collections_eagerly_in_fresh_session(session):
+    motokonigs = SqlMotoKonigRepository(session)
+    rides = SqlRideRepository(session)
+    motokonig = await motokonigs.add(MotoKonig(user_id=uuid4(), nickname="Гонщик"))
+    motokonig.add_achievement(Achievement(achievement_type=AchievementType.FIRST_RIDE))
+    await motokonigs.update(motokonig)
+    ride = await rides.add(Ride(
+        organizer_id=motokonig.motokonig_id,
+        title="Вокруг Ладоги",
+        difficulty=RideDifficulty.MODERATE,
+        planned_distance=900,
+        start_location="Санкт-Петербург",
+        planned_start=datetime.now(UTC) + timedelta(days=1),
+        planned_duration=720,
+        participants=[RideParticipant(motokonig_id=motokonig.motokonig_id, is_leader=True)],
+    ))
+    # Ленивая загрузка коллекции в async-сессии падает с MissingGreenlet
+    session.expunge_all()
+
+    by_user = await motokonigs.get_by_user_id(motokonig.user_id)
+    assert [a.achievement_type for a in by_user.achievements] == [AchievementType.FIRST_RIDE]
+    assert [len(m.achievements) for m in await motokonigs.get_list()] == [1]
+    assert [len(r.participants) for r in await rides.get_upcoming_rides()] == [1]
+    assert (await rides.get_by_id(ride.ride_id)).participants[0].is_leader
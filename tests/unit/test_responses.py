@@ -0,0 +1,69 @@
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from app.domain.entities.motorcycle import Motorcycle
+from app.domain.value_objects.engine_type import EngineType
+from app.domain.value_objects.motorcycle_type import MotorcycleType
+from app.presentation.responses import ORJSONResponse, SchemaResponse
+from app.presentation.schemas.listing import ListingResponseSchema
+from app.presentation.schemas.motorcycle import MotorcycleResponseSchema
+
+
+@pytest.fixture
+def motorcycle_dto() -> dict:
+    motorcycle = Motorcycle(
+        owner_id=uuid4(),
+        brand="Honda",
+        model="Africa Twin",
+        year=2022,
+        engine_volume=1084,
+        engine_type=EngineType.INLINE_2,
+        motorcycle_type=MotorcycleType.TOURING,
+    )
+    motorcycle.id = uuid4()
+    motorcycle.created_at = motorcycle.updated_at = datetime.now(UTC)
+    return motorcycle.to_dto()
+
+
+@pytest.fixture
+def validate_responses():
+    previous = SchemaResponse.validate
+    yield
+    SchemaResponse.validate = previous
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_schema_response_matches_response_model_output(motorcycle_dto, validate, validate_responses):
+    SchemaResponse.validate = validate
+    expected = MotorcycleResponseSchema.model_validate(motorcycle_dto).model_dump(mode="json")
+
+    response = SchemaResponse([motorcycle_dto, motorcycle_dto], MotorcycleResponseSchema)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [expected, expected]
+    assert json.loads(SchemaResponse(motorcycle_dto, MotorcycleResponseSchema, status_code=201).body) == expected
+
+
+def test_schema_response_drops_fields_outside_schema(motorcycle_dto, validate_responses):
+    SchemaResponse.validate = False
+    body = json.loads(SchemaResponse({**motorcycle_dto, "secret": "x"}, MotorcycleResponseSchema).body)
+    assert "secret" not in body
+
+
+def test_schema_response_validation_rejects_invalid_dto(motorcycle_dto, validate_responses):
+    SchemaResponse.validate = True
+    with pytest.raises(ValidationError):
+        SchemaResponse({**motorcycle_dto, "year": "not a year"}, MotorcycleResponseSchema)
+    with pytest.raises(ValidationError):
+        SchemaResponse([motorcycle_dto], ListingResponseSchema)
+
+
+def test_orjson_response_encodes_uuid_and_datetime():
+    listing_id = uuid4()
+    moment = datetime(2026, 5, 1, 12, 0, tzinfo=UTC)
+    response = ORJSONResponse({"id": listing_id, "at": moment})
+    assert json.loads(response.body) == {"id": str(listing_id), "at": "2026-05-01T12:00:00+00:00"}
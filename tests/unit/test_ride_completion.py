@@ -0,0 +1,287 @@
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import fakeredis.aioredis as fakeredis
+import pytest
+from advanced_alchemy.base import orm_registry
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.use_cases.motokonig.apply_ride_results import (
+    ApplyRideResultsUseCase,
+)
+from app.application.use_cases.motokonig.get_top_riders import GetTopRidersUseCase
+from app.application.use_cases.motokonig.update_ride_stats import (
+    UpdateRideStatsUseCase,
+)
+from app.application.use_cases.ride.complete_ride import CompleteRideUseCase
+from app.domain.entities.motokonig import MotoKonig
+from app.domain.entities.ride import Ride
+from app.domain.events.base import DomainEvent
+from app.domain.events.ride import CompletedRideParticipant, RideCompleted
+from app.domain.value_objects.achievement_type import AchievementType
+from app.domain.value_objects.ride_difficulty import RideDifficulty
+from app.infrastructure.repositories.sql_motokonig_repo import SqlMotoKonigRepository
+from app.infrastructure.repositories.sql_ride_repo import SqlRideRepository
+from app.infrastructure.services.leaderboard import (
+    LEADERBOARD_KEY,
+    REBUILD_KEY,
+    RedisLeaderboard,
+)
+
+
+class FakeRideRepo:
+    def __init__(self, ride: Ride | None = None):
+        self.ride = ride
+        self.applied: set[UUID] = set()
+        self.updates = 0
+
+    async def get_by_id(self, ride_id: UUID) -> Ride | None:
+        return self.ride
+
+    async def update(self, ride: Ride) -> Ride:
+        self.updates += 1
+        return ride
+
+    async def mark_results_applied(self, ride_id: UUID) -> bool:
+        if ride_id in self.applied:
+            return False
+        self.applied.add(ride_id)
+        return True
+
+
+class FakeMotoKonigRepo:
+    def __init__(self, profiles: list[MotoKonig]):
+        self.profiles = {p.motokonig_id: p for p in profiles}
+        self.saved: list[MotoKonig] = []
+        self.full_scans = 0
+
+    async def get_by_id(self, motokonig_id):
+        return self.profiles.get(motokonig_id)
+
+    async def get_many(self, motokonig_ids):
+        return [self.profiles[i] for i in motokonig_ids if i in self.profiles]
+
+    async def get_list(self, spec=None):
+        self.full_scans += 1
+        return [p for p in self.profiles.values() if p.is_public]
+
+    async def update(self, motokonig):
+        self.saved.append(motokonig)
+        return motokonig
+
+    async def update_many(self, motokonigs):
+        self.saved.extend(motokonigs)
+
+
+class FakeLeaderboard:
+    def __init__(self):
+        self.updated: list[MotoKonig] = []
+
+    async def update(self, motokonigs):
+        self.updated.extend(motokonigs)
+
+    async def replace(self, motokonigs):
+        self.updated = [m for m in motokonigs if m.is_public]
+
+    async def claim_rebuild(self) -> bool:
+        return True
+
+    async def top(self, limit: int) -> list[UUID]:
+        return [m.motokonig_id for m in self.updated][:limit]
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(orm_registry.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+class FakePublisher:
+    def __init__(self):
+        self.events: list[DomainEvent] = []
+
+    async def publish(self, event: DomainEvent) -> None:
+        self.events.append(event)
+
+
+def make_ride(organizer_id: UUID) -> Ride:
+    ride = Ride(
+        organizer_id=organizer_id,
+        title="Вечерний заезд",
+        difficulty=RideDifficulty.EASY,
+        planned_distance=120,
+        start_location="Калининград",
+        planned_start=datetime.utcnow(),
+        planned_duration=120,
+    )
+    ride.add_participant(organizer_id, is_leader=True)
+    ride.start_ride()
+    ride.actual_start -= timedelta(hours=2)
+    return ride
+
+
+def test_ride_completed_payload_round_trip():
+    event = RideCompleted(
+        ride_id=uuid4(),
+        completed_at=datetime.utcnow(),
+        duration=95,
+        participants=(CompletedRideParticipant(motokonig_id=uuid4(), distance=120, max_speed=140.0),),
+    )
+    assert RideCompleted.from_payload(event.to_payload()) == event
+
+
+async def test_complete_ride_publishes_event_instead_of_updating_profiles():
+    organizer_id = uuid4()
+    quitter_id = uuid4()
+    ride = make_ride(organizer_id)
+    ride.add_participant(quitter_id)
+    ride.remove_participant(quitter_id)
+    ride_repo = FakeRideRepo(ride)
+    publisher = FakePublisher()
+
+    await CompleteRideUseCase(ride_repo, publisher).execute(ride.ride_id, organizer_id, 118)
+
+    assert ride_repo.updates == 1
+    [event] = publisher.events
+    assert isinstance(event, RideCompleted)
+    assert event.duration >= 119
+    assert [p.motokonig_id for p in event.participants] == [organizer_id]
+    assert event.participants[0].distance == 118
+
+
+async def test_apply_ride_results_updates_all_participants_once():
+    riders = [MotoKonig(user_id=uuid4(), nickname=f"rider{i}") for i in range(3)]
+    motokonig_repo = FakeMotoKonigRepo(riders)
+    uc = ApplyRideResultsUseCase(motokonig_repo, FakeRideRepo())
+    event = RideCompleted(
+        ride_id=uuid4(),
+        completed_at=datetime.utcnow(),
+        duration=120,
+        participants=tuple(
+            CompletedRideParticipant(motokonig_id=r.motokonig_id, distance=150, max_speed=210.0)
+            for r in riders
+        ),
+    )
+
+    assert await uc.execute(event) == riders
+    # Повторная доставка того же сообщения ничего не меняет
+    assert await uc.execute(event) == []
+
+    assert motokonig_repo.saved == riders
+    for rider in riders:
+        assert rider.total_rides == 1
+        assert rider.total_distance == 150
+        assert {a.achievement_type for a in rider.achievements} == {
+            AchievementType.FIRST_RIDE,
+            AchievementType.DISTANCE_100K,
+            AchievementType.SPEED_DEMON,
+        }
+
+
+async def test_ride_results_are_applied_once_through_sql_repositories(session):
+    motokonigs = SqlMotoKonigRepository(session)
+    rides = SqlRideRepository(session)
+    organizer = await motokonigs.add(MotoKonig(user_id=uuid4(), nickname="organizer"))
+    rider = await motokonigs.add(MotoKonig(user_id=uuid4(), nickname="rider"))
+    ride = Ride(
+        organizer_id=organizer.motokonig_id,
+        title="Вечерний заезд",
+        difficulty=RideDifficulty.EASY,
+        planned_distance=120,
+        start_location="Калининград",
+        planned_start=datetime.utcnow(),
+        planned_duration=120,
+    )
+    ride.add_participant(organizer.motokonig_id, is_leader=True)
+    ride.add_participant(rider.motokonig_id)
+    ride = await rides.add(ride)
+    ride.start_ride()
+    ride.actual_start -= timedelta(hours=2)
+    await rides.update(ride)
+    # Дальше всё читается из базы, а не из карты идентичности сессии
+    session.expunge_all()
+
+    publisher = FakePublisher()
+    await CompleteRideUseCase(rides, publisher).execute(
+        ride.ride_id, organizer.motokonig_id, 150
+    )
+    [event] = publisher.events
+    apply_uc = ApplyRideResultsUseCase(motokonigs, rides)
+    assert len(await apply_uc.execute(event)) == 2
+    assert await apply_uc.execute(event) == []
+    session.expunge_all()
+
+    for profile in await motokonigs.get_many([organizer.motokonig_id, rider.motokonig_id]):
+        assert profile.total_rides == 1
+        assert profile.total_distance == 150
+        assert AchievementType.FIRST_RIDE in {a.achievement_type for a in profile.achievements}
+    assert (await rides.get_by_id(ride.ride_id)).is_completed
+
+
+async def test_update_ride_stats_moves_profile_in_leaderboard():
+    rider = MotoKonig(user_id=uuid4(), nickname="rider")
+    leaderboard = FakeLeaderboard()
+
+    await UpdateRideStatsUseCase(FakeMotoKonigRepo([rider]), leaderboard).execute(
+        rider.motokonig_id, 50, 60, 90.0
+    )
+
+    assert leaderboard.updated == [rider]
+
+
+async def test_top_riders_fallback_rebuilds_leaderboard_without_stale_profiles():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    leaderboard = RedisLeaderboard(redis)
+    riders = [MotoKonig(user_id=uuid4(), nickname=f"rider{i}") for i in range(2)]
+    hidden = MotoKonig(user_id=uuid4(), nickname="hidden")
+    deleted = MotoKonig(user_id=uuid4(), nickname="deleted")
+    await leaderboard.update([*riders, hidden, deleted])
+    hidden.is_public = False
+
+    uc = GetTopRidersUseCase(FakeMotoKonigRepo([*riders, hidden]), leaderboard)
+    assert len(await uc.execute(limit=3)) == 2
+
+    members = set(await redis.zrange(LEADERBOARD_KEY, 0, -1))
+    assert members == {str(r.motokonig_id) for r in riders}
+    await redis.aclose()
+
+
+async def test_top_riders_returns_complete_short_list_without_rebuild():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    leaderboard = RedisLeaderboard(redis)
+    riders = [MotoKonig(user_id=uuid4(), nickname=f"rider{i}") for i in range(2)]
+    riders[1].rating = 4.5
+    await leaderboard.update(riders)
+    repo = FakeMotoKonigRepo(riders)
+
+    top = await GetTopRidersUseCase(repo, leaderboard).execute(limit=10_000)
+
+    assert top == [riders[1], riders[0]]
+    assert repo.full_scans == 0
+    await redis.aclose()
+
+
+async def test_top_riders_rebuilds_stale_leaderboard_once_per_interval():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    leaderboard = RedisLeaderboard(redis)
+    rider = MotoKonig(user_id=uuid4(), nickname="rider")
+    deleted = MotoKonig(user_id=uuid4(), nickname="deleted")
+    deleted.rating = 5.0
+    await leaderboard.update([rider, deleted])
+    repo = FakeMotoKonigRepo([rider])
+    # Пока пересборка занята другим запросом, таблица отдаётся как есть
+    await redis.set(REBUILD_KEY, 1)
+    uc = GetTopRidersUseCase(repo, leaderboard)
+
+    assert await uc.execute() == [rider]
+    assert repo.full_scans == 0
+
+    await redis.delete(REBUILD_KEY)
+    assert await uc.execute() == [rider]
+    assert await uc.execute() == [rider]
+    assert repo.full_scans == 1
+    await redis.aclose()
@@ -0,0 +1,178 @@
+import asyncio
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import fakeredis.aioredis as fakeredis
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.asyncio import Redis
+
+from app.application.use_cases.ride.watch_positions import WatchRidePositionsUseCase
+from app.config.settings import TelemetryConfig
+from app.domain.ports.services.token import TokenServicePort
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.gps_fix import GpsFix
+from app.infrastructure.services.ride_position_hub import RedisRidePositionHub
+from app.presentation.routers.ride import router as ride_router
+
+
+def make_config(**kwargs) -> TelemetryConfig:
+    defaults = {"TELEMETRY_BROADCAST_TICK": 0.05, "TELEMETRY_CLIENT_QUEUE_SIZE": 2}
+    defaults.update(kwargs)
+    return TelemetryConfig(**defaults)
+
+
+def position_message(motokonig_id: str, ts: int, lat: float) -> str:
+    return json.dumps(["p", motokonig_id, ts, lat, 20.5, 60.0])
+
+
+async def test_tick_sends_snapshot_then_only_changes():
+    hub = RedisRidePositionHub(fakeredis.FakeRedis(decode_responses=True), make_config())
+    ride_id = uuid4()
+    channel = f"ride:{ride_id}:positions"
+    subscription = await hub.subscribe(ride_id)
+
+    hub.handle_message(channel, position_message("a", 1, 54.7))
+    hub.handle_message(channel, position_message("b", 1, 54.8))
+    hub.tick()
+    first = json.loads(await subscription.receive())
+    assert first["type"] == "snapshot"
+    assert set(first["positions"]) == {"a", "b"}
+
+    # Смещение меньше точности кадра не рассылается
+    hub.handle_message(channel, position_message("a", 2, 54.7000001))
+    hub.handle_message(channel, position_message("b", 2, 54.81))
+    hub.tick()
+    delta = json.loads(await subscription.receive())
+    assert delta["type"] == "delta"
+    assert delta["seq"] == first["seq"] + 1
+    assert list(delta["positions"]) == ["b"]
+
+
+async def test_slow_client_gets_snapshot_instead_of_stale_deltas():
+    hub = RedisRidePositionHub(fakeredis.FakeRedis(decode_responses=True), make_config())
+    ride_id = uuid4()
+    channel = f"ride:{ride_id}:positions"
+    subscription = await hub.subscribe(ride_id)
+
+    for step in range(5):
+        hub.handle_message(channel, position_message("a", step, 54.7 + step * 0.01))
+        hub.tick()
+
+    frame = json.loads(await subscription.receive())
+    assert frame["type"] == "snapshot"
+    assert frame["positions"]["a"][1] == pytest.approx(54.74)
+
+
+async def test_late_joiner_snapshot_contains_checkpoint_arrivals():
+    hub = RedisRidePositionHub(fakeredis.FakeRedis(decode_responses=True), make_config())
+    ride_id = uuid4()
+    channel = f"ride:{ride_id}:positions"
+    stored = CheckpointArrival(
+        ride_id=ride_id,
+        checkpoint_id=uuid4(),
+        motokonig_id=uuid4(),
+        reached_at=datetime(2026, 6, 1, tzinfo=UTC),
+    )
+    early = await hub.subscribe(ride_id, [stored])
+    hub.tick()
+    await early.receive()
+
+    hub.handle_message(channel, json.dumps(["c", "a", "cp-2", 100]))
+    hub.tick()
+    delta = json.loads(await early.receive())
+    assert delta["checkpoints"] == [["a", "cp-2", 100]]
+
+    late = await hub.subscribe(ride_id)
+    hub.tick()
+    snapshot = json.loads(await late.receive())
+    assert snapshot["type"] == "snapshot"
+    assert len(snapshot["checkpoints"]) == 2
+
+
+async def test_publish_fans_out_through_redis():
+    redis: Redis = fakeredis.FakeRedis(decode_responses=True)
+    publisher = RedisRidePositionHub(redis, make_config())
+    listener = RedisRidePositionHub(redis, make_config())
+    await listener.start()
+
+    ride_id = uuid4()
+    motokonig_id = uuid4()
+    subscription = await listener.subscribe(ride_id)
+    fix = GpsFix(recorded_at=datetime.now(UTC), latitude=54.71, longitude=20.51, speed=42.0)
+    await publisher.publish(ride_id, motokonig_id, fix)
+
+    frame = json.loads(await asyncio.wait_for(subscription.receive(), timeout=2))
+    assert frame["positions"][str(motokonig_id)][1:] == [54.71, 20.51, 42.0]
+
+    await listener.unsubscribe(subscription)
+    await listener.stop()
+    await redis.aclose()
+
+
+class _FakeTokenService:
+    async def is_token_blacklisted(self, token: str) -> bool:
+        return False
+
+    async def decode_token(self, token: str) -> dict:
+        return {"type": "access", "sub": str(uuid4()), "username": "rider", "role": "USER"}
+
+
+class _FakeSubscription:
+    def __init__(self, frames: list[str]):
+        self.frames = frames
+
+    async def receive(self) -> str:
+        if self.frames:
+            return self.frames.pop(0)
+        if self.frames is FAILING:
+            raise RuntimeError("hub is gone")
+        await asyncio.Event().wait()
+
+
+FAILING: list[str] = []
+
+
+class _FakeWatchUseCase:
+    def __init__(self, frames: list[str]):
+        self.subscription = _FakeSubscription(frames)
+        self.unsubscribed = False
+
+    async def subscribe(self, ride_id, user_id) -> _FakeSubscription:
+        return self.subscription
+
+    async def unsubscribe(self, subscription) -> None:
+        self.unsubscribed = True
+
+
+def _positions_client(watch_uc: _FakeWatchUseCase) -> TestClient:
+    provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: watch_uc, provides=WatchRidePositionsUseCase)
+    provider.provide(lambda: _FakeTokenService(), provides=TokenServicePort)
+    app = FastAPI()
+    app.include_router(ride_router, prefix="/rides")
+    setup_dishka(make_async_container(provider), app)
+    return TestClient(app)
+
+
+def test_positions_stream_unsubscribes_when_client_leaves():
+    watch_uc = _FakeWatchUseCase(["frame"])
+
+    with _positions_client(watch_uc).websocket_connect(f"/rides/{uuid4()}/positions?token=t") as ws:
+        assert ws.receive_text() == "frame"
+
+    assert watch_uc.unsubscribed
+
+
+def test_positions_stream_surfaces_sender_failures():
+    watch_uc = _FakeWatchUseCase(FAILING)
+
+    with pytest.raises(RuntimeError, match="hub is gone"):
+        with _positions_client(watch_uc).websocket_connect(f"/rides/{uuid4()}/positions?token=t") as ws:
+            ws.receive_text()
+
+    assert watch_uc.unsubscribed
@@ -0,0 +1,329 @@
+import asyncio
+from collections.abc import Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from advanced_alchemy.base import orm_registry
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.use_cases.ride.ingest_telemetry import IngestTelemetryUseCase
+from app.config.settings import TelemetryConfig
+from app.domain.entities.participant_track import ParticipantTrack
+from app.domain.value_objects.checkpoint_arrival import CheckpointArrival
+from app.domain.value_objects.checkpoint_grid import CheckpointGrid
+from app.domain.value_objects.gps_fix import GpsFix
+from app.domain.value_objects.user_role import UserRole
+from app.infrastructure.models import MotoKonig, Ride, RideParticipant, User
+from app.infrastructure.models.ride_telemetry_point import RideTelemetryPoint
+from app.infrastructure.repositories.sql_ride_telemetry_repo import (
+    SqlRideTelemetryRepository,
+)
+from app.infrastructure.services import telemetry_buffer
+from app.infrastructure.services.checkpoint_index import CachedCheckpointIndex
+from app.infrastructure.services.telemetry_buffer import BatchedTelemetryBuffer
+
+START = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+
+
+def make_fix(seconds: int, latitude: float, longitude: float = 20.5, speed: float | None = None) -> GpsFix:
+    return GpsFix(
+        recorded_at=START + timedelta(seconds=seconds),
+        latitude=latitude,
+        longitude=longitude,
+        speed=speed,
+    )
+
+
+class FakePositionHub:
+    def __init__(self):
+        self.published: list[GpsFix] = []
+        self.arrivals: list[CheckpointArrival] = []
+
+    async def publish(self, ride_id: UUID, motokonig_id: UUID, fix: GpsFix) -> None:
+        self.published.append(fix)
+
+    async def publish_arrival(self, arrival: CheckpointArrival) -> None:
+        self.arrivals.append(arrival)
+
+
+class FakeCheckpointIndex:
+    def __init__(self, grid: CheckpointGrid | None = None):
+        self.grid = grid or CheckpointGrid([], radius_m=50)
+
+    async def get(self, ride_id: UUID) -> CheckpointGrid:
+        return self.grid
+
+    def invalidate(self, ride_id: UUID) -> None:
+        pass
+
+
+class FakeTelemetryBuffer:
+    def __init__(self, track: ParticipantTrack | None = None):
+        self.track = track
+        self.pushed: list[GpsFix] = []
+        self.arrivals: list[CheckpointArrival] = []
+
+    async def load_track(self, ride_id: UUID, user_id: UUID) -> ParticipantTrack | None:
+        return self.track
+
+    async def load_arrivals(self, ride_id: UUID) -> list[CheckpointArrival]:
+        return list(self.arrivals)
+
+    async def push(
+            self,
+            track: ParticipantTrack,
+            fixes: Sequence[GpsFix],
+            arrivals: Sequence[CheckpointArrival] = (),
+    ) -> None:
+        self.pushed.extend(fixes)
+        self.arrivals.extend(arrivals)
+
+    async def flush(self) -> int:
+        return len(self.pushed)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+def test_gps_fix_validation_and_distance():
+    with pytest.raises(ValueError):
+        make_fix(0, latitude=91)
+    with pytest.raises(ValueError):
+        make_fix(0, latitude=0, longitude=181)
+
+    a = make_fix(0, latitude=54.70)
+    b = make_fix(10, latitude=54.71)
+    # 0.01° широты ≈ 1112 м
+    assert a.distance_to(b) == pytest.approx(1112, rel=0.01)
+
+
+def test_participant_track_accumulates_stats():
+    track = ParticipantTrack(ride_id=uuid4(), motokonig_id=uuid4())
+    assert track.apply(make_fix(0, latitude=54.7000))
+    assert track.apply(make_fix(10, latitude=54.7020, speed=85.0))
+
+    assert track.distance_m == pytest.approx(222, rel=0.01)
+    assert track.moving_seconds == 10
+    assert track.max_speed == 85.0
+    assert track.average_speed == pytest.approx(80, rel=0.01)
+
+
+def test_participant_track_rejects_out_of_order_and_jumps():
+    track = ParticipantTrack(ride_id=uuid4(), motokonig_id=uuid4())
+    assert track.apply(make_fix(10, latitude=54.70))
+    assert not track.apply(make_fix(5, latitude=54.70))
+    # 10 км за 1 секунду — сбой GPS
+    assert not track.apply(make_fix(11, latitude=54.79))
+    assert track.distance_m == 0
+
+
+async def test_ingest_use_case_pushes_accepted_fixes():
+    track = ParticipantTrack(ride_id=uuid4(), motokonig_id=uuid4())
+    buffer = FakeTelemetryBuffer(track)
+    hub = FakePositionHub()
+    uc = IngestTelemetryUseCase(buffer, hub, FakeCheckpointIndex())
+
+    session = await uc.start_session(track.ride_id, uuid4())
+    accepted = await uc.execute(
+        session,
+        [make_fix(2, latitude=54.701), make_fix(0, latitude=54.700), make_fix(2, latitude=54.702)],
+    )
+
+    assert accepted == 2
+    assert [f.recorded_at for f in buffer.pushed] == [START, START + timedelta(seconds=2)]
+    assert hub.published == [buffer.pushed[-1]]
+
+
+async def test_ingest_use_case_requires_active_participation():
+    uc = IngestTelemetryUseCase(FakeTelemetryBuffer(), FakePositionHub(), FakeCheckpointIndex())
+    with pytest.raises(ValueError):
+        await uc.start_session(uuid4(), uuid4())
+
+
+def test_checkpoint_grid_finds_only_points_within_radius():
+    near, far = uuid4(), uuid4()
+    route = [(uuid4(), 54.70 + i * 0.01, 20.50) for i in range(300)]
+    grid = CheckpointGrid([*route, (near, 54.6500, 20.5000), (far, 54.6500, 20.5010)], radius_m=50)
+
+    assert len(grid) == 302
+    # ~33 м до первой точки и ~65 м до второй
+    assert grid.nearby(make_fix(0, latitude=54.6503)) == [near]
+    assert grid.nearby(make_fix(0, latitude=10.0)) == []
+
+
+async def test_ingest_use_case_detects_checkpoint_once_per_participant():
+    checkpoint_id = uuid4()
+    grid = CheckpointGrid([(checkpoint_id, 54.7010, 20.5)], radius_m=50)
+    track = ParticipantTrack(ride_id=uuid4(), motokonig_id=uuid4())
+    buffer = FakeTelemetryBuffer(track)
+    hub = FakePositionHub()
+    uc = IngestTelemetryUseCase(buffer, hub, FakeCheckpointIndex(grid))
+
+    await uc.execute(track, [make_fix(0, latitude=54.7000), make_fix(5, latitude=54.7009)])
+    await uc.execute(track, [make_fix(10, latitude=54.7011)])
+
+    assert [a.checkpoint_id for a in buffer.arrivals] == [checkpoint_id]
+    assert buffer.arrivals[0].reached_at == START + timedelta(seconds=5)
+    assert hub.arrivals == buffer.arrivals
+
+
+async def test_saved_track_restores_distance_to_the_metre():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(orm_registry.metadata.create_all)
+
+    ride_id, motokonig_id, user_id = uuid4(), uuid4(), uuid4()
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.add(MotoKonig(id=motokonig_id, user_id=user_id, nickname="Гонщик"))
+        session.add(Ride(
+            id=ride_id, organizer_id=motokonig_id, title="Вокруг Ладоги", difficulty=2,
+            planned_distance=900, start_location="Санкт-Петербург", end_location="Сортавала",
+            planned_start=START, planned_duration=720, actual_start=START,
+        ))
+        await session.flush()
+        await session.execute(insert(RideParticipant), [{"ride_id": ride_id, "motokonig_id": motokonig_id}])
+
+        repo = SqlRideTelemetryRepository(session)
+        track = await repo.get_active_track(ride_id, user_id)
+        track.apply(make_fix(0, 54.0, speed=50))
+        track.apply(make_fix(60, 54.0075, speed=50))  # ~834 м
+        await repo.save_tracks([track])
+
+        restored = await repo.get_active_track(ride_id, user_id)
+    await engine.dispose()
+
+    assert track.distance_covered == 0
+    assert restored.distance_m == pytest.approx(track.distance_m)
+    assert restored.average_speed == pytest.approx(track.average_speed)
+
+
+async def test_flush_drops_rides_that_violate_integrity_and_keeps_the_rest():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    event.listen(
+        engine.sync_engine, "connect", lambda conn, _: conn.execute("PRAGMA foreign_keys=ON")
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(orm_registry.metadata.create_all)
+
+    ride_id, motokonig_id, user_id = uuid4(), uuid4(), uuid4()
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session, session.begin():
+        session.add(User(id=user_id, username="rider", password_hash="hash", role=UserRole.USER))
+        await session.flush()
+        session.add(MotoKonig(id=motokonig_id, user_id=user_id, nickname="Гонщик"))
+        await session.flush()
+        session.add(Ride(
+            id=ride_id, organizer_id=motokonig_id, title="Вокруг Ладоги", difficulty=2,
+            planned_distance=900, start_location="Санкт-Петербург", end_location="Сортавала",
+            planned_start=START, planned_duration=720, actual_start=START,
+        ))
+
+    buffer = BatchedTelemetryBuffer(factory, TelemetryConfig())
+    # Поездку удалили посреди заезда: её отметки нарушают внешний ключ
+    deleted = ParticipantTrack(ride_id=uuid4(), motokonig_id=motokonig_id)
+    alive = ParticipantTrack(ride_id=ride_id, motokonig_id=motokonig_id)
+    await buffer.push(deleted, [make_fix(0, 54.0)])
+    await buffer.push(alive, [make_fix(0, 54.0), make_fix(5, 54.0001)])
+
+    assert await buffer.flush() == 2
+    # Отброшенная поездка не возвращается в буфер и не мешает следующим записям
+    await buffer.push(alive, [make_fix(10, 54.0002)])
+    assert await buffer.flush() == 1
+
+    async with factory() as session:
+        assert await session.scalar(select(func.count()).select_from(RideTelemetryPoint)) == 3
+    await engine.dispose()
+
+
+async def test_push_caps_buffered_points_keeping_the_newest():
+    buffer = BatchedTelemetryBuffer(None, TelemetryConfig(TELEMETRY_MAX_BUFFERED_POINTS=3))
+    track = ParticipantTrack(ride_id=uuid4(), motokonig_id=uuid4())
+
+    await buffer.push(track, [make_fix(second, 54.0) for second in range(5)])
+
+    assert [p.fix.recorded_at.second for p in buffer._points] == [2, 3, 4]
+
+
+async def test_push_caps_buffered_arrivals(monkeypatch):
+    monkeypatch.setattr(telemetry_buffer, "MAX_BUFFERED_ARRIVALS", 2)
+    buffer = BatchedTelemetryBuffer(None, TelemetryConfig())
+    track = ParticipantTrack(ride_id=uuid4(), motokonig_id=uuid4())
+    arrivals = [
+        CheckpointArrival(
+            ride_id=track.ride_id,
+            checkpoint_id=uuid4(),
+            motokonig_id=track.motokonig_id,
+            reached_at=START + timedelta(seconds=second),
+        )
+        for second in range(3)
+    ]
+
+    await buffer.push(track, [], arrivals)
+
+    assert buffer._arrivals == arrivals[1:]
+
+
+class GatedCheckpoints:
+    """Подмена загрузки контрольных точек, которую тест отпускает вручную"""
+
+    def __init__(self):
+        self.loading: list[UUID] = []
+        self.release = asyncio.Event()
+
+    async def load(self, ride_id: UUID) -> list[tuple[UUID, float, float]]:
+        self.loading.append(ride_id)
+        await self.release.wait()
+        return [(uuid4(), 54.0, 20.5)]
+
+
+@asynccontextmanager
+async def no_session():
+    yield None
+
+
+async def test_checkpoint_index_builds_rides_independently(monkeypatch):
+    gate = GatedCheckpoints()
+    monkeypatch.setattr(
+        SqlRideTelemetryRepository, "get_checkpoints", lambda repo, ride_id: gate.load(ride_id)
+    )
+    index = CachedCheckpointIndex(no_session, TelemetryConfig())
+    first, second = uuid4(), uuid4()
+
+    tasks = [asyncio.create_task(index.get(ride_id)) for ride_id in (first, first, second)]
+    await asyncio.sleep(0)
+    # Вторая поездка грузится, не дожидаясь первой, а первая — один раз
+    assert gate.loading == [first, second]
+
+    gate.release.set()
+    grids = await asyncio.gather(*tasks)
+    assert grids[0] is grids[1]
+    assert await index.get(second) is grids[2]
+
+
+async def test_checkpoint_index_invalidate_drops_stale_grids(monkeypatch):
+    gate = GatedCheckpoints()
+    monkeypatch.setattr(
+        SqlRideTelemetryRepository, "get_checkpoints", lambda repo, ride_id: gate.load(ride_id)
+    )
+    index = CachedCheckpointIndex(no_session, TelemetryConfig())
+    ride_id = uuid4()
+
+    building = asyncio.create_task(index.get(ride_id))
+    await asyncio.sleep(0)
+    # Точки сменились во время загрузки: загруженный индекс не кэшируется
+    index.invalidate(ride_id)
+    gate.release.set()
+    stale = await building
+
+    fresh = await index.get(ride_id)
+    assert fresh is not stale
+    assert gate.loading == [ride_id, ride_id]
+
+    index.invalidate(ride_id)
+    assert await index.get(ride_id) is not fresh
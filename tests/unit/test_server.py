@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from app.config.settings import MinIOConfig, PostgresConfig, ServerConfig
+from app.infrastructure.storage.minio_client import MinIOFileStorage
+from app.server import (
+    build_config,
+    prepare_metrics_dir,
+    share_connection_budget,
+    worker_count,
+)
+
+
+def test_worker_count_defaults_to_available_cores():
+    assert worker_count(ServerConfig(SERVER_WORKERS=3)) == 3
+    assert worker_count(ServerConfig()) >= 1
+
+
+def test_build_config_enables_fast_loop_recycling_and_drain():
+    config = build_config(
+        ServerConfig(
+            SERVER_WORKERS=2,
+            SERVER_MAX_REQUESTS=1000,
+            SERVER_MAX_REQUESTS_JITTER=100,
+            SERVER_GRACEFUL_TIMEOUT=15,
+        )
+    )
+    assert config.workers == 2
+    assert (config.loop, config.http) == ("uvloop", "httptools")
+    assert (config.limit_max_requests, config.limit_max_requests_jitter) == (1000, 100)
+    assert config.timeout_graceful_shutdown == 15
+    assert config.proxy_headers
+
+    assert build_config(ServerConfig(SERVER_MAX_REQUESTS=0)).limit_max_requests is None
+
+
+def test_workers_share_postgres_connection_budget(monkeypatch):
+    monkeypatch.setenv("POSTGRES_POOL_PROCESSES", "1")
+
+    share_connection_budget(4)
+
+    assert os.environ["POSTGRES_POOL_PROCESSES"] == "4"
+    pool_processes = int(os.environ["POSTGRES_POOL_PROCESSES"])
+    assert PostgresConfig(POSTGRES_POOL_PROCESSES=pool_processes).get_pool_size() == 15
+
+
+def test_prepare_metrics_dir_drops_previous_run(tmp_path, monkeypatch):
+    # setenv, а не delenv: monkeypatch вернёт окружение после теста
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    (metrics_dir / "counter_123.db").write_bytes(b"stale")
+
+    prepare_metrics_dir(str(metrics_dir))
+
+    assert list(metrics_dir.iterdir()) == []
+    assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == str(metrics_dir)
+
+
+@pytest.mark.asyncio
+async def test_file_storage_shares_one_client_after_start():
+    storage = MinIOFileStorage(MinIOConfig())
+    await storage.start()
+    async with storage._client() as first, storage._client() as second:
+        assert first is second
+    await storage.stop()
+    assert storage._shared is None
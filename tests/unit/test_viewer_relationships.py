@@ -0,0 +1,123 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import fakeredis.aioredis as fakeredis
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.application.use_cases.club_membership.resolve_viewer_relationships import (
+    ResolveViewerRelationshipsUseCase,
+)
+from app.application.use_cases.moto_club.delete_club import DeleteMotoClubUseCase
+from app.domain.value_objects.viewer_relationship import ViewerRelationship
+from app.infrastructure.services.viewer_relationship_cache import (
+    RedisViewerRelationshipCache,
+    SessionViewerRelationshipCache,
+)
+
+
+class FakeMembershipRepo:
+    def __init__(self, clubs: dict[UUID, set[UUID]]):
+        self.clubs = clubs
+        self.peer_queries = 0
+
+    async def get_club_member_ids(self, club_id: UUID) -> list[UUID]:
+        return list(self.clubs[club_id])
+
+    async def get_club_peer_ids(self, user_id, candidate_ids) -> set[UUID]:
+        self.peer_queries += 1
+        peers = set()
+        for members in self.clubs.values():
+            if user_id in members:
+                peers |= members & set(candidate_ids)
+        return peers
+
+
+class FakeClubRepo:
+    def __init__(self, repo: FakeMembershipRepo):
+        self.repo = repo
+
+    async def delete(self, club_id: UUID) -> bool:
+        # Членства удаляются каскадом вместе с клубом
+        return self.repo.clubs.pop(club_id, None) is not None
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def cache():
+    return RedisViewerRelationshipCache(fakeredis.FakeRedis(decode_responses=True))
+
+
+async def test_batch_is_resolved_with_one_query_then_from_cache(cache):
+    viewer, *others = [uuid4() for _ in range(100)]
+    club = uuid4()
+    repo = FakeMembershipRepo({club: {viewer, *others[:10]}})
+    uc = ResolveViewerRelationshipsUseCase(repo, cache)
+
+    first = await uc.execute(viewer, [viewer, *others])
+    second = await uc.execute(viewer, others)
+
+    assert repo.peer_queries == 1
+    assert first[viewer] == ViewerRelationship.owner()
+    assert sum(r.is_club_member for r in first.values()) == 11
+    assert not any(r.is_friend for user_id, r in first.items() if user_id != viewer)
+    assert {k: v for k, v in first.items() if k != viewer} == second
+
+
+async def test_invalidation_refreshes_both_sides(cache):
+    viewer, rider = uuid4(), uuid4()
+    club = uuid4()
+    repo = FakeMembershipRepo({club: {viewer}})
+    uc = ResolveViewerRelationshipsUseCase(repo, cache)
+
+    assert not (await uc.execute_one(viewer, rider)).is_club_member
+    assert not (await uc.execute_one(rider, viewer)).is_club_member
+
+    repo.clubs[club].add(rider)
+    await cache.invalidate(rider, await repo.get_club_member_ids(club))
+
+    assert (await uc.execute_one(viewer, rider)).is_club_member
+    assert (await uc.execute_one(rider, viewer)).is_club_member
+
+
+async def test_invalidation_waits_for_commit(cache, session):
+    viewer, rider = uuid4(), uuid4()
+    club = uuid4()
+    repo = FakeMembershipRepo({club: {viewer}})
+    uc = ResolveViewerRelationshipsUseCase(repo, cache)
+    assert not (await uc.execute_one(viewer, rider)).is_club_member
+
+    await session.begin()
+    repo.clubs[club].add(rider)
+    await SessionViewerRelationshipCache(cache, session).invalidate(rider, repo.clubs[club])
+    # До коммита кэш не трогаем: перечитать успели бы старое состояние
+    assert await cache.get_many(viewer, [rider]) == {rider: False}
+
+    await session.commit()
+    await asyncio.gather(*cache._tasks)
+    assert (await uc.execute_one(viewer, rider)).is_club_member
+
+
+async def test_deleted_club_members_stop_seeing_each_other(cache, session):
+    viewer, rider = uuid4(), uuid4()
+    club = uuid4()
+    repo = FakeMembershipRepo({club: {viewer, rider}})
+    resolve = ResolveViewerRelationshipsUseCase(repo, cache)
+    assert (await resolve.execute_one(viewer, rider)).is_club_member
+    assert (await resolve.execute_one(rider, viewer)).is_club_member
+
+    await session.begin()
+    relationship_cache = SessionViewerRelationshipCache(cache, session)
+    assert await DeleteMotoClubUseCase(FakeClubRepo(repo), repo, relationship_cache).execute(club)
+    await session.commit()
+    await asyncio.gather(*cache._tasks)
+
+    assert not (await resolve.execute_one(viewer, rider)).is_club_member
+    assert not (await resolve.execute_one(rider, viewer)).is_club_member